@@ -181,12 +181,19 @@ CORS_ALLOW_HEADERS = [
     'authorization',
     'content-type',
     'dnt',
+    'if-none-match',
     'origin',
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
 ]
 
+# 그래프 조회 API 의 조건부 요청(If-None-Match)과 변경분 조회(since)에 사용
+CORS_EXPOSE_HEADERS = [
+    'ETag',
+    'X-Progress-Version',
+]
+
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_USE_TLS = True
@@ -97,3 +97,23 @@ else
     docker exec cron-app sh -c "service cron restart"
     echo "Cron 작업이 업데이트되었습니다."
 fi
+
+# 리마인드 스케줄러 실행 확인 (리마인드, PushOutbox 재시도, 문제 해결 알림 묶음 발송)
+PUSH_REMINDER_SCHEDULER_RUNNING=$(docker ps --filter "name=push-reminder-scheduler" --format "{{.Names}}")
+
+if [ -z "$PUSH_REMINDER_SCHEDULER_RUNNING" ]; then
+    echo "리마인드 스케줄러 컨테이너가 실행 중이지 않습니다. 리마인드 스케줄러 컨테이너를 시작합니다."
+    docker-compose up -d push-reminder-scheduler  # 리마인드 스케줄러 컨테이너 시작
+    sleep 10  # 컨테이너가 완전히 시작될 시간을 줌
+
+    # 리마인드 스케줄러 컨테이너가 제대로 시작됐는지 다시 확인
+    PUSH_REMINDER_SCHEDULER_RUNNING=$(docker ps --filter "name=push-reminder-scheduler" --format "{{.Names}}")
+    if [ -z "$PUSH_REMINDER_SCHEDULER_RUNNING" ]; then
+        echo "Error: 리마인드 스케줄러 컨테이너를 시작하지 못했습니다. 스크립트를 종료합니다."
+        exit 1
+    fi
+else
+    echo "리마인드 스케줄러를 재시작합니다."
+    docker restart push-reminder-scheduler
+    echo "리마인드 스케줄러가 재시작되었습니다."
+fi
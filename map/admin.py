@@ -1,4 +1,4 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django import forms
 
 from map.forms.admin_forms import MapAdminForm, NodeAdminForm, CategoryAdminForm
@@ -13,6 +13,11 @@ from map.models import (
     NodeCompletedHistory,
     PopularMap,
 )
+from map_graph.services.map_graph_snapshot_service import (
+    increase_map_graph_version,
+    save_map_graph_topology,
+)
+from play.services import MapPlayNodeStatisticService
 
 
 class ArrowAdminForm(forms.ModelForm):
@@ -101,6 +106,47 @@ class NodeCompleteRuleAdminForm(forms.ModelForm):
         return cleaned_data
 
 
+class MapGraphVersionAdminMixin:
+    """
+    Map 구조(Node, Arrow, NodeCompleteRule)를 수정하면 Map 의 graph_version 을 올려
+    캐싱된 Map 그래프 Snapshot 이 다시 만들어지도록 하고, Map 구조를 다시 컴파일해서 저장합니다.
+    커밋 후에는 MapPlay 별 Node 통계(MapPlayNodeStatistic)도 새 구조 기준으로 다시 계산합니다.
+    순환, 고아 Rule, 완료할 수 없는 Node 가 있으면 경고 메시지를 보여줍니다.
+    """
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        map_ids = {obj.map_id}
+        # 다른 Map 으로 옮겨진 경우 이전 Map 도 갱신
+        if change and 'map' in form.changed_data and form.initial.get('map'):
+            map_ids.add(form.initial['map'])
+        self.compile_map_graphs(request, map_ids)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        self.compile_map_graphs(request, {obj.map_id})
+
+    def delete_queryset(self, request, queryset):
+        map_ids = set(queryset.values_list('map_id', flat=True))
+        super().delete_queryset(request, queryset)
+        self.compile_map_graphs(request, map_ids)
+
+    def compile_map_graphs(self, request, map_ids):
+        MapPlayNodeStatisticService.rebuild_map_statistics_on_commit(map_ids)
+        for map_id in map_ids:
+            increase_map_graph_version(map_id)
+            topology = save_map_graph_topology(map_id)
+            if topology.is_valid:
+                continue
+            self.message_user(
+                request,
+                f'{map_id} 맵 구조를 확인해주세요. '
+                f'순환 Node: {list(topology.cycle_node_ids)}, '
+                f'고아 Rule: {list(topology.orphan_rule_ids)}, '
+                f'완료할 수 없는 Node: {list(topology.unreachable_node_ids)}',
+                level=messages.WARNING,
+            )
+
+
 class MapCategoryInline(admin.TabularInline):
     model = MapCategory
     extra = 1
@@ -112,7 +158,7 @@ class MapAdmin(admin.ModelAdmin):
     list_display = ('name', 'created_by', 'subscriber_count', 'play_count', 'is_private', 'created_at')
     list_filter = ('is_private', 'is_deleted')
     search_fields = ('name', 'description')
-    readonly_fields = ('subscriber_count', 'play_count', 'created_at', 'updated_at')
+    readonly_fields = ('subscriber_count', 'play_count', 'graph_version', 'created_at', 'updated_at')
     form = MapAdminForm
     inlines = [MapCategoryInline]
 
@@ -127,7 +173,7 @@ class PopularMapAdmin(admin.ModelAdmin):
 
 
 @admin.register(Node)
-class NodeAdmin(admin.ModelAdmin):
+class NodeAdmin(MapGraphVersionAdminMixin, admin.ModelAdmin):
     list_display = ('name', 'map', 'is_active', 'created_at')
     list_filter = ('is_active', 'is_deleted')
     search_fields = ('name', 'title', 'description', 'map__name')
@@ -140,7 +186,7 @@ class NodeAdmin(admin.ModelAdmin):
 
 
 @admin.register(Arrow)
-class ArrowAdmin(admin.ModelAdmin):
+class ArrowAdmin(MapGraphVersionAdminMixin, admin.ModelAdmin):
     form = ArrowAdminForm
     list_display = (
         'map',
@@ -190,7 +236,7 @@ class ArrowAdmin(admin.ModelAdmin):
 
 
 @admin.register(NodeCompleteRule)
-class NodeCompleteRuleAdmin(admin.ModelAdmin):
+class NodeCompleteRuleAdmin(MapGraphVersionAdminMixin, admin.ModelAdmin):
     form = NodeCompleteRuleAdminForm
     list_display = ('node', 'map', 'created_at')
     list_filter = ('is_deleted',)
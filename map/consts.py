@@ -11,3 +11,15 @@ class PopularMapType(StrValueLabel):
     DAILY = ('daily', '일별')
     MONTHLY = ('monthly', '월별')
 
+
+# import_map / export_map, Map 복제에서 한 번에 INSERT 하는 최대 행 수
+MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE = 1000
+
+
+class MapSeedShape(StrValueLabel):
+    """
+    seed_map / benchmark_map 에서 만드는 가상 Map 형태
+    """
+    CHAIN = ('chain', '체인')
+    TREE = ('tree', '트리 (fan-out)')
+    DAG = ('dag', 'DAG (fan-in / fan-out)')
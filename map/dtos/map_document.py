@@ -0,0 +1,79 @@
+from typing import (
+    List,
+    Optional,
+)
+
+from pydantic import BaseModel
+
+from question.consts import (
+    QuestionType,
+    ValidationType,
+)
+
+
+class MapDocumentQuestionAnswerDTO(BaseModel):
+    answer: str
+    description: str = ''
+
+
+class MapDocumentQuestionFileDTO(BaseModel):
+    name: Optional[str] = None
+    file: str
+
+
+class MapDocumentQuestionDTO(BaseModel):
+    """
+    문제 하나마다 Rule 의 Node 를 가리키는 self arrow 가 하나씩 만들어집니다.
+    """
+    title: str
+    description: str
+    question_types: List[QuestionType] = [QuestionType.TEXT, QuestionType.FILE]
+    answer_validation_type: ValidationType = ValidationType.MANUAL
+    is_by_pass: bool = False
+    default_success_feedback: Optional[str] = None
+    default_failure_feedback: Optional[str] = None
+    answers: List[MapDocumentQuestionAnswerDTO] = []
+    files: List[MapDocumentQuestionFileDTO] = []
+
+
+class MapDocumentRuleDTO(BaseModel):
+    """
+    node 와 start_nodes 는 Node 의 key 입니다.
+    start_nodes 의 Node 에서 이 Rule 로 들어오는 Arrow 가 만들어집니다.
+    """
+    key: str
+    name: str
+    node: str
+    questions: List[MapDocumentQuestionDTO] = []
+    start_nodes: List[str] = []
+
+
+class MapDocumentNodeDTO(BaseModel):
+    key: str
+    name: str
+    title: str
+    description: str = ''
+    background_image: Optional[str] = None
+    is_active: bool = True
+    position_x: float
+    position_y: float
+    width: float = 100
+    height: float = 100
+
+
+class MapDocumentMapDTO(BaseModel):
+    name: str
+    description: str = ''
+    icon_image: str = ''
+    background_image: str = ''
+    is_private: bool = False
+
+
+class MapDocumentDTO(BaseModel):
+    """
+    import_map / export_map 에서 사용하는 Map 전체 구조 문서입니다.
+    Node / Rule 은 DB id 대신 문서 안에서만 쓰는 key 로 서로를 참조합니다.
+    """
+    map: MapDocumentMapDTO
+    nodes: List[MapDocumentNodeDTO] = []
+    rules: List[MapDocumentRuleDTO] = []
@@ -1,6 +1,9 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    Field,
+)
 from rest_framework.request import Request
 
 
@@ -38,3 +41,13 @@ class MyMapListRequestDTO(BaseModel):
             search=request.query_params.get('search'),
             category_id=request.query_params.get('category_id'),
         )
+
+
+class MapForkRequestDTO(BaseModel):
+    name: Optional[str] = Field(default=None, min_length=1, max_length=255)
+
+    @classmethod
+    def of(cls, request: Request) -> 'MapForkRequestDTO':
+        return cls(
+            name=request.data.get('name'),
+        )
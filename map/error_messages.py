@@ -10,3 +10,7 @@ class MapInvalidInputResponseErrorStatus(StrValueLabel):
         'invalid-feedback-input',
         '입력값을 다시 한번 확인해주세요.',
     )
+    INVALID_INPUT_MAP_FORK_ERROR_400 = (
+        'invalid-map-fork-input',
+        '입력값을 다시 한번 확인해주세요.',
+    )
@@ -0,0 +1,255 @@
+import json
+import random
+import statistics
+import time
+import uuid
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import (
+    connection,
+    transaction,
+)
+from django.test.utils import CaptureQueriesContext
+
+from map.consts import MapSeedShape
+from map.models import Node
+from map.services.map_seed_service import MapSeedService
+from map_graph.consts import MAP_GRAPH_SNAPSHOT_CACHE_KEY
+from map_graph.services.map_graph_service import MapGraphService
+from map_graph.services.map_graph_snapshot_service import (
+    clear_local_map_graph_snapshots,
+    get_map_graph_snapshot,
+    get_map_graph_version,
+)
+from member.models import Member
+from node.services.node_detail_service import NodeDetailService
+from play.models import MapPlayMember
+from play.services import MapPlayProgressService
+from question.models import Question
+from question.services.member_answer_service import MemberAnswerService
+from question.services.node_completion_service import NodeCompletionService
+
+
+class Command(BaseCommand):
+    """
+    python manage.py benchmark_map
+    python manage.py benchmark_map --shape dag --nodes 100 1000 5000 --plays 10 --output after.json --compare before.json
+
+    크기별로 가상 Map 과 MapPlay 를 만들고 주요 경로의 실행 시간(중앙값)과 SQL 쿼리 수를 측정합니다.
+    측정이 끝나면 만든 데이터는 롤백합니다. (--keep 으로 남길 수 있음)
+    """
+    help = '가상 Map 크기별로 그래프 조회, Node 상세, 답변 제출, Node 완료 처리의 시간과 쿼리 수를 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--shape', choices=[shape.value for shape in MapSeedShape], default=MapSeedShape.DAG.value, help='Map 형태')
+        parser.add_argument('--nodes', type=int, nargs='+', default=[100, 1000], help='측정할 Node 수 목록')
+        parser.add_argument('--rules-per-node', type=int, default=1, help='Node 별 Rule 수')
+        parser.add_argument('--fan-in', type=int, default=2, help='dag: Node 로 들어오는 최대 Arrow 수')
+        parser.add_argument('--fan-out', type=int, default=2, help='tree: Node 에서 나가는 Arrow 수')
+        parser.add_argument('--plays', type=int, default=5, help='Map 별 MapPlay 수')
+        parser.add_argument('--completion-ratio', type=float, default=0.5, help='풀 수 있는 Node 를 완료할 확률')
+        parser.add_argument('--repeat', type=int, default=5, help='경로별 반복 횟수')
+        parser.add_argument('--seed', type=int, default=7, help='난수 seed')
+        parser.add_argument('--output', type=str, default=None, help='결과 JSON 파일 경로')
+        parser.add_argument('--compare', type=str, default=None, help='비교할 이전 결과 JSON 파일 경로')
+        parser.add_argument('--keep', action='store_true', help='만든 Map 을 롤백하지 않고 남김')
+
+    def handle(self, *args, **options):
+        results = []
+        for node_count in options['nodes']:
+            results.extend(self._run(node_count, options))
+
+        report = {
+            'options': {
+                key: options[key]
+                for key in ('shape', 'nodes', 'rules_per_node', 'fan_in', 'fan_out', 'plays', 'completion_ratio', 'repeat', 'seed')
+            },
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"{options['output']} 에 저장했습니다."))
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as file:
+                self._compare(json.load(file)['results'], results)
+
+    def _run(self, node_count: int, options: dict) -> List[Dict]:
+        with transaction.atomic():
+            created_by = Member.objects.create(
+                username=f'benchmark-{uuid.uuid4().hex[:12]}',
+            )
+            seed_service = MapSeedService(random.Random(options['seed']))
+            map_obj = seed_service.seed_map(
+                created_by_id=created_by.id,
+                shape=options['shape'],
+                node_count=node_count,
+                rules_per_node=options['rules_per_node'],
+                fan_in=options['fan_in'],
+                fan_out=options['fan_out'],
+            )
+            map_play_members = seed_service.seed_plays(
+                map_obj.id,
+                max(1, options['plays']),
+                options['completion_ratio'],
+            )
+            results = self._measure_all(node_count, map_obj.id, map_play_members[0], options['repeat'])
+            if not options['keep']:
+                self._clear_snapshot(map_obj.id)
+                transaction.set_rollback(True)
+
+        for result in results:
+            self.stdout.write(
+                f"{result['nodes']:>7} {result['name']:<42} "
+                f"{result['median_ms']:>10.2f}ms (min {result['min_ms']:.2f}ms) {result['queries']:>5} queries"
+            )
+        return results
+
+    def _measure_all(self, node_count: int, map_id: int, map_play_member: MapPlayMember, repeat: int) -> List[Dict]:
+        member_id = map_play_member.member_id
+        map_play_member_id = map_play_member.id
+        map_play_id = map_play_member.map_play_id
+        progress = MapPlayProgressService().get_progress(map_play_id)
+        snapshot = get_map_graph_snapshot(map_id)
+        completed_node_ids = set(progress.completed_node_ids)
+        node_id = progress.completed_node_ids[0] if progress.completed_node_ids else next(iter(snapshot.nodes))
+
+        # 아직 완료되지 않았지만 시작 Node 가 모두 완료되어 바로 풀 수 있는 문제
+        answerable_arrow_ids = []
+        for candidate_node_id in snapshot.nodes:
+            if candidate_node_id in completed_node_ids:
+                continue
+            for rule_id in snapshot.rule_ids_by_node_id.get(candidate_node_id, ()):
+                arrow_ids = snapshot.arrow_ids_by_rule_id.get(rule_id, ())
+                if all(
+                    snapshot.arrows[arrow_id].start_node_id in completed_node_ids
+                    for arrow_id in arrow_ids
+                    if snapshot.arrows[arrow_id].start_node_id != candidate_node_id
+                ):
+                    answerable_arrow_ids.extend(
+                        arrow_id
+                        for arrow_id in arrow_ids
+                        if snapshot.arrows[arrow_id].start_node_id == candidate_node_id
+                    )
+                    break
+            if len(answerable_arrow_ids) >= repeat:
+                break
+        answerable_questions = list(
+            Question.objects.select_related(
+                'map',
+                'arrow',
+                'arrow__start_node',
+            ).filter(
+                arrow_id__in=answerable_arrow_ids[:repeat],
+                is_deleted=False,
+            )
+        )
+
+        results = [
+            self._measure(
+                'map_graph.get_nodes (cold snapshot)',
+                node_count,
+                repeat,
+                lambda _: MapGraphService(member_id).get_nodes(map_id, map_play_member_id),
+                before=lambda: self._clear_snapshot(map_id),
+            ),
+            self._measure(
+                'map_graph.get_nodes',
+                node_count,
+                repeat,
+                lambda _: MapGraphService(member_id).get_nodes(map_id, map_play_member_id),
+            ),
+            self._measure(
+                'map_graph.get_arrows',
+                node_count,
+                repeat,
+                lambda _: MapGraphService(member_id).get_arrows(map_id, map_play_member_id),
+            ),
+            self._measure(
+                'node_detail.get_node_detail',
+                node_count,
+                repeat,
+                lambda _: NodeDetailService(member_id, map_play_member_id).get_node_detail(node_id),
+            ),
+            self._measure(
+                'node_completion.process_nodes_completion',
+                node_count,
+                repeat,
+                lambda _: NodeCompletionService(member_id, map_play_member_id, map_play_id).process_nodes_completion(
+                    nodes=list(Node.objects.filter(id=node_id)),
+                ),
+            ),
+        ]
+        if answerable_questions:
+            results.append(
+                self._measure(
+                    'member_answer.create_answer',
+                    node_count,
+                    len(answerable_questions),
+                    lambda index: MemberAnswerService(
+                        answerable_questions[index],
+                        member_id,
+                        map_play_member_id,
+                        map_play_id,
+                    ).create_answer('', []),
+                )
+            )
+        return results
+
+    @staticmethod
+    def _measure(
+            name: str,
+            node_count: int,
+            repeat: int,
+            func: Callable[[int], object],
+            before: Optional[Callable[[], None]] = None,
+    ) -> Dict:
+        elapsed_ms_list = []
+        query_counts = []
+        for index in range(repeat):
+            if before:
+                before()
+            with CaptureQueriesContext(connection) as context:
+                started_at = time.perf_counter()
+                func(index)
+                elapsed_ms_list.append((time.perf_counter() - started_at) * 1000)
+            query_counts.append(len(context.captured_queries))
+        return {
+            'nodes': node_count,
+            'name': name,
+            'median_ms': round(statistics.median(elapsed_ms_list), 3),
+            'min_ms': round(min(elapsed_ms_list), 3),
+            'queries': max(query_counts),
+        }
+
+    @staticmethod
+    def _clear_snapshot(map_id: int) -> None:
+        clear_local_map_graph_snapshots()
+        cache.delete(MAP_GRAPH_SNAPSHOT_CACHE_KEY.format(map_id=map_id, version=get_map_graph_version(map_id)))
+
+    def _compare(self, base_results: List[Dict], results: List[Dict]) -> None:
+        base_result_by_key = {
+            (base_result['nodes'], base_result['name']): base_result
+            for base_result in base_results
+        }
+        for result in results:
+            base_result = base_result_by_key.get((result['nodes'], result['name']))
+            if base_result is None:
+                continue
+            ratio = result['median_ms'] / base_result['median_ms'] if base_result['median_ms'] else 0
+            line = (
+                f"{result['nodes']:>7} {result['name']:<42} "
+                f"{base_result['median_ms']:>10.2f}ms -> {result['median_ms']:.2f}ms (x{ratio:.2f}), "
+                f"queries {base_result['queries']} -> {result['queries']}"
+            )
+            if result['queries'] > base_result['queries']:
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from map.models import Map
+from map_graph.services.map_graph_snapshot_service import (
+    increase_map_graph_version,
+    save_map_graph_topology,
+)
+from play.services import MapPlayNodeStatisticService
+
+
+class Command(BaseCommand):
+    """
+    python manage.py compile_map_graph
+    python manage.py compile_map_graph --map-id 1 --map-id 2
+    """
+    help = (
+        'Map 구조를 다시 컴파일해서 저장하고 MapPlay 별 Node 통계를 다시 계산한 뒤 '
+        '순환, 고아 Rule, 완료할 수 없는 Node 를 출력합니다. (SQL 로 Map 을 만들거나 수정한 경우 실행)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--map-id', type=int, action='append', help='특정 Map 만 처리 (여러 번 지정 가능)')
+
+    def handle(self, *args, **options):
+        maps = Map.objects.filter(is_deleted=False).order_by('id')
+        if options['map_id']:
+            maps = maps.filter(id__in=options['map_id'])
+
+        statistic_service = MapPlayNodeStatisticService()
+        invalid_count = 0
+        map_ids = list(maps.values_list('id', flat=True))
+        for map_id in map_ids:
+            increase_map_graph_version(map_id)
+            topology = save_map_graph_topology(map_id)
+            statistic_service.rebuild_map_statistics(map_id)
+            if topology.is_valid:
+                continue
+            invalid_count += 1
+            self.stdout.write(
+                self.style.WARNING(
+                    f'{map_id} 맵 - 순환 Node: {list(topology.cycle_node_ids)}, '
+                    f'고아 Rule: {list(topology.orphan_rule_ids)}, '
+                    f'완료할 수 없는 Node: {list(topology.unreachable_node_ids)}'
+                )
+            )
+        self.stdout.write(self.style.SUCCESS(f'{len(map_ids)}개 Map 을 컴파일했습니다. (확인 필요: {invalid_count}개)'))
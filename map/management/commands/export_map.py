@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+import yaml
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+from map.exceptions import MapNotFoundException
+from map.services.map_document_service import MapDocumentService
+
+
+class Command(BaseCommand):
+    """
+    python manage.py export_map 1
+    python manage.py export_map 1 --output map.yaml
+    python manage.py export_map 1 --format yaml
+    """
+    help = 'Map 구조(Node, Rule, Arrow, 문제, 정답, 문제 파일)를 import_map 에서 읽을 수 있는 JSON/YAML 문서로 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('map_id', type=int, help='Map id')
+        parser.add_argument('--output', type=str, help='저장할 파일 경로 (없으면 표준 출력)')
+        parser.add_argument('--format', choices=['json', 'yaml'], help='문서 형식 (없으면 --output 확장자로 결정, 기본 json)')
+
+    def handle(self, *args, **options):
+        try:
+            document = MapDocumentService().export_map(options['map_id'])
+        except MapNotFoundException:
+            raise CommandError(f"{options['map_id']} Map 이 없습니다.")
+
+        output = options['output']
+        output_format = options['format']
+        if not output_format:
+            output_format = 'yaml' if output and Path(output).suffix in ('.yaml', '.yml') else 'json'
+
+        data = document.model_dump(mode='json')
+        if output_format == 'yaml':
+            text = yaml.safe_dump(data, allow_unicode=True, sort_keys=False)
+        else:
+            text = json.dumps(data, ensure_ascii=False, indent=2)
+
+        if not output:
+            self.stdout.write(text)
+            return
+        Path(output).write_text(text, encoding='utf-8')
+        self.stdout.write(
+            self.style.SUCCESS(f'{len(document.nodes)}개 Node, {len(document.rules)}개 Rule 을 {output} 에 저장했습니다.')
+        )
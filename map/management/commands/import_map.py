@@ -0,0 +1,68 @@
+import json
+import time
+from pathlib import Path
+
+import yaml
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from pydantic import ValidationError
+
+from map.dtos.map_document import MapDocumentDTO
+from map.services.map_document_service import MapDocumentService
+
+
+def read_map_document(path: str) -> MapDocumentDTO:
+    """
+    .yaml / .yml 은 YAML, 그 외는 JSON 으로 읽습니다.
+    """
+    text = Path(path).read_text(encoding='utf-8')
+    if Path(path).suffix in ('.yaml', '.yml'):
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    return MapDocumentDTO.model_validate(data)
+
+
+class Command(BaseCommand):
+    """
+    python manage.py import_map map.json --created-by 1
+    python manage.py import_map map.yaml --created-by 1 --dry-run
+    """
+    help = 'Map 구조 문서(JSON/YAML)를 검증하고 한 트랜잭션으로 새 Map 을 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=str, help='Map 구조 문서 경로 (.json, .yaml, .yml)')
+        parser.add_argument('--created-by', type=int, help='Map 생성자 Member id (--dry-run 이 아니면 필수)')
+        parser.add_argument('--dry-run', action='store_true', help='검증 결과만 출력하고 저장하지 않음')
+
+    def handle(self, *args, **options):
+        try:
+            document = read_map_document(options['path'])
+        except (OSError, ValueError, ValidationError, yaml.YAMLError) as e:
+            raise CommandError(f'문서를 읽을 수 없습니다: {e}')
+
+        service = MapDocumentService()
+        errors, warnings = service.validate(document)
+        for warning in warnings:
+            self.stdout.write(self.style.WARNING(warning))
+        if errors:
+            raise CommandError('\n'.join(errors))
+
+        question_count = sum(len(rule.questions) for rule in document.rules)
+        summary = (
+            f'Node {len(document.nodes)}개, Rule {len(document.rules)}개, '
+            f'Arrow {sum(len(rule.start_nodes) for rule in document.rules) + question_count}개, '
+            f'문제 {question_count}개'
+        )
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'[dry-run] 검증 완료: {summary}'))
+            return
+        if not options['created_by']:
+            raise CommandError('--created-by 를 입력해주세요.')
+
+        started_at = time.perf_counter()
+        map_obj = service.import_map(document, options['created_by'])
+        elapsed = time.perf_counter() - started_at
+        self.stdout.write(self.style.SUCCESS(f'{map_obj.id} Map 을 만들었습니다: {summary} ({elapsed:.2f}s)'))
@@ -0,0 +1,48 @@
+import random
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+from map.consts import MapSeedShape
+from map.services.map_seed_service import MapSeedService
+from member.models import Member
+
+
+class Command(BaseCommand):
+    """
+    python manage.py seed_map --created-by 1 --shape chain --nodes 2000
+    python manage.py seed_map --created-by 1 --shape dag --nodes 5000 --rules-per-node 2 --fan-in 3 --plays 100 --seed 7
+    """
+    help = '성능 측정용 가상 Map (chain / tree / dag) 과 무작위로 진행된 MapPlay 를 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--created-by', type=int, required=True, help='Map 생성자 Member id')
+        parser.add_argument('--shape', choices=[shape.value for shape in MapSeedShape], default=MapSeedShape.DAG.value, help='Map 형태')
+        parser.add_argument('--nodes', type=int, default=1000, help='Node 수')
+        parser.add_argument('--rules-per-node', type=int, default=1, help='Node 별 Rule 수')
+        parser.add_argument('--fan-in', type=int, default=2, help='dag: Node 로 들어오는 최대 Arrow 수')
+        parser.add_argument('--fan-out', type=int, default=2, help='tree: Node 에서 나가는 Arrow 수')
+        parser.add_argument('--plays', type=int, default=0, help='만들 MapPlay 수')
+        parser.add_argument('--completion-ratio', type=float, default=0.5, help='풀 수 있는 Node 를 완료할 확률')
+        parser.add_argument('--seed', type=int, default=None, help='난수 seed')
+
+    def handle(self, *args, **options):
+        if not Member.objects.filter(id=options['created_by']).exists():
+            raise CommandError(f"{options['created_by']} Member 가 없습니다.")
+
+        service = MapSeedService(random.Random(options['seed']))
+        map_obj = service.seed_map(
+            created_by_id=options['created_by'],
+            shape=options['shape'],
+            node_count=options['nodes'],
+            rules_per_node=options['rules_per_node'],
+            fan_in=options['fan_in'],
+            fan_out=options['fan_out'],
+        )
+        self.stdout.write(f"{map_obj.id} 맵 생성 ({options['shape']}, Node {options['nodes']}개)")
+        if options['plays']:
+            service.seed_plays(map_obj.id, options['plays'], options['completion_ratio'])
+            self.stdout.write(f"MapPlay {options['plays']}개 생성")
+        self.stdout.write(self.style.SUCCESS(f'{map_obj.id} 맵을 만들었습니다.'))
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.10 on 2026-10-18 15:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0015_remove_arrow_question'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='map',
+            name='graph_version',
+            field=models.BigIntegerField(default=0, help_text='Node/Arrow/NodeCompleteRule 구조 버전'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.1.10 on 2026-10-18 16:16
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def forward(apps, schema_editor):
+    # 기존 이력에 MapPlay 채우기
+    for table in ('map_arrowprogress', 'map_nodecompletedhistory'):
+        schema_editor.execute(
+            f'UPDATE {table} AS history '
+            f'SET map_play_id = map_play_member.map_play_id '
+            f'FROM play_mapplaymember AS map_play_member '
+            f'WHERE history.map_play_member_id = map_play_member.id '
+            f'AND history.map_play_id IS NULL'
+        )
+
+    # 같은 MapPlay 에서 중복 생성된 이력 정리 (해결된 것, 먼저 생성된 것을 남김)
+    schema_editor.execute(
+        'DELETE FROM map_arrowprogress WHERE id IN ('
+        'SELECT id FROM ('
+        'SELECT id, ROW_NUMBER() OVER (PARTITION BY map_play_id, arrow_id ORDER BY is_resolved DESC, id) AS row_number '
+        'FROM map_arrowprogress WHERE map_play_id IS NOT NULL'
+        ') AS duplicated WHERE duplicated.row_number > 1'
+        ')'
+    )
+    schema_editor.execute(
+        'DELETE FROM map_nodecompletedhistory WHERE id IN ('
+        'SELECT id FROM ('
+        'SELECT id, ROW_NUMBER() OVER (PARTITION BY map_play_id, node_id, node_complete_rule_id ORDER BY id) AS row_number '
+        'FROM map_nodecompletedhistory WHERE map_play_id IS NOT NULL'
+        ') AS duplicated WHERE duplicated.row_number > 1'
+        ')'
+    )
+
+
+def backward(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('play', '0006_mapplaynodestatistic'),
+        ('map', '0016_map_graph_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arrowprogress',
+            name='map_play',
+            field=models.ForeignKey(blank=True, help_text='맵 플레이', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='arrow_progresses', to='play.mapplay'),
+        ),
+        migrations.AddField(
+            model_name='nodecompletedhistory',
+            name='map_play',
+            field=models.ForeignKey(blank=True, help_text='맵 플레이', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='node_completed_histories', to='play.mapplay'),
+        ),
+        migrations.RunPython(forward, backward),
+    ]
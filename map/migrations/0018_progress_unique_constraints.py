@@ -0,0 +1,21 @@
+# Generated by Django 4.1.10 on 2026-10-18 16:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0017_progress_map_play'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='arrowprogress',
+            constraint=models.UniqueConstraint(fields=('map_play', 'arrow'), name='unique_map_play_arrow_progress'),
+        ),
+        migrations.AddConstraint(
+            model_name='nodecompletedhistory',
+            constraint=models.UniqueConstraint(fields=('map_play', 'node', 'node_complete_rule'), name='unique_map_play_node_completed_history'),
+        ),
+    ]
@@ -20,6 +20,14 @@ class ArrowProgress(models.Model):
         related_name='arrow_progresses',
         help_text='진행 중인 사용자',
     )
+    map_play = models.ForeignKey(
+        'play.MapPlay',
+        on_delete=models.DO_NOTHING,
+        related_name='arrow_progresses',
+        help_text='맵 플레이',
+        null=True,
+        blank=True,
+    )
     map_play_member = models.ForeignKey(
         'play.MapPlayMember',
         on_delete=models.DO_NOTHING,
@@ -36,6 +44,12 @@ class ArrowProgress(models.Model):
     class Meta:
         verbose_name = 'Arrow 진행상태'
         verbose_name_plural = 'Arrow 진행상태'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['map_play', 'arrow'],
+                name='unique_map_play_arrow_progress',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.member.nickname}의 {self.arrow} 진행상태'
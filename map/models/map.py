@@ -11,6 +11,7 @@ class Map(models.Model):
     background_image = models.CharField(max_length=2048, help_text='배경 이미지')
     subscriber_count = models.BigIntegerField(default=0, help_text='구독자 수', db_index=True)
     play_count = models.BigIntegerField(default=0, help_text='플레이 횟수', db_index=True)
+    graph_version = models.BigIntegerField(default=0, help_text='Node/Arrow/NodeCompleteRule 구조 버전')
     created_by = models.ForeignKey(
         Member,
         on_delete=models.DO_NOTHING,
@@ -26,6 +26,14 @@ class NodeCompletedHistory(models.Model):
         related_name='node_completed_histories',
         help_text='해금 규칙',
     )
+    map_play = models.ForeignKey(
+        'play.MapPlay',
+        on_delete=models.DO_NOTHING,
+        related_name='node_completed_histories',
+        help_text='맵 플레이',
+        null=True,
+        blank=True,
+    )
     map_play_member = models.ForeignKey(
         'play.MapPlayMember',
         on_delete=models.DO_NOTHING,
@@ -40,6 +48,12 @@ class NodeCompletedHistory(models.Model):
     class Meta:
         verbose_name = '노드 해금 이력'
         verbose_name_plural = '노드 해금 이력'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['map_play', 'node', 'node_complete_rule'],
+                name='unique_map_play_node_completed_history',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.member.nickname}의 {self.node.name} 해금'
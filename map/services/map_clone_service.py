@@ -0,0 +1,278 @@
+from typing import Optional
+
+from django.db import (
+    connection,
+    transaction,
+)
+
+from map.consts import MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE
+from map.exceptions import MapNotFoundException
+from map.models import (
+    Arrow,
+    Map,
+    MapCategory,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.services.map_graph_snapshot_service import save_map_graph_topology
+from question.models import (
+    Question,
+    QuestionAnswer,
+    QuestionFile,
+)
+from subscription.services.subscription_service import MapSubscriptionService
+
+
+class MapCloneService:
+    """
+    Map 전체 구조(Node, NodeCompleteRule, Arrow, Question, QuestionAnswer, QuestionFile)를
+    새 Map 으로 복제합니다.
+    원본은 잠금 없이 values() 로 읽고, 테이블 단위로 bulk_create 하면서 원본 id -> 새 id 를 매핑합니다.
+    원본 읽기와 복제는 한 트랜잭션에서 수행하며, 최상위 트랜잭션이면 REPEATABLE READ 로 같은 스냅샷을 읽습니다.
+    """
+    def __init__(self, member_id: int):
+        self.member_id = member_id
+
+    def _get_source_map(self, map_id: int) -> Map:
+        """
+        공개 Map, 내가 만든 Map, 구독한 비공개 Map 만 복제할 수 있습니다.
+        """
+        map_obj = Map.objects.filter(id=map_id, is_deleted=False).first()
+        if map_obj is None:
+            raise MapNotFoundException()
+        if not map_obj.is_private or map_obj.created_by_id == self.member_id:
+            return map_obj
+
+        subscription_status = MapSubscriptionService(
+            member_id=self.member_id,
+        ).get_subscription_status_by_map_ids([map_id])
+        if not subscription_status[map_id]:
+            raise MapNotFoundException()
+        return map_obj
+
+    def clone_map(self, map_id: int, name: Optional[str] = None) -> Map:
+        """
+        삭제되지 않은 구조만 복제하며, 복제한 Map 은 비공개로 만들어집니다.
+        Node 수와 관계없이 쿼리 수가 일정합니다.
+        """
+        source_map = self._get_source_map(map_id)
+
+        is_outermost_transaction = not connection.in_atomic_block
+        with transaction.atomic():
+            if is_outermost_transaction and connection.vendor == 'postgresql':
+                # 원본 읽기 도중 편집이 끼어들어도 테이블 간 id 참조가 어긋나지 않도록 같은 스냅샷에서 읽음
+                with connection.cursor() as cursor:
+                    cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ')
+
+            # 원본 읽기 (잠금 없음)
+            source_nodes = list(
+                Node.objects.filter(
+                    map_id=map_id,
+                    is_deleted=False,
+                ).order_by(
+                    'id',
+                ).values(
+                    'id',
+                    'name',
+                    'title',
+                    'description',
+                    'background_image',
+                    'is_active',
+                    'position_x',
+                    'position_y',
+                    'width',
+                    'height',
+                )
+            )
+            source_rules = list(
+                NodeCompleteRule.objects.filter(
+                    map_id=map_id,
+                    is_deleted=False,
+                ).order_by(
+                    'id',
+                ).values(
+                    'id',
+                    'name',
+                    'node_id',
+                )
+            )
+            source_arrows = list(
+                Arrow.objects.filter(
+                    map_id=map_id,
+                    is_deleted=False,
+                ).order_by(
+                    'id',
+                ).values(
+                    'id',
+                    'start_node_id',
+                    'node_complete_rule_id',
+                )
+            )
+            source_questions = list(
+                Question.objects.filter(
+                    map_id=map_id,
+                    is_deleted=False,
+                ).order_by(
+                    'id',
+                ).values(
+                    'id',
+                    'arrow_id',
+                    'title',
+                    'question_types',
+                    'description',
+                    'answer_validation_type',
+                    'is_by_pass',
+                    'default_success_feedback',
+                    'default_failure_feedback',
+                )
+            )
+            source_answers = list(
+                QuestionAnswer.objects.filter(
+                    map_id=map_id,
+                    is_deleted=False,
+                ).order_by(
+                    'id',
+                ).values(
+                    'question_id',
+                    'answer',
+                    'description',
+                )
+            )
+            source_files = list(
+                QuestionFile.objects.filter(
+                    map_id=map_id,
+                ).order_by(
+                    'id',
+                ).values(
+                    'question_id',
+                    'name',
+                    'file',
+                )
+            )
+            category_ids = list(
+                MapCategory.objects.filter(
+                    map_id=map_id,
+                    is_deleted=False,
+                ).values_list(
+                    'category_id',
+                    flat=True,
+                )
+            )
+
+            new_map = Map.objects.create(
+                name=name or source_map.name,
+                description=source_map.description,
+                icon_image=source_map.icon_image,
+                background_image=source_map.background_image,
+                created_by_id=self.member_id,
+                is_private=True,
+            )
+            MapCategory.objects.bulk_create(
+                [
+                    MapCategory(
+                        map=new_map,
+                        category_id=category_id,
+                    )
+                    for category_id in category_ids
+                ]
+            )
+
+            nodes = Node.objects.bulk_create(
+                [
+                    Node(
+                        map=new_map,
+                        **{key: value for key, value in source_node.items() if key != 'id'},
+                    )
+                    for source_node in source_nodes
+                ],
+                batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+            )
+            node_id_map = {
+                source_node['id']: node.id
+                for source_node, node in zip(source_nodes, nodes)
+            }
+
+            # 삭제된 Node 를 가리키는 Rule / Arrow 는 복제하지 않음
+            source_rules = [rule for rule in source_rules if rule['node_id'] in node_id_map]
+            rules = NodeCompleteRule.objects.bulk_create(
+                [
+                    NodeCompleteRule(
+                        map=new_map,
+                        name=source_rule['name'],
+                        node_id=node_id_map[source_rule['node_id']],
+                    )
+                    for source_rule in source_rules
+                ],
+                batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+            )
+            rule_id_map = {
+                source_rule['id']: rule.id
+                for source_rule, rule in zip(source_rules, rules)
+            }
+
+            source_arrows = [
+                arrow
+                for arrow in source_arrows
+                if arrow['start_node_id'] in node_id_map and arrow['node_complete_rule_id'] in rule_id_map
+            ]
+            arrows = Arrow.objects.bulk_create(
+                [
+                    Arrow(
+                        map=new_map,
+                        start_node_id=node_id_map[source_arrow['start_node_id']],
+                        node_complete_rule_id=rule_id_map[source_arrow['node_complete_rule_id']],
+                    )
+                    for source_arrow in source_arrows
+                ],
+                batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+            )
+            arrow_id_map = {
+                source_arrow['id']: arrow.id
+                for source_arrow, arrow in zip(source_arrows, arrows)
+            }
+
+            # 복제되지 않은 Arrow 에 연결된 문제는 Arrow 없이 복제
+            questions = Question.objects.bulk_create(
+                [
+                    Question(
+                        map=new_map,
+                        arrow_id=arrow_id_map.get(source_question['arrow_id']),
+                        **{key: value for key, value in source_question.items() if key not in ('id', 'arrow_id')},
+                    )
+                    for source_question in source_questions
+                ],
+                batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+            )
+            question_id_map = {
+                source_question['id']: question.id
+                for source_question, question in zip(source_questions, questions)
+            }
+
+            QuestionAnswer.objects.bulk_create(
+                [
+                    QuestionAnswer(
+                        map=new_map,
+                        question_id=question_id_map[source_answer['question_id']],
+                        answer=source_answer['answer'],
+                        description=source_answer['description'],
+                    )
+                    for source_answer in source_answers
+                    if source_answer['question_id'] in question_id_map
+                ],
+                batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+            )
+            QuestionFile.objects.bulk_create(
+                [
+                    QuestionFile(
+                        map=new_map,
+                        question_id=question_id_map[source_file['question_id']],
+                        name=source_file['name'],
+                        file=source_file['file'],
+                    )
+                    for source_file in source_files
+                    if source_file['question_id'] in question_id_map
+                ],
+                batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+            )
+            save_map_graph_topology(new_map.id)
+        return new_map
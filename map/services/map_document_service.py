@@ -0,0 +1,328 @@
+from collections import Counter
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from django.db import transaction
+from django.db.models import Prefetch
+
+from map.consts import MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE
+from map.dtos.map_document import (
+    MapDocumentDTO,
+    MapDocumentMapDTO,
+    MapDocumentNodeDTO,
+    MapDocumentQuestionAnswerDTO,
+    MapDocumentQuestionDTO,
+    MapDocumentQuestionFileDTO,
+    MapDocumentRuleDTO,
+)
+from map.exceptions import MapNotFoundException
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.dtos.map_graph_snapshot import (
+    SnapshotArrow,
+    SnapshotNode,
+    SnapshotRule,
+)
+from map_graph.services.map_graph_snapshot_service import (
+    compile_map_graph_topology,
+    save_map_graph_topology,
+)
+from question.models import (
+    Question,
+    QuestionAnswer,
+    QuestionFile,
+)
+
+
+class MapDocumentService:
+    """
+    Map 전체 구조(Node, NodeCompleteRule, Arrow, Question, QuestionAnswer, QuestionFile)를
+    하나의 문서로 내보내고 가져옵니다.
+    """
+
+    def validate(self, document: MapDocumentDTO) -> Tuple[List[str], List[str]]:
+        """
+        문서를 검증해서 (오류 목록, 경고 목록)을 반환합니다.
+        - 오류: key 중복, 없는 Node 참조, 순환
+        - 경고: Arrow / 문제가 없는 Rule, 완료할 수 없는 Node
+        """
+        errors = []
+        for key, count in Counter(node.key for node in document.nodes).items():
+            if count > 1:
+                errors.append(f"Node key '{key}' 가 {count}번 사용되었습니다.")
+        for key, count in Counter(rule.key for rule in document.rules).items():
+            if count > 1:
+                errors.append(f"Rule key '{key}' 가 {count}번 사용되었습니다.")
+
+        node_keys = {node.key for node in document.nodes}
+        for rule in document.rules:
+            if rule.node not in node_keys:
+                errors.append(f"'{rule.key}' Rule 의 node '{rule.node}' 가 없습니다.")
+            for start_node in rule.start_nodes:
+                if start_node not in node_keys:
+                    errors.append(f"'{rule.key}' Rule 의 start_nodes '{start_node}' 가 없습니다.")
+                elif start_node == rule.node:
+                    errors.append(f"'{rule.key}' Rule 의 self arrow 는 start_nodes 대신 questions 로 만들어주세요.")
+        if errors:
+            return errors, []
+
+        # 문서 안의 순서를 임시 id 로 사용해서 Map 구조를 컴파일
+        nodes, arrows, rules = self._get_snapshot_items(document)
+        topology = compile_map_graph_topology(nodes, arrows, rules)
+        warnings = []
+        if topology.cycle_node_ids:
+            errors.append(f'순환이 있습니다: {[document.nodes[node_id].key for node_id in topology.cycle_node_ids]}')
+        if topology.orphan_rule_ids:
+            warnings.append(
+                f'Arrow 와 문제가 없는 Rule: {[document.rules[rule_id].key for rule_id in topology.orphan_rule_ids]}'
+            )
+        unreachable_node_ids = set(topology.unreachable_node_ids) - set(topology.cycle_node_ids)
+        if unreachable_node_ids:
+            warnings.append(
+                f'완료할 수 없는 Node: {[document.nodes[node_id].key for node_id in sorted(unreachable_node_ids)]}'
+            )
+        return errors, warnings
+
+    @transaction.atomic
+    def import_map(self, document: MapDocumentDTO, created_by_id: int) -> Map:
+        """
+        검증된 문서로 새 Map 을 만듭니다.
+        테이블 단위로 bulk_create 하므로 Node 수와 관계없이 INSERT 횟수가 일정합니다.
+        """
+        map_obj = Map.objects.create(
+            created_by_id=created_by_id,
+            **document.map.model_dump(),
+        )
+        nodes = Node.objects.bulk_create(
+            [
+                Node(
+                    map=map_obj,
+                    **node.model_dump(exclude={'key'}),
+                )
+                for node in document.nodes
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+        node_by_key = {document_node.key: node for document_node, node in zip(document.nodes, nodes)}
+        rules = NodeCompleteRule.objects.bulk_create(
+            [
+                NodeCompleteRule(
+                    map=map_obj,
+                    name=rule.name,
+                    node=node_by_key[rule.node],
+                )
+                for rule in document.rules
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+
+        # 문제마다 self arrow 하나, start_nodes 마다 Arrow 하나
+        self_arrows = []
+        self_arrow_questions = []
+        arrows = []
+        for document_rule, rule in zip(document.rules, rules):
+            for question in document_rule.questions:
+                self_arrows.append(
+                    Arrow(
+                        map=map_obj,
+                        start_node=node_by_key[document_rule.node],
+                        node_complete_rule=rule,
+                    )
+                )
+                self_arrow_questions.append(question)
+            for start_node in document_rule.start_nodes:
+                arrows.append(
+                    Arrow(
+                        map=map_obj,
+                        start_node=node_by_key[start_node],
+                        node_complete_rule=rule,
+                    )
+                )
+        Arrow.objects.bulk_create(self_arrows + arrows, batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE)
+
+        questions = Question.objects.bulk_create(
+            [
+                Question(
+                    map=map_obj,
+                    arrow=arrow,
+                    **question.model_dump(mode='json', exclude={'answers', 'files'}),
+                )
+                for arrow, question in zip(self_arrows, self_arrow_questions)
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+        QuestionAnswer.objects.bulk_create(
+            [
+                QuestionAnswer(
+                    map=map_obj,
+                    question=question,
+                    **answer.model_dump(),
+                )
+                for question, document_question in zip(questions, self_arrow_questions)
+                for answer in document_question.answers
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+        QuestionFile.objects.bulk_create(
+            [
+                QuestionFile(
+                    map=map_obj,
+                    question=question,
+                    **file.model_dump(),
+                )
+                for question, document_question in zip(questions, self_arrow_questions)
+                for file in document_question.files
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+        save_map_graph_topology(map_obj.id)
+        return map_obj
+
+    def export_map(self, map_id: int) -> MapDocumentDTO:
+        """
+        삭제되지 않은 Map 구조를 문서로 만듭니다. key 는 node-<id>, rule-<id> 형태입니다.
+        문제가 연결되지 않은 self arrow 는 문서로 표현할 수 없으므로 제외됩니다.
+        """
+        map_obj = Map.objects.filter(id=map_id, is_deleted=False).first()
+        if map_obj is None:
+            raise MapNotFoundException()
+
+        nodes = list(Node.objects.filter(map_id=map_id, is_deleted=False).order_by('id'))
+        node_ids = {node.id for node in nodes}
+        rules = [
+            rule
+            for rule in NodeCompleteRule.objects.filter(map_id=map_id, is_deleted=False).order_by('id')
+            if rule.node_id in node_ids
+        ]
+        start_node_ids_by_rule_id: Dict[int, List[int]] = {rule.id: [] for rule in rules}
+        for start_node_id, rule_id, end_node_id in Arrow.objects.filter(
+            map_id=map_id,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values_list(
+            'start_node_id',
+            'node_complete_rule_id',
+            'node_complete_rule__node_id',
+        ):
+            if start_node_id != end_node_id and start_node_id in node_ids and rule_id in start_node_ids_by_rule_id:
+                start_node_ids_by_rule_id[rule_id].append(start_node_id)
+
+        questions_by_rule_id: Dict[int, List[MapDocumentQuestionDTO]] = {rule.id: [] for rule in rules}
+        questions = Question.objects.filter(
+            map_id=map_id,
+            is_deleted=False,
+            arrow__is_deleted=False,
+        ).select_related(
+            'arrow__node_complete_rule',
+        ).prefetch_related(
+            Prefetch('answers', queryset=QuestionAnswer.objects.filter(is_deleted=False).order_by('id')),
+            Prefetch('files', queryset=QuestionFile.objects.order_by('id')),
+        ).order_by(
+            'id',
+        )
+        for question in questions:
+            arrow = question.arrow
+            if arrow.start_node_id != arrow.node_complete_rule.node_id:
+                continue
+            if arrow.node_complete_rule_id not in questions_by_rule_id:
+                continue
+            questions_by_rule_id[arrow.node_complete_rule_id].append(
+                MapDocumentQuestionDTO(
+                    title=question.title,
+                    description=question.description,
+                    question_types=question.question_types,
+                    answer_validation_type=question.answer_validation_type,
+                    is_by_pass=question.is_by_pass,
+                    default_success_feedback=question.default_success_feedback,
+                    default_failure_feedback=question.default_failure_feedback,
+                    answers=[
+                        MapDocumentQuestionAnswerDTO(answer=answer.answer, description=answer.description)
+                        for answer in question.answers.all()
+                    ],
+                    files=[
+                        MapDocumentQuestionFileDTO(name=file.name, file=file.file)
+                        for file in question.files.all()
+                    ],
+                )
+            )
+
+        return MapDocumentDTO(
+            map=MapDocumentMapDTO(
+                name=map_obj.name,
+                description=map_obj.description,
+                icon_image=map_obj.icon_image,
+                background_image=map_obj.background_image,
+                is_private=map_obj.is_private,
+            ),
+            nodes=[
+                MapDocumentNodeDTO(
+                    key=f'node-{node.id}',
+                    name=node.name,
+                    title=node.title,
+                    description=node.description,
+                    background_image=node.background_image,
+                    is_active=node.is_active,
+                    position_x=node.position_x,
+                    position_y=node.position_y,
+                    width=node.width,
+                    height=node.height,
+                )
+                for node in nodes
+            ],
+            rules=[
+                MapDocumentRuleDTO(
+                    key=f'rule-{rule.id}',
+                    name=rule.name,
+                    node=f'node-{rule.node_id}',
+                    questions=questions_by_rule_id[rule.id],
+                    start_nodes=[f'node-{start_node_id}' for start_node_id in start_node_ids_by_rule_id[rule.id]],
+                )
+                for rule in rules
+            ],
+        )
+
+    @staticmethod
+    def _get_snapshot_items(
+            document: MapDocumentDTO,
+    ) -> Tuple[List[SnapshotNode], List[SnapshotArrow], List[SnapshotRule]]:
+        """
+        문서의 Node / Rule 순서(index)를 id 로 사용하는 Snapshot 항목을 만듭니다.
+        """
+        node_id_by_key = {node.key: node_id for node_id, node in enumerate(document.nodes)}
+        nodes = [
+            SnapshotNode(
+                id=node_id,
+                name=node.name,
+                title=node.title,
+                position_x=node.position_x,
+                position_y=node.position_y,
+                width=node.width,
+                height=node.height,
+                is_active=node.is_active,
+            )
+            for node_id, node in enumerate(document.nodes)
+        ]
+        rules = []
+        arrows = []
+        for rule_id, rule in enumerate(document.rules):
+            node_id = node_id_by_key[rule.node]
+            rules.append(SnapshotRule(id=rule_id, name=rule.name, node_id=node_id))
+            start_node_ids = [node_id] * len(rule.questions) + [node_id_by_key[key] for key in rule.start_nodes]
+            for start_node_id in start_node_ids:
+                arrows.append(
+                    SnapshotArrow(
+                        id=len(arrows),
+                        start_node_id=start_node_id,
+                        end_node_id=node_id,
+                        node_complete_rule_id=rule_id,
+                    )
+                )
+        return nodes, arrows, rules
@@ -0,0 +1,231 @@
+import random
+from collections import defaultdict
+from typing import (
+    Dict,
+    List,
+    Set,
+)
+
+from django.db import transaction
+
+from map.consts import (
+    MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+    MapSeedShape,
+)
+from map.dtos.map_document import (
+    MapDocumentDTO,
+    MapDocumentMapDTO,
+    MapDocumentNodeDTO,
+    MapDocumentQuestionDTO,
+    MapDocumentRuleDTO,
+)
+from map.models import (
+    Arrow,
+    ArrowProgress,
+    Map,
+    NodeCompletedHistory,
+    NodeCompleteRule,
+)
+from map.services.map_document_service import MapDocumentService
+from map_graph.services.map_graph_snapshot_service import get_map_graph_snapshot
+from member.models import Member
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from play.services import (
+    MapPlayNodeStatisticService,
+    MapPlayProgressService,
+)
+
+
+def get_seed_start_node_indexes(
+        shape: str,
+        node_index: int,
+        fan_in: int,
+        fan_out: int,
+        randomizer: random.Random,
+) -> List[int]:
+    """
+    node_index 번째 Node 로 들어오는 Arrow 의 시작 Node 순서입니다. 항상 node_index 보다 앞의 Node 만 가리킵니다.
+    """
+    if node_index == 0:
+        return []
+    if shape == MapSeedShape.CHAIN.value:
+        return [node_index - 1]
+    if shape == MapSeedShape.TREE.value:
+        return [(node_index - 1) // fan_out]
+    return sorted(randomizer.sample(range(node_index), min(node_index, randomizer.randint(1, fan_in))))
+
+
+def build_seed_map_document(
+        shape: str,
+        node_count: int,
+        rules_per_node: int = 1,
+        fan_in: int = 2,
+        fan_out: int = 2,
+        randomizer: random.Random = None,
+) -> MapDocumentDTO:
+    """
+    Node 마다 rules_per_node 개의 Rule 을 만들고, Rule 마다 바로 통과(is_by_pass)하는 문제를 하나씩 둡니다.
+    같은 Node 의 Rule 들은 모두 같은 시작 Node 들을 가지므로, 어떤 Rule 로도 같은 순서로 풀 수 있습니다.
+    """
+    randomizer = randomizer or random.Random()
+    nodes = []
+    rules = []
+    columns = max(1, int(node_count ** 0.5))
+    for node_index in range(node_count):
+        nodes.append(
+            MapDocumentNodeDTO(
+                key=f'node-{node_index}',
+                name=f'Node {node_index}',
+                title=f'Node {node_index}',
+                position_x=(node_index % columns) * 200,
+                position_y=(node_index // columns) * 200,
+            )
+        )
+        start_nodes = [
+            f'node-{start_node_index}'
+            for start_node_index in get_seed_start_node_indexes(shape, node_index, fan_in, fan_out, randomizer)
+        ]
+        for rule_index in range(rules_per_node):
+            rules.append(
+                MapDocumentRuleDTO(
+                    key=f'rule-{node_index}-{rule_index}',
+                    name=f'Rule {node_index}-{rule_index}',
+                    node=f'node-{node_index}',
+                    questions=[
+                        MapDocumentQuestionDTO(
+                            title=f'Question {node_index}-{rule_index}',
+                            description='',
+                            is_by_pass=True,
+                        ),
+                    ],
+                    start_nodes=start_nodes,
+                )
+            )
+    return MapDocumentDTO(
+        map=MapDocumentMapDTO(name=f'Seed {shape} {node_count}'),
+        nodes=nodes,
+        rules=rules,
+    )
+
+
+class MapSeedService:
+    """
+    성능 측정용 가상 Map 과 무작위로 진행된 MapPlay 를 만듭니다.
+    """
+    def __init__(self, randomizer: random.Random = None):
+        self.randomizer = randomizer or random.Random()
+
+    @transaction.atomic
+    def seed_map(
+            self,
+            created_by_id: int,
+            shape: str,
+            node_count: int,
+            rules_per_node: int = 1,
+            fan_in: int = 2,
+            fan_out: int = 2,
+    ) -> Map:
+        document = build_seed_map_document(shape, node_count, rules_per_node, fan_in, fan_out, self.randomizer)
+        return MapDocumentService().import_map(document, created_by_id)
+
+    @transaction.atomic
+    def seed_plays(self, map_id: int, play_count: int, completion_ratio: float = 0.5) -> List[MapPlayMember]:
+        """
+        MapPlay 마다 멤버 한 명을 만들고, 앞의 Node 부터 completion_ratio 확률로 문제를 풀어서 진행시킵니다.
+        NodeCompletionService 의 연쇄 처리와 같은 결과가 되도록
+        - 완료된 Node 에서 출발하는 Arrow 는 모두 해결된 것으로,
+        - 완료된 Node 의 Rule 은 모두 완료된 것으로 저장합니다.
+        """
+        arrows = list(Arrow.objects.filter(map_id=map_id, is_deleted=False).values('id', 'start_node_id', 'node_complete_rule_id'))
+        rules = list(NodeCompleteRule.objects.filter(map_id=map_id, is_deleted=False).order_by('id').values('id', 'node_id'))
+        node_ids = sorted({rule['node_id'] for rule in rules})
+        rule_ids_by_node_id: Dict[int, List[int]] = defaultdict(list)
+        for rule in rules:
+            rule_ids_by_node_id[rule['node_id']].append(rule['id'])
+        node_id_by_rule_id = {rule['id']: rule['node_id'] for rule in rules}
+        start_node_ids_by_node_id: Dict[int, Set[int]] = defaultdict(set)
+        for arrow in arrows:
+            end_node_id = node_id_by_rule_id[arrow['node_complete_rule_id']]
+            if arrow['start_node_id'] != end_node_id:
+                start_node_ids_by_node_id[end_node_id].add(arrow['start_node_id'])
+
+        map_play_count = MapPlay.objects.filter(map_id=map_id).count()
+        members = Member.objects.bulk_create(
+            [
+                Member(
+                    username=f'seed-{map_id}-{map_play_count + index}',
+                    nickname=f'seed-{map_id}-{map_play_count + index}',
+                )
+                for index in range(play_count)
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+        map_plays = MapPlay.objects.bulk_create(
+            [
+                MapPlay(
+                    map_id=map_id,
+                    title=f'Seed Play {map_play_count + index}',
+                    created_by=member,
+                )
+                for index, member in enumerate(members)
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+        map_play_members = MapPlayMember.objects.bulk_create(
+            [
+                MapPlayMember(
+                    map_play=map_play,
+                    member=member,
+                    role=MapPlayMemberRole.ADMIN,
+                )
+                for map_play, member in zip(map_plays, members)
+            ],
+            batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE,
+        )
+
+        arrow_progresses = []
+        node_completed_histories = []
+        for map_play_member in map_play_members:
+            # Node id 는 문서 순서대로 만들어지므로 시작 Node 가 항상 먼저 처리됨
+            completed_node_ids = set()
+            for node_id in node_ids:
+                if start_node_ids_by_node_id[node_id] <= completed_node_ids and self.randomizer.random() < completion_ratio:
+                    completed_node_ids.add(node_id)
+            arrow_progresses.extend(
+                ArrowProgress(
+                    map_id=map_id,
+                    arrow_id=arrow['id'],
+                    member_id=map_play_member.member_id,
+                    map_play_id=map_play_member.map_play_id,
+                    map_play_member=map_play_member,
+                    is_resolved=True,
+                )
+                for arrow in arrows
+                if arrow['start_node_id'] in completed_node_ids
+            )
+            node_completed_histories.extend(
+                NodeCompletedHistory(
+                    map_id=map_id,
+                    node_id=node_id,
+                    member_id=map_play_member.member_id,
+                    map_play_id=map_play_member.map_play_id,
+                    map_play_member=map_play_member,
+                    node_complete_rule_id=rule_id,
+                )
+                for node_id in sorted(completed_node_ids)
+                for rule_id in rule_ids_by_node_id[node_id]
+            )
+        ArrowProgress.objects.bulk_create(arrow_progresses, batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE)
+        NodeCompletedHistory.objects.bulk_create(node_completed_histories, batch_size=MAP_DOCUMENT_BULK_CREATE_BATCH_SIZE)
+
+        snapshot = get_map_graph_snapshot(map_id)
+        progress_service = MapPlayProgressService()
+        statistic_service = MapPlayNodeStatisticService()
+        for map_play in map_plays:
+            progress_service.rebuild_progress(map_play.id)
+            statistic_service.rebuild_statistics(map_play.id, snapshot)
+        return map_play_members
@@ -0,0 +1,133 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from map.dtos.map_document import (
+    MapDocumentQuestionAnswerDTO,
+    MapDocumentQuestionFileDTO,
+)
+from map.exceptions import MapNotFoundException
+from map.models import (
+    Category,
+    Map,
+    MapCategory,
+    Node,
+)
+from map.services.map_clone_service import MapCloneService
+from map.services.map_document_service import MapDocumentService
+from map.tests.services.test_map_document_service import build_chain_document
+from map_graph.models import MapGraphTopology
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Member
+from question.models import (
+    Question,
+    QuestionAnswer,
+    QuestionFile,
+)
+
+
+class MapCloneServiceTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: Map 생성자와 복제하는 사용자
+        self.owner = Member.objects.create(
+            username='owner',
+            nickname='생성자',
+        )
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.document_service = MapDocumentService()
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def test_clone_map_should_copy_whole_structure_with_new_ids(self):
+        # Given: 정답, 파일, 카테고리가 있는 3개 Node 체인 Map
+        document = build_chain_document(3)
+        document.rules[0].questions[0].answers = [MapDocumentQuestionAnswerDTO(answer='A', description='A 설명')]
+        document.rules[1].questions[0].files = [MapDocumentQuestionFileDTO(name='자료', file='files/a.pdf')]
+        source_map = self.document_service.import_map(document, self.owner.id)
+        category = Category.objects.create(name='카테고리', description='', icon='')
+        MapCategory.objects.create(map=source_map, category=category)
+        # Given: 삭제된 Node 는 복제되지 않아야 함
+        Node.objects.create(map=source_map, name='Deleted', title='', description='', position_x=0, position_y=0, is_deleted=True)
+
+        # When: 복제
+        new_map = MapCloneService(member_id=self.member.id).clone_map(source_map.id, name='My Copy')
+
+        # Then: 새 Map 은 내 비공개 Map 이어야 함
+        self.assertEqual(new_map.name, 'My Copy')
+        self.assertEqual(new_map.created_by_id, self.member.id)
+        self.assertTrue(new_map.is_private)
+        self.assertEqual(list(new_map.categories.all()), [category])
+        # Then: 내보낸 문서가 원본과 같아야 함 (key 제외)
+        source_document = self.document_service.export_map(source_map.id)
+        new_document = self.document_service.export_map(new_map.id)
+        self.assertEqual(
+            [node.model_dump(exclude={'key'}) for node in new_document.nodes],
+            [node.model_dump(exclude={'key'}) for node in source_document.nodes],
+        )
+        self.assertEqual(
+            [rule.model_dump(exclude={'key', 'node', 'start_nodes'}) for rule in new_document.rules],
+            [rule.model_dump(exclude={'key', 'node', 'start_nodes'}) for rule in source_document.rules],
+        )
+        self.assertEqual(
+            [len(rule.start_nodes) for rule in new_document.rules],
+            [len(rule.start_nodes) for rule in source_document.rules],
+        )
+        # Then: 모든 참조가 새 Map 안을 가리켜야 함
+        new_node_ids = set(Node.objects.filter(map=new_map).values_list('id', flat=True))
+        self.assertEqual(len(new_node_ids), 3)
+        self.assertFalse(new_node_ids & set(Node.objects.filter(map=source_map).values_list('id', flat=True)))
+        for question in Question.objects.filter(map=new_map).select_related('arrow'):
+            self.assertEqual(question.arrow.map_id, new_map.id)
+        self.assertEqual(
+            list(QuestionAnswer.objects.filter(map=new_map).values_list('question__map_id', 'answer')),
+            [(new_map.id, 'A')],
+        )
+        self.assertEqual(
+            list(QuestionFile.objects.filter(map=new_map).values_list('question__map_id', 'file')),
+            [(new_map.id, 'files/a.pdf')],
+        )
+        # Then: 복제한 Map 구조도 컴파일되어 있어야 함
+        topology = MapGraphTopology.objects.get(map=new_map)
+        self.assertTrue(topology.is_valid)
+        self.assertEqual(topology.node_count, 3)
+
+    def test_clone_map_should_use_constant_queries(self):
+        # Given: 크기가 다른 두 Map
+        small_map = self.document_service.import_map(build_chain_document(10), self.owner.id)
+        large_map = self.document_service.import_map(build_chain_document(300), self.owner.id)
+        service = MapCloneService(member_id=self.member.id)
+
+        def count_queries(map_id: int) -> int:
+            with CaptureQueriesContext(connection) as context:
+                service.clone_map(map_id)
+            return len(context.captured_queries)
+
+        # When: 각각 복제
+        # Then: Node 수와 관계없이 쿼리 수가 같아야 함
+        self.assertEqual(count_queries(large_map.id), count_queries(small_map.id))
+        self.assertEqual(Map.objects.filter(name='Chain Map', created_by=self.member).count(), 2)
+
+    def test_clone_map_should_not_clone_private_map_of_others(self):
+        # Given: 다른 사람의 비공개 Map
+        document = build_chain_document(1)
+        document.map.is_private = True
+        source_map = self.document_service.import_map(document, self.owner.id)
+
+        # When: 구독하지 않은 사용자가 복제
+        # Then: Map 을 찾을 수 없어야 함
+        with self.assertRaises(MapNotFoundException):
+            MapCloneService(member_id=self.member.id).clone_map(source_map.id)
+
+        # When: 생성자가 복제
+        new_map = MapCloneService(member_id=self.owner.id).clone_map(source_map.id)
+
+        # Then: 복제되어야 함
+        self.assertEqual(Node.objects.filter(map=new_map).count(), 1)
@@ -0,0 +1,185 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from map.dtos.map_document import (
+    MapDocumentDTO,
+    MapDocumentMapDTO,
+    MapDocumentNodeDTO,
+    MapDocumentQuestionAnswerDTO,
+    MapDocumentQuestionDTO,
+    MapDocumentQuestionFileDTO,
+    MapDocumentRuleDTO,
+)
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map.services.map_document_service import MapDocumentService
+from map_graph.models import MapGraphTopology
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Member
+from question.models import (
+    Question,
+    QuestionAnswer,
+    QuestionFile,
+)
+
+
+def build_chain_document(node_count: int) -> MapDocumentDTO:
+    """
+    node-0 -> node-1 -> ... 체인 문서, 모든 Node 에 문제 하나씩
+    """
+    return MapDocumentDTO(
+        map=MapDocumentMapDTO(name='Chain Map'),
+        nodes=[
+            MapDocumentNodeDTO(
+                key=f'node-{i}',
+                name=f'Node {i}',
+                title=f'Title {i}',
+                position_x=i * 100,
+                position_y=0,
+            )
+            for i in range(node_count)
+        ],
+        rules=[
+            MapDocumentRuleDTO(
+                key=f'rule-{i}',
+                name=f'Rule {i}',
+                node=f'node-{i}',
+                questions=[MapDocumentQuestionDTO(title=f'Question {i}', description='')],
+                start_nodes=[f'node-{i - 1}'] if i else [],
+            )
+            for i in range(node_count)
+        ],
+    )
+
+
+class MapDocumentServiceTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.service = MapDocumentService()
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def test_import_map_should_create_whole_structure(self):
+        # Given: node-0 -> node-1, node-0 문제에 정답과 파일이 있는 문서
+        document = build_chain_document(2)
+        document.rules[0].questions[0].answers = [MapDocumentQuestionAnswerDTO(answer='A', description='A 설명')]
+        document.rules[0].questions[0].files = [MapDocumentQuestionFileDTO(name='자료', file='files/a.pdf')]
+
+        # When: 가져오기
+        map_obj = self.service.import_map(document, self.member.id)
+
+        # Then: 모든 구조가 만들어져야 함
+        nodes = {node.name: node for node in Node.objects.filter(map=map_obj)}
+        self.assertEqual(set(nodes), {'Node 0', 'Node 1'})
+        self.assertEqual(NodeCompleteRule.objects.filter(map=map_obj).count(), 2)
+        self.assertEqual(
+            set(Arrow.objects.filter(map=map_obj).values_list('start_node_id', 'node_complete_rule__node_id')),
+            {
+                (nodes['Node 0'].id, nodes['Node 0'].id),
+                (nodes['Node 1'].id, nodes['Node 1'].id),
+                (nodes['Node 0'].id, nodes['Node 1'].id),
+            },
+        )
+        question = Question.objects.get(map=map_obj, title='Question 0')
+        self.assertEqual(question.arrow.start_node_id, nodes['Node 0'].id)
+        self.assertEqual(question.question_types, ['text', 'file'])
+        self.assertEqual(question.answer_validation_type, 'manual')
+        self.assertEqual(list(QuestionAnswer.objects.filter(question=question).values_list('answer', flat=True)), ['A'])
+        self.assertEqual(list(QuestionFile.objects.filter(question=question).values_list('file', flat=True)), ['files/a.pdf'])
+        # Then: Map 구조도 컴파일되어 있어야 함
+        topology = MapGraphTopology.objects.get(map=map_obj)
+        self.assertTrue(topology.is_valid)
+        self.assertEqual(topology.node_count, 2)
+
+    def test_export_map_should_be_importable(self):
+        # Given: 가져온 Map
+        document = build_chain_document(3)
+        document.rules[2].questions[0].answers = [MapDocumentQuestionAnswerDTO(answer='B')]
+        map_obj = self.service.import_map(document, self.member.id)
+
+        # When: 내보낸 뒤 다시 가져오기
+        exported_document = self.service.export_map(map_obj.id)
+        copied_map = self.service.import_map(exported_document, self.member.id)
+
+        # Then: key 를 제외한 내용이 같아야 함
+        def normalize(target: MapDocumentDTO) -> dict:
+            node_index_by_key = {node.key: i for i, node in enumerate(target.nodes)}
+            data = target.model_dump(mode='json')
+            for node in data['nodes']:
+                node.pop('key')
+            for rule in data['rules']:
+                rule.pop('key')
+                rule['node'] = node_index_by_key[rule['node']]
+                rule['start_nodes'] = [node_index_by_key[key] for key in rule['start_nodes']]
+            return data
+
+        self.assertEqual(normalize(exported_document), normalize(document))
+        self.assertEqual(normalize(self.service.export_map(copied_map.id)), normalize(document))
+
+    def test_import_map_should_use_constant_queries(self):
+        # Given: 크기가 다른 두 문서
+        def count_queries(node_count: int) -> int:
+            with CaptureQueriesContext(connection) as context:
+                self.service.import_map(build_chain_document(node_count), self.member.id)
+            return len(context.captured_queries)
+
+        # When: 각각 가져오기
+        # Then: Node 수와 관계없이 쿼리 수가 같아야 함
+        self.assertEqual(count_queries(300), count_queries(10))
+        self.assertEqual(Map.objects.filter(name='Chain Map').count(), 2)
+
+    def test_validate_should_return_reference_and_cycle_errors(self):
+        # Given: 없는 Node 참조, 중복 key
+        document = build_chain_document(3)
+        document.rules[1].start_nodes = ['node-9']
+        document.nodes[2].key = 'node-0'
+
+        # When: 검증
+        errors, _ = self.service.validate(document)
+
+        # Then: 참조 오류가 있어야 함
+        self.assertIn("Node key 'node-0' 가 2번 사용되었습니다.", errors)
+        self.assertIn("'rule-1' Rule 의 start_nodes 'node-9' 가 없습니다.", errors)
+
+        # Given: node-1 <-> node-2 순환
+        document = build_chain_document(3)
+        document.rules[1].start_nodes = ['node-0', 'node-2']
+
+        # When: 검증
+        errors, warnings = self.service.validate(document)
+
+        # Then: 순환 오류가 있어야 함
+        self.assertEqual(errors, ["순환이 있습니다: ['node-1', 'node-2']"])
+
+    def test_validate_should_warn_orphan_rule_and_unreachable_node(self):
+        # Given: Arrow 도 문제도 없는 Rule 로만 완료되는 node-1
+        document = build_chain_document(2)
+        document.rules[1].questions = []
+        document.rules[1].start_nodes = []
+
+        # When: 검증
+        errors, warnings = self.service.validate(document)
+
+        # Then: 오류는 없고 경고만 있어야 함
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            warnings,
+            [
+                "Arrow 와 문제가 없는 Rule: ['rule-1']",
+                "완료할 수 없는 Node: ['node-1']",
+            ],
+        )
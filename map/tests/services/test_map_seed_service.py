@@ -0,0 +1,79 @@
+import random
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from map.consts import MapSeedShape
+from map.services.map_document_service import MapDocumentService
+from map.services.map_seed_service import (
+    MapSeedService,
+    build_seed_map_document,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Member
+from play.models import (
+    MapPlayNodeStatistic,
+    MapPlayProgress,
+)
+from question.services.map_progress_recompute_service import MapProgressRecomputeService
+
+
+class BuildSeedMapDocumentTest(TestCase):
+    def test_build_seed_map_document_should_make_valid_shapes(self):
+        for shape in MapSeedShape:
+            # Given: 형태별 50개 Node, Node 별 Rule 2개
+            # When: 문서 생성
+            document = build_seed_map_document(shape.value, 50, rules_per_node=2, fan_in=3, fan_out=2, randomizer=random.Random(1))
+
+            # Then: 오류와 경고가 없어야 함
+            self.assertEqual(len(document.nodes), 50)
+            self.assertEqual(len(document.rules), 100)
+            self.assertEqual(MapDocumentService().validate(document), ([], []))
+
+    def test_build_seed_map_document_should_follow_shape(self):
+        # Given: 형태별 문서
+        chain = build_seed_map_document(MapSeedShape.CHAIN.value, 4)
+        tree = build_seed_map_document(MapSeedShape.TREE.value, 7, fan_out=2)
+        dag = build_seed_map_document(MapSeedShape.DAG.value, 30, fan_in=3, randomizer=random.Random(1))
+
+        # Then: 체인은 바로 앞 Node, 트리는 부모 Node, DAG 는 앞의 Node 최대 fan_in 개에서 들어와야 함
+        self.assertEqual([rule.start_nodes for rule in chain.rules], [[], ['node-0'], ['node-1'], ['node-2']])
+        self.assertEqual(
+            [rule.start_nodes for rule in tree.rules],
+            [[], ['node-0'], ['node-0'], ['node-1'], ['node-1'], ['node-2'], ['node-2']],
+        )
+        for index, rule in enumerate(dag.rules[1:], start=1):
+            self.assertTrue(1 <= len(rule.start_nodes) <= 3)
+            self.assertTrue(all(int(start_node.split('-')[1]) < index for start_node in rule.start_nodes))
+
+
+class MapSeedServiceTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: Map 생성자
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def test_seed_plays_should_match_node_completion_result(self):
+        # Given: DAG Map
+        service = MapSeedService(random.Random(3))
+        map_obj = service.seed_map(self.member.id, MapSeedShape.DAG.value, 60, rules_per_node=2)
+
+        # When: 무작위로 진행된 MapPlay 5개 생성
+        map_play_members = service.seed_plays(map_obj.id, 5, completion_ratio=0.8)
+
+        # Then: 진행 상태와 통계가 만들어져야 함
+        map_play_ids = [map_play_member.map_play_id for map_play_member in map_play_members]
+        progresses = MapPlayProgress.objects.filter(map_play_id__in=map_play_ids)
+        self.assertEqual(progresses.count(), 5)
+        self.assertTrue(any(progress.completed_node_ids for progress in progresses))
+        self.assertTrue(MapPlayNodeStatistic.objects.filter(map_play_id__in=map_play_ids).exists())
+        # Then: 연쇄 처리를 다시 실행해도 바뀌는 것이 없어야 함
+        self.assertEqual(MapProgressRecomputeService(map_obj.id).recompute(map_play_ids, dry_run=True), [])
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+from common.common_consts.common_status_codes import SuccessStatusCode
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from map.models import (
+    Map,
+    Node,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import (
+    Guest,
+    Member,
+)
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class MapForkViewTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 클라이언트 설정
+        self.client = APIClient()
+
+        # Given: 로그인한 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+            member_status_id=1,
+        )
+        self.guest = Guest.objects.create(
+            member=self.member,
+            temp_nickname='testsdfsdf',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+
+        # Given: Node 가 하나 있는 공개 Map
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            icon_image='test_icon.jpg',
+            background_image='test_bg.jpg',
+            created_by=self.member,
+            is_private=False,
+        )
+        Node.objects.create(
+            map=self.map,
+            name='Node',
+            title='Title',
+            description='Description',
+            position_x=0,
+            position_y=0,
+        )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_fork_map(self, mock_jwt_decode, mock_auth_cred):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: Map 복제 API 호출
+        response = self.client.post(
+            reverse('map:map-fork', kwargs={'map_id': self.map.id}),
+            data={'name': 'Forked Map'},
+            format='json',
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 새 Map 이 만들어져야 함
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['status_code'], SuccessStatusCode.SUCCESS.value)
+        new_map = Map.objects.get(id=response.data['data']['map_id'])
+        self.assertEqual(new_map.name, 'Forked Map')
+        self.assertEqual(Node.objects.filter(map=new_map).count(), 1)
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_404_when_map_not_exists(self, mock_jwt_decode, mock_auth_cred):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 없는 Map 복제 API 호출
+        response = self.client.post(
+            reverse('map:map-fork', kwargs={'map_id': self.map.id + 100}),
+            format='json',
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 404
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -9,6 +9,7 @@ from map.views.client import (
     MapShareLinkView,
     MapShareValidateView,
     MapFeedbackAnswersView,
+    MapForkView,
 )
 
 app_name = 'map'
@@ -17,6 +18,7 @@ app_name = 'map'
 urlpatterns = [
     path('', MapListView.as_view(), name='map-list'),
     path('/<int:map_id>/share', MapShareLinkView.as_view(), name='map-create-share-link'),
+    path('/<int:map_id>/fork', MapForkView.as_view(), name='map-fork'),
     path('/<int:map_id>/feedback-answers', MapFeedbackAnswersView.as_view(), name='map-feedback-answers'),
     path('/<int:map_id>', MapDetailView.as_view(), name='map-detail'),
     path('/subscribed', MapSubscribedListView.as_view(), name='map-subscribed-list'),
@@ -11,6 +11,7 @@ from map.cursor_criteria.cursor_criteria import (
     MyMapListCursorCriteria,
 )
 from map.dtos.request_dtos import (
+    MapForkRequestDTO,
     MapListRequestDTO,
     MapSubscribedListRequestDTO,
     MyMapListRequestDTO,
@@ -22,6 +23,7 @@ from map.dtos.response_dtos import (
     MapPopularListResponseDTO,
 )
 from map.error_messages import MapInvalidInputResponseErrorStatus
+from map.services.map_clone_service import MapCloneService
 from map.services.map_service import MapService
 from map.services.map_share_service import MapShareService
 from member.permissions import (
@@ -33,7 +35,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from node.services.node_services import get_nodes_by_map_id
+from map_graph.services.map_graph_snapshot_service import get_map_node_count
 from subscription.services.subscription_service import MapSubscriptionService
 from django.urls import reverse
 
@@ -92,7 +94,8 @@ class MapDetailView(APIView):
     def get(self, request, map_id: int):
         map_service = MapService(member_id=request.guest.member_id)
         map_dto = map_service.get_map_detail(map_id)
-        nodes = get_nodes_by_map_id(map_id)
+        # 전체 Node 수는 저장된 Map 구조 컴파일 결과에서 읽음
+        total_node_count = get_map_node_count(map_dto.map.id, map_dto.map.graph_version)
 
         return Response(
             BaseFormatResponse(
@@ -101,7 +104,7 @@ class MapDetailView(APIView):
                     map_dto.map,
                     is_subscribed=map_dto.is_subscribed,
                     is_owner=map_dto.map.created_by_id == request.guest.member_id,
-                    total_node_count=len(nodes),
+                    total_node_count=total_node_count,
                 ).model_dump(),
             ).model_dump(),
             status=status.HTTP_200_OK
@@ -339,7 +342,7 @@ class MapShareValidateView(APIView):
         subscription_service = MapSubscriptionService(member_id=request.guest.member_id)
         subscription_status = subscription_service.get_subscription_status_by_map_ids([map_obj.id])
         is_subscribed = subscription_status[map_obj.id]
-        nodes = get_nodes_by_map_id(map_obj.id)
+        total_node_count = get_map_node_count(map_obj.id, map_obj.graph_version)
 
         return Response(
             BaseFormatResponse(
@@ -348,7 +351,7 @@ class MapShareValidateView(APIView):
                     map_obj,
                     is_subscribed=is_subscribed,
                     is_owner=map_obj.created_by_id == request.guest.member_id,
-                    total_node_count=len(nodes),
+                    total_node_count=total_node_count,
                 ).model_dump(),
             ).model_dump(),
             status=status.HTTP_200_OK
@@ -422,3 +425,48 @@ class MapFeedbackAnswersView(APIView):
             ).model_dump(),
             status=status.HTTP_200_OK,
         )
+
+
+class MapForkView(APIView):
+    """
+    Map 복제 API
+    """
+    permission_classes = [IsMemberLogin]
+
+    def post(self, request, map_id: int):
+        """
+        Map 구조 전체를 복제해서 내 비공개 Map 으로 만듭니다.
+
+        Args:
+            request: Request 객체
+            map_id: 복제할 Map ID
+
+        Returns:
+            Response: 새 Map ID
+        """
+        try:
+            map_fork_request = MapForkRequestDTO.of(request)
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=MapInvalidInputResponseErrorStatus.INVALID_INPUT_MAP_FORK_ERROR_400.label,
+                error_code=MapInvalidInputResponseErrorStatus.INVALID_INPUT_MAP_FORK_ERROR_400.value,
+                errors=e.errors(),
+            )
+        map_clone_service = MapCloneService(
+            member_id=request.guest.member_id,
+        )
+        new_map = map_clone_service.clone_map(
+            map_id,
+            name=map_fork_request.name,
+        )
+
+        return Response(
+            BaseFormatResponse(
+                status_code=SuccessStatusCode.SUCCESS.value,
+                data={
+                    'map_id': new_map.id,
+                }
+            ).model_dump(),
+            status=status.HTTP_201_CREATED
+        )
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from map_graph.models import MapGraphTopology
+
+
+@admin.register(MapGraphTopology)
+class MapGraphTopologyAdmin(admin.ModelAdmin):
+    list_display = ('map', 'graph_version', 'is_valid', 'node_count', 'arrow_count', 'rule_count', 'compiled_at')
+    list_filter = ('is_valid',)
+    search_fields = ('map__name',)
+    readonly_fields = [field.name for field in MapGraphTopology._meta.fields]
@@ -6,3 +6,29 @@ class GraphNodeStatus(StrValueLabel):
     IN_PROGRESS = ('IN_PROGRESS', '진행중')
     LOCKED = ('FAIL', '잠김')
     DEACTIVATED = ('DEACTIVATED', '비활성화')
+
+
+# Snapshot 구조가 바뀌면 이전 형태로 캐싱된 값을 읽지 않도록 키의 v 를 올려야 합니다.
+MAP_GRAPH_SNAPSHOT_CACHE_KEY = 'map_graph:snapshot:v3:{map_id}:{version}'
+MAP_GRAPH_SNAPSHOT_CACHE_SECONDS = 60 * 60 * 24
+# 워커 프로세스 안에서 들고 있는 최대 Map Snapshot 개수
+MAP_GRAPH_SNAPSHOT_LOCAL_CACHE_SIZE = 128
+# 영역 조회용 그리드 인덱스 한 칸의 크기 (Node 좌표 단위)
+MAP_GRAPH_GRID_CELL_SIZE = 1000
+# tile=z/x/y 로 조회할 때 허용하는 최대 z (Map 레이아웃 영역을 2^z x 2^z 로 나눔)
+MAP_GRAPH_TILE_MAX_ZOOM = 16
+
+# 그래프 묶음 API 에서 선택 가능한 항목 (include=nodes,arrows 형태)
+GRAPH_BUNDLE_INCLUDE_NODES = 'nodes'
+GRAPH_BUNDLE_INCLUDE_ARROWS = 'arrows'
+GRAPH_BUNDLE_INCLUDE_NODE_COMPLETE_RULES = 'node_complete_rules'
+GRAPH_BUNDLE_INCLUDE_META = 'meta'
+GRAPH_BUNDLE_INCLUDES = (
+    GRAPH_BUNDLE_INCLUDE_NODES,
+    GRAPH_BUNDLE_INCLUDE_ARROWS,
+    GRAPH_BUNDLE_INCLUDE_NODE_COMPLETE_RULES,
+    GRAPH_BUNDLE_INCLUDE_META,
+)
+
+# 진행 상태 버전을 내려주는 응답 헤더
+MAP_GRAPH_PROGRESS_VERSION_HEADER = 'X-Progress-Version'
@@ -1,9 +1,11 @@
 from typing import (
     Literal,
     Set,
+    Union,
 )
 
 from map.models import Arrow
+from map_graph.dtos.map_graph_snapshot import SnapshotArrow
 from pydantic import BaseModel
 
 
@@ -17,7 +19,7 @@ class GraphArrow(BaseModel):
     @classmethod
     def from_arrow(
             cls,
-            arrow: Arrow,
+            arrow: Union[Arrow, SnapshotArrow],
             completed_arrow_ids: Set[int],
     ) -> 'GraphArrow':
         if arrow.id in completed_arrow_ids:
@@ -28,7 +30,7 @@ class GraphArrow(BaseModel):
         return cls(
             id=arrow.id,
             start_node_id=arrow.start_node_id,
-            end_node_id=arrow.node_complete_rule.node_id,
+            end_node_id=arrow.end_node_id,
             active_rule_id=arrow.node_complete_rule_id,
             status=status,
         )
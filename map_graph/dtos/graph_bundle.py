@@ -0,0 +1,24 @@
+from typing import (
+    List,
+    Optional,
+)
+
+from pydantic import BaseModel
+
+from map_graph.dtos.graph_arrow import GraphArrow
+from map_graph.dtos.map_meta import MapMetaDTO
+from map_graph.dtos.response_dtos import (
+    NodeCompleteRuleDTO,
+    NodeGraphDTO,
+)
+
+
+class GraphBundleDTO(BaseModel):
+    """
+    Map 그래프 화면에 필요한 nodes, arrows, node_complete_rules, meta 를 한 번에 내려줍니다.
+    include 로 선택하지 않은 항목은 None 이며 응답에서 제외됩니다.
+    """
+    nodes: Optional[List[NodeGraphDTO]] = None
+    arrows: Optional[List[GraphArrow]] = None
+    node_complete_rules: Optional[List[NodeCompleteRuleDTO]] = None
+    meta: Optional[MapMetaDTO] = None
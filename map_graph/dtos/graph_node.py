@@ -2,9 +2,11 @@ from typing import (
     Dict,
     Literal,
     Set,
+    Union,
 )
 
 from map.models import Node
+from map_graph.dtos.map_graph_snapshot import SnapshotNode
 from pydantic import BaseModel
 
 
@@ -20,7 +22,7 @@ class GraphNode(BaseModel):
     @classmethod
     def from_node(
             cls,
-            node: Node,
+            node: Union[Node, SnapshotNode],
             completed_node_ids: Set[int],
             start_node_ids_by_end_node_id: Dict[int, Set[int]],
     ) -> 'GraphNode':
@@ -41,7 +43,7 @@ class GraphNode(BaseModel):
     @classmethod
     def get_status(
             cls,
-            node: Node,
+            node: Union[Node, SnapshotNode],
             completed_node_ids: Set[int],
             start_node_ids_by_end_node_id: Dict[int, Set[int]],
     ):
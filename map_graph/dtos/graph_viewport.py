@@ -0,0 +1,35 @@
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+)
+
+from map_graph.dtos.map_graph_topology import MapGraphTopologyDTO
+
+
+class GraphViewportDTO(BaseModel):
+    """
+    bbox=min_x,min_y,max_x,max_y 또는 tile=z/x/y 로 요청한 조회 영역입니다.
+    tile 은 Map 레이아웃 영역을 2^z x 2^z 로 나눈 칸 중 (x, y) 번째 칸입니다.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    bbox: Optional[Tuple[float, float, float, float]] = None
+    tile: Optional[Tuple[int, int, int]] = None
+
+    def get_bbox(self, topology: MapGraphTopologyDTO) -> Tuple[float, float, float, float]:
+        if self.bbox:
+            return self.bbox
+        zoom, tile_x, tile_y = self.tile
+        tile_width = (topology.max_x - topology.min_x) / 2 ** zoom
+        tile_height = (topology.max_y - topology.min_y) / 2 ** zoom
+        return (
+            topology.min_x + tile_x * tile_width,
+            topology.min_y + tile_y * tile_height,
+            topology.min_x + (tile_x + 1) * tile_width,
+            topology.min_y + (tile_y + 1) * tile_height,
+        )
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+)
+
+from map.models import Map
+from play.models import (
+    MapPlayMember,
+    MapPlayProgress,
+)
+
+
+class MapGraphContext(BaseModel):
+    """
+    접근 권한 검증이 끝난 Map 과 MapPlay 진행 상태입니다.
+    그래프 상태를 계산하기 전에 ETag 비교만으로 응답할 수 있도록 먼저 조회합니다.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    map_obj: Map
+    map_play_member: Optional[MapPlayMember] = None
+    progress: Optional[MapPlayProgress] = None
+
+    @property
+    def progress_version(self) -> int:
+        return self.progress.version if self.progress else 0
+
+    @property
+    def etag(self) -> str:
+        """
+        Map 구조 버전, Map 수정일시, MapPlay 진행 상태 버전으로 만든 strong ETag 입니다.
+        """
+        return '"{map_id}-{graph_version}-{updated_at}-{map_play_id}-{progress_version}"'.format(
+            map_id=self.map_obj.id,
+            graph_version=self.map_obj.graph_version,
+            updated_at=int(self.map_obj.updated_at.timestamp()),
+            map_play_id=self.map_play_member.map_play_id if self.map_play_member else 0,
+            progress_version=self.progress_version,
+        )
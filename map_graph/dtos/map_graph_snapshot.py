@@ -0,0 +1,127 @@
+import math
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+)
+
+from map_graph.consts import MAP_GRAPH_GRID_CELL_SIZE
+from map_graph.dtos.map_graph_topology import MapGraphTopologyDTO
+
+
+def get_grid_cell(position: float) -> int:
+    return math.floor(position / MAP_GRAPH_GRID_CELL_SIZE)
+
+
+class SnapshotNode(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    title: str
+    position_x: float
+    position_y: float
+    width: float
+    height: float
+    is_active: bool
+
+
+class SnapshotArrow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    start_node_id: int
+    end_node_id: int
+    node_complete_rule_id: int
+
+    @property
+    def is_self_arrow(self) -> bool:
+        return self.start_node_id == self.end_node_id
+
+
+class SnapshotRule(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    name: str
+    node_id: int
+
+
+class MapGraphSnapshot(BaseModel):
+    """
+    Map 의 Node / Arrow / NodeCompleteRule 구조를 한 번에 컴파일한 불변 데이터입니다.
+    (map_id, version) 단위로 캐싱되며, Map 구조가 수정되면 version 이 올라가 새로 만들어집니다.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    map_id: int
+    version: int
+    nodes: Dict[int, SnapshotNode]
+    arrows: Dict[int, SnapshotArrow]
+    rules: Dict[int, SnapshotRule]
+    # 인접 리스트: start_node_id -> 출발하는 arrow id 목록
+    arrow_ids_by_start_node_id: Dict[int, Tuple[int, ...]]
+    # rule -> rule 에 묶인 arrow id 목록
+    arrow_ids_by_rule_id: Dict[int, Tuple[int, ...]]
+    # node -> node 를 해금하는 rule id 목록
+    rule_ids_by_node_id: Dict[int, Tuple[int, ...]]
+    # end_node_id -> 들어오는 start_node_id 목록 (self arrow 제외)
+    start_node_ids_by_end_node_id: Dict[int, FrozenSet[int]]
+    self_arrow_ids: FrozenSet[int]
+    # 위상 정렬, 시작 Node, 레이아웃 영역 등 미리 계산한 값
+    topology: MapGraphTopologyDTO = MapGraphTopologyDTO()
+    # 그리드 인덱스: (cell_x, cell_y) -> 해당 칸과 겹치는 Node id 목록
+    node_ids_by_grid_cell: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+
+    def get_arrows_by_start_node_id(self, node_id: int) -> List[SnapshotArrow]:
+        return [self.arrows[arrow_id] for arrow_id in self.arrow_ids_by_start_node_id.get(node_id, ())]
+
+    def get_arrows_by_rule_id(self, rule_id: int) -> List[SnapshotArrow]:
+        return [self.arrows[arrow_id] for arrow_id in self.arrow_ids_by_rule_id.get(rule_id, ())]
+
+    def get_rules_by_node_id(self, node_id: int) -> List[SnapshotRule]:
+        return [self.rules[rule_id] for rule_id in self.rule_ids_by_node_id.get(node_id, ())]
+
+    def get_node_ids_in_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[int]:
+        """
+        그리드 인덱스로 후보를 좁힌 뒤 영역과 겹치는 Node id 를 오름차순으로 반환합니다.
+        """
+        # Map 레이아웃 밖의 빈 칸은 확인하지 않도록 영역을 자름
+        min_x = max(min_x, self.topology.min_x)
+        min_y = max(min_y, self.topology.min_y)
+        max_x = min(max_x, self.topology.max_x)
+        max_y = min(max_y, self.topology.max_y)
+        if min_x > max_x or min_y > max_y:
+            return []
+
+        candidate_node_ids = set()
+        for cell_x in range(get_grid_cell(min_x), get_grid_cell(max_x) + 1):
+            for cell_y in range(get_grid_cell(min_y), get_grid_cell(max_y) + 1):
+                candidate_node_ids.update(self.node_ids_by_grid_cell.get((cell_x, cell_y), ()))
+        return sorted(
+            node_id
+            for node_id in candidate_node_ids
+            if self.nodes[node_id].position_x <= max_x
+            and self.nodes[node_id].position_x + self.nodes[node_id].width >= min_x
+            and self.nodes[node_id].position_y <= max_y
+            and self.nodes[node_id].position_y + self.nodes[node_id].height >= min_y
+        )
+
+    def get_arrow_ids_by_node_ids(self, node_ids: Iterable[int]) -> List[int]:
+        """
+        주어진 Node 에서 출발하거나 도착하는 Arrow id 를 오름차순으로 반환합니다.
+        도착 Node 는 Rule 의 Node 이므로 Node -> Rule -> Arrow 인덱스로 찾습니다.
+        """
+        arrow_ids = set()
+        for node_id in node_ids:
+            arrow_ids.update(self.arrow_ids_by_start_node_id.get(node_id, ()))
+            for rule_id in self.rule_ids_by_node_id.get(node_id, ()):
+                arrow_ids.update(self.arrow_ids_by_rule_id.get(rule_id, ()))
+        return sorted(arrow_ids)
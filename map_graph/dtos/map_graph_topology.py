@@ -0,0 +1,62 @@
+from typing import (
+    Dict,
+    Tuple,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+)
+
+from map_graph.models import MapGraphTopology
+
+
+class MapGraphTopologyDTO(BaseModel):
+    """
+    Map 구조를 컴파일하면서 미리 계산한 위상 정보와 검증 결과입니다.
+    Map 구조가 수정될 때 한 번 계산하고, 조회 API 에서는 계산하지 않고 읽기만 합니다.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    # 순환에 걸리지 않은 Node 들의 위상 정렬 순서 (시작 Node 는 id 오름차순)
+    topological_order: Tuple[int, ...] = ()
+    # node_id -> 시작 Node 로부터의 최장 거리 (순환에 걸린 Node 는 제외)
+    depth_by_node_id: Dict[int, int] = {}
+    # 들어오는 Arrow 가 없는 Node (self arrow 제외)
+    start_node_ids: Tuple[int, ...] = ()
+    # 순환에 포함된 Node
+    cycle_node_ids: Tuple[int, ...] = ()
+    # Arrow 가 하나도 없거나, 삭제된 Node 를 해금하는 Rule
+    orphan_rule_ids: Tuple[int, ...] = ()
+    # 어떤 순서로 풀어도 완료할 수 없는 Node
+    unreachable_node_ids: Tuple[int, ...] = ()
+    # 레이아웃 영역 (Node 의 width / height 포함)
+    min_x: float = 0
+    max_x: float = 0
+    min_y: float = 0
+    max_y: float = 0
+    node_count: int = 0
+    arrow_count: int = 0
+    rule_count: int = 0
+
+    @classmethod
+    def from_topology(cls, topology: MapGraphTopology) -> 'MapGraphTopologyDTO':
+        return cls(
+            topological_order=tuple(topology.topological_order),
+            depth_by_node_id={int(node_id): depth for node_id, depth in topology.depth_by_node_id.items()},
+            start_node_ids=tuple(topology.start_node_ids),
+            cycle_node_ids=tuple(topology.cycle_node_ids),
+            orphan_rule_ids=tuple(topology.orphan_rule_ids),
+            unreachable_node_ids=tuple(topology.unreachable_node_ids),
+            min_x=topology.min_x,
+            max_x=topology.max_x,
+            min_y=topology.min_y,
+            max_y=topology.max_y,
+            node_count=topology.node_count,
+            arrow_count=topology.arrow_count,
+            rule_count=topology.rule_count,
+        )
+
+    @property
+    def is_valid(self) -> bool:
+        return not (self.cycle_node_ids or self.orphan_rule_ids or self.unreachable_node_ids)
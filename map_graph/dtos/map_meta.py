@@ -1,10 +1,10 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
-from map.models import Map, Node
+from map.models import Map
 from pydantic import BaseModel
 
-from map_graph.dtos.graph_node import GraphNode
+from map_graph.dtos.map_graph_topology import MapGraphTopologyDTO
 
 
 class MapThemeDTO(BaseModel):
@@ -78,22 +78,13 @@ class MapMetaDTO(BaseModel):
     def from_map(
             cls,
             map_obj: Map,
-            nodes: List[Node],
-            completed_nodes: List[GraphNode],
+            topology: MapGraphTopologyDTO,
+            completed_node_count: int,
             start_date: Optional[datetime] = None,
     ) -> 'MapMetaDTO':
-        # 레이아웃 계산
-        min_position_x_node = min(nodes, key=lambda node: node.position_x, default=None)
-        min_position_y_node = min(nodes, key=lambda node: node.position_y, default=None)
-        max_position_x_node = max(nodes, key=lambda node: node.position_x + node.width, default=None)
-        max_position_y_node = max(nodes, key=lambda node: node.position_y + node.height, default=None)
-        min_x = getattr(min_position_x_node, 'position_x', 0)
-        max_x = getattr(max_position_x_node, 'position_x', 0) + max_position_x_node.width
-        min_y = getattr(min_position_y_node, 'position_y', 0)
-        max_y = getattr(max_position_y_node, 'position_y', 0) + max_position_y_node.height
-
-        width = abs(max_x - min_x)
-        height = abs(max_y - min_y)
+        # 레이아웃과 Node 수는 Map 구조를 컴파일할 때 계산해둔 값을 사용 (빈 Map 은 0)
+        width = abs(topology.max_x - topology.min_x)
+        height = abs(topology.max_y - topology.min_y)
 
         if not start_date:
             learning_period = None
@@ -108,15 +99,15 @@ class MapMetaDTO(BaseModel):
             title=map_obj.name,
             description=map_obj.description,
             stats=MapStatsDTO(
-                total_nodes=len(nodes),
-                completed_nodes=len(completed_nodes),
+                total_nodes=topology.node_count,
+                completed_nodes=completed_node_count,
                 learning_period=learning_period,
             ),
             layout=MapLayoutDTO(
-                min_x=min_x,
-                max_x=max_x,
-                min_y=min_y,
-                max_y=max_y,
+                min_x=topology.min_x,
+                max_x=topology.max_x,
+                min_y=topology.min_y,
+                max_y=topology.max_y,
                 width=width,
                 height=height,
                 grid_size=20,
@@ -60,15 +60,14 @@ class MyAnswerDTO(BaseModel):
                 id=user_question_answer.member.id,
                 nickname=user_question_answer.member.nickname,
             ),
+            # 삭제되지 않은 파일만 Prefetch 로 가져와야 합니다.
             files=[
                 FileDTO(
                     id=file.id,
                     name=file.name,
                     url=file.file,
                 )
-                for file in user_question_answer.files.filter(
-                    is_deleted=False,
-                )
+                for file in user_question_answer.files.all()
             ],
         )
 
@@ -85,6 +84,8 @@ class QuestionDTO(BaseModel):
     answer_submit_with_file: bool
     answer_submittable: bool
     my_answers: List[MyAnswerDTO]
+    my_answers_has_more: bool = False
+    my_answers_next_cursor: Optional[str] = None
 
 
 class RuleProgressDTO(BaseModel):
@@ -0,0 +1,93 @@
+import math
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel
+from rest_framework.request import Request
+
+from map_graph.consts import (
+    GRAPH_BUNDLE_INCLUDES,
+    MAP_GRAPH_TILE_MAX_ZOOM,
+)
+from map_graph.dtos.graph_viewport import GraphViewportDTO
+from map_graph.exceptions import (
+    MapGraphInvalidIncludeException,
+    MapGraphInvalidSinceException,
+    MapGraphInvalidViewportException,
+)
+
+
+def get_since_query_param(request: Request) -> Optional[int]:
+    """
+    since=<progress_version> 쿼리 파라미터를 읽습니다.
+    """
+    since = request.query_params.get('since')
+    if since is None or since == '':
+        return None
+    if not since.isdigit():
+        raise MapGraphInvalidSinceException()
+    return int(since)
+
+
+def get_viewport_query_param(request: Request) -> Optional[GraphViewportDTO]:
+    """
+    bbox=min_x,min_y,max_x,max_y 또는 tile=z/x/y 쿼리 파라미터를 읽습니다.
+    """
+    bbox = request.query_params.get('bbox')
+    tile = request.query_params.get('tile')
+    if not bbox and not tile:
+        return None
+    if bbox and tile:
+        raise MapGraphInvalidViewportException()
+    try:
+        if bbox:
+            min_x, min_y, max_x, max_y = (float(value) for value in bbox.split(','))
+            if not all(math.isfinite(value) for value in (min_x, min_y, max_x, max_y)):
+                raise ValueError
+            if min_x > max_x or min_y > max_y:
+                raise ValueError
+            return GraphViewportDTO(bbox=(min_x, min_y, max_x, max_y))
+        zoom, tile_x, tile_y = (int(value) for value in tile.split('/'))
+        if not 0 <= zoom <= MAP_GRAPH_TILE_MAX_ZOOM:
+            raise ValueError
+        if not (0 <= tile_x < 2 ** zoom and 0 <= tile_y < 2 ** zoom):
+            raise ValueError
+        return GraphViewportDTO(tile=(zoom, tile_x, tile_y))
+    except ValueError:
+        raise MapGraphInvalidViewportException()
+
+
+class GraphStatusRequestDTO(BaseModel):
+    since: Optional[int] = None
+    viewport: Optional[GraphViewportDTO] = None
+
+    @classmethod
+    def of(cls, request: Request) -> 'GraphStatusRequestDTO':
+        return cls(
+            since=get_since_query_param(request),
+            viewport=get_viewport_query_param(request),
+        )
+
+
+class GraphBundleRequestDTO(BaseModel):
+    includes: Tuple[str, ...] = GRAPH_BUNDLE_INCLUDES
+    since: Optional[int] = None
+
+    @classmethod
+    def of(cls, request: Request) -> 'GraphBundleRequestDTO':
+        since = get_since_query_param(request)
+        include = request.query_params.get('include')
+        if not include:
+            return cls(since=since)
+        includes = tuple(
+            dict.fromkeys(
+                selector.strip()
+                for selector in include.split(',')
+                if selector.strip()
+            )
+        )
+        if not includes or any(selector not in GRAPH_BUNDLE_INCLUDES for selector in includes):
+            raise MapGraphInvalidIncludeException()
+        return cls(includes=includes, since=since)
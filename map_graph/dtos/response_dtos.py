@@ -1,7 +1,11 @@
-from typing import List
+from typing import (
+    List,
+    Union,
+)
 
 from map.models import NodeCompleteRule
 from map_graph.dtos.graph_node import GraphNode
+from map_graph.dtos.map_graph_snapshot import SnapshotRule
 from pydantic import BaseModel
 
 
@@ -33,7 +37,7 @@ class NodeCompleteRuleDTO(BaseModel):
     target_nodes: List[int]
 
     @classmethod
-    def from_rule(cls, rule: NodeCompleteRule) -> 'NodeCompleteRuleDTO':
+    def from_rule(cls, rule: Union[NodeCompleteRule, SnapshotRule]) -> 'NodeCompleteRuleDTO':
         return cls(
             id=rule.id,
             name=rule.name,
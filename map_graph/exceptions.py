@@ -0,0 +1,19 @@
+from common.common_exceptions import CommonAPIException
+
+
+class MapGraphInvalidIncludeException(CommonAPIException):
+    status_code = 400
+    default_code = 'map-graph-invalid-include'
+    default_detail = 'include 는 nodes, arrows, node_complete_rules, meta 중에서 선택해주세요.'
+
+
+class MapGraphInvalidSinceException(CommonAPIException):
+    status_code = 400
+    default_code = 'map-graph-invalid-since'
+    default_detail = 'since 는 0 이상의 진행 상태 버전이어야 합니다.'
+
+
+class MapGraphInvalidViewportException(CommonAPIException):
+    status_code = 400
+    default_code = 'map-graph-invalid-viewport'
+    default_detail = 'bbox=min_x,min_y,max_x,max_y 또는 tile=z/x/y 중 하나만 올바르게 입력해주세요.'
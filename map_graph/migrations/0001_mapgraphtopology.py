@@ -0,0 +1,43 @@
+# Generated by Django 4.1.10 on 2026-10-18 15:56
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('map', '0016_map_graph_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MapGraphTopology',
+            fields=[
+                ('map', models.OneToOneField(help_text='맵', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='graph_topology', serialize=False, to='map.map')),
+                ('graph_version', models.BigIntegerField(default=0, help_text='컴파일한 시점의 Map graph_version')),
+                ('topological_order', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='순환이 없는 Node id 의 위상 정렬 순서', size=None)),
+                ('depth_by_node_id', models.JSONField(blank=True, default=dict, help_text='Node id 별 시작 Node 로부터의 최장 거리')),
+                ('start_node_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='들어오는 Arrow 가 없는 Node id 목록', size=None)),
+                ('cycle_node_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='순환에 포함된 Node id 목록', size=None)),
+                ('orphan_rule_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='Arrow 가 없거나 삭제된 Node 를 해금하는 NodeCompleteRule id 목록', size=None)),
+                ('unreachable_node_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='완료할 수 없는 Node id 목록', size=None)),
+                ('min_x', models.FloatField(default=0, help_text='레이아웃 최소 x')),
+                ('max_x', models.FloatField(default=0, help_text='레이아웃 최대 x (width 포함)')),
+                ('min_y', models.FloatField(default=0, help_text='레이아웃 최소 y')),
+                ('max_y', models.FloatField(default=0, help_text='레이아웃 최대 y (height 포함)')),
+                ('node_count', models.IntegerField(default=0, help_text='Node 수')),
+                ('arrow_count', models.IntegerField(default=0, help_text='Arrow 수')),
+                ('rule_count', models.IntegerField(default=0, help_text='NodeCompleteRule 수')),
+                ('is_valid', models.BooleanField(db_index=True, default=True, help_text='순환, 고아 Rule, 완료할 수 없는 Node 가 없는지 여부')),
+                ('compiled_at', models.DateTimeField(auto_now=True, help_text='컴파일 일시')),
+            ],
+            options={
+                'verbose_name': '맵 그래프 컴파일 결과',
+                'verbose_name_plural': '맵 그래프 컴파일 결과',
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+
+class MapGraphTopology(models.Model):
+    """
+    Map 구조(Node, Arrow, NodeCompleteRule)를 컴파일한 결과입니다.
+    Admin 에서 Map 구조를 수정할 때 계산해서 저장하고, Map 그래프 Snapshot 을 만들 때 같은 graph_version 이면 그대로 사용합니다.
+    """
+    map = models.OneToOneField(
+        'map.Map',
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name='graph_topology',
+        help_text='맵',
+    )
+    graph_version = models.BigIntegerField(
+        default=0,
+        help_text='컴파일한 시점의 Map graph_version',
+    )
+    topological_order = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='순환이 없는 Node id 의 위상 정렬 순서',
+    )
+    depth_by_node_id = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='Node id 별 시작 Node 로부터의 최장 거리',
+    )
+    start_node_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='들어오는 Arrow 가 없는 Node id 목록',
+    )
+    cycle_node_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='순환에 포함된 Node id 목록',
+    )
+    orphan_rule_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='Arrow 가 없거나 삭제된 Node 를 해금하는 NodeCompleteRule id 목록',
+    )
+    unreachable_node_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='완료할 수 없는 Node id 목록',
+    )
+    min_x = models.FloatField(default=0, help_text='레이아웃 최소 x')
+    max_x = models.FloatField(default=0, help_text='레이아웃 최대 x (width 포함)')
+    min_y = models.FloatField(default=0, help_text='레이아웃 최소 y')
+    max_y = models.FloatField(default=0, help_text='레이아웃 최대 y (height 포함)')
+    node_count = models.IntegerField(default=0, help_text='Node 수')
+    arrow_count = models.IntegerField(default=0, help_text='Arrow 수')
+    rule_count = models.IntegerField(default=0, help_text='NodeCompleteRule 수')
+    is_valid = models.BooleanField(
+        default=True,
+        db_index=True,
+        help_text='순환, 고아 Rule, 완료할 수 없는 Node 가 없는지 여부',
+    )
+    compiled_at = models.DateTimeField(
+        auto_now=True,
+        help_text='컴파일 일시',
+    )
+
+    class Meta:
+        verbose_name = '맵 그래프 컴파일 결과'
+        verbose_name_plural = '맵 그래프 컴파일 결과'
+
+    def __str__(self):
+        return f'{self.map_id} 맵 그래프 컴파일 결과 (v{self.graph_version})'
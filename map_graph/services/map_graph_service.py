@@ -1,5 +1,6 @@
 from typing import (
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -7,20 +8,31 @@ from typing import (
 
 from django.utils import timezone
 
-from map.models import (
-    Arrow,
-    NodeCompleteRule, ArrowProgress,
+from map.models import NodeCompleteRule
+from map_graph.consts import (
+    GRAPH_BUNDLE_INCLUDE_ARROWS,
+    GRAPH_BUNDLE_INCLUDE_META,
+    GRAPH_BUNDLE_INCLUDE_NODE_COMPLETE_RULES,
+    GRAPH_BUNDLE_INCLUDE_NODES,
+    GRAPH_BUNDLE_INCLUDES,
 )
 from map_graph.dtos.graph_arrow import GraphArrow
+from map_graph.dtos.graph_bundle import GraphBundleDTO
 from map_graph.dtos.graph_node import GraphNode
-from map_graph.dtos.response_dtos import NodeCompleteRuleDTO
-from map_graph.dtos.map_meta import MapMetaDTO
-from node.services.node_services import (
-    get_nodes_by_map_id,
+from map_graph.dtos.graph_viewport import GraphViewportDTO
+from map_graph.dtos.map_graph_context import MapGraphContext
+from map_graph.dtos.map_graph_snapshot import MapGraphSnapshot
+from map_graph.dtos.response_dtos import (
+    NodeCompleteRuleDTO,
+    NodeGraphDTO,
 )
-from play.models import MapPlayMember
+from map_graph.dtos.map_meta import MapMetaDTO
+from map_graph.services.map_graph_snapshot_service import get_map_graph_snapshot
 from subscription.models import MapSubscription
-from play.services import MapPlayService
+from play.services import (
+    MapPlayProgressService,
+    MapPlayService,
+)
 
 
 class MapGraphService:
@@ -28,37 +40,48 @@ class MapGraphService:
         self.member_id = member_id
         self.map_play_service = MapPlayService()
 
-    def get_nodes(self, map_id: int, map_play_member_id: Optional[int] = None) -> List[GraphNode]:
-        # Map과 MapPlayMember 접근 권한 검증
-        self.map_play_service.validate_map_and_play_member_access(map_id, self.member_id, map_play_member_id)
-
-        # 맵에 속한 노드들을 가져옵니다.
-        nodes = get_nodes_by_map_id(map_id)
-
-        # 화살표 데이터를 가져와서 시작 노드 매핑을 생성합니다.
-        arrows = Arrow.objects.filter(
-            map_id=map_id,
-            is_deleted=False,
-        ).select_related(
-            'start_node',
-            'node_complete_rule__node',
+    def get_context(self, map_id: int, map_play_member_id: Optional[int] = None) -> MapGraphContext:
+        """
+        Map과 MapPlayMember 접근 권한을 검증하고 MapPlay 진행 상태를 가져옵니다.
+        ETag 비교에 필요한 정보만 조회하며, 그래프 상태 계산은 하지 않습니다.
+        """
+        map_obj, map_play_member = self.map_play_service.validate_map_and_get_play_member(
+            map_id,
+            self.member_id,
+            map_play_member_id,
+        )
+        return MapGraphContext(
+            map_obj=map_obj,
+            map_play_member=map_play_member,
+            progress=(
+                MapPlayProgressService().get_progress(map_play_member.map_play_id)
+                if map_play_member else None
+            ),
         )
-        start_node_ids_by_end_node_id = get_start_node_ids_by_end_node_id(arrows)
-
-        # 완료된 노드들의 id를 저장합니다.
-        completed_node_ids = {
-            completed_node.id
-            for completed_node in self.get_map_play_member_completed_nodes(map_play_member_id)
-        }
 
-        return [
-            GraphNode.from_node(
-                node,
-                completed_node_ids,
-                start_node_ids_by_end_node_id,
-            )
-            for node in nodes
-        ]
+    def get_nodes(
+            self,
+            map_id: int,
+            map_play_member_id: Optional[int] = None,
+            since: Optional[int] = None,
+            context: Optional[MapGraphContext] = None,
+            viewport: Optional[GraphViewportDTO] = None,
+    ) -> List[GraphNode]:
+        """
+        since 가 주어지면 해당 진행 상태 버전 이후 상태가 바뀐 Node 만 반환합니다.
+        viewport 가 주어지면 영역과 겹치는 Node 만 반환합니다.
+        """
+        context = context or self.get_context(map_id, map_play_member_id)
+        snapshot = get_map_graph_snapshot(map_id, context.map_obj.graph_version)
+        nodes = self._build_graph_nodes(
+            snapshot,
+            self._get_completed_node_ids(context),
+            self._get_viewport_node_ids(snapshot, viewport),
+        )
+        changed_node_ids = self._get_changed_node_ids(snapshot, context, since)
+        if changed_node_ids is None:
+            return nodes
+        return [node for node in nodes if node.id in changed_node_ids]
 
     def get_map_play_member_completed_nodes(self, map_play_member_id: Optional[int] = None) -> List[GraphNode]:
         """
@@ -66,47 +89,40 @@ class MapGraphService:
         """
         if not map_play_member_id:
             return []
-        completed_histories = self.map_play_service.get_map_play_completed_node_histories(
-            self.map_play_service._get_map_play_member_by_id(map_play_member_id).map_play_id
+        map_play_id = self.map_play_service._get_map_play_member_by_id(map_play_member_id).map_play_id
+        progress = MapPlayProgressService().get_progress(map_play_id)
+        return self._build_completed_graph_nodes(
+            get_map_graph_snapshot(progress.map_id),
+            progress.completed_node_ids,
         )
-        completed_nodes_dict = {
-            history.node.id: history.node
-            for history in completed_histories
-        }
-        return [
-            GraphNode.from_node(
-                node,
-                set(completed_nodes_dict.keys()),
-                {},
-            )
-            for node in completed_nodes_dict.values()
-        ]
-
-    def get_arrows(self, map_id: int, map_play_member_id: Optional[int] = None) -> List[GraphArrow]:
-        # Map과 MapPlayMember 접근 권한 검증
-        self.map_play_service.validate_map_and_play_member_access(map_id, self.member_id, map_play_member_id)
 
-        # 화살표 데이터를 가져옵니다.
-        arrows = Arrow.objects.filter(
-            map_id=map_id,
-            is_deleted=False,
-        )
-        completed_arrow_ids = set(
-            ArrowProgress.objects.filter(
-                arrow_id__in=arrows.values_list('id', flat=True),
-                is_resolved=True,
-            ).values_list(
-                'arrow_id',
-                flat=True,
-            )
+    def get_arrows(
+            self,
+            map_id: int,
+            map_play_member_id: Optional[int] = None,
+            since: Optional[int] = None,
+            context: Optional[MapGraphContext] = None,
+            viewport: Optional[GraphViewportDTO] = None,
+    ) -> List[GraphArrow]:
+        """
+        Arrow 의 도착 Node 는 Map 구조 Snapshot 에서, 해결 여부는 요청한 MapPlay 의 진행 상태에서 가져오므로
+        Arrow 수와 관계없이 쿼리 수가 일정합니다.
+        MapPlay 없이 조회하면 모든 Arrow 는 잠김 상태입니다.
+        since 가 주어지면 해당 진행 상태 버전 이후 해결된 Arrow 만 반환합니다.
+        viewport 가 주어지면 영역과 겹치는 Node 에서 출발하거나 도착하는 Arrow 만 반환합니다.
+        """
+        context = context or self.get_context(map_id, map_play_member_id)
+        snapshot = get_map_graph_snapshot(map_id, context.map_obj.graph_version)
+        viewport_node_ids = self._get_viewport_node_ids(snapshot, viewport)
+        arrows = self._build_graph_arrows(
+            snapshot,
+            self._get_resolved_arrow_ids(context),
+            None if viewport_node_ids is None else snapshot.get_arrow_ids_by_node_ids(viewport_node_ids),
         )
-        return [
-            GraphArrow.from_arrow(
-                arrow,
-                completed_arrow_ids,
-            )
-            for arrow in arrows
-        ]
+        changed_arrow_ids = self._get_changed_arrow_ids(context, since)
+        if changed_arrow_ids is None:
+            return arrows
+        return [arrow for arrow in arrows if arrow.id in changed_arrow_ids]
 
     def get_node_complete_rules(self, map_id: int) -> List[NodeCompleteRuleDTO]:
         # Map 접근 권한 검증
@@ -123,31 +139,191 @@ class MapGraphService:
             for rule in rules
         ]
 
-    def get_map_meta(self, map_id: int, map_play_member_id: Optional[int] = None) -> MapMetaDTO:
-        # Map과 MapPlayMember 접근 권한 검증
-        map_obj = self.map_play_service.validate_map_and_play_member_access(map_id, self.member_id, map_play_member_id)
+    def get_map_meta(
+            self,
+            map_id: int,
+            map_play_member_id: Optional[int] = None,
+            context: Optional[MapGraphContext] = None,
+    ) -> MapMetaDTO:
+        context = context or self.get_context(map_id, map_play_member_id)
+        snapshot = get_map_graph_snapshot(map_id, context.map_obj.graph_version)
+        return self._build_map_meta(context, snapshot)
+
+    def get_graph_bundle(
+            self,
+            map_id: int,
+            map_play_member_id: Optional[int] = None,
+            includes: Iterable[str] = GRAPH_BUNDLE_INCLUDES,
+            since: Optional[int] = None,
+            context: Optional[MapGraphContext] = None,
+    ) -> GraphBundleDTO:
+        """
+        nodes, arrows, node_complete_rules, meta 를 한 번에 조회합니다.
+        접근 권한 검증, Map 구조, MapPlay 진행 상태 조회를 한 번씩만 수행합니다.
+        since 가 주어지면 nodes, arrows 는 상태가 바뀐 것만 포함합니다.
+        """
+        context = context or self.get_context(map_id, map_play_member_id)
+        snapshot = get_map_graph_snapshot(map_id, context.map_obj.graph_version)
+
+        bundle = GraphBundleDTO()
+        if GRAPH_BUNDLE_INCLUDE_NODES in includes:
+            nodes = self._build_graph_nodes(snapshot, self._get_completed_node_ids(context))
+            changed_node_ids = self._get_changed_node_ids(snapshot, context, since)
+            bundle.nodes = [
+                NodeGraphDTO.from_graph_node(node)
+                for node in nodes
+                if changed_node_ids is None or node.id in changed_node_ids
+            ]
+        if GRAPH_BUNDLE_INCLUDE_ARROWS in includes:
+            arrows = self._build_graph_arrows(snapshot, self._get_resolved_arrow_ids(context))
+            changed_arrow_ids = self._get_changed_arrow_ids(context, since)
+            bundle.arrows = [
+                arrow
+                for arrow in arrows
+                if changed_arrow_ids is None or arrow.id in changed_arrow_ids
+            ]
+        if GRAPH_BUNDLE_INCLUDE_NODE_COMPLETE_RULES in includes:
+            bundle.node_complete_rules = [
+                NodeCompleteRuleDTO.from_rule(rule)
+                for rule in snapshot.rules.values()
+            ]
+        if GRAPH_BUNDLE_INCLUDE_META in includes:
+            bundle.meta = self._build_map_meta(context, snapshot)
+        return bundle
+
+    @staticmethod
+    def is_delta_available(context: MapGraphContext, since: Optional[int]) -> bool:
+        """
+        since 이후 변경분만 계산할 수 있는지 확인합니다.
+        현재 진행 상태 버전보다 큰 since 는 알 수 없는 버전이므로 전체를 내려줍니다.
+        """
+        return since is not None and since <= context.progress_version
+
+    @staticmethod
+    def _get_completed_node_ids(context: MapGraphContext) -> Set[int]:
+        return set(context.progress.completed_node_ids) if context.progress else set()
+
+    @staticmethod
+    def _get_resolved_arrow_ids(context: MapGraphContext) -> Set[int]:
+        return set(context.progress.resolved_arrow_ids) if context.progress else set()
+
+    def _get_changed_node_ids(
+            self,
+            snapshot: MapGraphSnapshot,
+            context: MapGraphContext,
+            since: Optional[int],
+    ) -> Optional[Set[int]]:
+        """
+        since 이후 상태가 바뀐 Node id 를 반환합니다. (변경분 계산이 불가능하면 None)
+        새로 완료된 Node 와, 그 Node 에서 출발하는 Arrow 의 도착 Node(잠김 -> 진행중)가 대상입니다.
+        """
+        if not self.is_delta_available(context, since):
+            return None
+        if not context.progress:
+            return set()
+        completed_node_ids, _ = MapPlayProgressService().get_changed_ids_since(context.progress, since)
+        changed_node_ids = set(completed_node_ids)
+        for node_id in completed_node_ids:
+            for arrow in snapshot.get_arrows_by_start_node_id(node_id):
+                if not arrow.is_self_arrow:
+                    changed_node_ids.add(arrow.end_node_id)
+        return changed_node_ids
+
+    def _get_changed_arrow_ids(self, context: MapGraphContext, since: Optional[int]) -> Optional[Set[int]]:
+        """
+        since 이후 해결된 Arrow id 를 반환합니다. (변경분 계산이 불가능하면 None)
+        """
+        if not self.is_delta_available(context, since):
+            return None
+        if not context.progress:
+            return set()
+        _, resolved_arrow_ids = MapPlayProgressService().get_changed_ids_since(context.progress, since)
+        return resolved_arrow_ids
+
+    @staticmethod
+    def _get_viewport_node_ids(
+            snapshot: MapGraphSnapshot,
+            viewport: Optional[GraphViewportDTO],
+    ) -> Optional[List[int]]:
+        """
+        viewport 영역과 겹치는 Node id 를 Snapshot 의 그리드 인덱스로 찾습니다. (viewport 가 없으면 None)
+        """
+        if viewport is None:
+            return None
+        return snapshot.get_node_ids_in_bbox(*viewport.get_bbox(snapshot.topology))
+
+    @staticmethod
+    def _build_graph_nodes(
+            snapshot: MapGraphSnapshot,
+            completed_node_ids: Set[int],
+            node_ids: Optional[List[int]] = None,
+    ) -> List[GraphNode]:
+        nodes = snapshot.nodes.values() if node_ids is None else [snapshot.nodes[node_id] for node_id in node_ids]
+        return [
+            GraphNode.from_node(
+                node,
+                completed_node_ids,
+                snapshot.start_node_ids_by_end_node_id,
+            )
+            for node in nodes
+        ]
+
+    @staticmethod
+    def _build_graph_arrows(
+            snapshot: MapGraphSnapshot,
+            resolved_arrow_ids: Set[int],
+            arrow_ids: Optional[List[int]] = None,
+    ) -> List[GraphArrow]:
+        arrows = snapshot.arrows.values() if arrow_ids is None else [snapshot.arrows[arrow_id] for arrow_id in arrow_ids]
+        return [
+            GraphArrow.from_arrow(
+                arrow,
+                resolved_arrow_ids,
+            )
+            for arrow in arrows
+        ]
 
-        nodes = list(get_nodes_by_map_id(map_id))
-        completed_nodes = self.get_map_play_member_completed_nodes(map_play_member_id)
+    @staticmethod
+    def _build_completed_graph_nodes(snapshot: MapGraphSnapshot, completed_node_ids: List[int]) -> List[GraphNode]:
+        """
+        완료된 Node 중 삭제되지 않은 Node 들을 GraphNode 로 반환합니다.
+        """
+        completed_node_id_set = set(completed_node_ids)
+        return [
+            GraphNode.from_node(
+                snapshot.nodes[node_id],
+                completed_node_id_set,
+                {},
+            )
+            for node_id in completed_node_ids
+            if node_id in snapshot.nodes
+        ]
 
+    def _build_map_meta(self, context: MapGraphContext, snapshot: MapGraphSnapshot) -> MapMetaDTO:
+        """
+        레이아웃과 전체 Node 수는 컴파일된 topology 에서, 완료 Node 수는 MapPlay 진행 상태에서 읽으므로
+        Node 수와 관계없이 Node 를 만들지 않고 쿼리도 추가로 발생하지 않습니다.
+        """
         start_date = None
-        if map_play_member_id:
-            try:
-                joined_map_play = MapPlayMember.objects.get(
-                    id=map_play_member_id,
-                    deactivated=False,
-                )
-                # UTC 시간을 현재 timezone으로 변환 후 날짜 추출
-                start_date = timezone.localtime(joined_map_play.created_at).date()
-            except MapPlayMember.DoesNotExist:
-                pass
+        if context.map_play_member:
+            # UTC 시간을 현재 timezone으로 변환 후 날짜 추출
+            start_date = timezone.localtime(context.map_play_member.created_at).date()
         return MapMetaDTO.from_map(
-            map_obj=map_obj,
-            nodes=nodes,
-            completed_nodes=completed_nodes,
+            map_obj=context.map_obj,
+            topology=snapshot.topology,
+            completed_node_count=self._get_completed_node_count(snapshot, context),
             start_date=start_date,
         )
 
+    @staticmethod
+    def _get_completed_node_count(snapshot: MapGraphSnapshot, context: MapGraphContext) -> int:
+        """
+        진행 상태의 완료 Node 중 삭제되지 않은 Node 수를 반환합니다.
+        """
+        if not context.progress:
+            return 0
+        return sum(1 for node_id in context.progress.completed_node_ids if node_id in snapshot.nodes)
+
 
 def get_start_node_ids_by_end_node_id(arrows: List[GraphArrow]) -> Dict[int, Set[int]]:
     """
@@ -0,0 +1,388 @@
+import threading
+from collections import (
+    OrderedDict,
+    defaultdict,
+    deque,
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from django.core.cache import cache
+from django.db.models import F
+
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.consts import (
+    MAP_GRAPH_SNAPSHOT_CACHE_KEY,
+    MAP_GRAPH_SNAPSHOT_CACHE_SECONDS,
+    MAP_GRAPH_SNAPSHOT_LOCAL_CACHE_SIZE,
+)
+from map_graph.dtos.map_graph_snapshot import (
+    MapGraphSnapshot,
+    SnapshotArrow,
+    SnapshotNode,
+    SnapshotRule,
+    get_grid_cell,
+)
+from map_graph.dtos.map_graph_topology import MapGraphTopologyDTO
+from map_graph.models import MapGraphTopology
+
+
+# 워커 프로세스 단위 캐시 (map_id -> 가장 최근에 읽은 버전의 Snapshot)
+_local_snapshots: 'OrderedDict[int, MapGraphSnapshot]' = OrderedDict()
+_local_snapshots_lock = threading.Lock()
+
+
+def get_map_graph_snapshot(map_id: int, version: Optional[int] = None) -> MapGraphSnapshot:
+    """
+    Map 의 컴파일된 그래프 Snapshot 을 반환합니다.
+    프로세스 캐시 -> Redis -> DB 순서로 조회하며, version 을 모르면 Map 에서 읽어옵니다.
+    """
+    if version is None:
+        version = get_map_graph_version(map_id)
+
+    with _local_snapshots_lock:
+        snapshot = _local_snapshots.get(map_id)
+        if snapshot is not None and snapshot.version == version:
+            _local_snapshots.move_to_end(map_id)
+            return snapshot
+
+    cache_key = MAP_GRAPH_SNAPSHOT_CACHE_KEY.format(map_id=map_id, version=version)
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        snapshot = build_map_graph_snapshot(map_id, version)
+        cache.set(cache_key, snapshot, MAP_GRAPH_SNAPSHOT_CACHE_SECONDS)
+
+    with _local_snapshots_lock:
+        _local_snapshots[map_id] = snapshot
+        _local_snapshots.move_to_end(map_id)
+        while len(_local_snapshots) > MAP_GRAPH_SNAPSHOT_LOCAL_CACHE_SIZE:
+            _local_snapshots.popitem(last=False)
+    return snapshot
+
+
+def get_map_graph_version(map_id: int) -> int:
+    return Map.objects.filter(
+        id=map_id,
+    ).values_list(
+        'graph_version',
+        flat=True,
+    ).first() or 0
+
+
+def increase_map_graph_version(map_id: int) -> None:
+    """
+    Map 구조(Node, Arrow, NodeCompleteRule)가 수정되었을 때 호출해야 합니다.
+    버전이 올라가면 다음 조회 시 Snapshot 이 다시 만들어집니다.
+    """
+    Map.objects.filter(
+        id=map_id,
+    ).update(
+        graph_version=F('graph_version') + 1,
+    )
+
+
+def clear_local_map_graph_snapshots() -> None:
+    with _local_snapshots_lock:
+        _local_snapshots.clear()
+
+
+def build_map_graph_snapshot(map_id: int, version: int) -> MapGraphSnapshot:
+    nodes = [
+        SnapshotNode(**node)
+        for node in Node.objects.filter(
+            map_id=map_id,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'name',
+            'title',
+            'position_x',
+            'position_y',
+            'width',
+            'height',
+            'is_active',
+        )
+    ]
+    # end_node 는 rule 의 node 이므로 같은 쿼리에서 함께 가져옵니다.
+    arrows = [
+        SnapshotArrow(
+            id=arrow_id,
+            start_node_id=start_node_id,
+            end_node_id=end_node_id,
+            node_complete_rule_id=node_complete_rule_id,
+        )
+        for arrow_id, start_node_id, node_complete_rule_id, end_node_id in Arrow.objects.filter(
+            map_id=map_id,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values_list(
+            'id',
+            'start_node_id',
+            'node_complete_rule_id',
+            'node_complete_rule__node_id',
+        )
+    ]
+    rules = [
+        SnapshotRule(**rule)
+        for rule in NodeCompleteRule.objects.filter(
+            map_id=map_id,
+            is_deleted=False,
+        ).order_by(
+            'id',
+        ).values(
+            'id',
+            'name',
+            'node_id',
+        )
+    ]
+    return compile_map_graph_snapshot(
+        map_id,
+        version,
+        nodes,
+        arrows,
+        rules,
+        get_saved_map_graph_topology(map_id, version),
+    )
+
+
+def compile_map_graph_snapshot(
+        map_id: int,
+        version: int,
+        nodes: List[SnapshotNode],
+        arrows: List[SnapshotArrow],
+        rules: List[SnapshotRule],
+        topology: Optional[MapGraphTopologyDTO] = None,
+) -> MapGraphSnapshot:
+    """
+    DB 조회 없이 Node / Arrow / Rule 목록으로 인접 리스트와 인덱스를 구성합니다.
+    저장된 컴파일 결과(topology)가 없으면 함께 계산합니다.
+    """
+    arrow_ids_by_start_node_id: Dict[int, List[int]] = defaultdict(list)
+    arrow_ids_by_rule_id: Dict[int, List[int]] = defaultdict(list)
+    start_node_ids_by_end_node_id: Dict[int, Set[int]] = defaultdict(set)
+    self_arrow_ids = set()
+    for arrow in arrows:
+        arrow_ids_by_start_node_id[arrow.start_node_id].append(arrow.id)
+        arrow_ids_by_rule_id[arrow.node_complete_rule_id].append(arrow.id)
+        if arrow.is_self_arrow:
+            self_arrow_ids.add(arrow.id)
+        else:
+            start_node_ids_by_end_node_id[arrow.end_node_id].add(arrow.start_node_id)
+
+    rule_ids_by_node_id: Dict[int, List[int]] = defaultdict(list)
+    for rule in rules:
+        rule_ids_by_node_id[rule.node_id].append(rule.id)
+
+    # Node 가 걸쳐 있는 모든 칸에 등록
+    node_ids_by_grid_cell: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for node in nodes:
+        for cell_x in range(get_grid_cell(node.position_x), get_grid_cell(node.position_x + node.width) + 1):
+            for cell_y in range(get_grid_cell(node.position_y), get_grid_cell(node.position_y + node.height) + 1):
+                node_ids_by_grid_cell[(cell_x, cell_y)].append(node.id)
+
+    return MapGraphSnapshot(
+        map_id=map_id,
+        version=version,
+        nodes={node.id: node for node in nodes},
+        arrows={arrow.id: arrow for arrow in arrows},
+        rules={rule.id: rule for rule in rules},
+        arrow_ids_by_start_node_id={
+            node_id: tuple(arrow_ids) for node_id, arrow_ids in arrow_ids_by_start_node_id.items()
+        },
+        arrow_ids_by_rule_id={
+            rule_id: tuple(arrow_ids) for rule_id, arrow_ids in arrow_ids_by_rule_id.items()
+        },
+        rule_ids_by_node_id={
+            node_id: tuple(rule_ids) for node_id, rule_ids in rule_ids_by_node_id.items()
+        },
+        start_node_ids_by_end_node_id={
+            node_id: frozenset(start_node_ids) for node_id, start_node_ids in start_node_ids_by_end_node_id.items()
+        },
+        self_arrow_ids=frozenset(self_arrow_ids),
+        topology=topology or compile_map_graph_topology(nodes, arrows, rules),
+        node_ids_by_grid_cell={
+            cell: tuple(node_ids) for cell, node_ids in node_ids_by_grid_cell.items()
+        },
+    )
+
+
+def compile_map_graph_topology(
+        nodes: List[SnapshotNode],
+        arrows: List[SnapshotArrow],
+        rules: List[SnapshotRule],
+) -> MapGraphTopologyDTO:
+    """
+    DB 조회 없이 Map 구조를 검증하고 위상 정보를 계산합니다.
+    - 위상 정렬 / 깊이: self arrow 를 제외한 Arrow 로 Kahn 알고리즘을 수행합니다.
+    - 순환: 위상 정렬에서 남은 Node 중, 뒤쪽으로만 이어진 Node 를 걷어내고 남은 Node 입니다.
+    - 고아 Rule: Arrow 가 없거나 삭제된 Node 를 해금하는 Rule 입니다.
+    - 완료할 수 없는 Node: self arrow 만 있는 Rule 부터 완료를 전파해도 완료되지 않는 Node 입니다.
+    """
+    node_ids = sorted(node.id for node in nodes)
+    node_id_set = set(node_ids)
+    successor_ids_by_node_id: Dict[int, Set[int]] = defaultdict(set)
+    predecessor_ids_by_node_id: Dict[int, Set[int]] = defaultdict(set)
+    start_node_ids_by_rule_id: Dict[int, Set[int]] = defaultdict(set)
+    rule_ids_by_start_node_id: Dict[int, Set[int]] = defaultdict(set)
+    arrow_rule_ids = set()
+    for arrow in arrows:
+        arrow_rule_ids.add(arrow.node_complete_rule_id)
+        if arrow.is_self_arrow:
+            continue
+        start_node_ids_by_rule_id[arrow.node_complete_rule_id].add(arrow.start_node_id)
+        rule_ids_by_start_node_id[arrow.start_node_id].add(arrow.node_complete_rule_id)
+        if arrow.start_node_id in node_id_set and arrow.end_node_id in node_id_set:
+            successor_ids_by_node_id[arrow.start_node_id].add(arrow.end_node_id)
+            predecessor_ids_by_node_id[arrow.end_node_id].add(arrow.start_node_id)
+
+    # 위상 정렬 및 시작 Node 로부터의 최장 거리
+    in_degrees = {node_id: len(predecessor_ids_by_node_id.get(node_id, ())) for node_id in node_ids}
+    start_node_ids = [node_id for node_id in node_ids if not in_degrees[node_id]]
+    depth_by_node_id = {node_id: 0 for node_id in start_node_ids}
+    topological_order = []
+    nodes_to_process = deque(start_node_ids)
+    while nodes_to_process:
+        node_id = nodes_to_process.popleft()
+        topological_order.append(node_id)
+        for next_node_id in sorted(successor_ids_by_node_id.get(node_id, ())):
+            depth_by_node_id[next_node_id] = max(depth_by_node_id.get(next_node_id, 0), depth_by_node_id[node_id] + 1)
+            in_degrees[next_node_id] -= 1
+            if not in_degrees[next_node_id]:
+                nodes_to_process.append(next_node_id)
+
+    # 정렬되지 않은 Node 중 순환 뒤쪽에만 있는 Node 를 걷어내면 순환 위의 Node 만 남음
+    cycle_node_ids = node_id_set.difference(topological_order)
+    out_degrees = {
+        node_id: len(successor_ids_by_node_id.get(node_id, set()) & cycle_node_ids)
+        for node_id in cycle_node_ids
+    }
+    nodes_to_process = deque(node_id for node_id, out_degree in out_degrees.items() if not out_degree)
+    while nodes_to_process:
+        node_id = nodes_to_process.popleft()
+        cycle_node_ids.discard(node_id)
+        for prev_node_id in predecessor_ids_by_node_id.get(node_id, ()):
+            if prev_node_id not in out_degrees:
+                continue
+            out_degrees[prev_node_id] -= 1
+            if not out_degrees[prev_node_id]:
+                nodes_to_process.append(prev_node_id)
+    for node_id in node_id_set.difference(topological_order):
+        depth_by_node_id.pop(node_id, None)
+
+    orphan_rule_ids = {
+        rule.id
+        for rule in rules
+        if rule.id not in arrow_rule_ids or rule.node_id not in node_id_set
+    }
+
+    # Rule 단위로 완료 가능 여부 전파 (남은 시작 Node 수가 0 이 되면 Rule 의 Node 완료 가능)
+    node_id_by_rule_id = {rule.id: rule.node_id for rule in rules if rule.id not in orphan_rule_ids}
+    pending_counts = {rule_id: len(start_node_ids_by_rule_id.get(rule_id, ())) for rule_id in node_id_by_rule_id}
+    completable_node_ids = set()
+    nodes_to_process = deque(
+        node_id_by_rule_id[rule_id]
+        for rule_id, pending_count in pending_counts.items()
+        if not pending_count
+    )
+    while nodes_to_process:
+        node_id = nodes_to_process.popleft()
+        if node_id in completable_node_ids:
+            continue
+        completable_node_ids.add(node_id)
+        for rule_id in rule_ids_by_start_node_id.get(node_id, ()):
+            if rule_id not in pending_counts:
+                continue
+            pending_counts[rule_id] -= 1
+            if not pending_counts[rule_id]:
+                nodes_to_process.append(node_id_by_rule_id[rule_id])
+
+    return MapGraphTopologyDTO(
+        topological_order=tuple(topological_order),
+        depth_by_node_id=depth_by_node_id,
+        start_node_ids=tuple(start_node_ids),
+        cycle_node_ids=tuple(sorted(cycle_node_ids)),
+        orphan_rule_ids=tuple(sorted(orphan_rule_ids)),
+        unreachable_node_ids=tuple(sorted(node_id_set - completable_node_ids)),
+        min_x=min((node.position_x for node in nodes), default=0),
+        max_x=max((node.position_x + node.width for node in nodes), default=0),
+        min_y=min((node.position_y for node in nodes), default=0),
+        max_y=max((node.position_y + node.height for node in nodes), default=0),
+        node_count=len(nodes),
+        arrow_count=len(arrows),
+        rule_count=len(rules),
+    )
+
+
+def get_saved_map_graph_topology(map_id: int, version: int) -> Optional[MapGraphTopologyDTO]:
+    """
+    같은 graph_version 으로 저장된 컴파일 결과를 반환합니다. (없거나 이전 버전이면 None)
+    """
+    topology = MapGraphTopology.objects.filter(
+        map_id=map_id,
+        graph_version=version,
+    ).first()
+    if topology is None:
+        return None
+    return MapGraphTopologyDTO.from_topology(topology)
+
+
+def get_map_node_count(map_id: int, version: int) -> int:
+    """
+    저장된 컴파일 결과에서 Node 수만 읽습니다.
+    같은 graph_version 으로 저장된 결과가 없으면 Map 그래프 Snapshot 에서 계산합니다.
+    """
+    node_count = MapGraphTopology.objects.filter(
+        map_id=map_id,
+        graph_version=version,
+    ).values_list(
+        'node_count',
+        flat=True,
+    ).first()
+    if node_count is None:
+        return get_map_graph_snapshot(map_id, version).topology.node_count
+    return node_count
+
+
+def save_map_graph_topology(map_id: int) -> MapGraphTopologyDTO:
+    """
+    현재 graph_version 의 Map 구조를 컴파일해서 저장합니다.
+    Map 구조를 수정하고 increase_map_graph_version 을 호출한 뒤에 호출해야 합니다.
+    Admin 처럼 Map 구조를 수정한 트랜잭션 안에서 호출되므로, 롤백되면 사라질 구조의 Snapshot 이 남지 않도록
+    Redis / 프로세스 캐시에 저장하지 않고 만듭니다. (컴파일 결과 row 는 같은 트랜잭션에서 함께 롤백됨)
+    """
+    version = get_map_graph_version(map_id)
+    topology = build_map_graph_snapshot(map_id, version).topology
+    MapGraphTopology.objects.update_or_create(
+        map_id=map_id,
+        defaults={
+            'graph_version': version,
+            'topological_order': list(topology.topological_order),
+            'depth_by_node_id': {str(node_id): depth for node_id, depth in topology.depth_by_node_id.items()},
+            'start_node_ids': list(topology.start_node_ids),
+            'cycle_node_ids': list(topology.cycle_node_ids),
+            'orphan_rule_ids': list(topology.orphan_rule_ids),
+            'unreachable_node_ids': list(topology.unreachable_node_ids),
+            'min_x': topology.min_x,
+            'max_x': topology.max_x,
+            'min_y': topology.min_y,
+            'max_y': topology.max_y,
+            'node_count': topology.node_count,
+            'arrow_count': topology.arrow_count,
+            'rule_count': topology.rule_count,
+            'is_valid': topology.is_valid,
+        },
+    )
+    return topology
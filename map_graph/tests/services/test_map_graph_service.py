@@ -1,4 +1,7 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from map.exceptions import MapNotFoundException
 from map.models import (
     Map,
@@ -6,10 +9,21 @@ from map.models import (
     NodeCompleteRule,
     NodeCompletedHistory,
     Arrow,
+    ArrowProgress,
 )
 from map_graph.dtos.graph_arrow import GraphArrow
 from map_graph.services.map_graph_service import MapGraphService, get_start_node_ids_by_end_node_id
+from map_graph.services.map_graph_snapshot_service import (
+    clear_local_map_graph_snapshots,
+    increase_map_graph_version,
+)
 from member.models import Member
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from play.services import MapPlayProgressService
 from subscription.models import MapSubscription
 
 
@@ -249,11 +263,15 @@ class MapGraphServiceTest(TestCase):
         service = MapGraphService(member_id=self.member.id)
 
         # Given: Arrow 생성
+        node_complete_rule = NodeCompleteRule.objects.create(
+            map=self.map,
+            name='Test Rule 1',
+            node=self.nodes[1],
+        )
         arrow = Arrow.objects.create(
             map=self.map,
             start_node=self.nodes[0],
-            end_node=self.nodes[1],
-            node_complete_rule=self.node_complete_rule,
+            node_complete_rule=node_complete_rule,
         )
 
         # When: Arrow 목록 조회
@@ -264,8 +282,9 @@ class MapGraphServiceTest(TestCase):
         self.assertEqual(arrows[0].id, arrow.id)
         self.assertEqual(arrows[0].start_node_id, self.nodes[0].id)
         self.assertEqual(arrows[0].end_node_id, self.nodes[1].id)
-        self.assertEqual(arrows[0].active_rule_id, self.node_complete_rule.id)
-        self.assertEqual(arrows[0].status, 'completed')
+        self.assertEqual(arrows[0].active_rule_id, node_complete_rule.id)
+        # Then: MapPlay 없이 조회하면 잠김 상태여야 함
+        self.assertEqual(arrows[0].status, 'locked')
 
     def test_should_return_empty_list_when_get_arrows_with_no_arrows(self):
         # Given: 서비스 초기화
@@ -281,22 +300,48 @@ class MapGraphServiceTest(TestCase):
         # Given: 서비스 초기화
         service = MapGraphService(member_id=self.member.id)
 
-        # Given: Arrow 생성
+        # Given: node0 -> node1 -> node2 Arrow 생성
+        rules = [
+            NodeCompleteRule.objects.create(
+                map=self.map,
+                name=f'Test Rule {i}',
+                node=self.nodes[i],
+            )
+            for i in (1, 2)
+        ]
         arrow1 = Arrow.objects.create(
             map=self.map,
             start_node=self.nodes[0],  # completed node
-            end_node=self.nodes[1],
-            node_complete_rule=self.node_complete_rule,
+            node_complete_rule=rules[0],
         )
         arrow2 = Arrow.objects.create(
             map=self.map,
             start_node=self.nodes[1],  # not completed node
-            end_node=self.nodes[2],
-            node_complete_rule=self.node_complete_rule,
+            node_complete_rule=rules[1],
         )
 
+        # Given: MapPlay 에서 arrow1 해결
+        map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        map_play_member = MapPlayMember.objects.create(
+            map_play=map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+        ArrowProgress.objects.create(
+            map=self.map,
+            arrow=arrow1,
+            member=self.member,
+            map_play_member=map_play_member,
+            is_resolved=True,
+        )
+        MapPlayProgressService().rebuild_progress(map_play.id)
+
         # When: Arrow 목록 조회
-        arrows = service.get_arrows(self.map.id)
+        arrows = service.get_arrows(self.map.id, map_play_member.id)
 
         # Then: Arrow 상태가 올바르게 설정되어야 함
         arrows_by_id = {arrow.id: arrow for arrow in arrows}
@@ -313,11 +358,22 @@ class MapGraphServiceTest(TestCase):
         )
 
         # Given: Arrow 생성
+        private_node = Node.objects.create(
+            map=private_map,
+            name='Private Node',
+            title='Private Title',
+            description='Private Description',
+            position_x=0,
+            position_y=0,
+        )
         Arrow.objects.create(
             map=private_map,
-            start_node=self.nodes[0],
-            end_node=self.nodes[1],
-            node_complete_rule=self.node_complete_rule,
+            start_node=private_node,
+            node_complete_rule=NodeCompleteRule.objects.create(
+                map=private_map,
+                name='Private Rule',
+                node=private_node,
+            ),
         )
 
         # Given: 비회원으로 서비스 초기화
@@ -455,3 +511,225 @@ class MapGraphServiceTest(TestCase):
 
         # Then: 정상적으로 조회되어야 함
         self.assertEqual(meta.id, private_map.id)
+
+
+class MapGraphServiceArrowQueryTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 사용자, Map 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+            is_private=False,
+        )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def _create_chain(self, arrow_count: int):
+        # node0 -> node1 -> ... 체인 구조 생성
+        nodes = Node.objects.bulk_create([
+            Node(
+                map=self.map,
+                name=f'Node {i}',
+                title=f'Title {i}',
+                description=f'Description {i}',
+                position_x=i * 100,
+                position_y=0,
+            )
+            for i in range(arrow_count + 1)
+        ])
+        rules = NodeCompleteRule.objects.bulk_create([
+            NodeCompleteRule(
+                map=self.map,
+                name=f'Rule {i}',
+                node=node,
+            )
+            for i, node in enumerate(nodes)
+        ])
+        return Arrow.objects.bulk_create([
+            Arrow(
+                map=self.map,
+                start_node=nodes[i],
+                node_complete_rule=rules[i + 1],
+            )
+            for i in range(arrow_count)
+        ])
+
+    def _create_map_play_member(self, title: str) -> MapPlayMember:
+        map_play = MapPlay.objects.create(
+            map=self.map,
+            title=title,
+            created_by=self.member,
+        )
+        return MapPlayMember.objects.create(
+            map_play=map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+
+    def _count_get_arrows_queries(self, map_play_member_id: int) -> int:
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            MapGraphService(member_id=self.member.id).get_arrows(self.map.id, map_play_member_id)
+        return len(context.captured_queries)
+
+    def test_get_arrows_should_use_constant_queries_regardless_of_arrow_count(self):
+        # Given: Arrow 10개 Map 의 쿼리 수 측정
+        arrows = self._create_chain(10)
+        map_play_member = self._create_map_play_member('Test Play')
+        MapPlayProgressService().rebuild_progress(map_play_member.map_play_id)
+        small_query_count = self._count_get_arrows_queries(map_play_member.id)
+
+        # Given: Arrow 300개로 늘린 뒤 절반 해결
+        arrows += self._create_chain(290)
+        ArrowProgress.objects.bulk_create([
+            ArrowProgress(
+                map=self.map,
+                arrow=arrow,
+                member=self.member,
+                map_play_member=map_play_member,
+                is_resolved=True,
+            )
+            for arrow in arrows[:150]
+        ])
+        MapPlayProgressService().rebuild_progress(map_play_member.map_play_id)
+
+        # When: Arrow 300개 Map 조회
+        # Then: 쿼리 수가 Arrow 수와 관계없이 같아야 함
+        self.assertEqual(self._count_get_arrows_queries(map_play_member.id), small_query_count)
+
+        # Then: Map 구조 캐시가 있으면 Map, MapPlayMember, 진행 상태 조회만 발생해야 함
+        with self.assertNumQueries(3):
+            result = MapGraphService(member_id=self.member.id).get_arrows(self.map.id, map_play_member.id)
+        self.assertEqual(len(result), 300)
+        self.assertEqual(
+            {arrow.id for arrow in result if arrow.status == 'completed'},
+            {arrow.id for arrow in arrows[:150]},
+        )
+
+    def test_get_arrows_should_scope_progress_to_map_play(self):
+        # Given: 같은 Map 의 두 MapPlay 중 하나에서만 Arrow 해결
+        arrows = self._create_chain(2)
+        map_play_member = self._create_map_play_member('Test Play')
+        other_map_play_member = self._create_map_play_member('Other Play')
+        ArrowProgress.objects.create(
+            map=self.map,
+            arrow=arrows[0],
+            member=self.member,
+            map_play_member=other_map_play_member,
+            is_resolved=True,
+        )
+        MapPlayProgressService().rebuild_progress(other_map_play_member.map_play_id)
+
+        # When: 다른 MapPlay 로 조회
+        result = MapGraphService(member_id=self.member.id).get_arrows(self.map.id, map_play_member.id)
+
+        # Then: 다른 MapPlay 의 진행 상태가 섞이지 않아야 함
+        self.assertEqual({arrow.status for arrow in result}, {'locked'})
+
+        # When: 해결한 MapPlay 로 조회
+        result = MapGraphService(member_id=self.member.id).get_arrows(self.map.id, other_map_play_member.id)
+
+        # Then: 해결한 Arrow 만 완료 상태여야 함
+        self.assertEqual(
+            {arrow.id: arrow.status for arrow in result},
+            {arrows[0].id: 'completed', arrows[1].id: 'locked'},
+        )
+
+
+class MapGraphServiceMapMetaTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 사용자, Map, MapPlay 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+            is_private=False,
+        )
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=self.map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def test_get_map_meta_should_return_empty_layout_when_map_has_no_node(self):
+        # When: Node 가 없는 Map 의 메타 정보 조회
+        meta = MapGraphService(member_id=self.member.id).get_map_meta(self.map.id, self.map_play_member.id)
+
+        # Then: 레이아웃과 Node 수가 0 이어야 함
+        self.assertEqual(meta.stats.total_nodes, 0)
+        self.assertEqual(meta.stats.completed_nodes, 0)
+        self.assertEqual(
+            (meta.layout.min_x, meta.layout.max_x, meta.layout.min_y, meta.layout.max_y),
+            (0, 0, 0, 0),
+        )
+        self.assertEqual((meta.layout.width, meta.layout.height), (0, 0))
+
+    def test_get_map_meta_should_read_precomputed_values(self):
+        # Given: 200 개 Node 중 3 개 완료, 그 중 1 개는 이후 삭제
+        nodes = Node.objects.bulk_create([
+            Node(
+                map=self.map,
+                name=f'Node {i}',
+                title=f'Title {i}',
+                description=f'Description {i}',
+                position_x=i * 10,
+                position_y=-i,
+            )
+            for i in range(200)
+        ])
+        rules = NodeCompleteRule.objects.bulk_create([
+            NodeCompleteRule(map=self.map, name=f'Rule {i}', node=node)
+            for i, node in enumerate(nodes[:3])
+        ])
+        NodeCompletedHistory.objects.bulk_create([
+            NodeCompletedHistory(
+                map=self.map,
+                node=node,
+                member=self.member,
+                map_play_member=self.map_play_member,
+                node_complete_rule=rule,
+            )
+            for node, rule in zip(nodes[:3], rules)
+        ])
+        MapPlayProgressService().rebuild_progress(self.map_play.id)
+        Node.objects.filter(id=nodes[2].id).update(is_deleted=True)
+        increase_map_graph_version(self.map.id)
+        service = MapGraphService(member_id=self.member.id)
+        service.get_map_meta(self.map.id, self.map_play_member.id)
+
+        # When: Map 구조 캐시가 있는 상태에서 다시 조회
+        # Then: Map 조회, MapPlayMember 조회, 진행 상태 조회 3번만 발생해야 함
+        with self.assertNumQueries(3):
+            meta = service.get_map_meta(self.map.id, self.map_play_member.id)
+
+        # Then: 삭제된 Node 는 전체/완료 수에서 빠져야 함
+        self.assertEqual(meta.stats.total_nodes, 199)
+        self.assertEqual(meta.stats.completed_nodes, 2)
+        # Then: 레이아웃은 Node 의 width / height 를 포함해야 함
+        self.assertEqual((meta.layout.min_x, meta.layout.max_x), (0, 1990 + nodes[0].width))
+        self.assertEqual((meta.layout.min_y, meta.layout.max_y), (-199, nodes[0].height))
@@ -0,0 +1,336 @@
+import random
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.consts import MAP_GRAPH_SNAPSHOT_CACHE_KEY
+from map_graph.dtos.map_graph_snapshot import (
+    SnapshotArrow,
+    SnapshotNode,
+    SnapshotRule,
+)
+from map_graph.models import MapGraphTopology
+from map_graph.services.map_graph_snapshot_service import (
+    clear_local_map_graph_snapshots,
+    compile_map_graph_snapshot,
+    compile_map_graph_topology,
+    get_map_graph_snapshot,
+    get_map_node_count,
+    increase_map_graph_version,
+    save_map_graph_topology,
+)
+from member.models import Member
+
+
+class MapGraphSnapshotServiceTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 사용자 및 Map 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+        )
+        # Given: node1 -> node2 구조
+        self.node1 = Node.objects.create(
+            map=self.map,
+            name='Node 1',
+            title='Title 1',
+            description='Description 1',
+            position_x=100,
+            position_y=100,
+        )
+        self.node2 = Node.objects.create(
+            map=self.map,
+            name='Node 2',
+            title='Title 2',
+            description='Description 2',
+            position_x=200,
+            position_y=200,
+        )
+        self.rule1 = NodeCompleteRule.objects.create(
+            map=self.map,
+            node=self.node1,
+            name='Rule 1',
+        )
+        self.rule2 = NodeCompleteRule.objects.create(
+            map=self.map,
+            node=self.node2,
+            name='Rule 2',
+        )
+        self.self_arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.node1,
+            node_complete_rule=self.rule1,
+        )
+        self.arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.node1,
+            node_complete_rule=self.rule2,
+        )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def test_get_map_graph_snapshot(self):
+        # When: Snapshot 조회
+        snapshot = get_map_graph_snapshot(self.map.id)
+
+        # Then: Map 구조가 컴파일되어 있어야 함
+        self.assertEqual(set(snapshot.nodes.keys()), {self.node1.id, self.node2.id})
+        self.assertEqual(set(snapshot.rules.keys()), {self.rule1.id, self.rule2.id})
+        self.assertEqual(snapshot.arrows[self.arrow.id].end_node_id, self.node2.id)
+        self.assertEqual(snapshot.self_arrow_ids, frozenset({self.self_arrow.id}))
+        self.assertEqual(snapshot.start_node_ids_by_end_node_id, {self.node2.id: frozenset({self.node1.id})})
+        self.assertEqual(
+            [arrow.id for arrow in snapshot.get_arrows_by_start_node_id(self.node1.id)],
+            [self.self_arrow.id, self.arrow.id],
+        )
+        self.assertEqual(
+            [rule.id for rule in snapshot.get_rules_by_node_id(self.node2.id)],
+            [self.rule2.id],
+        )
+
+    def test_get_map_graph_snapshot_should_use_cache_when_version_not_changed(self):
+        # Given: Snapshot 을 한 번 조회
+        get_map_graph_snapshot(self.map.id, 0)
+
+        # When: 같은 버전으로 다시 조회
+        # Then: Map 구조 조회 쿼리가 발생하지 않아야 함
+        with self.assertNumQueries(0):
+            snapshot = get_map_graph_snapshot(self.map.id, 0)
+        self.assertEqual(len(snapshot.nodes), 2)
+
+        # When: 프로세스 캐시가 비워진 경우
+        clear_local_map_graph_snapshots()
+
+        # Then: Redis 캐시에서 가져와야 함
+        with self.assertNumQueries(0):
+            snapshot = get_map_graph_snapshot(self.map.id, 0)
+        self.assertEqual(len(snapshot.nodes), 2)
+
+    def test_get_map_graph_snapshot_should_rebuild_when_version_increased(self):
+        # Given: Snapshot 을 한 번 조회
+        get_map_graph_snapshot(self.map.id)
+        # Given: Node 추가 후 버전 증가
+        node3 = Node.objects.create(
+            map=self.map,
+            name='Node 3',
+            title='Title 3',
+            description='Description 3',
+            position_x=300,
+            position_y=300,
+        )
+        increase_map_graph_version(self.map.id)
+
+        # When: Snapshot 재조회
+        snapshot = get_map_graph_snapshot(self.map.id)
+
+        # Then: 새로운 버전으로 다시 만들어져야 함
+        self.assertEqual(snapshot.version, 1)
+        self.assertIn(node3.id, snapshot.nodes)
+
+    def test_get_map_graph_snapshot_should_exclude_deleted(self):
+        # Given: Arrow 삭제
+        self.arrow.is_deleted = True
+        self.arrow.save()
+
+        # When: Snapshot 조회
+        snapshot = get_map_graph_snapshot(self.map.id)
+
+        # Then: 삭제된 Arrow 는 포함되지 않아야 함
+        self.assertNotIn(self.arrow.id, snapshot.arrows)
+        self.assertEqual(snapshot.start_node_ids_by_end_node_id, {})
+
+    def test_save_map_graph_topology(self):
+        # When: Map 구조 컴파일 후 저장
+        increase_map_graph_version(self.map.id)
+        topology = save_map_graph_topology(self.map.id)
+
+        # Then: 위상 정보와 레이아웃 영역이 계산되어 있어야 함
+        self.assertTrue(topology.is_valid)
+        self.assertEqual(topology.topological_order, (self.node1.id, self.node2.id))
+        self.assertEqual(topology.start_node_ids, (self.node1.id,))
+        self.assertEqual(topology.depth_by_node_id, {self.node1.id: 0, self.node2.id: 1})
+        self.assertEqual(
+            (topology.min_x, topology.max_x, topology.min_y, topology.max_y),
+            (100, 200 + self.node2.width, 100, 200 + self.node2.height),
+        )
+        saved_topology = MapGraphTopology.objects.get(map=self.map)
+        self.assertEqual(saved_topology.graph_version, 1)
+        self.assertEqual(saved_topology.depth_by_node_id, {str(self.node1.id): 0, str(self.node2.id): 1})
+
+        # When: 캐시가 비워진 뒤 Snapshot 을 다시 만드는 경우
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        snapshot = get_map_graph_snapshot(self.map.id, 1)
+
+        # Then: 저장된 컴파일 결과를 그대로 사용해야 함
+        self.assertEqual(snapshot.topology, topology)
+
+    def test_save_map_graph_topology_should_not_cache_uncommitted_snapshot(self):
+        # When: Map 구조 수정 후 컴파일했지만 트랜잭션이 롤백된 경우 (Admin 저장 실패)
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                Node.objects.filter(id=self.node2.id).update(is_deleted=True)
+                increase_map_graph_version(self.map.id)
+                save_map_graph_topology(self.map.id)
+                raise RuntimeError()
+
+        # Then: 커밋되지 않은 구조의 Snapshot 이 캐싱되지 않아야 함
+        self.assertIsNone(cache.get(MAP_GRAPH_SNAPSHOT_CACHE_KEY.format(map_id=self.map.id, version=1)))
+
+        # When: 다시 수정해서 같은 버전이 된 뒤 조회
+        increase_map_graph_version(self.map.id)
+        snapshot = get_map_graph_snapshot(self.map.id)
+
+        # Then: 롤백된 구조가 아닌 현재 구조여야 함
+        self.assertEqual(snapshot.version, 1)
+        self.assertIn(self.node2.id, snapshot.nodes)
+
+    def test_get_map_node_count_should_read_saved_topology(self):
+        # Given: Map 구조 컴파일 결과 저장
+        increase_map_graph_version(self.map.id)
+        save_map_graph_topology(self.map.id)
+
+        # When: 저장된 graph_version 으로 Node 수 조회
+        with self.assertNumQueries(1):
+            node_count = get_map_node_count(self.map.id, 1)
+
+        # Then: 저장된 Node 수를 반환해야 함
+        self.assertEqual(node_count, 2)
+
+    def test_get_map_node_count_should_fallback_to_snapshot_when_not_saved(self):
+        # When: 저장된 컴파일 결과가 없는 경우
+        node_count = get_map_node_count(self.map.id, 0)
+
+        # Then: Snapshot 에서 계산한 Node 수를 반환해야 함
+        self.assertEqual(node_count, 2)
+
+
+class CompileMapGraphTopologyTest(TestCase):
+    @staticmethod
+    def _node(node_id: int, position_x: float = 0, position_y: float = 0) -> SnapshotNode:
+        return SnapshotNode(
+            id=node_id,
+            name='',
+            title='',
+            position_x=position_x,
+            position_y=position_y,
+            width=10,
+            height=20,
+            is_active=True,
+        )
+
+    def test_compile_map_graph_topology_should_find_depth_and_start_nodes(self):
+        # Given: 1 -> 2 -> 4, 1 -> 3 -> 4, 3 -> 4 는 Rule 두 개 중 하나
+        nodes = [self._node(node_id, node_id * 100, -node_id * 10) for node_id in range(1, 5)]
+        rules = [SnapshotRule(id=node_id, name='', node_id=node_id) for node_id in range(1, 5)]
+        rules.append(SnapshotRule(id=5, name='', node_id=4))
+        arrows = [
+            SnapshotArrow(id=1, start_node_id=1, end_node_id=1, node_complete_rule_id=1),
+            SnapshotArrow(id=2, start_node_id=1, end_node_id=2, node_complete_rule_id=2),
+            SnapshotArrow(id=3, start_node_id=1, end_node_id=3, node_complete_rule_id=3),
+            SnapshotArrow(id=4, start_node_id=2, end_node_id=4, node_complete_rule_id=4),
+            SnapshotArrow(id=5, start_node_id=3, end_node_id=4, node_complete_rule_id=5),
+        ]
+
+        # When: 컴파일
+        topology = compile_map_graph_topology(nodes, arrows, rules)
+
+        # Then: 위상 정렬, 깊이, 레이아웃 영역이 계산되어야 함
+        self.assertTrue(topology.is_valid)
+        self.assertEqual(topology.topological_order, (1, 2, 3, 4))
+        self.assertEqual(topology.start_node_ids, (1,))
+        self.assertEqual(topology.depth_by_node_id, {1: 0, 2: 1, 3: 1, 4: 2})
+        self.assertEqual((topology.min_x, topology.max_x), (100, 410))
+        self.assertEqual((topology.min_y, topology.max_y), (-40, 10))
+        self.assertEqual((topology.node_count, topology.arrow_count, topology.rule_count), (4, 5, 5))
+
+    def test_compile_map_graph_topology_should_find_cycle_orphan_rule_and_unreachable_nodes(self):
+        # Given: 1(시작) -> 2 <-> 3 -> 4 순환, Arrow 가 없는 Rule, Rule 이 없는 Node 5
+        nodes = [self._node(node_id) for node_id in range(1, 6)]
+        rules = [SnapshotRule(id=node_id, name='', node_id=node_id) for node_id in range(1, 6)]
+        arrows = [
+            SnapshotArrow(id=1, start_node_id=1, end_node_id=1, node_complete_rule_id=1),
+            SnapshotArrow(id=2, start_node_id=1, end_node_id=2, node_complete_rule_id=2),
+            SnapshotArrow(id=3, start_node_id=3, end_node_id=2, node_complete_rule_id=2),
+            SnapshotArrow(id=4, start_node_id=2, end_node_id=3, node_complete_rule_id=3),
+            SnapshotArrow(id=5, start_node_id=3, end_node_id=4, node_complete_rule_id=4),
+        ]
+
+        # When: 컴파일
+        topology = compile_map_graph_topology(nodes, arrows, rules)
+
+        # Then: 순환 위의 Node 만 순환으로, 순환 뒤 Node 는 완료할 수 없는 Node 로 표시되어야 함
+        self.assertFalse(topology.is_valid)
+        self.assertEqual(topology.cycle_node_ids, (2, 3))
+        self.assertEqual(topology.orphan_rule_ids, (5,))
+        self.assertEqual(topology.unreachable_node_ids, (2, 3, 4, 5))
+        self.assertEqual(topology.start_node_ids, (1, 5))
+        self.assertEqual(topology.topological_order, (1, 5))
+        self.assertEqual(topology.depth_by_node_id, {1: 0, 5: 0})
+
+    def test_compile_map_graph_topology_should_allow_empty_map(self):
+        # When: Node 가 없는 Map 컴파일
+        topology = compile_map_graph_topology([], [], [])
+
+        # Then: 레이아웃 영역은 0 이어야 함
+        self.assertTrue(topology.is_valid)
+        self.assertEqual((topology.min_x, topology.max_x, topology.min_y, topology.max_y), (0, 0, 0, 0))
+
+
+class MapGraphSnapshotGridIndexTest(TestCase):
+    def test_get_node_ids_in_bbox_should_equal_full_scan(self):
+        # Given: 무작위로 배치된 크기가 다른 Node
+        randomizer = random.Random(11)
+        nodes = [
+            SnapshotNode(
+                id=node_id,
+                name='',
+                title='',
+                position_x=randomizer.uniform(-5000, 20000),
+                position_y=randomizer.uniform(-5000, 20000),
+                width=randomizer.choice([50, 100, 2500]),
+                height=randomizer.choice([50, 100, 2500]),
+                is_active=True,
+            )
+            for node_id in range(500)
+        ]
+        snapshot = compile_map_graph_snapshot(0, 0, nodes, [], [])
+
+        for _ in range(50):
+            # Given: 무작위 영역 (레이아웃 밖으로 벗어나는 영역 포함)
+            min_x = randomizer.uniform(-10000, 25000)
+            min_y = randomizer.uniform(-10000, 25000)
+            max_x = min_x + randomizer.uniform(0, 8000)
+            max_y = min_y + randomizer.uniform(0, 8000)
+
+            # When: 그리드 인덱스로 조회
+            node_ids = snapshot.get_node_ids_in_bbox(min_x, min_y, max_x, max_y)
+
+            # Then: 모든 Node 를 확인한 결과와 같아야 함
+            self.assertEqual(
+                node_ids,
+                [
+                    node.id
+                    for node in nodes
+                    if node.position_x <= max_x
+                    and node.position_x + node.width >= min_x
+                    and node.position_y <= max_y
+                    and node.position_y + node.height >= min_y
+                ],
+            )
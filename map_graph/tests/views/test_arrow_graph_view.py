@@ -60,7 +60,6 @@ class ArrowGraphViewTest(TestCase):
         self.arrow = Arrow.objects.create(
             map=self.map,
             start_node=self.nodes[0],
-            end_node=self.nodes[1],
             node_complete_rule=self.node_complete_rule,
         )
 
@@ -0,0 +1,227 @@
+from unittest.mock import patch
+
+from common.common_consts.common_status_codes import SuccessStatusCode
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from map.models import (
+    Arrow,
+    ArrowProgress,
+    Map,
+    Node,
+    NodeCompleteRule,
+    NodeCompletedHistory,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Guest, Member
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class GraphBundleViewTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 클라이언트 설정
+        self.client = APIClient()
+
+        # Given: 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+            member_status_id=1,
+        )
+        self.guest = Guest.objects.create(
+            member=self.member,
+            temp_nickname='testsdfsdf',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+
+        # Given: 테스트 Map 생성
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+            is_private=False,
+        )
+
+        # Given: node0 -> node1 구조
+        self.nodes = [
+            Node.objects.create(
+                map=self.map,
+                name=f'Test Node {i}',
+                title=f'Test Title {i}',
+                description=f'Test Description {i}',
+                position_x=i * 100,
+                position_y=i * 100,
+                is_active=True,
+            )
+            for i in range(2)
+        ]
+        self.rules = [
+            NodeCompleteRule.objects.create(
+                map=self.map,
+                name=f'Test Rule {i}',
+                node=node,
+            )
+            for i, node in enumerate(self.nodes)
+        ]
+        self.question_arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[0],
+            node_complete_rule=self.rules[0],
+        )
+        self.arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[0],
+            node_complete_rule=self.rules[1],
+        )
+
+        # Given: MapPlay 에서 node0 완료
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=self.map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+        for arrow in (self.question_arrow, self.arrow):
+            ArrowProgress.objects.create(
+                map=self.map,
+                arrow=arrow,
+                member=self.member,
+                map_play_member=self.map_play_member,
+                is_resolved=True,
+            )
+        NodeCompletedHistory.objects.create(
+            map=self.map,
+            node=self.nodes[0],
+            member=self.member,
+            map_play_member=self.map_play_member,
+            node_complete_rule=self.rules[0],
+        )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_graph_bundle(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 그래프 묶음 API 호출
+        response = self.client.get(
+            reverse(
+                'map-graph:graph-bundle-with-map-play-member',
+                kwargs={'map_id': self.map.id, 'map_play_member_id': self.map_play_member.id},
+            ),
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 응답 검증
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status_code'], SuccessStatusCode.SUCCESS.value)
+        data = response.data['data']
+        self.assertEqual(
+            {node['id']: node['status'] for node in data['nodes']},
+            {self.nodes[0].id: 'completed', self.nodes[1].id: 'in_progress'},
+        )
+        self.assertEqual(
+            {arrow['id']: arrow['status'] for arrow in data['arrows']},
+            {self.question_arrow.id: 'completed', self.arrow.id: 'completed'},
+        )
+        self.assertEqual(
+            {rule['id']: rule['target_nodes'] for rule in data['node_complete_rules']},
+            {rule.id: [rule.node_id] for rule in self.rules},
+        )
+        self.assertEqual(data['meta']['stats']['total_nodes'], 2)
+        self.assertEqual(data['meta']['stats']['completed_nodes'], 1)
+        self.assertIsNotNone(data['meta']['stats']['learning_period'])
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_only_included_when_include_given(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: nodes, arrows 만 요청
+        response = self.client.get(
+            reverse('map-graph:graph-bundle', kwargs={'map_id': self.map.id}),
+            {'include': 'nodes,arrows'},
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 선택한 항목만 내려와야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data['data'].keys()), {'nodes', 'arrows'})
+        # Then: MapPlay 가 없으면 진행 상태는 없어야 함
+        self.assertEqual(
+            {arrow['status'] for arrow in response.data['data']['arrows']},
+            {'locked'},
+        )
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_400_when_invalid_include(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 존재하지 않는 항목 요청
+        response = self.client.get(
+            reverse('map-graph:graph-bundle', kwargs={'map_id': self.map.id}),
+            {'include': 'nodes,unknown'},
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 400 응답 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['status_code'], 'map-graph-invalid-include')
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_load_graph_with_constant_queries(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+        url = reverse(
+            'map-graph:graph-bundle-with-map-play-member',
+            kwargs={'map_id': self.map.id, 'map_play_member_id': self.map_play_member.id},
+        )
+        # Given: Map 구조 캐싱
+        self.client.get(url, HTTP_AUTHORIZATION='jwt some-token')
+
+        # When: 다시 호출
+        # Then: Map 조회, MapPlayMember 조회, 진행 상태 조회 3번만 발생해야 함
+        with self.assertNumQueries(3):
+            response = self.client.get(url, HTTP_AUTHORIZATION='jwt some-token')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
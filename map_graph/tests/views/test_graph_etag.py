@@ -0,0 +1,254 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from map.models import (
+    Arrow,
+    ArrowProgress,
+    Map,
+    Node,
+    NodeCompleteRule,
+    NodeCompletedHistory,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Guest, Member
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from play.services import MapPlayProgressService
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class GraphETagTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 클라이언트 설정
+        self.client = APIClient()
+
+        # Given: 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+            member_status_id=1,
+        )
+        self.guest = Guest.objects.create(
+            member=self.member,
+            temp_nickname='testsdfsdf',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+
+        # Given: 테스트 Map 생성
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+            is_private=False,
+        )
+
+        # Given: node0 -> node1 -> node2 구조
+        self.nodes = [
+            Node.objects.create(
+                map=self.map,
+                name=f'Test Node {i}',
+                title=f'Test Title {i}',
+                description=f'Test Description {i}',
+                position_x=i * 100,
+                position_y=i * 100,
+                is_active=True,
+            )
+            for i in range(3)
+        ]
+        self.rules = [
+            NodeCompleteRule.objects.create(
+                map=self.map,
+                name=f'Test Rule {i}',
+                node=node,
+            )
+            for i, node in enumerate(self.nodes)
+        ]
+        self.question_arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[0],
+            node_complete_rule=self.rules[0],
+        )
+        self.arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[0],
+            node_complete_rule=self.rules[1],
+        )
+        self.next_arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[1],
+            node_complete_rule=self.rules[2],
+        )
+
+        # Given: MapPlay 에서 node0 완료
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=self.map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+        for arrow in (self.question_arrow, self.arrow):
+            ArrowProgress.objects.create(
+                map=self.map,
+                arrow=arrow,
+                member=self.member,
+                map_play_member=self.map_play_member,
+                is_resolved=True,
+            )
+        NodeCompletedHistory.objects.create(
+            map=self.map,
+            node=self.nodes[0],
+            member=self.member,
+            map_play_member=self.map_play_member,
+            node_complete_rule=self.rules[0],
+        )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def _get(self, name: str, data: dict = None, **headers):
+        return self.client.get(
+            reverse(
+                name,
+                kwargs={'map_id': self.map.id, 'map_play_member_id': self.map_play_member.id},
+            ),
+            data or {},
+            HTTP_AUTHORIZATION='jwt some-token',
+            **headers,
+        )
+
+    def _complete_node1(self):
+        # node0 -> node1 Arrow 해결로 node1 완료
+        progress_service = MapPlayProgressService()
+        progress = progress_service.get_progress(self.map_play.id, for_update=True)
+        progress_service.add_progress(
+            progress,
+            resolved_arrow_ids=[self.next_arrow.id],
+            completed_node_rules=[(self.nodes[1].id, self.rules[1].id)],
+        )
+        return progress
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_304_when_etag_matched(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+        for name in ('map-graph:node-graph-with-map-play-member', 'map-graph:graph-bundle-with-map-play-member'):
+            # Given: 최초 조회로 ETag 획득
+            response = self._get(name)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            etag = response['ETag']
+            self.assertEqual(response['X-Progress-Version'], '0')
+
+            # When: 같은 ETag 로 다시 조회
+            # Then: Map 조회, MapPlayMember 조회, 진행 상태 조회만 하고 304 응답
+            with self.assertNumQueries(3):
+                response = self._get(name, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            self.assertEqual(response['ETag'], etag)
+            self.assertFalse(response.content)
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_change_etag_when_progress_changed(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+        etag = self._get('map-graph:map-meta-with-map-play-member')['ETag']
+
+        # Given: 진행 상태 변경
+        self._complete_node1()
+
+        # When: 이전 ETag 로 조회
+        response = self._get('map-graph:map-meta-with-map-play-member', HTTP_IF_NONE_MATCH=etag)
+
+        # Then: 새로운 ETag 와 함께 200 응답
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response['X-Progress-Version'], '1')
+        self.assertEqual(response.data['data']['stats']['completed_nodes'], 2)
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_only_changed_when_since_given(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+        since = int(self._get('map-graph:graph-bundle-with-map-play-member')['X-Progress-Version'])
+
+        # Given: 진행 상태 변경
+        self._complete_node1()
+
+        # When: 변경분 조회
+        response = self._get('map-graph:graph-bundle-with-map-play-member', {'since': since})
+
+        # Then: 완료된 node1 과 진행 가능해진 node2, 해결된 Arrow 만 내려와야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data['data']
+        self.assertTrue(data['is_delta'])
+        self.assertEqual(data['progress_version'], 1)
+        self.assertEqual(
+            {node['id']: node['status'] for node in data['nodes']},
+            {self.nodes[1].id: 'completed', self.nodes[2].id: 'in_progress'},
+        )
+        self.assertEqual(
+            {arrow['id']: arrow['status'] for arrow in data['arrows']},
+            {self.next_arrow.id: 'completed'},
+        )
+
+        # When: 최신 버전으로 변경분 조회
+        response = self._get('map-graph:node-graph-with-map-play-member', {'since': 1})
+
+        # Then: 바뀐 Node 가 없어야 함
+        self.assertEqual(response.data['data']['nodes'], [])
+
+        # When: 알 수 없는 미래 버전으로 조회
+        response = self._get('map-graph:arrow-graph-with-map-play-member', {'since': 100})
+
+        # Then: 전체를 내려줘야 함
+        self.assertNotIn('is_delta', response.data['data'])
+        self.assertEqual(len(response.data['data']['arrows']), 3)
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_400_when_invalid_since(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 숫자가 아닌 since 로 조회
+        response = self._get('map-graph:node-graph-with-map-play-member', {'since': 'abc'})
+
+        # Then: 400 응답 검증
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['status_code'], 'map-graph-invalid-since')
@@ -0,0 +1,187 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Guest, Member
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class GraphViewportTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 클라이언트 설정
+        self.client = APIClient()
+
+        # Given: 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+            member_status_id=1,
+        )
+        self.guest = Guest.objects.create(
+            member=self.member,
+            temp_nickname='testsdfsdf',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+
+        # Given: 테스트 Map 생성
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+            is_private=False,
+        )
+
+        # Given: 4 x 4 격자로 배치된 Node (간격 1500, 크기 100) -> 레이아웃 영역 0 ~ 4600
+        self.nodes = {}
+        for row in range(4):
+            for column in range(4):
+                self.nodes[(column, row)] = Node.objects.create(
+                    map=self.map,
+                    name=f'Node {column}-{row}',
+                    title=f'Title {column}-{row}',
+                    description=f'Description {column}-{row}',
+                    position_x=column * 1500,
+                    position_y=row * 1500,
+                    is_active=True,
+                )
+        self.rules = {
+            key: NodeCompleteRule.objects.create(
+                map=self.map,
+                name=f'Rule {node.name}',
+                node=node,
+            )
+            for key, node in self.nodes.items()
+        }
+        # Given: 같은 행의 Node 를 왼쪽에서 오른쪽으로 연결
+        self.arrows = {
+            (column, row): Arrow.objects.create(
+                map=self.map,
+                start_node=self.nodes[(column, row)],
+                node_complete_rule=self.rules[(column + 1, row)],
+            )
+            for row in range(4)
+            for column in range(3)
+        }
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def _get(self, url_name: str, params: dict):
+        return self.client.get(
+            reverse(url_name, kwargs={'map_id': self.map.id}),
+            params,
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_nodes_in_bbox(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 왼쪽 위 2 x 2 영역 조회 (Node 가장자리에 걸치는 영역 포함)
+        response = self._get('map-graph:node-graph', {'bbox': '-50,-50,1550,1550'})
+
+        # Then: 영역과 겹치는 Node 만 내려와야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {node['id'] for node in response.data['data']['nodes']},
+            {self.nodes[(column, row)].id for column in range(2) for row in range(2)},
+        )
+        # Then: 상태도 함께 내려와야 함
+        self.assertEqual(
+            {node['id']: node['status'] for node in response.data['data']['nodes']}[self.nodes[(0, 0)].id],
+            'in_progress',
+        )
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_nodes_in_tile(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 레이아웃을 2 x 2 로 나눈 오른쪽 아래 타일 조회 (2300 ~ 4600)
+        response = self._get('map-graph:node-graph', {'tile': '1/1/1'})
+
+        # Then: 타일 안의 Node 만 내려와야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {node['id'] for node in response.data['data']['nodes']},
+            {self.nodes[(column, row)].id for column in range(2, 4) for row in range(2, 4)},
+        )
+
+        # When: 전체 영역 타일 조회
+        response = self._get('map-graph:node-graph', {'tile': '0/0/0'})
+
+        # Then: 모든 Node 가 내려와야 함
+        self.assertEqual(len(response.data['data']['nodes']), len(self.nodes))
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_arrows_touching_nodes_in_bbox(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 첫 번째 행의 두 번째 Node 만 포함하는 영역 조회
+        response = self._get('map-graph:arrow-graph', {'bbox': '1500,0,1600,100'})
+
+        # Then: 해당 Node 로 들어오고 나가는 Arrow 만 내려와야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {arrow['id'] for arrow in response.data['data']['arrows']},
+            {self.arrows[(0, 0)].id, self.arrows[(1, 0)].id},
+        )
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_400_when_invalid_viewport(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        for params in (
+            {'bbox': '0,0,100'},
+            {'bbox': '100,0,0,100'},
+            {'bbox': '0,0,nan,100'},
+            {'tile': '1/2/0'},
+            {'tile': '17/0/0'},
+            {'bbox': '0,0,100,100', 'tile': '0/0/0'},
+        ):
+            # When: 잘못된 영역으로 조회
+            response = self._get('map-graph:node-graph', params)
+
+            # Then: 400 응답 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data['status_code'], 'map-graph-invalid-viewport')
@@ -1,6 +1,7 @@
 from django.urls import path
 from map_graph.views import (
     ArrowGraphView,
+    GraphBundleView,
     NodeGraphView,
     NodeCompleteRuleView,
     MapMetaView,
@@ -16,4 +17,6 @@ urlpatterns = [
     path('/node-complete-rule/<int:map_id>', NodeCompleteRuleView.as_view(), name='node-complete-rule'),
     path('/meta/<int:map_id>', MapMetaView.as_view(), name='map-meta'),
     path('/meta/<int:map_id>/member-play/<int:map_play_member_id>', MapMetaView.as_view(), name='map-meta-with-map-play-member'),
+    path('/bundle/<int:map_id>', GraphBundleView.as_view(), name='graph-bundle'),
+    path('/bundle/<int:map_id>/member-play/<int:map_play_member_id>', GraphBundleView.as_view(), name='graph-bundle-with-map-play-member'),
 ]
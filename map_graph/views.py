@@ -1,5 +1,12 @@
 from common.common_consts.common_status_codes import SuccessStatusCode
 from common.dtos.response_dtos import BaseFormatResponse
+from django.utils.http import parse_etags
+from map_graph.consts import MAP_GRAPH_PROGRESS_VERSION_HEADER
+from map_graph.dtos.map_graph_context import MapGraphContext
+from map_graph.dtos.request_dtos import (
+    GraphBundleRequestDTO,
+    GraphStatusRequestDTO,
+)
 from map_graph.dtos.response_dtos import NodeGraphDTO
 from map_graph.services.map_graph_service import MapGraphService
 from member.permissions import IsGuestExists
@@ -9,41 +16,106 @@ from rest_framework.views import APIView
 from typing import Optional
 
 
-class NodeGraphView(APIView):
+class MapGraphETagMixin:
+    """
+    Map 구조 버전과 MapPlay 진행 상태 버전으로 ETag 를 만들어
+    If-None-Match 가 일치하면 상태 계산 없이 304 를 응답합니다.
+    """
+
+    @staticmethod
+    def is_not_modified(request, context: MapGraphContext) -> bool:
+        if_none_match = request.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        etags = parse_etags(if_none_match)
+        return '*' in etags or context.etag in etags
+
+    @staticmethod
+    def set_graph_headers(response: Response, context: MapGraphContext) -> Response:
+        response['ETag'] = context.etag
+        response[MAP_GRAPH_PROGRESS_VERSION_HEADER] = str(context.progress_version)
+        return response
+
+    def not_modified_response(self, context: MapGraphContext) -> Response:
+        return self.set_graph_headers(Response(status=status.HTTP_304_NOT_MODIFIED), context)
+
+    @staticmethod
+    def get_delta_data(service: MapGraphService, context: MapGraphContext, since: Optional[int]) -> dict:
+        """
+        since 로 변경분만 내려주는 경우 응답에 버전 정보를 함께 내려줍니다.
+        """
+        if not service.is_delta_available(context, since):
+            return {}
+        return {
+            'is_delta': True,
+            'progress_version': context.progress_version,
+            'graph_version': context.map_obj.graph_version,
+        }
+
+
+class NodeGraphView(MapGraphETagMixin, APIView):
     permission_classes = [IsGuestExists]
 
     def get(self, request, map_id: int, map_play_member_id: Optional[int] = None):
+        request_dto = GraphStatusRequestDTO.of(request)
         service = MapGraphService(member_id=request.guest.member_id)
-        return Response(
-            BaseFormatResponse(
-                status_code=SuccessStatusCode.SUCCESS.value,
-                data={
-                    'nodes': [
-                        NodeGraphDTO.from_graph_node(node).model_dump()
-                        for node in service.get_nodes(map_id, map_play_member_id)
-                    ]
-                }
-            ).model_dump(),
-            status=status.HTTP_200_OK
+        context = service.get_context(map_id, map_play_member_id)
+        if self.is_not_modified(request, context):
+            return self.not_modified_response(context)
+        return self.set_graph_headers(
+            Response(
+                BaseFormatResponse(
+                    status_code=SuccessStatusCode.SUCCESS.value,
+                    data={
+                        'nodes': [
+                            NodeGraphDTO.from_graph_node(node).model_dump()
+                            for node in service.get_nodes(
+                                map_id,
+                                map_play_member_id,
+                                since=request_dto.since,
+                                context=context,
+                                viewport=request_dto.viewport,
+                            )
+                        ],
+                        **self.get_delta_data(service, context, request_dto.since),
+                    }
+                ).model_dump(),
+                status=status.HTTP_200_OK
+            ),
+            context,
         )
 
 
-class ArrowGraphView(APIView):
+class ArrowGraphView(MapGraphETagMixin, APIView):
     permission_classes = [IsGuestExists]
 
     def get(self, request, map_id: int, map_play_member_id: Optional[int] = None):
+        request_dto = GraphStatusRequestDTO.of(request)
         service = MapGraphService(member_id=request.guest.member_id)
-        return Response(
-            BaseFormatResponse(
-                status_code=SuccessStatusCode.SUCCESS.value,
-                data={
-                    'arrows': [
-                        arrow.model_dump()
-                        for arrow in service.get_arrows(map_id, map_play_member_id)
-                    ]
-                }
-            ).model_dump(),
-            status=status.HTTP_200_OK
+        context = service.get_context(map_id, map_play_member_id)
+        if self.is_not_modified(request, context):
+            return self.not_modified_response(context)
+        return self.set_graph_headers(
+            Response(
+                BaseFormatResponse(
+                    status_code=SuccessStatusCode.SUCCESS.value,
+                    data={
+                        'arrows': [
+                            arrow.model_dump()
+                            for arrow in service.get_arrows(
+                                map_id,
+                                map_play_member_id,
+                                since=request_dto.since,
+                                context=context,
+                                viewport=request_dto.viewport,
+                            )
+                        ],
+                        **self.get_delta_data(service, context, request_dto.since),
+                    }
+                ).model_dump(),
+                status=status.HTTP_200_OK
+            ),
+            context,
         )
 
 
@@ -66,15 +138,57 @@ class NodeCompleteRuleView(APIView):
         )
 
 
-class MapMetaView(APIView):
+class MapMetaView(MapGraphETagMixin, APIView):
     permission_classes = [IsGuestExists]
 
     def get(self, request, map_id: int, map_play_member_id: Optional[int] = None):
         service = MapGraphService(member_id=request.guest.member_id)
-        return Response(
-            BaseFormatResponse(
-                status_code=SuccessStatusCode.SUCCESS.value,
-                data=service.get_map_meta(map_id, map_play_member_id).model_dump(),
-            ).model_dump(),
-            status=status.HTTP_200_OK
+        context = service.get_context(map_id, map_play_member_id)
+        if self.is_not_modified(request, context):
+            return self.not_modified_response(context)
+        return self.set_graph_headers(
+            Response(
+                BaseFormatResponse(
+                    status_code=SuccessStatusCode.SUCCESS.value,
+                    data=service.get_map_meta(map_id, map_play_member_id, context=context).model_dump(),
+                ).model_dump(),
+                status=status.HTTP_200_OK
+            ),
+            context,
+        )
+
+
+class GraphBundleView(MapGraphETagMixin, APIView):
+    permission_classes = [IsGuestExists]
+
+    def get(self, request, map_id: int, map_play_member_id: Optional[int] = None):
+        request_dto = GraphBundleRequestDTO.of(request)
+        service = MapGraphService(member_id=request.guest.member_id)
+        context = service.get_context(map_id, map_play_member_id)
+        if self.is_not_modified(request, context):
+            return self.not_modified_response(context)
+        bundle = service.get_graph_bundle(
+            map_id,
+            map_play_member_id,
+            request_dto.includes,
+            since=request_dto.since,
+            context=context,
+        )
+        return self.set_graph_headers(
+            Response(
+                BaseFormatResponse(
+                    status_code=SuccessStatusCode.SUCCESS.value,
+                    # include 로 선택한 항목만 내려줍니다.
+                    data={
+                        **{
+                            key: value
+                            for key, value in bundle.model_dump().items()
+                            if value is not None
+                        },
+                        **self.get_delta_data(service, context, request_dto.since),
+                    },
+                ).model_dump(),
+                status=status.HTTP_200_OK
+            ),
+            context,
         )
@@ -0,0 +1,8 @@
+# Node 상세에서 Question 별로 함께 내려주는 답변 수 (나머지는 더보기로 조회)
+NODE_DETAIL_MY_ANSWERS_SIZE = 5
+
+# Question 답변 더보기 기본 조회 수
+NODE_QUESTION_ANSWERS_DEFAULT_SIZE = 20
+
+# Node 상세 묶음 조회 최대 Node 수
+NODE_DETAIL_BATCH_MAX_SIZE = 20
@@ -0,0 +1,11 @@
+from common.common_criteria.cursor_criteria import CursorCriteria
+
+
+class NodeQuestionAnswersCursorCriteria(CursorCriteria):
+    """
+    정답 -> 검토 대기 -> 오답 순서, 같은 상태 안에서는 최신순으로 정렬합니다.
+    """
+    cursor_keys = [
+        'is_correct_order__gte',
+        'id__lt',
+    ]
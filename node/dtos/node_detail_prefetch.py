@@ -0,0 +1,33 @@
+from collections import defaultdict
+from typing import (
+    Dict,
+    List,
+    Set,
+    Tuple,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+)
+
+from map_graph.dtos.map_graph_snapshot import MapGraphSnapshot
+from map_graph.dtos.node_detail import MyAnswerDTO
+from question.models import QuestionFile
+
+
+class NodeDetailPrefetchDTO(BaseModel):
+    """
+    여러 Node 상세를 만들 때 함께 사용하는 MapPlay 진행 상태와 미리 조회한 데이터입니다.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    snapshot: MapGraphSnapshot
+    resolved_arrow_ids: Set[int]
+    completed_node_ids: Set[int]
+    statistic_by_node_id: Dict[int, Tuple[int, int]]
+    is_subscribed: bool = False
+    question_files_by_question_id: Dict[int, List[QuestionFile]] = Field(default_factory=lambda: defaultdict(list))
+    my_answers_by_question_id: Dict[int, List[MyAnswerDTO]] = Field(default_factory=dict)
+    my_answers_next_cursor_by_question_id: Dict[int, str] = Field(default_factory=dict)
@@ -0,0 +1,25 @@
+from typing import List
+
+from pydantic import BaseModel
+from rest_framework.request import Request
+
+from node.consts import NODE_DETAIL_BATCH_MAX_SIZE
+from node.exceptions import NodeDetailBatchInvalidException
+
+
+class NodeDetailBatchRequestDTO(BaseModel):
+    node_ids: List[int]
+
+    @classmethod
+    def of(cls, request: Request) -> 'NodeDetailBatchRequestDTO':
+        node_ids = [
+            node_id.strip()
+            for node_id in request.query_params.get('node_ids', '').split(',')
+            if node_id.strip()
+        ]
+        if not node_ids or any(not node_id.isdigit() for node_id in node_ids):
+            raise NodeDetailBatchInvalidException()
+        node_ids = list(dict.fromkeys(int(node_id) for node_id in node_ids))
+        if len(node_ids) > NODE_DETAIL_BATCH_MAX_SIZE:
+            raise NodeDetailBatchInvalidException()
+        return cls(node_ids=node_ids)
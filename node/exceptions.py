@@ -5,3 +5,9 @@ class NodeNotFoundException(CommonAPIException):
     status_code = 404
     default_code = 'node-not-found'
     default_detail = '정상적인 Node 요청이 아닙니다.'
+
+
+class NodeDetailBatchInvalidException(CommonAPIException):
+    status_code = 400
+    default_code = 'node-detail-batch-invalid'
+    default_detail = '같은 Map 의 Node 를 1개 이상 20개 이하로 요청해주세요.'
@@ -1,17 +1,29 @@
+from collections import defaultdict
 from typing import (
+    Dict,
     List,
     Optional,
     Tuple,
     Set,
 )
 
-from django.db.models import F, Q, Case, When, Value, IntegerField
+from django.db.models import (
+    Case,
+    F,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
 
 from map.models import (
     Arrow,
     ArrowProgress,
     Node,
-    NodeCompleteRule,
     NodeCompletedHistory,
 )
 from map_graph.dtos.node_detail import (
@@ -23,12 +35,26 @@ from map_graph.dtos.node_detail import (
     QuestionDTO,
     RuleProgressDTO,
 )
-from node.exceptions import NodeNotFoundException
+from map_graph.dtos.map_graph_snapshot import SnapshotArrow
+from map_graph.services.map_graph_snapshot_service import get_map_graph_snapshot
+from node.consts import NODE_DETAIL_MY_ANSWERS_SIZE
+from node.cursor_criteria.cursor_criteria import NodeQuestionAnswersCursorCriteria
+from node.dtos.node_detail_prefetch import NodeDetailPrefetchDTO
+from node.exceptions import (
+    NodeDetailBatchInvalidException,
+    NodeNotFoundException,
+)
 from play.models import MapPlayMember
+from play.services import (
+    MapPlayNodeStatisticService,
+    MapPlayProgressService,
+)
 from question.consts import QuestionType
+from question.exceptions import QuestionNotFoundException
 from question.models import (
     QuestionFile,
     UserQuestionAnswer, Question,
+    UserQuestionAnswerFile,
 )
 from subscription.services.subscription_service import MapSubscriptionService
 
@@ -51,14 +77,7 @@ def get_map_play_completed_question_ids(
             'id',
         )
     )
-    resolved_arrow_ids = ArrowProgress.objects.filter(
-        arrow__in=question_id_by_arrow_id.keys(),
-        is_resolved=True,
-        map_play_member__map_play_id=map_play_id,
-    ).values_list(
-        'arrow_id',
-        flat=True,
-    )
+    resolved_arrow_ids = get_map_play_completed_arrow_ids(map_play_id, list(question_id_by_arrow_id.keys()))
     return set(question_id_by_arrow_id[resolved_arrow_id] for resolved_arrow_id in resolved_arrow_ids)
 
 
@@ -90,16 +109,7 @@ def get_map_play_completed_arrow_ids(
         return set()
     if not arrow_ids:
         return set()
-    return set(
-        ArrowProgress.objects.filter(
-            arrow_id__in=arrow_ids,
-            is_resolved=True,
-            map_play_member__map_play_id=map_play_id,
-        ).values_list(
-            'arrow_id',
-            flat=True,
-        )
-    )
+    return set(MapPlayProgressService().get_progress(map_play_id).resolved_arrow_ids) & set(arrow_ids)
 
 
 def get_map_play_member_completed_node_ids(
@@ -129,15 +139,7 @@ def get_map_play_completed_node_ids(
         return set()
     if not node_ids:
         return set()
-    return set(
-        NodeCompletedHistory.objects.filter(
-            map_play_member__map_play_id=map_play_id,
-            node_id__in=node_ids,
-        ).values_list(
-            'node_id',
-            flat=True,
-        )
-    )
+    return set(MapPlayProgressService().get_progress(map_play_id).completed_node_ids) & set(node_ids)
 
 
 def find_activatable_node_ids_after_completion(
@@ -182,8 +184,10 @@ class NodeDetailService:
                 'map_play',
             ).filter(
                 id=map_play_member_id,
+                member_id=member_id,
+                deactivated=False,
             ).first()
-            if map_play_member_id else None
+            if map_play_member_id and member_id else None
         )
         self.map_play = self.map_play_member.map_play if self.map_play_member else None
 
@@ -196,97 +200,122 @@ class NodeDetailService:
         return self.map_play.id if self.map_play else None
 
     def get_node_detail(self, node_id: int) -> NodeDetailDTO:
-        try:
-            node = Node.objects.get(
-                id=node_id,
+        return self.get_node_details([node_id])[0]
+
+    def get_node_details(self, node_ids: List[int]) -> List[NodeDetailDTO]:
+        """
+        같은 Map 의 여러 Node 상세를 한 번에 조회합니다.
+        MapPlay 진행 상태, 구독 여부, Question, Question 파일, 답변은 Node 수와 관계없이 한 번씩만 조회합니다.
+        """
+        node_ids = list(dict.fromkeys(node_ids))
+        nodes_by_id = {
+            node.id: node
+            for node in Node.objects.select_related(
+                'map',
+            ).filter(
+                id__in=node_ids,
                 is_deleted=False,
             )
-        except Node.DoesNotExist:
+        }
+        if len(nodes_by_id) != len(node_ids):
             raise NodeNotFoundException()
-
-        rules = list(
-            NodeCompleteRule.objects.filter(
-                node_id=node_id,
-                is_deleted=False,
-            )
-        )
-        rule_ids = [rule.id for rule in rules]
-        arrows = Arrow.objects.filter(
-            node_complete_rule_id__in=rule_ids,
-            is_deleted=False,
-        ).select_related(
-            'start_node',
-        )
-
-        # Rule별 Question 매핑
-        questions_by_rule_id = {}
+        if len({node.map_id for node in nodes_by_id.values()}) > 1:
+            raise NodeDetailBatchInvalidException()
+        nodes = [nodes_by_id[node_id] for node_id in node_ids]
+        map_obj = nodes[0].map
+
+        # Rule, Arrow 구조는 컴파일된 Snapshot 에서 가져옵니다.
+        snapshot = get_map_graph_snapshot(map_obj.id, map_obj.graph_version)
+        arrows_by_node_id = {
+            node.id: [
+                arrow
+                for rule in snapshot.get_rules_by_node_id(node.id)
+                for arrow in snapshot.get_arrows_by_rule_id(rule.id)
+            ]
+            for node in nodes
+        }
         questions = list(
             Question.objects.filter(
-                arrow_id__in=[arrow.id for arrow in arrows],
+                arrow_id__in=[arrow.id for arrows in arrows_by_node_id.values() for arrow in arrows],
                 is_deleted=False,
             )
         )
-        members_completed_arrow_ids = get_map_play_completed_arrow_ids(
-            self.map_play_id,
-            [arrow.id for arrow in arrows]
+        # MapPlay 진행 상태는 primary key 조회 한 번으로 가져옵니다.
+        map_play_progress = MapPlayProgressService().get_progress_or_none(self.map_play_id)
+        prefetch = NodeDetailPrefetchDTO(
+            snapshot=snapshot,
+            resolved_arrow_ids=set(map_play_progress.resolved_arrow_ids) if map_play_progress else set(),
+            completed_node_ids=set(map_play_progress.completed_node_ids) if map_play_progress else set(),
+            statistic_by_node_id=self._get_node_map_play_statistics(node_ids),
         )
-        users_question_answers = UserQuestionAnswer.objects.select_related(
-            'reviewed_by',
-            'member',
-        ).filter(
-            Q(map_play_member_id=self.map_play_member_id) |
-            Q(map_play_member__map_play_id=self.map_play_id, is_correct=True),
-        ).prefetch_related(
-            'files',
-        ).annotate(
-            is_correct_order=Case(
-                When(is_correct=True, then=Value(0)),
-                When(is_correct=None, then=Value(1)),
-                When(is_correct=False, then=Value(2)),
-                output_field=IntegerField(),
-            )
-        ).order_by(
-            'is_correct_order',
-            '-created_at',
-        )
-        users_answers_by_question_id = {}
-        for users_question_answer in users_question_answers:
-            if users_question_answer.question_id not in users_answers_by_question_id:
-                users_answers_by_question_id[users_question_answer.question_id] = []
-            users_answers_by_question_id[users_question_answer.question_id].append(
-                MyAnswerDTO.from_answer(users_question_answer)
-            )
+        node_status_by_id = {
+            node.id: self._get_node_status(node, arrows_by_node_id[node.id], prefetch)
+            for node in nodes
+        }
 
-        is_start_node = all([arrow.start_node_id == arrow.end_node_id for arrow in arrows])
-        question_ids = [question.id for question in questions]
-        members_completed_question_ids = get_map_play_completed_question_ids(
-            self.map_play_id,
-            question_ids
-        )
-        members_completed_node_ids = get_map_play_completed_node_ids(
-            self.map_play_id,
-            # 현재 노드도 포함
-            [arrow.start_node_id for arrow in arrows] + [node_id]
-        )
-        question_dtos_by_rule_id = {}
+        # 잠긴 Node 는 Question 을 보여주지 않으므로 열린 Node 의 Question 만 한 번에 가져옵니다.
+        unlocked_arrow_ids = {
+            arrow.id
+            for node_id, arrows in arrows_by_node_id.items()
+            if node_status_by_id[node_id] != 'locked'
+            for arrow in arrows
+        }
+        unlocked_question_ids = [question.id for question in questions if question.arrow_id in unlocked_arrow_ids]
+        if unlocked_arrow_ids:
+            subscription_service = MapSubscriptionService(member_id=self.member_id)
+            prefetch.is_subscribed = subscription_service.get_subscription_status_by_map_ids([map_obj.id])[map_obj.id]
+        if unlocked_question_ids:
+            (
+                prefetch.my_answers_by_question_id,
+                prefetch.my_answers_next_cursor_by_question_id,
+            ) = self._get_my_answers_by_question_id(unlocked_question_ids)
+            for question_file in QuestionFile.objects.filter(question_id__in=unlocked_question_ids):
+                prefetch.question_files_by_question_id[question_file.question_id].append(question_file)
+
+        questions_by_arrow_id = {question.arrow_id: question for question in questions}
+        return [
+            self._build_node_detail(
+                node=node,
+                node_status=node_status_by_id[node.id],
+                arrows=arrows_by_node_id[node.id],
+                questions=[
+                    questions_by_arrow_id[arrow.id]
+                    for arrow in arrows_by_node_id[node.id]
+                    if arrow.id in questions_by_arrow_id
+                ],
+                prefetch=prefetch,
+            )
+            for node in nodes
+        ]
 
+    @staticmethod
+    def _get_node_status(node: Node, arrows: List[SnapshotArrow], prefetch: NodeDetailPrefetchDTO) -> str:
         # 현재 조회되는 Node 는 End node
         # Arrows 중에서 completed 된게 하나라도 있으면 in_progress
         # 모든 Arrow 가 start_node_id == end_node_id 면 in_progress
         # 해결된 Node 면 completed
         # 아니면 locked
-        node_status = 'locked'
         if not node.is_active:
-            node_status = 'deactivated'
-        elif node.id in members_completed_node_ids:
-            node_status = 'completed'
-        elif bool(len({arrow.id for arrow in arrows} & members_completed_arrow_ids)):
-            node_status = 'in_progress'
-        elif is_start_node:
-            node_status = 'in_progress'
-
+            return 'deactivated'
+        if node.id in prefetch.completed_node_ids:
+            return 'completed'
+        if {arrow.id for arrow in arrows} & prefetch.resolved_arrow_ids:
+            return 'in_progress'
+        if all([arrow.start_node_id == arrow.end_node_id for arrow in arrows]):
+            return 'in_progress'
+        return 'locked'
+
+    def _build_node_detail(
+            self,
+            node: Node,
+            node_status: str,
+            arrows: List[SnapshotArrow],
+            questions: List[Question],
+            prefetch: NodeDetailPrefetchDTO,
+    ) -> NodeDetailDTO:
+        rules = prefetch.snapshot.get_rules_by_node_id(node.id)
         # 통계 데이터 조회
-        activated_count, completed_count = self._get_node_map_play_statistics(node)
+        activated_count, completed_count = prefetch.statistic_by_node_id.get(node.id, (0, 0))
         if node_status == 'locked':
             return NodeDetailDTO(
                 id=node.id,
@@ -302,17 +331,19 @@ class NodeDetailService:
                 active_rules=[],
             )
 
-        subscription_service = MapSubscriptionService(member_id=self.member_id)
-        is_subscribed = subscription_service.get_subscription_status_by_map_ids([node.map_id])[node.map_id]
-
-        question_files_by_question_id = {}
-        question_files = QuestionFile.objects.filter(
-            question_id__in=question_ids,
+        # Rule별 Question 매핑
+        questions_by_rule_id = {}
+        is_start_node = all([arrow.start_node_id == arrow.end_node_id for arrow in arrows])
+        members_completed_question_ids = {
+            question.id
+            for question in questions
+            if question.arrow_id in prefetch.resolved_arrow_ids
+        }
+        # 현재 노드도 포함
+        members_completed_node_ids = prefetch.completed_node_ids & (
+            {arrow.start_node_id for arrow in arrows} | {node.id}
         )
-        for question_file in question_files:
-            if question_file.question_id not in question_files_by_question_id:
-                question_files_by_question_id[question_file.question_id] = []
-            question_files_by_question_id[question_file.question_id].append(question_file)
+        question_dtos_by_rule_id = {}
 
         question_by_arrow_id = {
             question.arrow_id: question for question in questions if question.arrow_id
@@ -339,7 +370,7 @@ class NodeDetailService:
                 self.member_id
                 and self.map_play_member_id
                 and question_status == 'in_progress'
-                and is_subscribed
+                and prefetch.is_subscribed
             )
 
             if mapping_question.id:
@@ -356,14 +387,16 @@ class NodeDetailService:
                                 url=file.file,
                                 name=file.name,
                             )
-                            for file in question_files_by_question_id.get(mapping_question.id, [])
+                            for file in prefetch.question_files_by_question_id.get(mapping_question.id, [])
                         ],
                         status=question_status,
                         by_node_id=arrow.start_node_id,
                         answer_submit_with_text=QuestionType.TEXT.value in mapping_question.question_types,
                         answer_submit_with_file=QuestionType.FILE.value in mapping_question.question_types,
                         answer_submittable=answer_submittable,
-                        my_answers=users_answers_by_question_id.get(mapping_question.id, []),
+                        my_answers=prefetch.my_answers_by_question_id.get(mapping_question.id, []),
+                        my_answers_has_more=mapping_question.id in prefetch.my_answers_next_cursor_by_question_id,
+                        my_answers_next_cursor=prefetch.my_answers_next_cursor_by_question_id.get(mapping_question.id),
                     )
                 )
 
@@ -371,12 +404,13 @@ class NodeDetailService:
                     questions_by_rule_id[arrow.node_complete_rule_id] = []
                 questions_by_rule_id[arrow.node_complete_rule_id].append(mapping_question)
             else:
+                start_node_name = getattr(prefetch.snapshot.nodes.get(arrow.start_node_id), 'name', '')
                 question_dtos_by_rule_id[arrow.node_complete_rule_id].append(
                     QuestionDTO(
                         id=None,
                         arrow_id=arrow.id,
-                        title=f'"{arrow.start_node.name}"를 완료해주세요.',
-                        description=f'"{arrow.start_node.name}" 를 완료해주세요.',
+                        title=f'"{start_node_name}"를 완료해주세요.',
+                        description=f'"{start_node_name}" 를 완료해주세요.',
                         question_files=[],
                         status=(
                             'completed'
@@ -450,36 +484,137 @@ class NodeDetailService:
             ],
         )
 
-    def _get_node_map_play_statistics(self, node: Node) -> Tuple[int, int]:
-        completed_count = self._get_node_completed_in_map_play_count(node.id)
-        activated_count = self._get_in_node_progress_in_map_play_count(node.id)
-
-        return activated_count, completed_count
-
-    def _get_node_completed_in_map_play_count(self, node_id: int) -> int:
+    def get_question_answers(
+            self,
+            node_id: int,
+            question_id: int,
+            decoded_next_cursor: dict,
+            size: int,
+    ) -> Tuple[List[MyAnswerDTO], bool, Optional[str]]:
+        """
+        Node 상세에서 잘린 Question 답변을 이어서 조회합니다. (더보기)
+
+        Returns:
+            Tuple[List[MyAnswerDTO], bool, Optional[str]]: 답변 목록, 다음 페이지 여부, 다음 커서
+        """
+        if not Question.objects.filter(
+            id=question_id,
+            is_deleted=False,
+            arrow__is_deleted=False,
+            arrow__node_complete_rule__node_id=node_id,
+        ).exists():
+            raise QuestionNotFoundException()
         if not self.map_play_member:
-            return 0
-
-        return NodeCompletedHistory.objects.filter(
-            node_id=node_id,
-            map_play_member__map_play_id=self.map_play_member.map_play_id,
-        ).count()
+            return [], False, None
+
+        answers_queryset = self._get_my_answers_queryset([question_id])
+        if decoded_next_cursor:
+            answers_queryset = answers_queryset.filter(
+                Q(is_correct_order__gt=decoded_next_cursor['is_correct_order__gte'])
+                | Q(
+                    is_correct_order=decoded_next_cursor['is_correct_order__gte'],
+                    id__lt=decoded_next_cursor['id__lt'],
+                )
+            )
+        answers = list(
+            answers_queryset.select_related(
+                'reviewed_by',
+                'member',
+            ).prefetch_related(
+                self._get_answer_files_prefetch(),
+            ).order_by(
+                *NodeQuestionAnswersCursorCriteria.get_ordering_data()
+            )[:size + 1]
+        )
+        has_more = len(answers) > size
+        answers = answers[:size]
+        return (
+            [MyAnswerDTO.from_answer(answer) for answer in answers],
+            has_more,
+            NodeQuestionAnswersCursorCriteria.get_encoded_base64_cursor_data(answers[-1]) if has_more else None,
+        )
 
-    def _get_before_node_solved_in_map_play_count(self, node_id: int) -> int:
-        if not self.map_play_member:
-            return 0
-        start_node_ids = set(
-            Arrow.objects.filter(
-                node_complete_rule__node_id=node_id,
-            ).values_list(
-                'start_node_id',
-                flat=True,
+    def _get_my_answers_queryset(self, question_ids: List[int]) -> QuerySet:
+        """
+        Question 들에 대한 내 답변과, 같은 MapPlay 에서 나온 정답을 조회합니다.
+        """
+        return UserQuestionAnswer.objects.filter(
+            Q(map_play_member_id=self.map_play_member_id)
+            | Q(map_play_member__map_play_id=self.map_play_id, is_correct=True),
+            question_id__in=question_ids,
+        ).annotate(
+            is_correct_order=Case(
+                When(is_correct=True, then=Value(0)),
+                When(is_correct=None, then=Value(1)),
+                When(is_correct=False, then=Value(2)),
+                output_field=IntegerField(),
             )
         )
-        return NodeCompletedHistory.objects.filter(
-            node_id__in=start_node_ids,
-            map_play_member__map_play_id=self.map_play_member.map_play_id,
-        ).count()
 
-    def _get_in_node_progress_in_map_play_count(self, node_id: int) -> int:
-        return self._get_before_node_solved_in_map_play_count(node_id) - self._get_node_completed_in_map_play_count(node_id)
+    @staticmethod
+    def _get_answer_files_prefetch() -> Prefetch:
+        return Prefetch(
+            'files',
+            queryset=UserQuestionAnswerFile.objects.filter(
+                is_deleted=False,
+            ),
+        )
+
+    def _get_my_answers_by_question_id(
+            self,
+            question_ids: List[int],
+    ) -> Tuple[Dict[int, List[MyAnswerDTO]], Dict[int, str]]:
+        """
+        Question 별로 NODE_DETAIL_MY_ANSWERS_SIZE 개의 답변만 가져옵니다.
+        답변 수와 관계없이 답변 조회 1번, 파일 조회 1번으로 끝납니다.
+
+        Returns:
+            Tuple[Dict[int, List[MyAnswerDTO]], Dict[int, str]]: Question 별 답변, 더보기가 있는 Question 별 다음 커서
+        """
+        if not self.map_play_member or not question_ids:
+            return {}, {}
+
+        ordering = NodeQuestionAnswersCursorCriteria.get_ordering_data()
+        answers_queryset = self._get_my_answers_queryset(question_ids)
+        # Question 별로 더보기 여부 확인을 위해 1개 더 가져옵니다.
+        capped_answer_ids = answers_queryset.filter(
+            question_id=OuterRef('question_id'),
+        ).order_by(
+            *ordering
+        ).values(
+            'id',
+        )[:NODE_DETAIL_MY_ANSWERS_SIZE + 1]
+        users_question_answers = answers_queryset.filter(
+            id__in=Subquery(capped_answer_ids),
+        ).select_related(
+            'reviewed_by',
+            'member',
+        ).prefetch_related(
+            self._get_answer_files_prefetch(),
+        ).order_by(
+            'question_id',
+            *ordering
+        )
+
+        answers_by_question_id = defaultdict(list)
+        for users_question_answer in users_question_answers:
+            answers_by_question_id[users_question_answer.question_id].append(users_question_answer)
+
+        users_answers_by_question_id = {}
+        next_cursors_by_question_id = {}
+        for question_id, answers in answers_by_question_id.items():
+            users_answers_by_question_id[question_id] = [
+                MyAnswerDTO.from_answer(answer)
+                for answer in answers[:NODE_DETAIL_MY_ANSWERS_SIZE]
+            ]
+            if len(answers) > NODE_DETAIL_MY_ANSWERS_SIZE:
+                next_cursors_by_question_id[question_id] = (
+                    NodeQuestionAnswersCursorCriteria.get_encoded_base64_cursor_data(
+                        answers[NODE_DETAIL_MY_ANSWERS_SIZE - 1]
+                    )
+                )
+        return users_answers_by_question_id, next_cursors_by_question_id
+
+    def _get_node_map_play_statistics(self, node_ids: List[int]) -> Dict[int, Tuple[int, int]]:
+        # NodeCompletionService 에서 갱신하는 MapPlay 별 Node 통계를 한 번에 조회합니다.
+        return MapPlayNodeStatisticService().get_statistics(self.map_play_id, node_ids)
@@ -0,0 +1,272 @@
+from common.common_utils.decode_utils import urlsafe_base64_to_data
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Member
+from node.consts import NODE_DETAIL_MY_ANSWERS_SIZE
+from node.exceptions import NodeNotFoundException
+from node.services.node_detail_service import NodeDetailService
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from play.services import MapPlayProgressService
+from question.consts import (
+    QuestionType,
+    ValidationType,
+)
+from question.exceptions import QuestionNotFoundException
+from question.models import (
+    Question,
+    UserQuestionAnswer,
+    UserQuestionAnswerFile,
+)
+
+
+class NodeDetailServiceTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 사용자, Map 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+        )
+        # Given: 문제 2개로 완료되는 시작 Node, 다른 Node 1개
+        self.node, self.other_node = [
+            Node.objects.create(
+                map=self.map,
+                name=f'Node {i}',
+                title=f'Title {i}',
+                description=f'Description {i}',
+                position_x=i * 100,
+                position_y=0,
+            )
+            for i in range(2)
+        ]
+        rule = NodeCompleteRule.objects.create(
+            map=self.map,
+            node=self.node,
+            name='Rule',
+        )
+        other_rule = NodeCompleteRule.objects.create(
+            map=self.map,
+            node=self.other_node,
+            name='Other Rule',
+        )
+        self.questions = [
+            Question.objects.create(
+                map=self.map,
+                arrow=Arrow.objects.create(
+                    map=self.map,
+                    start_node=self.node,
+                    node_complete_rule=rule,
+                ),
+                title=f'Question {i}',
+                description=f'Question Description {i}',
+                question_types=[QuestionType.TEXT.value],
+                answer_validation_type=ValidationType.MANUAL.value,
+            )
+            for i in range(2)
+        ]
+        self.other_question = Question.objects.create(
+            map=self.map,
+            arrow=Arrow.objects.create(
+                map=self.map,
+                start_node=self.other_node,
+                node_complete_rule=other_rule,
+            ),
+            title='Other Question',
+            description='Other Question Description',
+            question_types=[QuestionType.TEXT.value],
+            answer_validation_type=ValidationType.MANUAL.value,
+        )
+        # Given: MapPlay 생성
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=self.map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+        MapPlayProgressService().rebuild_progress(self.map_play.id)
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def _create_answers(self, question: Question, count: int, is_correct=None):
+        answers = UserQuestionAnswer.objects.bulk_create([
+            UserQuestionAnswer(
+                map=self.map,
+                question=question,
+                member=self.member,
+                map_play_member=self.map_play_member,
+                answer=f'answer {i}',
+                is_correct=is_correct,
+            )
+            for i in range(count)
+        ])
+        # 답변마다 정상 파일 1개, 삭제된 파일 1개
+        UserQuestionAnswerFile.objects.bulk_create([
+            UserQuestionAnswerFile(
+                map=self.map,
+                question=question,
+                user_question_answer=answer,
+                file=f'file/{answer.id}',
+                is_deleted=is_deleted,
+            )
+            for answer in answers
+            for is_deleted in (False, True)
+        ])
+        return answers
+
+    def _count_node_detail_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            NodeDetailService(
+                member_id=self.member.id,
+                map_play_member_id=self.map_play_member.id,
+            ).get_node_detail(self.node.id)
+        return len(context.captured_queries)
+
+    def test_get_node_detail_should_use_constant_queries_regardless_of_answer_count(self):
+        # Given: 답변 10개
+        for question in self.questions + [self.other_question]:
+            self._create_answers(question, 10 // 3 + 1)
+        # Given: Map 구조 캐싱
+        self._count_node_detail_queries()
+        small_query_count = self._count_node_detail_queries()
+
+        # Given: 답변 500개로 증가
+        for question in self.questions + [self.other_question]:
+            self._create_answers(question, 500 // 3)
+
+        # When: Node 상세 조회
+        # Then: 답변 수와 관계없이 쿼리 수가 같아야 함
+        self.assertEqual(self._count_node_detail_queries(), small_query_count)
+
+    def test_get_node_detail_should_cap_answers_per_question(self):
+        # Given: 첫 번째 문제에 정답 1개, 검토 대기 10개, 다른 Node 문제에 답변
+        correct_answer = self._create_answers(self.questions[0], 1, is_correct=True)[0]
+        self._create_answers(self.questions[0], 10)
+        self._create_answers(self.other_question, 3)
+
+        # When: Node 상세 조회
+        node_detail = NodeDetailService(
+            member_id=self.member.id,
+            map_play_member_id=self.map_play_member.id,
+        ).get_node_detail(self.node.id)
+
+        # Then: 이 Node 의 문제만, Question 별 최대 개수만큼 정답 먼저 내려와야 함
+        questions = {question.id: question for question in node_detail.active_rules[0].questions}
+        self.assertEqual(set(questions.keys()), {question.id for question in self.questions})
+        first_question = questions[self.questions[0].id]
+        self.assertEqual(len(first_question.my_answers), NODE_DETAIL_MY_ANSWERS_SIZE)
+        self.assertEqual(first_question.my_answers[0].id, correct_answer.id)
+        self.assertTrue(first_question.my_answers_has_more)
+        self.assertIsNotNone(first_question.my_answers_next_cursor)
+        # Then: 삭제된 파일은 제외되어야 함
+        self.assertEqual({len(answer.files) for answer in first_question.my_answers}, {1})
+        # Then: 답변이 없는 문제는 더보기가 없어야 함
+        self.assertEqual(questions[self.questions[1].id].my_answers, [])
+        self.assertFalse(questions[self.questions[1].id].my_answers_has_more)
+
+    def test_get_node_details_should_share_queries_across_nodes(self):
+        # Given: 두 Node 의 문제에 답변
+        for question in self.questions + [self.other_question]:
+            self._create_answers(question, 3)
+        service = NodeDetailService(
+            member_id=self.member.id,
+            map_play_member_id=self.map_play_member.id,
+        )
+        # Given: Map 구조 캐싱
+        service.get_node_details([self.node.id])
+        with CaptureQueriesContext(connection) as context:
+            service.get_node_details([self.node.id])
+        single_query_count = len(context.captured_queries)
+
+        # When: 두 Node 를 한 번에 조회
+        with CaptureQueriesContext(connection) as context:
+            node_details = service.get_node_details([self.other_node.id, self.node.id])
+
+        # Then: 한 Node 조회와 쿼리 수가 같고, 요청한 순서대로 내려와야 함
+        self.assertEqual(len(context.captured_queries), single_query_count)
+        self.assertEqual([node_detail.id for node_detail in node_details], [self.other_node.id, self.node.id])
+        self.assertEqual(
+            [
+                len(question.my_answers)
+                for node_detail in node_details
+                for rule in node_detail.active_rules
+                for question in rule.questions
+            ],
+            [3, 3, 3],
+        )
+
+    def test_get_node_details_should_raise_when_node_not_found(self):
+        # When & Then: 존재하지 않는 Node 가 섞여 있으면 예외 발생
+        with self.assertRaises(NodeNotFoundException):
+            NodeDetailService(member_id=self.member.id).get_node_details([self.node.id, 99999])
+
+    def test_get_question_answers_should_continue_from_cursor(self):
+        # Given: 첫 번째 문제에 오답 3개, 정답 2개, 검토 대기 8개
+        answers = (
+            self._create_answers(self.questions[0], 3, is_correct=False)
+            + self._create_answers(self.questions[0], 2, is_correct=True)
+            + self._create_answers(self.questions[0], 8)
+        )
+        service = NodeDetailService(
+            member_id=self.member.id,
+            map_play_member_id=self.map_play_member.id,
+        )
+        node_detail = service.get_node_detail(self.node.id)
+        question = next(
+            question
+            for question in node_detail.active_rules[0].questions
+            if question.id == self.questions[0].id
+        )
+        answer_ids = [answer.id for answer in question.my_answers]
+        next_cursor = question.my_answers_next_cursor
+
+        # When: 더보기로 나머지 답변 조회
+        while next_cursor:
+            page, has_more, next_cursor = service.get_question_answers(
+                self.node.id,
+                self.questions[0].id,
+                urlsafe_base64_to_data(next_cursor),
+                4,
+            )
+            answer_ids += [answer.id for answer in page]
+
+        # Then: 정답 -> 검토 대기 -> 오답, 최신순으로 중복 없이 모두 조회되어야 함
+        self.assertEqual(
+            answer_ids,
+            [answer.id for answer in sorted(answers[3:5], key=lambda answer: -answer.id)]
+            + [answer.id for answer in sorted(answers[5:], key=lambda answer: -answer.id)]
+            + [answer.id for answer in sorted(answers[:3], key=lambda answer: -answer.id)],
+        )
+
+    def test_get_question_answers_should_raise_when_question_not_in_node(self):
+        # When & Then: 다른 Node 의 문제로 조회하면 예외 발생
+        with self.assertRaises(QuestionNotFoundException):
+            NodeDetailService(
+                member_id=self.member.id,
+                map_play_member_id=self.map_play_member.id,
+            ).get_question_answers(self.node.id, self.other_question.id, {}, 10)
@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+from common.common_consts.common_status_codes import SuccessStatusCode
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Guest, Member
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class NodeDetailBatchViewTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 클라이언트 설정
+        self.client = APIClient()
+
+        # Given: 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+            member_status_id=1,
+        )
+        self.guest = Guest.objects.create(
+            member=self.member,
+            temp_nickname='testsdfsdf',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+
+        # Given: node0 -> node1 -> node2 구조
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+        )
+        self.nodes = [
+            Node.objects.create(
+                map=self.map,
+                name=f'Node {i}',
+                title=f'Title {i}',
+                description=f'Description {i}',
+                position_x=i * 100,
+                position_y=0,
+            )
+            for i in range(3)
+        ]
+        for i in range(2):
+            Arrow.objects.create(
+                map=self.map,
+                start_node=self.nodes[i],
+                node_complete_rule=NodeCompleteRule.objects.create(
+                    map=self.map,
+                    node=self.nodes[i + 1],
+                    name=f'Rule {i}',
+                ),
+            )
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_node_details_in_requested_order(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 여러 Node 상세 조회
+        response = self.client.get(
+            reverse('node:node-detail-batch'),
+            {'node_ids': f'{self.nodes[2].id},{self.nodes[0].id},{self.nodes[1].id}'},
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 요청한 순서대로 상태와 함께 내려와야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status_code'], SuccessStatusCode.SUCCESS.value)
+        self.assertEqual(
+            [(node['id'], node['status']) for node in response.data['data']['nodes']],
+            [
+                (self.nodes[2].id, 'locked'),
+                (self.nodes[0].id, 'in_progress'),
+                (self.nodes[1].id, 'locked'),
+            ],
+        )
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_400_when_invalid_node_ids(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        for node_ids in ('', 'a,1', ','.join(str(i) for i in range(1, 22))):
+            # When: 잘못된 node_ids 로 조회
+            response = self.client.get(
+                reverse('node:node-detail-batch'),
+                {'node_ids': node_ids},
+                HTTP_AUTHORIZATION='jwt some-token'
+            )
+
+            # Then: 400 응답 검증
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data['status_code'], 'node-detail-batch-invalid')
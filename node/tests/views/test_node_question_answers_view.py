@@ -0,0 +1,188 @@
+from unittest.mock import patch
+
+from common.common_consts.common_status_codes import SuccessStatusCode
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from map.models import (
+    Arrow,
+    Map,
+    Node,
+    NodeCompleteRule,
+)
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import Guest, Member
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from question.consts import (
+    QuestionType,
+    ValidationType,
+)
+from question.models import (
+    Question,
+    UserQuestionAnswer,
+)
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class NodeQuestionAnswersViewTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 클라이언트 설정
+        self.client = APIClient()
+
+        # Given: 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+            member_status_id=1,
+        )
+        self.guest = Guest.objects.create(
+            member=self.member,
+            temp_nickname='testsdfsdf',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+
+        # Given: 문제 1개로 완료되는 Node
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+        )
+        self.node = Node.objects.create(
+            map=self.map,
+            name='Node',
+            title='Title',
+            description='Description',
+            position_x=0,
+            position_y=0,
+        )
+        self.question = Question.objects.create(
+            map=self.map,
+            arrow=Arrow.objects.create(
+                map=self.map,
+                start_node=self.node,
+                node_complete_rule=NodeCompleteRule.objects.create(
+                    map=self.map,
+                    node=self.node,
+                    name='Rule',
+                ),
+            ),
+            title='Question',
+            description='Question Description',
+            question_types=[QuestionType.TEXT.value],
+            answer_validation_type=ValidationType.MANUAL.value,
+        )
+
+        # Given: MapPlay 에서 답변 3개 제출
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=self.map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+        self.answers = UserQuestionAnswer.objects.bulk_create([
+            UserQuestionAnswer(
+                map=self.map,
+                question=self.question,
+                member=self.member,
+                map_play_member=self.map_play_member,
+                answer=f'answer {i}',
+            )
+            for i in range(3)
+        ])
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_answers_with_cursor(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+        url = reverse(
+            'node:node-question-answers',
+            kwargs={
+                'node_id': self.node.id,
+                'map_play_member_id': self.map_play_member.id,
+                'question_id': self.question.id,
+            },
+        )
+
+        # When: 2개씩 조회
+        response = self.client.get(url, {'size': 2}, HTTP_AUTHORIZATION='jwt some-token')
+
+        # Then: 최신순 2개와 다음 커서가 내려와야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status_code'], SuccessStatusCode.SUCCESS.value)
+        data = response.data['data']
+        self.assertEqual([answer['id'] for answer in data['answers']], [self.answers[2].id, self.answers[1].id])
+        self.assertTrue(data['has_more'])
+
+        # When: 다음 커서로 조회
+        response = self.client.get(
+            url,
+            {'size': 2, 'next_cursor': data['next_cursor']},
+            HTTP_AUTHORIZATION='jwt some-token',
+        )
+
+        # Then: 나머지 1개가 내려와야 함
+        data = response.data['data']
+        self.assertEqual([answer['id'] for answer in data['answers']], [self.answers[0].id])
+        self.assertFalse(data['has_more'])
+        self.assertIsNone(data['next_cursor'])
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_not_return_answers_of_other_member_map_play_member(
+            self,
+            mock_jwt_decode,
+            mock_auth_cred,
+    ):
+        # Given: 다른 사용자로 인증 모킹
+        other_member = Member.objects.create(
+            username='other_user',
+            nickname='다른 유저',
+            member_status_id=1,
+        )
+        other_guest = Guest.objects.create(
+            member=other_member,
+            temp_nickname='othersdfsdf',
+            ip='127.0.0.1',
+            email='other@test.com',
+        )
+        mock_auth_cred.return_value = other_guest
+        mock_jwt_decode.return_value = {'guest_id': other_guest.id}
+        url = reverse(
+            'node:node-question-answers',
+            kwargs={
+                'node_id': self.node.id,
+                'map_play_member_id': self.map_play_member.id,
+                'question_id': self.question.id,
+            },
+        )
+
+        # When: 본인 소유가 아닌 map_play_member_id 로 조회
+        response = self.client.get(url, HTTP_AUTHORIZATION='jwt some-token')
+
+        # Then: 답변이 내려오지 않아야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data['data']
+        self.assertEqual(data['answers'], [])
+        self.assertFalse(data['has_more'])
@@ -1,11 +1,18 @@
 from django.urls import path
 
-from node.views import NodeDetailView
+from node.views import (
+    NodeDetailBatchView,
+    NodeDetailView,
+    NodeQuestionAnswersView,
+)
 
 app_name = 'node'
 
 
 urlpatterns = [
+    path('/batch', NodeDetailBatchView.as_view(), name='node-detail-batch'),
+    path('/batch/member-play/<int:map_play_member_id>', NodeDetailBatchView.as_view(), name='node-detail-batch'),
     path('/<int:node_id>', NodeDetailView.as_view(), name='node-detail'),
     path('/<int:node_id>/member-play/<int:map_play_member_id>', NodeDetailView.as_view(), name='node-detail'),
+    path('/<int:node_id>/member-play/<int:map_play_member_id>/question/<int:question_id>/answers', NodeQuestionAnswersView.as_view(), name='node-question-answers'),
 ]
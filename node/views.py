@@ -1,6 +1,10 @@
 from common.common_consts.common_status_codes import SuccessStatusCode
+from common.common_decorators.request_decorators import cursor_pagination
 from common.dtos.response_dtos import BaseFormatResponse
 from member.permissions import IsGuestExists
+from node.consts import NODE_QUESTION_ANSWERS_DEFAULT_SIZE
+from node.cursor_criteria.cursor_criteria import NodeQuestionAnswersCursorCriteria
+from node.dtos.request_dtos import NodeDetailBatchRequestDTO
 from node.services.node_detail_service import NodeDetailService
 from rest_framework import status
 from rest_framework.response import Response
@@ -22,3 +26,73 @@ class NodeDetailView(APIView):
             ).model_dump(),
             status=status.HTTP_200_OK
         )
+
+
+class NodeDetailBatchView(APIView):
+    permission_classes = [IsGuestExists]
+
+    def get(self, request, map_play_member_id: int = None):
+        """
+        같은 Map 의 여러 Node 상세를 한 번에 조회 (다음 Node 미리 불러오기)
+        - node_ids: 콤마로 구분된 Node id, 요청한 순서대로 응답
+        """
+        request_dto = NodeDetailBatchRequestDTO.of(request)
+        service = NodeDetailService(
+            member_id=request.guest.member_id,
+            map_play_member_id=map_play_member_id,
+        )
+        return Response(
+            BaseFormatResponse(
+                status_code=SuccessStatusCode.SUCCESS.value,
+                data={
+                    'nodes': [
+                        node_detail.model_dump()
+                        for node_detail in service.get_node_details(request_dto.node_ids)
+                    ],
+                },
+            ).model_dump(),
+            status=status.HTTP_200_OK
+        )
+
+
+class NodeQuestionAnswersView(APIView):
+    permission_classes = [IsGuestExists]
+
+    @cursor_pagination(
+        default_size=NODE_QUESTION_ANSWERS_DEFAULT_SIZE,
+        cursor_criteria=[NodeQuestionAnswersCursorCriteria],
+    )
+    def get(
+            self,
+            request,
+            node_id: int,
+            map_play_member_id: int,
+            question_id: int,
+            decoded_next_cursor: dict,
+            size: int,
+    ):
+        """
+        Node 상세의 Question 답변 더보기
+        - Node 상세의 my_answers_next_cursor 를 next_cursor 로 전달
+        """
+        service = NodeDetailService(
+            member_id=request.guest.member_id,
+            map_play_member_id=map_play_member_id,
+        )
+        answers, has_more, next_cursor = service.get_question_answers(
+            node_id=node_id,
+            question_id=question_id,
+            decoded_next_cursor=decoded_next_cursor,
+            size=size,
+        )
+        return Response(
+            BaseFormatResponse(
+                status_code=SuccessStatusCode.SUCCESS.value,
+                data={
+                    'answers': [answer.model_dump() for answer in answers],
+                    'next_cursor': next_cursor,
+                    'has_more': has_more,
+                },
+            ).model_dump(),
+            status=status.HTTP_200_OK
+        )
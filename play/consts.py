@@ -10,3 +10,7 @@ class MapPlayMemberDeactivateReason(StrValueLabel):
     SELF_DEACTIVATED = 'self_deactivated', '자발적 탈퇴'
     UNSUBSCRIBE = 'unsubscribe', '구독 탈퇴'
     BANNED = 'banned', '추방'
+
+
+# MapPlay 진행 상태 갱신(연쇄 처리) advisory lock 의 key 공간 (pg_advisory_xact_lock(namespace, map_play_id))
+MAP_PLAY_PROGRESS_ADVISORY_LOCK_NAMESPACE = 1001
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from map_graph.services.map_graph_snapshot_service import get_map_graph_snapshot
+from play.models import MapPlay
+from play.services import MapPlayNodeStatisticService
+
+
+class Command(BaseCommand):
+    """
+    python manage.py backfill_map_play_node_statistics
+    python manage.py backfill_map_play_node_statistics --map-id 1
+    python manage.py backfill_map_play_node_statistics --map-play-id 1 --map-play-id 2
+    """
+    help = 'NodeCompletedHistory 이력으로 MapPlay 별 Node 진행 중/완료 수를 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--map-id', type=int, help='특정 Map 의 MapPlay 만 처리')
+        parser.add_argument('--map-play-id', type=int, action='append', help='특정 MapPlay 만 처리 (여러 번 지정 가능)')
+
+    def handle(self, *args, **options):
+        map_plays = MapPlay.objects.order_by('id')
+        if options['map_id']:
+            map_plays = map_plays.filter(map_id=options['map_id'])
+        if options['map_play_id']:
+            map_plays = map_plays.filter(id__in=options['map_play_id'])
+
+        statistic_service = MapPlayNodeStatisticService()
+        count = 0
+        for map_play_id, map_id in list(map_plays.values_list('id', 'map_id')):
+            statistic_service.rebuild_statistics(map_play_id, get_map_graph_snapshot(map_id))
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'{count}개 MapPlay 의 Node 통계를 다시 계산했습니다.'))
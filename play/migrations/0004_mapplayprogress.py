@@ -0,0 +1,94 @@
+# Generated by Django 4.1.10 on 2026-10-18 15:36
+
+import django.contrib.postgres.fields
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Q
+
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def forward(apps, schema_editor):
+    MapPlay = apps.get_model('play', 'MapPlay')
+    MapPlayProgress = apps.get_model('play', 'MapPlayProgress')
+    ArrowProgress = apps.get_model('map', 'ArrowProgress')
+    NodeCompletedHistory = apps.get_model('map', 'NodeCompletedHistory')
+
+    # 기존 이력으로 MapPlay 별 진행 상태 생성, BACKFILL_BATCH_SIZE 개 MapPlay 마다 MapPlay 별로 집계한 쿼리 2번
+    map_plays = list(MapPlay.objects.order_by('id').values_list('id', 'map_id'))
+    for index in range(0, len(map_plays), BACKFILL_BATCH_SIZE):
+        chunk_map_plays = map_plays[index:index + BACKFILL_BATCH_SIZE]
+        chunk_map_play_ids = [map_play_id for map_play_id, _ in chunk_map_plays]
+        completed_by_map_play_id = {
+            row['map_play_member__map_play_id']: row
+            for row in NodeCompletedHistory.objects.filter(
+                map_play_member__map_play_id__in=chunk_map_play_ids,
+            ).values(
+                'map_play_member__map_play_id',
+            ).annotate(
+                node_ids=ArrayAgg('node_id', distinct=True),
+                rule_ids=ArrayAgg(
+                    'node_complete_rule_id',
+                    distinct=True,
+                    filter=Q(node_complete_rule_id__isnull=False),
+                ),
+            ).order_by()
+        }
+        resolved_arrow_ids_by_map_play_id = dict(
+            ArrowProgress.objects.filter(
+                map_play_member__map_play_id__in=chunk_map_play_ids,
+                is_resolved=True,
+            ).values(
+                'map_play_member__map_play_id',
+            ).annotate(
+                arrow_ids=ArrayAgg('arrow_id', distinct=True),
+            ).order_by().values_list(
+                'map_play_member__map_play_id',
+                'arrow_ids',
+            )
+        )
+        MapPlayProgress.objects.bulk_create([
+            MapPlayProgress(
+                map_play_id=map_play_id,
+                map_id=map_id,
+                completed_node_ids=sorted(completed_by_map_play_id.get(map_play_id, {}).get('node_ids') or []),
+                completed_rule_ids=sorted(completed_by_map_play_id.get(map_play_id, {}).get('rule_ids') or []),
+                resolved_arrow_ids=sorted(resolved_arrow_ids_by_map_play_id.get(map_play_id) or []),
+            )
+            for map_play_id, map_id in chunk_map_plays
+        ])
+
+
+def backward(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0016_map_graph_version'),
+        ('play', '0003_alter_mapplaymember_deactivated_reason'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MapPlayProgress',
+            fields=[
+                ('map_play', models.OneToOneField(help_text='맵 플레이', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='progress', serialize=False, to='play.mapplay')),
+                ('completed_node_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='완료된 Node id 목록 (오름차순)', size=None)),
+                ('resolved_arrow_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='해결된 Arrow id 목록 (오름차순)', size=None)),
+                ('completed_rule_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='완료된 NodeCompleteRule id 목록 (오름차순)', size=None)),
+                ('version', models.BigIntegerField(default=0, help_text='진행 상태 버전 (변경될 때마다 1 증가)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정일시')),
+                ('map', models.ForeignKey(help_text='맵', on_delete=django.db.models.deletion.DO_NOTHING, related_name='play_progresses', to='map.map')),
+            ],
+            options={
+                'verbose_name': '맵 플레이 진행 상태',
+                'verbose_name_plural': '맵 플레이 진행 상태',
+            },
+        ),
+        migrations.RunPython(forward, backward),
+    ]
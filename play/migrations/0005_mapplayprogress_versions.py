@@ -0,0 +1,39 @@
+# Generated by Django 4.1.10 on 2026-10-18 15:41
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+def forward(apps, schema_editor):
+    MapPlayProgress = apps.get_model('play', 'MapPlayProgress')
+
+    # 기존 진행 상태는 현재 version 에서 완료된 것으로 봅니다.
+    for progress in MapPlayProgress.objects.all().iterator():
+        progress.completed_node_versions = [progress.version] * len(progress.completed_node_ids)
+        progress.resolved_arrow_versions = [progress.version] * len(progress.resolved_arrow_ids)
+        progress.save(update_fields=['completed_node_versions', 'resolved_arrow_versions'])
+
+
+def backward(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('play', '0004_mapplayprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mapplayprogress',
+            name='completed_node_versions',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='completed_node_ids 와 같은 순서로, 각 Node 가 완료된 시점의 version', size=None),
+        ),
+        migrations.AddField(
+            model_name='mapplayprogress',
+            name='resolved_arrow_versions',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, help_text='resolved_arrow_ids 와 같은 순서로, 각 Arrow 가 해결된 시점의 version', size=None),
+        ),
+        migrations.RunPython(forward, backward),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.1.10 on 2026-10-18 15:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0016_map_graph_version'),
+        ('play', '0005_mapplayprogress_versions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MapPlayNodeStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activated_count', models.IntegerField(default=0, help_text='진행 중 수')),
+                ('completed_count', models.IntegerField(default=0, help_text='완료 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정일시')),
+                ('map_play', models.ForeignKey(help_text='맵 플레이', on_delete=django.db.models.deletion.DO_NOTHING, related_name='node_statistics', to='play.mapplay')),
+                ('node', models.ForeignKey(help_text='노드', on_delete=django.db.models.deletion.DO_NOTHING, related_name='map_play_statistics', to='map.node')),
+            ],
+            options={
+                'verbose_name': '맵 플레이 노드 통계',
+                'verbose_name_plural': '맵 플레이 노드 통계',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='mapplaynodestatistic',
+            constraint=models.UniqueConstraint(fields=('map_play', 'node'), name='unique_map_play_node_statistic'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Count
+
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def forward(apps, schema_editor):
+    """
+    기존 NodeCompletedHistory 이력으로 MapPlay 별 Node 진행 중/완료 수를 채웁니다.
+    MapPlayNodeStatisticService.rebuild_statistics 와 같은 계산입니다.
+    - 완료 이력 1개당 해당 Node 는 완료 수 +1, 진행 중 수 -1
+    - 그 Node 에서 출발하는 삭제되지 않은 Arrow 의 도착 Node 들은 진행 중 수 +1
+    """
+    MapPlay = apps.get_model('play', 'MapPlay')
+    MapPlayNodeStatistic = apps.get_model('play', 'MapPlayNodeStatistic')
+    Arrow = apps.get_model('map', 'Arrow')
+    NodeCompletedHistory = apps.get_model('map', 'NodeCompletedHistory')
+
+    # BACKFILL_BATCH_SIZE 개 MapPlay 마다 MapPlay / Node 별로 집계한 완료 수, Map 별 Arrow 를 한 번씩 조회
+    map_plays = list(MapPlay.objects.order_by('id').values_list('id', 'map_id'))
+    for index in range(0, len(map_plays), BACKFILL_BATCH_SIZE):
+        chunk_map_plays = map_plays[index:index + BACKFILL_BATCH_SIZE]
+        map_id_by_map_play_id = dict(chunk_map_plays)
+        end_node_ids_by_start_node_id = defaultdict(set)
+        for map_id, start_node_id, end_node_id in Arrow.objects.filter(
+            map_id__in=set(map_id_by_map_play_id.values()),
+            is_deleted=False,
+        ).values_list(
+            'map_id',
+            'start_node_id',
+            'node_complete_rule__node_id',
+        ):
+            end_node_ids_by_start_node_id[(map_id, start_node_id)].add(end_node_id)
+
+        count_deltas = defaultdict(lambda: [0, 0])
+        for map_play_id, node_id, completed_count in NodeCompletedHistory.objects.filter(
+            map_play_member__map_play_id__in=map_id_by_map_play_id.keys(),
+        ).values(
+            'map_play_member__map_play_id',
+            'node_id',
+        ).annotate(
+            completed_count=Count('id'),
+        ).order_by().values_list(
+            'map_play_member__map_play_id',
+            'node_id',
+            'completed_count',
+        ):
+            count_deltas[(map_play_id, node_id)][0] -= completed_count
+            count_deltas[(map_play_id, node_id)][1] += completed_count
+            for end_node_id in end_node_ids_by_start_node_id[(map_id_by_map_play_id[map_play_id], node_id)]:
+                count_deltas[(map_play_id, end_node_id)][0] += completed_count
+
+        MapPlayNodeStatistic.objects.bulk_create(
+            [
+                MapPlayNodeStatistic(
+                    map_play_id=map_play_id,
+                    node_id=node_id,
+                    activated_count=activated_count,
+                    completed_count=completed_count,
+                )
+                for (map_play_id, node_id), (activated_count, completed_count) in count_deltas.items()
+            ],
+            batch_size=BACKFILL_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+def backward(apps, schema_editor):
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('map', '0016_map_graph_version'),
+        ('play', '0006_mapplaynodestatistic'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, backward),
+    ]
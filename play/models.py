@@ -1,3 +1,4 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
 from play.consts import (
@@ -41,6 +42,127 @@ class MapPlay(models.Model):
         return f'{self.map.name}의 플레이: {self.title}'
 
 
+class MapPlayProgress(models.Model):
+    """
+    MapPlay 의 진행 상태를 한 행에 모아둔 테이블입니다.
+    NodeCompletedHistory / ArrowProgress 이력을 매번 집계하지 않고 primary key 조회 한 번으로 진행 상태를 가져옵니다.
+    NodeCompletionService 에서 이력과 같은 트랜잭션으로 갱신합니다.
+    """
+    map_play = models.OneToOneField(
+        MapPlay,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        related_name='progress',
+        help_text='맵 플레이',
+    )
+    map = models.ForeignKey(
+        'map.Map',
+        on_delete=models.DO_NOTHING,
+        related_name='play_progresses',
+        help_text='맵',
+    )
+    completed_node_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='완료된 Node id 목록 (오름차순)',
+    )
+    resolved_arrow_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='해결된 Arrow id 목록 (오름차순)',
+    )
+    completed_rule_ids = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='완료된 NodeCompleteRule id 목록 (오름차순)',
+    )
+    completed_node_versions = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='completed_node_ids 와 같은 순서로, 각 Node 가 완료된 시점의 version',
+    )
+    resolved_arrow_versions = ArrayField(
+        models.BigIntegerField(),
+        default=list,
+        blank=True,
+        help_text='resolved_arrow_ids 와 같은 순서로, 각 Arrow 가 해결된 시점의 version',
+    )
+    version = models.BigIntegerField(
+        default=0,
+        help_text='진행 상태 버전 (변경될 때마다 1 증가)',
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text='생성일시',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text='수정일시',
+    )
+
+    class Meta:
+        verbose_name = '맵 플레이 진행 상태'
+        verbose_name_plural = '맵 플레이 진행 상태'
+
+    def __str__(self):
+        return f'{self.map_play_id} 플레이 진행 상태 (v{self.version})'
+
+
+class MapPlayNodeStatistic(models.Model):
+    """
+    MapPlay 안에서 Node 별 진행 중/완료 수를 미리 세어둔 테이블입니다.
+    Node 상세 조회마다 NodeCompletedHistory 를 집계하지 않도록 NodeCompletionService 에서 이력과 함께 갱신합니다.
+    Map 구조가 바뀌면 (Admin 수정, compile_map_graph, recompute_map_progress) 새 구조 기준으로 다시 계산합니다.
+    - completed_count: 해당 Node 의 완료 이력 수
+    - activated_count: 해당 Node 로 들어오는 Arrow 의 시작 Node 완료 이력 수 - completed_count
+    """
+    map_play = models.ForeignKey(
+        MapPlay,
+        on_delete=models.DO_NOTHING,
+        related_name='node_statistics',
+        help_text='맵 플레이',
+    )
+    node = models.ForeignKey(
+        'map.Node',
+        on_delete=models.DO_NOTHING,
+        related_name='map_play_statistics',
+        help_text='노드',
+    )
+    activated_count = models.IntegerField(
+        default=0,
+        help_text='진행 중 수',
+    )
+    completed_count = models.IntegerField(
+        default=0,
+        help_text='완료 수',
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text='생성일시',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text='수정일시',
+    )
+
+    class Meta:
+        verbose_name = '맵 플레이 노드 통계'
+        verbose_name_plural = '맵 플레이 노드 통계'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['map_play', 'node'],
+                name='unique_map_play_node_statistic',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.map_play_id} 플레이 {self.node_id} 노드 통계'
+
+
 class MapPlayMember(models.Model):
     map_play = models.ForeignKey(
         MapPlay,
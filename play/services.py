@@ -1,21 +1,41 @@
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional, Tuple
+from functools import partial
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import pytz
-from django.db import transaction
+from django.db import (
+    connection,
+    transaction,
+)
 from django.utils import timezone
 from django.db.models import F, Q, QuerySet
 
 from map.exceptions import MapNotFoundException
-from map.models import Map, NodeCompletedHistory
+from map.models import ArrowProgress, Map, NodeCompletedHistory
+from map_graph.dtos.map_graph_snapshot import MapGraphSnapshot
+from map_graph.services.map_graph_snapshot_service import get_map_graph_snapshot
 from member.models import Guest
-from play.consts import MapPlayMemberRole, MapPlayMemberDeactivateReason
+from play.consts import (
+    MAP_PLAY_PROGRESS_ADVISORY_LOCK_NAMESPACE,
+    MapPlayMemberRole,
+    MapPlayMemberDeactivateReason,
+)
 from play.models import (
     MapPlay,
     MapPlayMember,
     MapPlayInviteCode,
     MapPlayBanned,
     MapPlayMemberRoleHistory,
+    MapPlayNodeStatistic,
+    MapPlayProgress,
 )
 from play.utils import generate_invite_code, increment_invite_code_uses
 from play.exceptions import (
@@ -102,6 +122,11 @@ class MapPlayService:
             created_by_id=created_by_id,
         )
 
+        MapPlayProgress.objects.create(
+            map_play=map_play,
+            map_id=map_id,
+        )
+
         # 생성자를 admin으로 추가
         self._increase_map_play_count(created_by_id, map_id)
         map_play_member = MapPlayMember.objects.create(
@@ -347,8 +372,8 @@ class MapPlayService:
                 member__is_active=True,
             )
             push_service = PushService()
-            push_service.send_push(
-                guest_id=guest.id,
+            push_service.enqueue_push_to_multiple(
+                guest_ids=[guest.id],
                 title=f"\'{map_play_member.map_play.map.name}\' 권한 변경",
                 body=f"{map_play_member.map_play.title} 의 권한이 {MapPlayMemberRole.ADMIN.label}로 변경되었습니다.",
                 push_channel_type=PushChannelType.ROLE_CHANGE,
@@ -583,20 +608,34 @@ class MapPlayService:
             MapNotFoundException: Map이 존재하지 않거나 접근 권한이 없는 경우
             PlayMemberNotFoundException: map_play_member_id가 주어졌으나 해당 멤버가 존재하지 않거나 비활성화된 경우
         """
+        map_obj, _ = self.validate_map_and_get_play_member(map_id, member_id, map_play_member_id)
+        return map_obj
+
+    def validate_map_and_get_play_member(
+        self,
+        map_id: int,
+        member_id: int,
+        map_play_member_id: Optional[int] = None,
+    ) -> Tuple[Map, Optional[MapPlayMember]]:
+        """
+        validate_map_and_play_member_access 와 같은 검증을 하고, 검증된 MapPlayMember 도 함께 반환합니다.
+        map_play_member_id가 없으면 MapPlayMember 는 None 입니다.
+        """
         # Map 접근 권한 검증
         map_obj = self.validate_map_access(map_id, member_id)
-            
+
         # map_play_member_id가 주어진 경우 해당 멤버 검증
+        map_play_member = None
         if map_play_member_id:
-            member_exists = MapPlayMember.objects.filter(
+            map_play_member = MapPlayMember.objects.filter(
                 id=map_play_member_id,
                 map_play__map_id=map_id,
                 deactivated=False,
-            ).exists()
-            if not member_exists:
+            ).first()
+            if not map_play_member:
                 raise PlayMemberNotFoundException()
-            
-        return map_obj
+
+        return map_obj, map_play_member
 
     def get_map_play_completed_node_histories(self, map_play_id: int) -> QuerySet:
         """
@@ -689,3 +728,388 @@ class MapPlayService:
         map_play.save(update_fields=['title', 'updated_at'])
         
         return map_play
+
+
+class MapPlayProgressService:
+    """
+    MapPlay 진행 상태(MapPlayProgress) 조회 및 갱신을 담당합니다.
+    """
+    def get_progress(self, map_play_id: int, for_update: bool = False) -> MapPlayProgress:
+        """
+        MapPlay 의 진행 상태를 primary key 로 조회합니다.
+        진행 상태가 없다면 이력으로 다시 만들어 저장합니다.
+        for_update 인 경우 트랜잭션 안에서 호출해야 하며, 같은 MapPlay 의 갱신은 순서대로 처리됩니다.
+        진행 상태가 아직 없어 row lock 을 잡을 수 없는 경우도 MapPlay 단위 advisory lock 으로 순서를 보장합니다.
+        """
+        queryset = MapPlayProgress.objects.all()
+        if for_update:
+            self.lock_map_play(map_play_id)
+            queryset = queryset.select_for_update()
+        try:
+            return queryset.get(map_play_id=map_play_id)
+        except MapPlayProgress.DoesNotExist:
+            self.rebuild_progress(map_play_id)
+            return queryset.get(map_play_id=map_play_id)
+
+    @staticmethod
+    def lock_map_play(map_play_id: int) -> None:
+        """
+        트랜잭션이 끝날 때까지 MapPlay 단위 advisory lock 을 잡습니다. 트랜잭션 안에서 호출해야 합니다.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_advisory_xact_lock(%s, %s)',
+                [MAP_PLAY_PROGRESS_ADVISORY_LOCK_NAMESPACE, map_play_id],
+            )
+
+    def get_progress_or_none(self, map_play_id: Optional[int]) -> Optional[MapPlayProgress]:
+        if not map_play_id:
+            return None
+        return self.get_progress(map_play_id)
+
+    def rebuild_progress(self, map_play_id: int) -> MapPlayProgress:
+        """
+        NodeCompletedHistory / ArrowProgress 이력으로 진행 상태를 다시 계산합니다.
+        이미 진행 상태가 있다면 version 을 1 올리고, 모든 항목을 새 version 에서 변경된 것으로 기록합니다.
+        """
+        map_id = MapPlay.objects.values_list('map_id', flat=True).get(id=map_play_id)
+        completed_histories = list(
+            NodeCompletedHistory.objects.filter(
+                map_play_member__map_play_id=map_play_id,
+            ).values_list(
+                'node_id',
+                'node_complete_rule_id',
+            )
+        )
+        resolved_arrow_ids = sorted(
+            set(
+                ArrowProgress.objects.filter(
+                    map_play_member__map_play_id=map_play_id,
+                    is_resolved=True,
+                ).values_list(
+                    'arrow_id',
+                    flat=True,
+                )
+            )
+        )
+        completed_node_ids = sorted({node_id for node_id, _ in completed_histories})
+        previous_version = MapPlayProgress.objects.filter(
+            map_play_id=map_play_id,
+        ).values_list(
+            'version',
+            flat=True,
+        ).first()
+        version = 0 if previous_version is None else previous_version + 1
+        progress, _ = MapPlayProgress.objects.update_or_create(
+            map_play_id=map_play_id,
+            defaults={
+                'map_id': map_id,
+                'completed_node_ids': completed_node_ids,
+                'completed_node_versions': [version] * len(completed_node_ids),
+                'completed_rule_ids': sorted({rule_id for _, rule_id in completed_histories}),
+                'resolved_arrow_ids': resolved_arrow_ids,
+                'resolved_arrow_versions': [version] * len(resolved_arrow_ids),
+                'version': version,
+            },
+        )
+        return progress
+
+    def add_progress(
+            self,
+            progress: MapPlayProgress,
+            resolved_arrow_ids: Iterable[int] = (),
+            completed_node_rules: Iterable[Tuple[int, int]] = (),
+    ) -> MapPlayProgress:
+        """
+        새로 해결된 Arrow 와 완료된 (node_id, rule_id) 를 진행 상태에 반영합니다.
+        변경이 있을 때만 저장하며 version 을 1 올립니다.
+        """
+        resolved_arrow_ids = set(resolved_arrow_ids) - set(progress.resolved_arrow_ids)
+        completed_node_rules = list(completed_node_rules)
+        completed_node_ids = {node_id for node_id, _ in completed_node_rules} - set(progress.completed_node_ids)
+        completed_rule_ids = {rule_id for _, rule_id in completed_node_rules} - set(progress.completed_rule_ids)
+        if not (resolved_arrow_ids or completed_node_ids or completed_rule_ids):
+            return progress
+
+        progress.version += 1
+        progress.resolved_arrow_ids, progress.resolved_arrow_versions = self._merge_versioned_ids(
+            progress.resolved_arrow_ids,
+            progress.resolved_arrow_versions,
+            resolved_arrow_ids,
+            progress.version,
+        )
+        progress.completed_node_ids, progress.completed_node_versions = self._merge_versioned_ids(
+            progress.completed_node_ids,
+            progress.completed_node_versions,
+            completed_node_ids,
+            progress.version,
+        )
+        progress.completed_rule_ids = sorted(set(progress.completed_rule_ids) | completed_rule_ids)
+        progress.save(
+            update_fields=[
+                'resolved_arrow_ids',
+                'resolved_arrow_versions',
+                'completed_node_ids',
+                'completed_node_versions',
+                'completed_rule_ids',
+                'version',
+                'updated_at',
+            ]
+        )
+        return progress
+
+    def get_changed_ids_since(self, progress: MapPlayProgress, since: int) -> Tuple[Set[int], Set[int]]:
+        """
+        since version 이후에 완료된 Node id 와 해결된 Arrow id 를 반환합니다.
+        """
+        changed_node_ids = {
+            node_id
+            for node_id, version in zip(progress.completed_node_ids, progress.completed_node_versions)
+            if version > since
+        }
+        changed_arrow_ids = {
+            arrow_id
+            for arrow_id, version in zip(progress.resolved_arrow_ids, progress.resolved_arrow_versions)
+            if version > since
+        }
+        return changed_node_ids, changed_arrow_ids
+
+    @staticmethod
+    def _merge_versioned_ids(
+            ids: List[int],
+            versions: List[int],
+            new_ids: Set[int],
+            version: int,
+    ) -> Tuple[List[int], List[int]]:
+        version_by_id = dict(zip(ids, versions))
+        version_by_id.update({new_id: version for new_id in new_ids})
+        merged_ids = sorted(version_by_id.keys())
+        return merged_ids, [version_by_id[merged_id] for merged_id in merged_ids]
+
+
+class MapPlayNodeStatisticService:
+    """
+    MapPlay 의 Node 별 진행 중/완료 수(MapPlayNodeStatistic) 조회 및 갱신을 담당합니다.
+    """
+    def get_statistic(self, map_play_id: Optional[int], node_id: int) -> Tuple[int, int]:
+        """
+        Returns:
+            Tuple[int, int]: 진행 중 수, 완료 수
+        """
+        return self.get_statistics(map_play_id, [node_id]).get(node_id, (0, 0))
+
+    def get_statistics(self, map_play_id: Optional[int], node_ids: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+        """
+        Returns:
+            Dict[int, Tuple[int, int]]: Node 별 (진행 중 수, 완료 수), 통계가 없는 Node 는 제외
+        """
+        if not map_play_id:
+            return {}
+        return {
+            node_id: (activated_count, completed_count)
+            for node_id, activated_count, completed_count in MapPlayNodeStatistic.objects.filter(
+                map_play_id=map_play_id,
+                node_id__in=node_ids,
+            ).values_list(
+                'node_id',
+                'activated_count',
+                'completed_count',
+            )
+        }
+
+    def increase_statistics(
+            self,
+            map_play_id: int,
+            snapshot: MapGraphSnapshot,
+            completed_node_ids: Iterable[int],
+    ):
+        """
+        새로 생성된 완료 이력의 node_id 들을 통계에 더합니다. (이력 1개당 node_id 1개)
+        같은 MapPlay 의 진행 상태 row lock 을 잡은 트랜잭션 안에서 호출해야 합니다.
+        """
+        count_deltas_by_node_id = self._get_count_deltas_by_node_id(snapshot, completed_node_ids)
+        if not count_deltas_by_node_id:
+            return
+        statistic_by_node_id = {
+            statistic.node_id: statistic
+            for statistic in MapPlayNodeStatistic.objects.filter(
+                map_play_id=map_play_id,
+                node_id__in=count_deltas_by_node_id.keys(),
+            )
+        }
+        statistics = []
+        for node_id, (activated_delta, completed_delta) in count_deltas_by_node_id.items():
+            statistic = statistic_by_node_id.get(
+                node_id,
+                MapPlayNodeStatistic(map_play_id=map_play_id, node_id=node_id),
+            )
+            statistic.activated_count += activated_delta
+            statistic.completed_count += completed_delta
+            statistics.append(statistic)
+        self._save_statistics(statistics)
+
+    def get_completed_node_ids_by_map_play_id(self, map_play_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """
+        Returns:
+            Dict[int, List[int]]: MapPlay 별 완료 이력의 node_id 목록 (이력 1개당 node_id 1개)
+        """
+        completed_node_ids_by_map_play_id = defaultdict(list)
+        for map_play_id, node_id in NodeCompletedHistory.objects.filter(
+            map_play_member__map_play_id__in=map_play_ids,
+        ).values_list(
+            'map_play_member__map_play_id',
+            'node_id',
+        ):
+            completed_node_ids_by_map_play_id[map_play_id].append(node_id)
+        return completed_node_ids_by_map_play_id
+
+    def get_statistics_by_map_play_id(self, map_play_ids: Iterable[int]) -> Dict[int, Dict[int, Tuple[int, int]]]:
+        """
+        Returns:
+            Dict[int, Dict[int, Tuple[int, int]]]: MapPlay 별 Node 별 저장된 (진행 중 수, 완료 수)
+        """
+        statistics_by_map_play_id = defaultdict(dict)
+        for map_play_id, node_id, activated_count, completed_count in MapPlayNodeStatistic.objects.filter(
+            map_play_id__in=map_play_ids,
+        ).values_list(
+            'map_play_id',
+            'node_id',
+            'activated_count',
+            'completed_count',
+        ):
+            statistics_by_map_play_id[map_play_id][node_id] = (activated_count, completed_count)
+        return statistics_by_map_play_id
+
+    def calculate_statistics(
+            self,
+            snapshot: MapGraphSnapshot,
+            completed_node_ids: Iterable[int],
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        완료 이력의 node_id 들로 현재 Map 구조 기준 Node 별 (진행 중 수, 완료 수)를 계산합니다.
+        """
+        return {
+            node_id: (activated_count, completed_count)
+            for node_id, (activated_count, completed_count) in self._get_count_deltas_by_node_id(
+                snapshot,
+                completed_node_ids,
+            ).items()
+        }
+
+    @staticmethod
+    def get_statistic_changes(
+            before: Dict[int, Tuple[int, int]],
+            after: Dict[int, Tuple[int, int]],
+    ) -> Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Returns:
+            Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]]: 값이 바뀌는 Node 별 (변경 전, 변경 후) (진행 중 수, 완료 수)
+        """
+        return {
+            node_id: (before.get(node_id, (0, 0)), after.get(node_id, (0, 0)))
+            for node_id in sorted(before.keys() | after.keys())
+            if before.get(node_id, (0, 0)) != after.get(node_id, (0, 0))
+        }
+
+    @transaction.atomic
+    def rebuild_statistics(
+            self,
+            map_play_id: int,
+            snapshot: MapGraphSnapshot,
+    ) -> Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        NodeCompletedHistory 이력으로 현재 Map 구조 기준 MapPlay 의 Node 통계를 다시 계산합니다.
+
+        Returns:
+            Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]]: 값이 바뀐 Node 별 (변경 전, 변경 후) (진행 중 수, 완료 수)
+        """
+        MapPlayProgressService().get_progress(map_play_id, for_update=True)
+        statistics = self.calculate_statistics(
+            snapshot,
+            self.get_completed_node_ids_by_map_play_id([map_play_id]).get(map_play_id, []),
+        )
+        statistic_changes = self.get_statistic_changes(
+            self.get_statistics_by_map_play_id([map_play_id]).get(map_play_id, {}),
+            statistics,
+        )
+        if not statistic_changes:
+            return statistic_changes
+
+        MapPlayNodeStatistic.objects.filter(
+            map_play_id=map_play_id,
+        ).exclude(
+            node_id__in=statistics.keys(),
+        ).delete()
+        self._save_statistics([
+            MapPlayNodeStatistic(
+                map_play_id=map_play_id,
+                node_id=node_id,
+                activated_count=activated_count,
+                completed_count=completed_count,
+            )
+            for node_id, (activated_count, completed_count) in statistics.items()
+        ])
+        return statistic_changes
+
+    def rebuild_map_statistics(self, map_id: int) -> int:
+        """
+        Map 의 모든 MapPlay 통계를 현재 Map 구조 기준으로 다시 계산합니다.
+        완료 시점의 Map 구조로 더해둔 진행 중 수가 Arrow 추가/삭제 후에도 맞도록 Map 구조를 수정한 뒤 실행합니다.
+
+        Returns:
+            int: 통계가 바뀐 MapPlay 수
+        """
+        snapshot = get_map_graph_snapshot(map_id)
+        map_play_ids = list(
+            MapPlay.objects.filter(
+                map_id=map_id,
+            ).order_by(
+                'id',
+            ).values_list(
+                'id',
+                flat=True,
+            )
+        )
+        return sum(
+            1
+            for map_play_id in map_play_ids
+            if self.rebuild_statistics(map_play_id, snapshot)
+        )
+
+    @staticmethod
+    def rebuild_map_statistics_on_commit(map_ids: Iterable[int]) -> None:
+        """
+        Map 구조를 수정한 트랜잭션이 커밋된 뒤 새 구조 기준으로 통계를 다시 계산하도록 Map 별로 작업을 등록합니다.
+        """
+        from play.tasks import rebuild_map_node_statistics
+        for map_id in sorted(set(map_ids)):
+            transaction.on_commit(partial(rebuild_map_node_statistics.delay, map_id))
+
+    @staticmethod
+    def _get_count_deltas_by_node_id(
+            snapshot: MapGraphSnapshot,
+            completed_node_ids: Iterable[int],
+    ) -> Dict[int, List[int]]:
+        """
+        완료된 Node 는 완료 수가 1 늘고 진행 중 수가 1 줄며,
+        그 Node 에서 출발하는 Arrow 의 도착 Node 들은 진행 중 수가 1 늘어납니다.
+        """
+        count_deltas_by_node_id = defaultdict(lambda: [0, 0])
+        for completed_node_id in completed_node_ids:
+            count_deltas_by_node_id[completed_node_id][0] -= 1
+            count_deltas_by_node_id[completed_node_id][1] += 1
+            for end_node_id in {
+                arrow.end_node_id
+                for arrow in snapshot.get_arrows_by_start_node_id(completed_node_id)
+            }:
+                count_deltas_by_node_id[end_node_id][0] += 1
+        return count_deltas_by_node_id
+
+    @staticmethod
+    def _save_statistics(statistics: List[MapPlayNodeStatistic]):
+        MapPlayNodeStatistic.objects.bulk_create(
+            statistics,
+            update_conflicts=True,
+            unique_fields=['map_play', 'node'],
+            update_fields=['activated_count', 'completed_count', 'updated_at'],
+        )
@@ -0,0 +1,8 @@
+from config.celery import app
+from play.services import MapPlayNodeStatisticService
+
+
+# Map 구조를 수정한 트랜잭션이 커밋된 뒤 transaction.on_commit 으로 실행
+@app.task
+def rebuild_map_node_statistics(map_id: int) -> int:
+    return MapPlayNodeStatisticService().rebuild_map_statistics(map_id)
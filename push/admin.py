@@ -3,7 +3,9 @@ from push.models import (
     DeviceToken,
     PushHistory,
     PushMapPlayMember,
+    PushOutbox,
 )
+from push.services import PushReminderScheduleService
 
 
 @admin.register(DeviceToken)
@@ -45,3 +47,36 @@ class PushHistoryAdmin(admin.ModelAdmin):
         'push_type',
         'is_active',
     )
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        PushReminderScheduleService.schedule_on_commit([obj.id])
+
+    def delete_model(self, request, obj):
+        push_map_play_member_id = obj.id
+        super().delete_model(request, obj)
+        PushReminderScheduleService.schedule_on_commit([push_map_play_member_id])
+
+    def delete_queryset(self, request, queryset):
+        push_map_play_member_ids = list(queryset.values_list('id', flat=True))
+        super().delete_queryset(request, queryset)
+        PushReminderScheduleService.schedule_on_commit(push_map_play_member_ids)
+
+
+@admin.register(PushOutbox)
+class PushOutboxAdmin(admin.ModelAdmin):
+    list_display = (
+        'id',
+        'title',
+        'push_channel_type',
+        'status',
+        'attempt_count',
+        'next_attempt_at',
+        'sent_at',
+        'created_at',
+    )
+    list_filter = (
+        'status',
+        'push_channel_type',
+    )
+    readonly_fields = ('created_at', 'updated_at')
@@ -11,3 +11,66 @@ class PushChannelType(StrValueLabel):
 
 class PushMapPlayMemberPushType(StrValueLabel):
     REMINDER = ('REMINDER', '리마인더')
+
+
+class PushOutboxStatus(StrValueLabel):
+    PENDING = 'pending', '발송 대기'
+    SENDING = 'sending', '발송 중'
+    SENT = 'sent', '발송 완료'
+    FAILED = 'failed', '발송 실패'
+
+
+# 여러 게스트에게 보내는 푸시를 PushOutbox 한 행에 담는 최대 게스트 수
+PUSH_TASK_GUEST_BATCH_SIZE = 100
+# FCM multicast 한 번에 보낼 수 있는 최대 디바이스 토큰 수
+FCM_MULTICAST_MAX_TOKENS = 500
+
+# PushOutbox 를 한 번에 가져와서 발송하는 최대 행 수
+PUSH_OUTBOX_BATCH_SIZE = 50
+# deliver_push_outbox 작업 한 번에 처리하는 최대 묶음 수
+PUSH_OUTBOX_MAX_BATCHES_PER_RUN = 20
+# 발송 실패 시 최대 시도 횟수, 넘으면 failed 로 남김
+PUSH_OUTBOX_MAX_ATTEMPTS = 5
+# 재시도 간격 (초), 시도할 때마다 2배씩 늘어남
+PUSH_OUTBOX_RETRY_BASE_SECONDS = 30
+# 발송 중(sending)으로 가져간 행을 다른 워커가 다시 가져갈 수 있을 때까지의 시간 (초), 발송 중 워커가 죽은 경우에 사용
+PUSH_OUTBOX_SENDING_LEASE_SECONDS = 300
+# FCM 프로젝트별 초당 최대 발송 디바이스 수
+PUSH_OUTBOX_MAX_MESSAGES_PER_SECOND = 500
+PUSH_OUTBOX_RATE_LIMIT_CACHE_KEY = 'push_outbox_rate_limit:{project_id}:{second}'
+
+# 다음 리마인드 발송 시각(epoch 초)을 score 로 PushMapPlayMember id 를 저장하는 Redis sorted set
+PUSH_REMINDER_SCHEDULE_KEY = 'push_reminder_schedule'
+# sorted set 을 DB 기준으로 만든 적이 있는지 표시, Redis 데이터가 사라지면 다음 확인 때 다시 만듦
+PUSH_REMINDER_SCHEDULE_BUILT_KEY = 'push_reminder_schedule:built'
+# 리마인드 시각 기준 시간대
+PUSH_REMINDER_TIME_ZONE = 'Asia/Seoul'
+# 리마인드 스케줄러가 발송할 때가 된 리마인드를 확인하는 간격 (초)
+PUSH_REMINDER_TICK_SECONDS = 5
+# 한 번에 꺼내서 발송하는 최대 리마인드 수
+PUSH_REMINDER_POP_BATCH_SIZE = 500
+# 스케줄러가 멈춰 있었던 경우, 발송 시각에서 이 시간(초) 넘게 지난 리마인드는 보내지 않음
+PUSH_REMINDER_MAX_DELAY_SECONDS = 60 * 10
+PUSH_REMIND_TITLE = '리마인드 알림'
+PUSH_REMIND_BODY = '{} 의 {} 리마인드 알림 입니다. {}'
+
+# 같은 묶음(예: 수신자별 MapPlay)의 알림을 모아 하나로 보내는 digest 버퍼, 발송할 시각을 score 로 묶음 id 를 저장하는 sorted set
+PUSH_DIGEST_EVENTS_KEY = 'push_digest:{digest_type}:{group_id}:events'
+PUSH_DIGEST_DUE_KEY = 'push_digest:{digest_type}:due'
+# 발송되지 못하고 남은 digest 버퍼가 Redis 에 남아있는 최대 시간 (초)
+PUSH_DIGEST_EVENTS_TTL_SECONDS = 60 * 60 * 24
+# 한 번에 꺼내서 발송하는 최대 digest 묶음 수
+PUSH_DIGEST_POP_BATCH_SIZE = 500
+# 문제 해결 알림을 MapPlay 별로 모았다가 한 번에 보내는 시간 (초)
+QUESTION_SOLVED_ALERT_DIGEST_TYPE = 'question_solved_alert'
+QUESTION_SOLVED_ALERT_DIGEST_WINDOW_SECONDS = 60
+
+# PushHistory 는 sent_at 기준 월별 파티션 테이블, 파티션 이름 형식
+PUSH_HISTORY_PARTITION_NAME = 'push_pushhistory_p{year:04d}{month:02d}'
+PUSH_HISTORY_DEFAULT_PARTITION_NAME = 'push_pushhistory_default'
+# 미리 만들어두는 다음 달 파티션 수
+PUSH_HISTORY_PARTITION_MONTHS_AHEAD = 3
+# 발송 이력 보관 기간 (개월), 지난 파티션은 DELETE 대신 통째로 삭제
+PUSH_HISTORY_RETENTION_MONTHS = 6
+# 내 알림 목록 기본 조회 수
+PUSH_NOTIFICATION_LIST_DEFAULT_SIZE = 20
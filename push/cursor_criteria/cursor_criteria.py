@@ -0,0 +1,22 @@
+from typing import Any
+
+from common.common_criteria.cursor_criteria import CursorCriteria
+from common.common_utils.encode_utils import data_to_urlsafe_base64
+
+
+class PushNotificationListCursorCriteria(CursorCriteria):
+    """
+    최신 발송순, 같은 발송일시 안에서는 id 역순으로 정렬합니다.
+    """
+    cursor_keys = [
+        'sent_at__lte',
+        'id__lt',
+    ]
+
+    @classmethod
+    def get_encoded_base64_cursor_data(cls, data: Any) -> str:
+        # 같은 초에 여러 알림이 발송되므로 (sent_at, id) 로 이어서 조회하려면 마이크로초까지 저장해야 함
+        return data_to_urlsafe_base64({
+            'sent_at__lte': data.sent_at.isoformat(),
+            'id__lt': data.id,
+        })
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from push.models import PushHistory
+
+
+class PushNotificationDto(BaseModel):
+    id: int = Field(description='발송 이력 id')
+    title: str = Field(description='알림 제목')
+    body: str = Field(description='알림 내용')
+    data: Optional[Dict[str, Any]] = Field(None, description='추가 데이터')
+    sent_at: datetime = Field(description='발송일시')
+
+    @classmethod
+    def from_push_history(cls, push_history: PushHistory) -> 'PushNotificationDto':
+        return cls(
+            id=push_history.id,
+            title=push_history.title,
+            body=push_history.body,
+            data=push_history.data,
+            sent_at=push_history.sent_at,
+        )
@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+
+class PushSendResultDto(BaseModel):
+    is_success: bool = Field(description='발송 성공 여부')
+    error_message: Optional[str] = Field(None, description='실패 사유')
+    is_invalid_token: bool = Field(False, description='토큰이 더 이상 유효하지 않아 비활성화해야 하는지 여부')
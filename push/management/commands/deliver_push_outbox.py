@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from push.tasks import deliver_push_outbox
+
+
+class Command(BaseCommand):
+    """
+    python manage.py deliver_push_outbox
+
+    커밋 후 바로 실행되는 deliver_push_outbox 작업이 놓친 행과, 재시도할 때가 된 행을 바로 발송합니다.
+    평소에는 run_push_reminder_scheduler 명령어가 발송할 때가 된 행이 있으면 deliver_push_outbox 작업을 등록합니다.
+    """
+    help = '발송할 때가 된 PushOutbox 를 발송합니다.'
+
+    def handle(self, *args, **options):
+        delivered_count = deliver_push_outbox()
+        self.stdout.write(self.style.SUCCESS(f'PushOutbox {delivered_count}개를 처리했습니다.'))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from push.consts import (
+    PUSH_HISTORY_PARTITION_MONTHS_AHEAD,
+    PUSH_HISTORY_RETENTION_MONTHS,
+)
+from push.services import PushHistoryPartitionService
+
+
+class Command(BaseCommand):
+    """
+    python manage.py manage_push_history_partitions
+    python manage.py manage_push_history_partitions --retention-months 12
+
+    PushHistory 의 다음 달 파티션을 미리 만들고, 보관 기간이 지난 파티션은 DELETE 대신 파티션을 통째로 삭제합니다. (cron 으로 매일 실행)
+    """
+    help = 'PushHistory 월별 파티션을 만들고 보관 기간이 지난 파티션을 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=PUSH_HISTORY_PARTITION_MONTHS_AHEAD,
+            help='미리 만들어둘 다음 달 파티션 수',
+        )
+        parser.add_argument(
+            '--retention-months',
+            type=int,
+            default=PUSH_HISTORY_RETENTION_MONTHS,
+            help='발송 이력 보관 기간 (개월)',
+        )
+
+    def handle(self, *args, **options):
+        created_partition_names, dropped_partition_names = PushHistoryPartitionService().maintain(
+            months_ahead=options['months_ahead'],
+            retention_months=options['retention_months'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'파티션 생성: {created_partition_names}, 파티션 삭제: {dropped_partition_names}'
+        ))
@@ -0,0 +1,42 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+
+from push.consts import PUSH_REMINDER_TICK_SECONDS
+from push.services import PushReminderScheduleService
+from push.tasks import run_push_reminder_tick
+
+
+class Command(BaseCommand):
+    """
+    python manage.py run_push_reminder_scheduler
+
+    계속 실행되면서 PUSH_REMINDER_TICK_SECONDS 마다 run_push_reminder_tick 을 실행합니다.
+    (리마인드 발송, 재시도할 때가 된 PushOutbox 발송 작업 등록, 발송 시각이 지난 문제 해결 알림 묶음 발송)
+    시작할 때 DB 기준으로 리마인드 sorted set 을 다시 만들고, 이후에는 PushMapPlayMember 가 바뀔 때마다 갱신된 값을 사용합니다.
+    스케줄러가 실행되지 않는 환경에서는 cron 의 push_map_play_member_reminder 명령어가 1분마다 같은 처리를 합니다.
+    """
+    help = '리마인드 스케줄러를 실행합니다.'
+
+    def handle(self, *args, **options):
+        self.is_running = True
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        scheduled_count = PushReminderScheduleService().rebuild()
+        self.stdout.write(self.style.SUCCESS(f'리마인드 {scheduled_count}개를 등록하고 스케줄러를 시작합니다.'))
+
+        while self.is_running:
+            try:
+                result = run_push_reminder_tick()
+                if result['sent_reminder_count']:
+                    self.stdout.write(f"리마인드 {result['sent_reminder_count']}개를 발송 대기열에 등록했습니다.")
+                if result['flushed_digest_count']:
+                    self.stdout.write(f"문제 해결 알림 묶음 {result['flushed_digest_count']}개를 보냈습니다.")
+            except Exception as e:
+                self.stderr.write(f'리마인드 스케줄러 실행 실패: {str(e)}')
+            time.sleep(PUSH_REMINDER_TICK_SECONDS)
+
+    def _stop(self, signum, frame):
+        self.is_running = False
@@ -0,0 +1,42 @@
+# Generated by Django 4.1.10 on 2026-10-18 16:22
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('push', '0005_pushmapplaymember_is_deleted'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PushOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('guest_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), help_text='수신 게스트 id 목록', size=None)),
+                ('device_token_ids', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, help_text='재시도 시 다시 보낼 디바이스 토큰 id 목록 (없으면 게스트의 모든 활성화된 토큰)', null=True, size=None)),
+                ('title', models.CharField(help_text='알림 제목', max_length=255)),
+                ('body', models.TextField(help_text='알림 내용')),
+                ('push_channel_type', models.CharField(choices=[('default', '기본'), ('question_feedback', '문제 피드백'), ('question_solved_alert', '문제 해결 알림'), ('role_change', '역할 변경'), ('map_play_member_reminder', '맵 플레이 멤버 리마인더')], default='default', help_text='알림 채널', max_length=50)),
+                ('data', models.JSONField(blank=True, help_text='추가 데이터', null=True)),
+                ('status', models.CharField(choices=[('pending', '발송 대기'), ('sent', '발송 완료'), ('failed', '발송 실패')], default='pending', help_text='발송 상태', max_length=20)),
+                ('attempt_count', models.IntegerField(default=0, help_text='발송 시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, help_text='다음 발송 시도 일시')),
+                ('last_error', models.TextField(blank=True, help_text='마지막 실패 사유', null=True)),
+                ('sent_at', models.DateTimeField(blank=True, help_text='발송 완료 일시', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정일시')),
+            ],
+            options={
+                'verbose_name': '푸시 발송 대기열',
+                'verbose_name_plural': '푸시 발송 대기열',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='pushoutbox',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='push_outbox_status_next_idx'),
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 4.1.10 on 2026-10-18 18:02
+
+from datetime import (
+    date,
+    datetime,
+    timezone,
+)
+
+from django.db import migrations, models
+
+
+PARTITION_MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    year, month_index = divmod(month.year * 12 + month.month - 1 + months, 12)
+    return date(year, month_index + 1, 1)
+
+
+def forward(apps, schema_editor):
+    """
+    push_pushhistory 를 sent_at 기준 월별 RANGE 파티션 테이블로 바꿉니다.
+    파티션 테이블의 기본 키에는 파티션 키가 포함되어야 하므로 기본 키는 (id, sent_at) 입니다.
+    기존 테이블 이름 변경부터 복사가 끝날 때까지 push_pushhistory 에 ACCESS EXCLUSIVE 잠금을 잡으므로,
+    발송 이력 수에 비례해서 발송 이력 저장과 알림 조회가 멈춥니다. 되돌릴 수 없는 마이그레이션입니다.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = 'push_pushhistory'::regclass AND contype = 'f'"
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename = 'push_pushhistory' AND indexname <> 'push_pushhistory_pkey'"
+        )
+        indexes = cursor.fetchall()
+        cursor.execute('SELECT MIN(sent_at) FROM push_pushhistory')
+        min_sent_at = cursor.fetchone()[0]
+
+    # 기존 테이블은 이름을 바꾸고, 새 테이블에서 같은 이름을 쓰도록 제약/인덱스를 먼저 제거
+    schema_editor.execute('ALTER TABLE push_pushhistory RENAME TO push_pushhistory_old')
+    schema_editor.execute('ALTER TABLE push_pushhistory_old RENAME CONSTRAINT push_pushhistory_pkey TO push_pushhistory_old_pkey')
+    for constraint_name, _ in foreign_keys:
+        schema_editor.execute(f'ALTER TABLE push_pushhistory_old DROP CONSTRAINT {constraint_name}')
+    for index_name, _ in indexes:
+        schema_editor.execute(f'DROP INDEX {index_name}')
+
+    schema_editor.execute('CREATE SEQUENCE push_pushhistory_partitioned_id_seq AS bigint')
+    schema_editor.execute(
+        'CREATE TABLE push_pushhistory (LIKE push_pushhistory_old INCLUDING COMMENTS) '
+        'PARTITION BY RANGE (sent_at)'
+    )
+    schema_editor.execute(
+        "ALTER TABLE push_pushhistory ALTER COLUMN id SET DEFAULT nextval('push_pushhistory_partitioned_id_seq')"
+    )
+    schema_editor.execute('ALTER TABLE push_pushhistory ADD CONSTRAINT push_pushhistory_pkey PRIMARY KEY (id, sent_at)')
+
+    # 기존 이력이 있는 달부터 PARTITION_MONTHS_AHEAD 개월 뒤까지 월별 파티션 생성, 범위를 벗어나면 default 파티션에 저장
+    now = datetime.now(timezone.utc)
+    month = (min_sent_at or now).astimezone(timezone.utc).date().replace(day=1)
+    last_month = _add_months(now.date().replace(day=1), PARTITION_MONTHS_AHEAD)
+    while month <= last_month:
+        next_month = _add_months(month, 1)
+        schema_editor.execute(
+            f'CREATE TABLE push_pushhistory_p{month.year:04d}{month.month:02d} PARTITION OF push_pushhistory '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{next_month.isoformat()} 00:00:00+00')"
+        )
+        month = next_month
+    schema_editor.execute('CREATE TABLE push_pushhistory_default PARTITION OF push_pushhistory DEFAULT')
+
+    schema_editor.execute('INSERT INTO push_pushhistory SELECT * FROM push_pushhistory_old')
+    schema_editor.execute(
+        "SELECT setval('push_pushhistory_partitioned_id_seq', COALESCE((SELECT MAX(id) FROM push_pushhistory), 0) + 1, false)"
+    )
+    schema_editor.execute('DROP TABLE push_pushhistory_old')
+    schema_editor.execute('ALTER SEQUENCE push_pushhistory_partitioned_id_seq RENAME TO push_pushhistory_id_seq')
+    schema_editor.execute('ALTER SEQUENCE push_pushhistory_id_seq OWNED BY push_pushhistory.id')
+
+    for constraint_name, constraint_definition in foreign_keys:
+        schema_editor.execute(f'ALTER TABLE push_pushhistory ADD CONSTRAINT {constraint_name} {constraint_definition}')
+    for _, index_definition in indexes:
+        schema_editor.execute(index_definition)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('push', '0006_pushoutbox'),
+    ]
+
+    operations = [
+        migrations.RunPython(forward),
+        migrations.AddIndex(
+            model_name='pushhistory',
+            index=models.Index(fields=['guest', '-sent_at', '-id'], name='push_history_guest_sent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pushhistory',
+            index=models.Index(fields=['sent_at'], name='push_history_sent_at_idx'),
+        ),
+    ]
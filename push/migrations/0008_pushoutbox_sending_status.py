@@ -0,0 +1,18 @@
+# Generated by Django 4.1.10 on 2026-10-18 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('push', '0007_partition_push_history'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pushoutbox',
+            name='status',
+            field=models.CharField(choices=[('pending', '발송 대기'), ('sending', '발송 중'), ('sent', '발송 완료'), ('failed', '발송 실패')], default='pending', help_text='발송 상태', max_length=20),
+        ),
+    ]
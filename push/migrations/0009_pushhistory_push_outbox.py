@@ -0,0 +1,19 @@
+# Generated by Django 4.1.10 on 2026-10-18 16:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('push', '0008_pushoutbox_sending_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pushhistory',
+            name='push_outbox',
+            field=models.ForeignKey(blank=True, help_text='발송한 푸시 (PushOutbox 를 거치지 않고 바로 발송한 경우 없음)', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='push_histories', to='push.pushoutbox'),
+        ),
+    ]
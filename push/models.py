@@ -1,9 +1,15 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.utils import timezone
 from member.models import (
     Guest,
     Member,
 )
-from push.consts import PushMapPlayMemberPushType
+from push.consts import (
+    PushChannelType,
+    PushMapPlayMemberPushType,
+    PushOutboxStatus,
+)
 
 
 class DeviceToken(models.Model):
@@ -48,6 +54,10 @@ class DeviceToken(models.Model):
 
 
 class PushHistory(models.Model):
+    """
+    Postgres 에서 sent_at 기준 월별 RANGE 파티션 테이블입니다. (기본 키는 (id, sent_at))
+    파티션 생성/삭제는 manage_push_history_partitions 명령어에서 처리합니다.
+    """
     guest = models.ForeignKey(
         Guest,
         on_delete=models.DO_NOTHING,
@@ -60,6 +70,14 @@ class PushHistory(models.Model):
         related_name='push_histories',
         help_text='수신 디바이스',
     )
+    push_outbox = models.ForeignKey(
+        'push.PushOutbox',
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
+        related_name='push_histories',
+        help_text='발송한 푸시 (PushOutbox 를 거치지 않고 바로 발송한 경우 없음)',
+    )
     title = models.CharField(
         max_length=255,
         help_text='알림 제목',
@@ -89,6 +107,10 @@ class PushHistory(models.Model):
     class Meta:
         verbose_name = '푸시 발송 이력'
         verbose_name_plural = '푸시 발송 이력'
+        indexes = [
+            models.Index(fields=['guest', '-sent_at', '-id'], name='push_history_guest_sent_idx'),
+            models.Index(fields=['sent_at'], name='push_history_sent_at_idx'),
+        ]
 
     def __str__(self):
         return f'{self.guest.id}에게 발송된 푸시: {self.title}'
@@ -150,3 +172,84 @@ class PushMapPlayMember(models.Model):
 
     def __str__(self):
         return f'{self.map_play_member.member.nickname}의 푸시 맵 {self.map_play_member.map_play.map.name} 플레이 멤버'
+
+
+class PushOutbox(models.Model):
+    """
+    발송할 푸시를 먼저 저장해두는 테이블입니다.
+    deliver_push_outbox 작업이 SELECT ... FOR UPDATE SKIP LOCKED 로 가져가 sending 으로 바꾼 뒤 트랜잭션 밖에서 발송하고,
+    실패하면 간격을 늘려가며 재시도합니다.
+    """
+    guest_ids = ArrayField(
+        models.BigIntegerField(),
+        help_text='수신 게스트 id 목록',
+    )
+    device_token_ids = ArrayField(
+        models.BigIntegerField(),
+        null=True,
+        blank=True,
+        help_text='재시도 시 다시 보낼 디바이스 토큰 id 목록 (없으면 게스트의 모든 활성화된 토큰)',
+    )
+    title = models.CharField(
+        max_length=255,
+        help_text='알림 제목',
+    )
+    body = models.TextField(
+        help_text='알림 내용',
+    )
+    push_channel_type = models.CharField(
+        max_length=50,
+        choices=PushChannelType.choices(),
+        default=PushChannelType.DEFAULT.value,
+        help_text='알림 채널',
+    )
+    data = models.JSONField(
+        null=True,
+        blank=True,
+        help_text='추가 데이터',
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=PushOutboxStatus.choices(),
+        default=PushOutboxStatus.PENDING.value,
+        help_text='발송 상태',
+    )
+    attempt_count = models.IntegerField(
+        default=0,
+        help_text='발송 시도 횟수',
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text='다음 발송 시도 일시',
+    )
+    last_error = models.TextField(
+        null=True,
+        blank=True,
+        help_text='마지막 실패 사유',
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='발송 완료 일시',
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text='생성일시',
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text='수정일시',
+    )
+
+    class Meta:
+        verbose_name = '푸시 발송 대기열'
+        verbose_name_plural = '푸시 발송 대기열'
+        indexes = [
+            models.Index(
+                fields=['status', 'next_attempt_at'],
+                name='push_outbox_status_next_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.title} ({self.status})'
@@ -1,4 +1,12 @@
 import json
+import time
+from datetime import (
+    date,
+    datetime,
+    time as dt_time,
+    timedelta,
+    timezone as dt_timezone,
+)
 from typing import (
     Any,
     Dict,
@@ -6,18 +14,69 @@ from typing import (
     Optional,
     Tuple,
 )
+from zoneinfo import ZoneInfo
+
+from django.core.cache import cache
+from django.db import (
+    connection,
+    transaction,
+)
+from django.db.models import (
+    Exists,
+    OuterRef,
+    Q,
+)
+from django.utils import timezone
+from django_redis import get_redis_connection
 from firebase_admin import messaging
 from firebase_admin.exceptions import FirebaseError
 
-from push.consts import PushChannelType
+from push.consts import (
+    FCM_MULTICAST_MAX_TOKENS,
+    PUSH_HISTORY_PARTITION_MONTHS_AHEAD,
+    PUSH_HISTORY_PARTITION_NAME,
+    PUSH_HISTORY_RETENTION_MONTHS,
+    PUSH_NOTIFICATION_LIST_DEFAULT_SIZE,
+    PUSH_DIGEST_DUE_KEY,
+    PUSH_DIGEST_EVENTS_KEY,
+    PUSH_DIGEST_EVENTS_TTL_SECONDS,
+    PUSH_DIGEST_POP_BATCH_SIZE,
+    PUSH_OUTBOX_BATCH_SIZE,
+    PUSH_OUTBOX_MAX_ATTEMPTS,
+    PUSH_OUTBOX_MAX_MESSAGES_PER_SECOND,
+    PUSH_OUTBOX_RATE_LIMIT_CACHE_KEY,
+    PUSH_OUTBOX_RETRY_BASE_SECONDS,
+    PUSH_OUTBOX_SENDING_LEASE_SECONDS,
+    PUSH_REMIND_BODY,
+    PUSH_REMIND_TITLE,
+    PUSH_REMINDER_MAX_DELAY_SECONDS,
+    PUSH_REMINDER_POP_BATCH_SIZE,
+    PUSH_REMINDER_SCHEDULE_BUILT_KEY,
+    PUSH_REMINDER_SCHEDULE_KEY,
+    PUSH_REMINDER_TIME_ZONE,
+    PUSH_TASK_GUEST_BATCH_SIZE,
+    PushChannelType,
+    PushOutboxStatus,
+)
+from push.cursor_criteria.cursor_criteria import PushNotificationListCursorCriteria
+from push.dtos.push_notification import PushNotificationDto
+from push.dtos.push_send_result import PushSendResultDto
 from push.models import (
     DeviceToken,
     PushHistory,
     PushMapPlayMember,
+    PushOutbox,
+)
+from push.transports import (
+    FcmPushTransport,
+    PushTransport,
 )
 
 
 class PushService:
+    def __init__(self, transport: Optional[PushTransport] = None):
+        self.transport = transport or FcmPushTransport()
+
     def validate_token(self, token: str) -> bool:
         """
         FCM 토큰 유효성 검사
@@ -82,90 +141,13 @@ class PushService:
         """
         특정 게스트의 모든 활성화된 디바이스로 푸시 발송
         """
-        device_tokens = DeviceToken.objects.filter(
-            guest_id=guest_id,
-            is_active=True,
+        return self.send_push_to_multiple(
+            [guest_id],
+            title,
+            body,
+            push_channel_type,
+            data,
         )
-        
-        if not device_tokens.exists():
-            return []
-        
-        histories = []
-        for device_token in device_tokens:
-            try:
-                # 토큰 재검증
-                if not self.validate_token(device_token.token):
-                    self.deactivate_token(device_token.token)
-                    continue
-
-                message = messaging.Message(
-                    data=data or {},
-                    android=messaging.AndroidConfig(
-                        priority='high',
-                        notification=messaging.AndroidNotification(
-                            title=title,
-                            body=body,
-                            channel_id=push_channel_type.value,
-                            priority='max',
-                            default_sound=True,
-                            default_vibrate_timings=True,
-                            click_action='.MainActivity',
-                        ),
-                        data=data or {},
-                    ),
-                    token=device_token.token,
-                )
-
-                # Firebase로 푸시 발송
-                response = messaging.send(message)
-
-                # 발송 이력 저장
-                history = PushHistory.objects.create(
-                    guest_id=guest_id,
-                    device_token=device_token,
-                    title=title,
-                    body=body,
-                    data=data,
-                    is_success=True,
-                )
-                histories.append(history)
-                
-            except FirebaseError as e:
-                error_message = str(e).lower()
-                # 토큰이 유효하지 않은 경우 체크
-                if any(msg in error_message for msg in [
-                    'not a valid fcm registration token',
-                    'requested entity was not found',
-                    'invalid argument',
-                    'registration token not valid'
-                ]):
-                    self.deactivate_token(device_token.token)
-                
-                # 발송 실패 이력 저장
-                history = PushHistory.objects.create(
-                    guest_id=guest_id,
-                    device_token=device_token,
-                    title=title,
-                    body=body,
-                    data=data,
-                    is_success=False,
-                    error_message=str(e),
-                )
-                histories.append(history)
-            except Exception as e:
-                # 기타 예외 처리
-                history = PushHistory.objects.create(
-                    guest_id=guest_id,
-                    device_token=device_token,
-                    title=title,
-                    body=body,
-                    data=data,
-                    is_success=False,
-                    error_message=f"Unexpected error: {str(e)}",
-                )
-                histories.append(history)
-                
-        return histories
 
     def send_notification(
         self,
@@ -220,19 +202,126 @@ class PushService:
         data: Optional[Dict[str, Any]] = None,
     ) -> List[PushHistory]:
         """
-        여러 게스트에게 동시에 푸시 발송
+        여러 게스트의 모든 활성화된 디바이스로 푸시 발송
+        - 디바이스 토큰은 한 번에 조회하고, FCM_MULTICAST_MAX_TOKENS 개씩 multicast 로 발송합니다.
+        - 유효하지 않은 토큰 비활성화와 발송 이력 저장도 한 번에 처리합니다.
         """
-        all_histories = []
-        for guest_id in guest_ids:
-            histories = self.send_push(
-                guest_id,
-                title,
-                body,
-                push_channel_type,
-                data,
+        return self.send_push_to_device_tokens(
+            self.get_active_device_tokens(guest_ids=guest_ids),
+            title,
+            body,
+            push_channel_type,
+            data,
+        )
+
+    @staticmethod
+    def get_active_device_tokens(
+        guest_ids: Optional[List[int]] = None,
+        device_token_ids: Optional[List[int]] = None,
+    ) -> List[DeviceToken]:
+        device_tokens = DeviceToken.objects.filter(
+            is_active=True,
+        )
+        if guest_ids is not None:
+            device_tokens = device_tokens.filter(guest_id__in=guest_ids)
+        if device_token_ids is not None:
+            device_tokens = device_tokens.filter(id__in=device_token_ids)
+        return list(device_tokens.order_by('id'))
+
+    def send_push_to_device_tokens(
+        self,
+        device_tokens: List[DeviceToken],
+        title: str,
+        body: str,
+        push_channel_type: PushChannelType = PushChannelType.DEFAULT,
+        data: Optional[Dict[str, Any]] = None,
+        save_histories: bool = True,
+    ) -> List[PushHistory]:
+        """
+        유효하지 않은 토큰은 비활성화하고 device_token.is_active 도 False 로 바꿉니다.
+        save_histories 가 False 면 발송 이력을 저장하지 않고 반환하므로, 호출한 쪽에서 모아서 한 번에 저장해야 합니다.
+        """
+        if not device_tokens:
+            return []
+
+        histories = []
+        invalid_device_token_ids = []
+        for index in range(0, len(device_tokens), FCM_MULTICAST_MAX_TOKENS):
+            chunk_device_tokens = device_tokens[index:index + FCM_MULTICAST_MAX_TOKENS]
+            try:
+                results = self.transport.send_multicast(
+                    [device_token.token for device_token in chunk_device_tokens],
+                    title,
+                    body,
+                    push_channel_type,
+                    data,
+                )
+            except Exception as e:
+                # 기타 예외 처리
+                results = [
+                    PushSendResultDto(is_success=False, error_message=f"Unexpected error: {str(e)}")
+                    for _ in chunk_device_tokens
+                ]
+
+            for device_token, result in zip(chunk_device_tokens, results):
+                if result.is_invalid_token:
+                    device_token.is_active = False
+                    invalid_device_token_ids.append(device_token.id)
+                histories.append(
+                    PushHistory(
+                        guest_id=device_token.guest_id,
+                        device_token=device_token,
+                        title=title,
+                        body=body,
+                        data=data,
+                        is_success=result.is_success,
+                        error_message=result.error_message,
+                    )
+                )
+
+        if invalid_device_token_ids:
+            DeviceToken.objects.filter(id__in=invalid_device_token_ids).update(is_active=False)
+        if not save_histories:
+            return histories
+        return PushHistory.objects.bulk_create(histories)
+
+    def enqueue_push_to_multiple(
+        self,
+        guest_ids: List[int],
+        title: str,
+        body: str,
+        push_channel_type: PushChannelType = PushChannelType.DEFAULT,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List[PushOutbox]:
+        """
+        여러 게스트에게 보내는 푸시를 PUSH_TASK_GUEST_BATCH_SIZE 명씩 나눠서 PushOutbox 에 저장합니다.
+        Firebase 요청과 PushHistory 저장은 커밋 후 deliver_push_outbox 작업에서 처리됩니다.
+        """
+        if not guest_ids:
+            return []
+        return self.enqueue_outboxes([
+            PushOutbox(
+                guest_ids=guest_ids[index:index + PUSH_TASK_GUEST_BATCH_SIZE],
+                title=title,
+                body=body,
+                push_channel_type=push_channel_type.value,
+                data=data,
             )
-            all_histories.extend(histories)
-        return all_histories
+            for index in range(0, len(guest_ids), PUSH_TASK_GUEST_BATCH_SIZE)
+        ])
+
+    @staticmethod
+    def enqueue_outboxes(outboxes: List[PushOutbox]) -> List[PushOutbox]:
+        """
+        내용이 서로 다른 푸시 여러 개를 PushOutbox 에 한 번에 저장하고, 커밋 후 발송 작업을 한 번만 등록합니다.
+        """
+        if not outboxes:
+            return []
+        outboxes = PushOutbox.objects.bulk_create(outboxes)
+
+        from push.tasks import deliver_push_outbox
+        transaction.on_commit(lambda: deliver_push_outbox.delay())
+        return outboxes
 
     def update_push_map_play_member_active_status(
         self,
@@ -257,6 +346,559 @@ class PushService:
         
         # 대량 업데이트 수행
         push_map_play_members.update(is_active=is_active)
+        PushReminderScheduleService.schedule_on_commit(push_map_play_member_ids)
         
         # 업데이트된 객체들 반환
         return list(push_map_play_members)
+
+
+class PushOutboxService:
+    """
+    PushOutbox 에 쌓인 푸시를 가져가서 발송합니다.
+    여러 워커가 동시에 실행해도 SELECT ... FOR UPDATE SKIP LOCKED 로 가져가면서 sending 으로 바꾸므로 같은 행을 두 번 발송하지 않습니다.
+    Firebase 요청은 트랜잭션 밖에서 보내고, 발송 이력(PushHistory)은 가져간 묶음을 다 보낸 뒤 결과와 함께 한 번에 저장합니다.
+    """
+    def __init__(self, push_service: Optional[PushService] = None):
+        self.push_service = push_service or PushService()
+
+    @staticmethod
+    def get_due_outboxes():
+        """
+        발송할 때가 된 행과, 발송 중으로 가져갔지만 PUSH_OUTBOX_SENDING_LEASE_SECONDS 안에 결과가 저장되지 않은 행입니다.
+        """
+        return PushOutbox.objects.filter(
+            status__in=[PushOutboxStatus.PENDING.value, PushOutboxStatus.SENDING.value],
+            next_attempt_at__lte=timezone.now(),
+        )
+
+    def deliver_pending(self, batch_size: int = PUSH_OUTBOX_BATCH_SIZE) -> Tuple[int, bool]:
+        """
+        발송할 때가 된 PushOutbox 를 batch_size 개까지 가져와서 발송합니다.
+
+        Returns:
+            Tuple[int, bool]: 처리한 행 수, 발송량 제한에 걸렸는지 여부
+        """
+        outboxes = self._claim(batch_size)
+        processed_count = 0
+        is_rate_limited = False
+        histories = []
+        for outbox in outboxes:
+            if outbox.device_token_ids is None:
+                device_tokens = self.push_service.get_active_device_tokens(guest_ids=outbox.guest_ids)
+            else:
+                device_tokens = self.push_service.get_active_device_tokens(device_token_ids=outbox.device_token_ids)
+            if not self._acquire_rate_limit(len(device_tokens)):
+                is_rate_limited = True
+                break
+
+            histories.extend(self._deliver(outbox, device_tokens))
+            processed_count += 1
+
+        # 발송량 제한으로 보내지 못한 행은 바로 다시 가져갈 수 있도록 되돌림
+        now = timezone.now()
+        for outbox in outboxes[processed_count:]:
+            outbox.status = PushOutboxStatus.PENDING.value
+            outbox.next_attempt_at = now
+            outbox.updated_at = now
+
+        with transaction.atomic():
+            PushHistory.objects.bulk_create(histories)
+            PushOutbox.objects.bulk_update(
+                outboxes,
+                ['device_token_ids', 'status', 'attempt_count', 'next_attempt_at', 'last_error', 'sent_at', 'updated_at'],
+            )
+        return processed_count, is_rate_limited
+
+    def _claim(self, batch_size: int) -> List[PushOutbox]:
+        """
+        발송할 때가 된 행을 잠그고 sending 으로 바꾼 뒤 바로 커밋합니다.
+        결과가 저장되기 전에 워커가 죽으면 PUSH_OUTBOX_SENDING_LEASE_SECONDS 뒤에 다른 워커가 다시 가져갑니다.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            outboxes = list(
+                self.get_due_outboxes().select_for_update(
+                    skip_locked=True,
+                ).order_by(
+                    'next_attempt_at',
+                    'id',
+                )[:batch_size]
+            )
+            for outbox in outboxes:
+                outbox.status = PushOutboxStatus.SENDING.value
+                outbox.next_attempt_at = now + timedelta(seconds=PUSH_OUTBOX_SENDING_LEASE_SECONDS)
+                outbox.updated_at = now
+            PushOutbox.objects.bulk_update(outboxes, ['status', 'next_attempt_at', 'updated_at'])
+        return outboxes
+
+    def _deliver(self, outbox: PushOutbox, device_tokens: List[DeviceToken]) -> List[PushHistory]:
+        """
+        발송에 실패한 토큰 중 아직 유효한 토큰만 다시 보낼 수 있도록 남깁니다.
+
+        Returns:
+            List[PushHistory]: 저장하지 않은 발송 이력
+        """
+        now = timezone.now()
+        outbox.attempt_count += 1
+        outbox.updated_at = now
+        try:
+            histories = self.push_service.send_push_to_device_tokens(
+                device_tokens,
+                outbox.title,
+                outbox.body,
+                PushChannelType(outbox.push_channel_type),
+                outbox.data,
+                save_histories=False,
+            )
+        except Exception as e:
+            histories = []
+            retry_device_token_ids = [device_token.id for device_token in device_tokens]
+            last_error = f"Unexpected error: {str(e)}"
+        else:
+            for history in histories:
+                history.push_outbox_id = outbox.id
+            failed_histories = [
+                history
+                for history in histories
+                if not history.is_success and history.device_token.is_active
+            ]
+            retry_device_token_ids = [history.device_token_id for history in failed_histories]
+            last_error = failed_histories[-1].error_message if failed_histories else None
+
+        if not retry_device_token_ids:
+            outbox.status = PushOutboxStatus.SENT.value
+            outbox.sent_at = now
+            return histories
+
+        outbox.device_token_ids = retry_device_token_ids
+        outbox.last_error = last_error
+        if outbox.attempt_count >= PUSH_OUTBOX_MAX_ATTEMPTS:
+            outbox.status = PushOutboxStatus.FAILED.value
+            return histories
+        outbox.status = PushOutboxStatus.PENDING.value
+        outbox.next_attempt_at = now + timedelta(
+            seconds=PUSH_OUTBOX_RETRY_BASE_SECONDS * 2 ** (outbox.attempt_count - 1),
+        )
+        return histories
+
+    def _acquire_rate_limit(self, message_count: int) -> bool:
+        """
+        FCM 프로젝트별로 초당 PUSH_OUTBOX_MAX_MESSAGES_PER_SECOND 개까지만 발송합니다.
+        한 번에 보내는 수가 제한보다 크면 그 초에 처음 보내는 경우에만 허용합니다.
+        """
+        if not message_count:
+            return True
+        key = PUSH_OUTBOX_RATE_LIMIT_CACHE_KEY.format(
+            project_id=self.push_service.transport.project_id,
+            second=int(time.time()),
+        )
+        cache.add(key, 0, timeout=2)
+        sent_count = cache.incr(key, message_count)
+        if sent_count <= PUSH_OUTBOX_MAX_MESSAGES_PER_SECOND or sent_count == message_count:
+            return True
+        cache.decr(key, message_count)
+        return False
+
+
+class PushReminderScheduleService:
+    """
+    PushMapPlayMember 리마인드를 다음 발송 시각(epoch 초)을 score 로 Redis sorted set 에 저장해두고,
+    발송할 때가 된 리마인드만 꺼내서 PushOutbox 로 보냅니다.
+    PushMapPlayMember 를 생성/수정/삭제/활성화 변경하면 schedule_on_commit 으로 다시 계산해야 합니다.
+    """
+    def __init__(self, redis_client=None):
+        self.redis_client = redis_client or get_redis_connection('default')
+
+    @staticmethod
+    def get_next_fire_at(
+        push_date: Optional[date],
+        push_time: Optional[dt_time],
+        after: datetime,
+    ) -> Optional[datetime]:
+        """
+        after 이후 처음 발송할 시각을 반환합니다.
+        push_date 가 없으면 매일 push_time 에 발송하고, 있으면 그 날 한 번만 발송합니다.
+        """
+        if push_time is None:
+            return None
+        time_zone = ZoneInfo(PUSH_REMINDER_TIME_ZONE)
+        after = after.astimezone(time_zone)
+        if push_date is not None:
+            fire_at = datetime.combine(push_date, push_time, tzinfo=time_zone)
+            return fire_at if fire_at > after else None
+
+        fire_at = datetime.combine(after.date(), push_time, tzinfo=time_zone)
+        if fire_at <= after:
+            fire_at = datetime.combine(after.date() + timedelta(days=1), push_time, tzinfo=time_zone)
+        return fire_at
+
+    @staticmethod
+    def get_schedulable_push_map_play_members():
+        return PushMapPlayMember.objects.filter(
+            is_active=True,
+            is_deleted=False,
+            push_time__isnull=False,
+            map_play_member__deactivated=False,
+            map_play_member__map_play__map__is_deleted=False,
+        )
+
+    @classmethod
+    def schedule_on_commit(cls, push_map_play_member_ids: List[int]) -> None:
+        """
+        커밋된 값으로 계산하도록 커밋 후 schedule 을 실행합니다.
+        """
+        push_map_play_member_ids = list(push_map_play_member_ids)
+        transaction.on_commit(lambda: cls().schedule(push_map_play_member_ids))
+
+    def schedule(self, push_map_play_member_ids: List[int], now: Optional[datetime] = None) -> Dict[int, datetime]:
+        """
+        PushMapPlayMember 의 다음 발송 시각을 다시 계산해서 저장합니다.
+        더 이상 발송하지 않는 리마인드(비활성화, 삭제, 지난 날짜 등)는 sorted set 에서 제거합니다.
+
+        Returns:
+            Dict[int, datetime]: 저장된 PushMapPlayMember id 별 다음 발송 시각
+        """
+        if not push_map_play_member_ids:
+            return {}
+        now = now or timezone.now()
+        fire_at_by_id = self._get_fire_at_by_id(
+            self.get_schedulable_push_map_play_members().filter(id__in=push_map_play_member_ids),
+            now,
+        )
+        pipeline = self.redis_client.pipeline()
+        pipeline.zrem(PUSH_REMINDER_SCHEDULE_KEY, *push_map_play_member_ids)
+        if fire_at_by_id:
+            pipeline.zadd(PUSH_REMINDER_SCHEDULE_KEY, self._to_scores(fire_at_by_id))
+        pipeline.execute()
+        return fire_at_by_id
+
+    def rebuild(self, now: Optional[datetime] = None) -> int:
+        """
+        DB 기준으로 sorted set 을 다시 만듭니다. (스케줄러 시작 시, Redis 데이터가 사라진 경우)
+
+        Returns:
+            int: 저장된 리마인드 수
+        """
+        fire_at_by_id = self._get_fire_at_by_id(self.get_schedulable_push_map_play_members(), now or timezone.now())
+        pipeline = self.redis_client.pipeline()
+        pipeline.delete(PUSH_REMINDER_SCHEDULE_KEY)
+        if fire_at_by_id:
+            pipeline.zadd(PUSH_REMINDER_SCHEDULE_KEY, self._to_scores(fire_at_by_id))
+        pipeline.set(PUSH_REMINDER_SCHEDULE_BUILT_KEY, 1)
+        pipeline.execute()
+        return len(fire_at_by_id)
+
+    def rebuild_if_missing(self, now: Optional[datetime] = None) -> Optional[int]:
+        """
+        sorted set 을 만든 적이 없거나 Redis 데이터가 사라진 경우에만 rebuild 합니다.
+
+        Returns:
+            Optional[int]: 다시 만든 경우 저장된 리마인드 수, 아니면 None
+        """
+        if self.redis_client.exists(PUSH_REMINDER_SCHEDULE_BUILT_KEY):
+            return None
+        return self.rebuild(now)
+
+    def pop_due(self, now: datetime, limit: int = PUSH_REMINDER_POP_BATCH_SIZE) -> Dict[int, datetime]:
+        """
+        발송할 때가 된 리마인드를 limit 개까지 꺼냅니다.
+        스케줄러가 여러 개 실행되어도 ZREM 에 성공한 쪽만 가져가므로 같은 리마인드를 두 번 꺼내지 않습니다.
+
+        Returns:
+            Dict[int, datetime]: 꺼낸 PushMapPlayMember id 별 발송 시각
+        """
+        due_entries = self.redis_client.zrangebyscore(
+            PUSH_REMINDER_SCHEDULE_KEY,
+            '-inf',
+            now.timestamp(),
+            start=0,
+            num=limit,
+            withscores=True,
+        )
+        if not due_entries:
+            return {}
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for push_map_play_member_id, _ in due_entries:
+            pipeline.zrem(PUSH_REMINDER_SCHEDULE_KEY, push_map_play_member_id)
+        return {
+            int(push_map_play_member_id): datetime.fromtimestamp(score, tz=dt_timezone.utc)
+            for (push_map_play_member_id, score), is_removed in zip(due_entries, pipeline.execute())
+            if is_removed
+        }
+
+    def send_due(self, now: Optional[datetime] = None) -> int:
+        """
+        발송할 때가 된 리마인드를 꺼내서 PushOutbox 에 한 번에 저장하고, 매일 반복하는 리마인드는 다음 발송 시각으로 다시 저장합니다.
+        발송 시각에서 PUSH_REMINDER_MAX_DELAY_SECONDS 넘게 지난 리마인드는 보내지 않습니다.
+
+        Returns:
+            int: PushOutbox 에 저장한 리마인드 수
+        """
+        now = now or timezone.now()
+        fire_at_by_id = self.pop_due(now)
+        if not fire_at_by_id:
+            return 0
+
+        push_map_play_members = self.get_schedulable_push_map_play_members().select_related(
+            'map_play_member__map_play__map',
+        ).filter(
+            id__in=fire_at_by_id.keys(),
+        ).order_by(
+            'id',
+        )
+        outboxes = []
+        next_fire_at_by_id = {}
+        for push_map_play_member in push_map_play_members:
+            if now - fire_at_by_id[push_map_play_member.id] <= timedelta(seconds=PUSH_REMINDER_MAX_DELAY_SECONDS):
+                outboxes.append(self._build_reminder_outbox(push_map_play_member))
+            next_fire_at = self.get_next_fire_at(push_map_play_member.push_date, push_map_play_member.push_time, now)
+            if next_fire_at:
+                next_fire_at_by_id[push_map_play_member.id] = next_fire_at
+
+        with transaction.atomic():
+            PushService.enqueue_outboxes(outboxes)
+        if next_fire_at_by_id:
+            self.redis_client.zadd(PUSH_REMINDER_SCHEDULE_KEY, self._to_scores(next_fire_at_by_id))
+        return len(outboxes)
+
+    def _get_fire_at_by_id(self, push_map_play_members, now: datetime) -> Dict[int, datetime]:
+        fire_at_by_id = {}
+        for push_map_play_member_id, push_date, push_time in push_map_play_members.values_list(
+            'id',
+            'push_date',
+            'push_time',
+        ).iterator():
+            fire_at = self.get_next_fire_at(push_date, push_time, now)
+            if fire_at:
+                fire_at_by_id[push_map_play_member_id] = fire_at
+        return fire_at_by_id
+
+    @staticmethod
+    def _to_scores(fire_at_by_id: Dict[int, datetime]) -> Dict[int, float]:
+        return {
+            push_map_play_member_id: fire_at.timestamp()
+            for push_map_play_member_id, fire_at in fire_at_by_id.items()
+        }
+
+    @staticmethod
+    def _build_reminder_outbox(push_map_play_member: PushMapPlayMember) -> PushOutbox:
+        map_play = push_map_play_member.map_play_member.map_play
+        return PushOutbox(
+            guest_ids=[push_map_play_member.guest_id],
+            title=PUSH_REMIND_TITLE,
+            body=PUSH_REMIND_BODY.format(
+                map_play.map.name,
+                map_play.title,
+                f"\n{push_map_play_member.remind_info}" if push_map_play_member.remind_info else "",
+            ),
+            data={
+                "type": PushChannelType.MAP_PLAY_MEMBER_REMINDER.value,
+                "map_id": str(map_play.map_id),
+            },
+        )
+
+
+class PushDigestService:
+    """
+    짧은 시간에 몰리는 알림을 묶음(group_id) 별로 Redis 에 모아두었다가 window_seconds 뒤에 한 번에 꺼내도록 합니다.
+    묶음의 첫 알림이 들어오면 발송할 시각을 sorted set 에 저장하고, 꺼낼 때는 ZREM 에 성공한 쪽만 가져가므로
+    예약된 작업과 놓친 묶음을 처리하는 명령어가 동시에 실행되어도 한 번만 발송됩니다.
+    """
+    def __init__(self, digest_type: str, window_seconds: int, redis_client=None):
+        self.digest_type = digest_type
+        self.window_seconds = window_seconds
+        self.redis_client = redis_client or get_redis_connection('default')
+        self.due_key = PUSH_DIGEST_DUE_KEY.format(digest_type=digest_type)
+
+    def _get_events_key(self, group_id: int) -> str:
+        return PUSH_DIGEST_EVENTS_KEY.format(digest_type=self.digest_type, group_id=group_id)
+
+    def add(self, group_id: int, event: Dict[str, Any], now: Optional[datetime] = None) -> bool:
+        """
+        알림을 묶음에 추가합니다.
+
+        Returns:
+            bool: 새 묶음이 시작되었는지 여부 (True 면 window_seconds 뒤에 flush 를 예약해야 함)
+        """
+        now = now or timezone.now()
+        events_key = self._get_events_key(group_id)
+        pipeline = self.redis_client.pipeline()
+        pipeline.rpush(events_key, json.dumps(event))
+        pipeline.expire(events_key, PUSH_DIGEST_EVENTS_TTL_SECONDS)
+        pipeline.zadd(self.due_key, {group_id: now.timestamp() + self.window_seconds}, nx=True)
+        return bool(pipeline.execute()[-1])
+
+    def claim(self, group_id: int) -> bool:
+        """
+        발송할 묶음을 가져갑니다. 다른 곳에서 이미 가져갔으면 False 를 반환합니다.
+        """
+        return bool(self.redis_client.zrem(self.due_key, group_id))
+
+    def pop_due(self, now: Optional[datetime] = None, limit: int = PUSH_DIGEST_POP_BATCH_SIZE) -> List[int]:
+        """
+        예약된 작업이 놓친, 발송할 시각이 지난 묶음을 limit 개까지 가져갑니다.
+        """
+        now = now or timezone.now()
+        group_ids = self.redis_client.zrangebyscore(self.due_key, '-inf', now.timestamp(), start=0, num=limit)
+        if not group_ids:
+            return []
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for group_id in group_ids:
+            pipeline.zrem(self.due_key, group_id)
+        return [
+            int(group_id)
+            for group_id, is_removed in zip(group_ids, pipeline.execute())
+            if is_removed
+        ]
+
+    def pop_events(self, group_id: int) -> List[Dict[str, Any]]:
+        """
+        claim 으로 가져간 묶음에 모인 알림을 꺼냅니다.
+        꺼낸 뒤에 들어온 알림은 새 묶음으로 시작됩니다.
+        """
+        events_key = self._get_events_key(group_id)
+        pipeline = self.redis_client.pipeline()
+        pipeline.lrange(events_key, 0, -1)
+        pipeline.delete(events_key)
+        events, _ = pipeline.execute()
+        return [json.loads(event) for event in events]
+
+
+def _add_months(month: date, months: int) -> date:
+    year, month_index = divmod(month.year * 12 + month.month - 1 + months, 12)
+    return date(year, month_index + 1, 1)
+
+
+class PushHistoryPartitionService:
+    """
+    PushHistory 의 sent_at 기준 월별 파티션을 관리합니다.
+    다음 달 파티션은 미리 만들어두고, 보관 기간이 지난 파티션은 DELETE 대신 DETACH 후 DROP 합니다.
+    """
+    @staticmethod
+    def get_partition_name(month: date) -> str:
+        return PUSH_HISTORY_PARTITION_NAME.format(year=month.year, month=month.month)
+
+    def get_partition_months(self) -> List[date]:
+        """
+        만들어진 월별 파티션의 달 목록 (default 파티션 제외)
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = %s::regclass",
+                [PushHistory._meta.db_table],
+            )
+            partition_names = [partition_name for partition_name, in cursor.fetchall()]
+        prefix = PUSH_HISTORY_PARTITION_NAME.split('{')[0]
+        partition_months = []
+        for partition_name in partition_names:
+            suffix = partition_name[len(prefix):]
+            if partition_name.startswith(prefix) and len(suffix) == 6 and suffix.isdigit():
+                partition_months.append(date(int(suffix[:4]), int(suffix[4:]), 1))
+        return sorted(partition_months)
+
+    def create_partitions(self, from_month: date, months: int) -> List[str]:
+        """
+        from_month 부터 months 개월의 파티션 중 없는 파티션을 만듭니다.
+        """
+        existing_months = set(self.get_partition_months())
+        created_partition_names = []
+        with connection.cursor() as cursor:
+            for index in range(months):
+                month = _add_months(from_month, index)
+                if month in existing_months:
+                    continue
+                partition_name = self.get_partition_name(month)
+                cursor.execute(
+                    f'CREATE TABLE {partition_name} PARTITION OF {PushHistory._meta.db_table} '
+                    f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                    f"TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+                )
+                created_partition_names.append(partition_name)
+        return created_partition_names
+
+    def drop_partitions_before(self, month: date) -> List[str]:
+        """
+        month 이전 달의 파티션을 DETACH 후 DROP 합니다.
+        """
+        dropped_partition_names = []
+        with connection.cursor() as cursor:
+            for partition_month in self.get_partition_months():
+                if partition_month >= month:
+                    break
+                partition_name = self.get_partition_name(partition_month)
+                cursor.execute(f'ALTER TABLE {PushHistory._meta.db_table} DETACH PARTITION {partition_name}')
+                cursor.execute(f'DROP TABLE {partition_name}')
+                dropped_partition_names.append(partition_name)
+        return dropped_partition_names
+
+    @transaction.atomic
+    def maintain(
+        self,
+        now: Optional[datetime] = None,
+        months_ahead: int = PUSH_HISTORY_PARTITION_MONTHS_AHEAD,
+        retention_months: int = PUSH_HISTORY_RETENTION_MONTHS,
+    ) -> Tuple[List[str], List[str]]:
+        """
+        이번 달부터 months_ahead 개월 뒤까지 파티션을 만들고, retention_months 개월보다 오래된 파티션을 삭제합니다.
+
+        Returns:
+            Tuple[List[str], List[str]]: 만든 파티션 이름 목록, 삭제한 파티션 이름 목록
+        """
+        this_month = (now or timezone.now()).astimezone(dt_timezone.utc).date().replace(day=1)
+        created_partition_names = self.create_partitions(this_month, months_ahead + 1)
+        dropped_partition_names = self.drop_partitions_before(_add_months(this_month, -retention_months))
+        return created_partition_names, dropped_partition_names
+
+
+class PushNotificationService:
+    def get_guest_notifications(
+        self,
+        guest_id: int,
+        decoded_next_cursor: Optional[dict] = None,
+        size: int = PUSH_NOTIFICATION_LIST_DEFAULT_SIZE,
+    ) -> Tuple[List[PushNotificationDto], bool, Optional[str]]:
+        """
+        게스트에게 발송된 알림을 최신순으로 조회합니다.
+        (sent_at, id) 기준 keyset 페이지네이션이라 sent_at 조건으로 필요한 파티션만 읽습니다.
+        발송 이력은 디바이스 토큰마다 저장되므로, 같은 PushOutbox 로 발송된 알림은 처음 성공한 이력 하나만 반환합니다.
+
+        Returns:
+            Tuple[List[PushNotificationDto], bool, Optional[str]]: 알림 목록, 다음 페이지 여부, 다음 커서
+        """
+        push_histories = PushHistory.objects.filter(
+            guest_id=guest_id,
+            is_success=True,
+        ).exclude(
+            Exists(
+                PushHistory.objects.filter(
+                    guest_id=OuterRef('guest_id'),
+                    push_outbox_id=OuterRef('push_outbox_id'),
+                    is_success=True,
+                    sent_at__lte=OuterRef('sent_at'),
+                    id__lt=OuterRef('id'),
+                )
+            )
+        )
+        if decoded_next_cursor:
+            push_histories = push_histories.filter(
+                Q(sent_at__lt=decoded_next_cursor['sent_at__lte'])
+                | Q(
+                    sent_at=decoded_next_cursor['sent_at__lte'],
+                    id__lt=decoded_next_cursor['id__lt'],
+                ),
+                sent_at__lte=decoded_next_cursor['sent_at__lte'],
+            )
+        push_histories = list(
+            push_histories.order_by(
+                *PushNotificationListCursorCriteria.get_ordering_data()
+            )[:size + 1]
+        )
+        has_more = len(push_histories) > size
+        push_histories = push_histories[:size]
+        return (
+            [PushNotificationDto.from_push_history(push_history) for push_history in push_histories],
+            has_more,
+            PushNotificationListCursorCriteria.get_encoded_base64_cursor_data(push_histories[-1]) if has_more else None,
+        )
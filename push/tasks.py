@@ -0,0 +1,54 @@
+from typing import Dict
+
+from config.celery import app
+from push.consts import PUSH_OUTBOX_MAX_BATCHES_PER_RUN
+from push.services import (
+    PushOutboxService,
+    PushReminderScheduleService,
+)
+from question.tasks import flush_due_question_solved_alert_digests
+
+
+# PushService().enqueue_push_to_multiple(...) 커밋 후, run_push_reminder_tick 에서 실행
+@app.task
+def deliver_push_outbox() -> int:
+    """
+    발송할 때가 된 PushOutbox 를 PUSH_OUTBOX_MAX_BATCHES_PER_RUN 묶음까지 발송합니다.
+    발송량 제한에 걸리면 1초 뒤에 이어서 발송하고, 나중에 재시도할 행은 run_push_reminder_tick 이 때가 되면 다시 등록합니다.
+    """
+    outbox_service = PushOutboxService()
+    delivered_count = 0
+    for _ in range(PUSH_OUTBOX_MAX_BATCHES_PER_RUN):
+        processed_count, is_rate_limited = outbox_service.deliver_pending()
+        delivered_count += processed_count
+        if is_rate_limited:
+            deliver_push_outbox.apply_async(countdown=1)
+            break
+        if not processed_count:
+            break
+    else:
+        # 한 번에 다 보내지 못한 경우 이어서 발송
+        deliver_push_outbox.delay()
+    return delivered_count
+
+
+# run_push_reminder_scheduler 명령어에서 PUSH_REMINDER_TICK_SECONDS 마다, push_map_play_member_reminder 명령어(cron) 에서 1분마다 실행
+@app.task
+def run_push_reminder_tick() -> Dict[str, int]:
+    """
+    발송할 때가 된 리마인드를 보내고, 재시도할 때가 된 PushOutbox 발송 작업을 등록하고, 발송 시각이 지난 문제 해결 알림 묶음을 보냅니다.
+    스케줄러와 cron 이 동시에 실행되어도 각 단계가 꺼낸 쪽만 처리하므로 같은 알림을 두 번 보내지 않습니다.
+    """
+    schedule_service = PushReminderScheduleService()
+    rebuilt_count = schedule_service.rebuild_if_missing()
+    sent_count = schedule_service.send_due()
+    is_outbox_due = PushOutboxService.get_due_outboxes().exists()
+    if is_outbox_due:
+        deliver_push_outbox.delay()
+    flushed_count = flush_due_question_solved_alert_digests()
+    return {
+        'rebuilt_reminder_count': rebuilt_count or 0,
+        'sent_reminder_count': sent_count,
+        'queued_outbox_delivery_count': int(is_outbox_due),
+        'flushed_digest_count': flushed_count,
+    }
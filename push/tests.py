@@ -1,3 +1,743 @@
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from map.models import Map
+from member.models import (
+    Guest,
+    Member,
+)
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from push.consts import (
+    PUSH_OUTBOX_RETRY_BASE_SECONDS,
+    PUSH_OUTBOX_SENDING_LEASE_SECONDS,
+    PUSH_REMINDER_SCHEDULE_BUILT_KEY,
+    PUSH_REMINDER_SCHEDULE_KEY,
+    PushChannelType,
+    PushMapPlayMemberPushType,
+    PushOutboxStatus,
+)
+from push.dtos.push_send_result import PushSendResultDto
+from push.models import (
+    DeviceToken,
+    PushHistory,
+    PushMapPlayMember,
+    PushOutbox,
+)
+from push.services import (
+    PushDigestService,
+    PushHistoryPartitionService,
+    PushOutboxService,
+    PushReminderScheduleService,
+    PushService,
+)
+from push.transports import PushTransport
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class FakePushTransport(PushTransport):
+    def __init__(self, invalid_tokens=(), failing_tokens=()):
+        self.invalid_tokens = set(invalid_tokens)
+        self.failing_tokens = set(failing_tokens)
+        self.sent_token_chunks = []
+
+    def send_multicast(
+        self,
+        tokens: List[str],
+        title: str,
+        body: str,
+        push_channel_type: PushChannelType,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List[PushSendResultDto]:
+        self.sent_token_chunks.append(list(tokens))
+        return [
+            PushSendResultDto(is_success=False, error_message='Requested entity was not found.', is_invalid_token=True)
+            if token in self.invalid_tokens else
+            PushSendResultDto(is_success=False, error_message='Internal error.')
+            if token in self.failing_tokens else
+            PushSendResultDto(is_success=True)
+            for token in tokens
+        ]
+
+
+class PushServiceSendPushToMultipleTest(TestCase):
+    def setUp(self):
+        # Given: 디바이스 토큰이 2개씩 있는 게스트 3명
+        self.guests = []
+        for i in range(3):
+            member = Member.objects.create(
+                username=f'test_user_{i}',
+                nickname=f'테스트 유저 {i}',
+            )
+            self.guests.append(
+                Guest.objects.create(
+                    member=member,
+                    temp_nickname=f'guest_{i}',
+                    ip='127.0.0.1',
+                    email=f'test{i}@test.com',
+                )
+            )
+        for guest in self.guests:
+            for j in range(2):
+                DeviceToken.objects.create(
+                    guest=guest,
+                    token=f'token-{guest.id}-{j}',
+                    device_type='android',
+                )
+        # Given: 비활성화된 토큰
+        DeviceToken.objects.create(
+            guest=self.guests[0],
+            token='inactive-token',
+            device_type='android',
+            is_active=False,
+        )
+
+    @patch('push.services.FCM_MULTICAST_MAX_TOKENS', 4)
+    def test_send_push_to_multiple_should_send_in_chunks_and_save_at_once(self):
+        # Given: 가짜 발송 수단, 토큰 하나는 유효하지 않음
+        invalid_token = f'token-{self.guests[1].id}-0'
+        transport = FakePushTransport(invalid_tokens=[invalid_token])
+
+        # When: 3명에게 푸시 발송
+        with self.assertNumQueries(3):
+            histories = PushService(transport).send_push_to_multiple(
+                [guest.id for guest in self.guests],
+                'title',
+                'body',
+                PushChannelType.QUESTION_SOLVED_ALERT,
+                {'type': 'question_solved_alert'},
+            )
+
+        # Then: 활성화된 토큰 6개를 4개씩 나눠서 2번 발송해야 함
+        self.assertEqual([len(tokens) for tokens in transport.sent_token_chunks], [4, 2])
+        self.assertNotIn('inactive-token', sum(transport.sent_token_chunks, []))
+        # Then: 토큰별 발송 이력이 저장되어야 함
+        self.assertEqual(len(histories), 6)
+        self.assertEqual(PushHistory.objects.count(), 6)
+        self.assertEqual(PushHistory.objects.filter(is_success=False).count(), 1)
+        # Then: 유효하지 않은 토큰은 비활성화되어야 함
+        self.assertFalse(DeviceToken.objects.get(token=invalid_token).is_active)
+        self.assertEqual(DeviceToken.objects.filter(is_active=True).count(), 5)
+
+    def test_send_push_should_save_failure_when_transport_raises(self):
+        # Given: 발송 중 예외가 발생하는 발송 수단
+        transport = FakePushTransport()
+
+        # When: 푸시 발송
+        with patch.object(transport, 'send_multicast', side_effect=ValueError('error')):
+            histories = PushService(transport).send_push(self.guests[0].id, 'title', 'body')
+
+        # Then: 실패 이력이 저장되고 토큰은 그대로여야 함
+        self.assertEqual(len(histories), 2)
+        self.assertTrue(all(not history.is_success for history in histories))
+        self.assertEqual(DeviceToken.objects.filter(guest=self.guests[0], is_active=True).count(), 2)
+
+    def test_send_push_to_multiple_should_return_empty_when_no_device_token(self):
+        # Given: 토큰이 없는 게스트
+        transport = FakePushTransport()
+
+        # When: 푸시 발송
+        histories = PushService(transport).send_push_to_multiple([0], 'title', 'body')
+
+        # Then: 발송하지 않아야 함
+        self.assertEqual(histories, [])
+        self.assertEqual(transport.sent_token_chunks, [])
+
+
+class PushOutboxServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Given: 디바이스 토큰이 2개씩 있는 게스트 2명
+        self.guests = []
+        for i in range(2):
+            member = Member.objects.create(
+                username=f'test_user_{i}',
+                nickname=f'테스트 유저 {i}',
+            )
+            self.guests.append(
+                Guest.objects.create(
+                    member=member,
+                    temp_nickname=f'guest_{i}',
+                    ip='127.0.0.1',
+                    email=f'test{i}@test.com',
+                )
+            )
+        for guest in self.guests:
+            for j in range(2):
+                DeviceToken.objects.create(
+                    guest=guest,
+                    token=f'token-{guest.id}-{j}',
+                    device_type='android',
+                )
+
+    def tearDown(self):
+        cache.clear()
+
+    @patch('push.services.PUSH_TASK_GUEST_BATCH_SIZE', 1)
+    @patch('push.tasks.deliver_push_outbox.delay')
+    def test_enqueue_push_to_multiple_should_save_outbox_and_deliver_after_commit(self, mock_deliver_delay):
+        # When: 2명에게 푸시 등록
+        with self.captureOnCommitCallbacks() as callbacks:
+            PushService(FakePushTransport()).enqueue_push_to_multiple(
+                [guest.id for guest in self.guests],
+                'title',
+                'body',
+                PushChannelType.QUESTION_FEEDBACK,
+            )
+            # Then: 커밋 전에는 발송하지 않아야 함
+            mock_deliver_delay.assert_not_called()
+
+        # Then: 게스트 묶음별로 발송 대기 상태로 저장되어야 함
+        self.assertEqual(
+            list(PushOutbox.objects.order_by('id').values_list('guest_ids', 'status')),
+            [([self.guests[0].id], PushOutboxStatus.PENDING.value), ([self.guests[1].id], PushOutboxStatus.PENDING.value)],
+        )
+        self.assertEqual(PushHistory.objects.count(), 0)
+
+        # When: 커밋
+        for callback in callbacks:
+            callback()
+
+        # Then: 발송 작업이 등록되어야 함
+        mock_deliver_delay.assert_called_once_with()
+
+    def test_deliver_pending_should_retry_only_failed_tokens_with_backoff(self):
+        # Given: 하나는 일시적으로 실패, 하나는 유효하지 않은 토큰
+        failing_token = f'token-{self.guests[0].id}-0'
+        invalid_token = f'token-{self.guests[1].id}-0'
+        transport = FakePushTransport(invalid_tokens=[invalid_token], failing_tokens=[failing_token])
+        outbox = PushOutbox.objects.create(
+            guest_ids=[guest.id for guest in self.guests],
+            title='title',
+            body='body',
+        )
+
+        # When: 발송
+        processed_count, is_rate_limited = PushOutboxService(PushService(transport)).deliver_pending()
+
+        # Then: 일시적으로 실패한 토큰만 간격을 두고 다시 보내야 함
+        self.assertEqual((processed_count, is_rate_limited), (1, False))
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.status, PushOutboxStatus.PENDING.value)
+        self.assertEqual(outbox.attempt_count, 1)
+        self.assertEqual(outbox.device_token_ids, [DeviceToken.objects.get(token=failing_token).id])
+        self.assertGreater(outbox.next_attempt_at, timezone.now() + timedelta(seconds=PUSH_OUTBOX_RETRY_BASE_SECONDS - 5))
+        self.assertEqual(PushHistory.objects.count(), 4)
+
+        # When: 재시도할 때가 되기 전에 다시 발송
+        # Then: 가져가지 않아야 함
+        self.assertEqual(PushOutboxService(PushService(transport)).deliver_pending(), (0, False))
+
+        # When: 재시도할 때가 되어 다시 발송, 이번에는 성공
+        PushOutbox.objects.filter(id=outbox.id).update(next_attempt_at=timezone.now())
+        transport.failing_tokens = set()
+        PushOutboxService(PushService(transport)).deliver_pending()
+
+        # Then: 실패했던 토큰에만 다시 보내고 발송 완료되어야 함
+        self.assertEqual(transport.sent_token_chunks[-1], [failing_token])
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.status, PushOutboxStatus.SENT.value)
+        self.assertEqual(outbox.attempt_count, 2)
+
+    def test_deliver_pending_should_save_histories_at_once(self):
+        # Given: 게스트별 발송 대기 2개 (토큰 2개씩)
+        for guest in self.guests:
+            PushOutbox.objects.create(
+                guest_ids=[guest.id],
+                title='title',
+                body='body',
+            )
+
+        # When: 발송
+        with CaptureQueriesContext(connection) as context:
+            processed_count, _ = PushOutboxService(PushService(FakePushTransport())).deliver_pending()
+
+        # Then: 발송 이력은 묶음을 다 보낸 뒤 한 번에 저장되어야 함
+        self.assertEqual(processed_count, 2)
+        self.assertEqual(PushHistory.objects.count(), 4)
+        self.assertEqual(
+            len([query for query in context.captured_queries if query['sql'].startswith('INSERT INTO "push_pushhistory"')]),
+            1,
+        )
+
+    @patch('push.services.PUSH_OUTBOX_MAX_ATTEMPTS', 1)
+    def test_deliver_pending_should_fail_after_max_attempts(self):
+        # Given: 계속 실패하는 발송 수단
+        transport = FakePushTransport()
+        outbox = PushOutbox.objects.create(
+            guest_ids=[self.guests[0].id],
+            title='title',
+            body='body',
+        )
+
+        # When: 발송 중 예외 발생
+        with patch.object(transport, 'send_multicast', side_effect=ValueError('error')):
+            PushOutboxService(PushService(transport)).deliver_pending()
+
+        # Then: 최대 시도 횟수를 넘으면 실패로 남아야 함
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.status, PushOutboxStatus.FAILED.value)
+        self.assertIn('error', outbox.last_error)
+
+    @patch('push.services.PUSH_OUTBOX_MAX_MESSAGES_PER_SECOND', 3)
+    def test_deliver_pending_should_stop_when_rate_limited(self):
+        # Given: 게스트별 발송 대기 2개 (토큰 2개씩)
+        transport = FakePushTransport()
+        for guest in self.guests:
+            PushOutbox.objects.create(
+                guest_ids=[guest.id],
+                title='title',
+                body='body',
+            )
+
+        # When: 초당 3개까지만 발송 가능한 상태로 발송
+        with patch('push.services.time.time', return_value=1000):
+            processed_count, is_rate_limited = PushOutboxService(PushService(transport)).deliver_pending()
+
+        # Then: 첫 번째만 발송하고 나머지는 대기해야 함
+        self.assertEqual((processed_count, is_rate_limited), (1, True))
+        self.assertEqual(
+            list(PushOutbox.objects.order_by('id').values_list('status', flat=True)),
+            [PushOutboxStatus.SENT.value, PushOutboxStatus.PENDING.value],
+        )
+
+    def test_deliver_pending_should_claim_as_sending_before_send(self):
+        # Given: 발송 대기 1개
+        transport = FakePushTransport()
+        outbox = PushOutbox.objects.create(
+            guest_ids=[self.guests[0].id],
+            title='title',
+            body='body',
+        )
+        claimed_outboxes = []
+
+        def send_multicast(*args, **kwargs):
+            claimed_outboxes.append(PushOutbox.objects.get(id=outbox.id))
+            return FakePushTransport.send_multicast(transport, *args, **kwargs)
+
+        # When: 발송
+        with patch.object(transport, 'send_multicast', side_effect=send_multicast):
+            PushOutboxService(PushService(transport)).deliver_pending()
+
+        # Then: 발송하는 동안에는 sending 으로 저장되어 다른 워커가 가져가지 않아야 함
+        self.assertEqual(claimed_outboxes[0].status, PushOutboxStatus.SENDING.value)
+        self.assertGreater(
+            claimed_outboxes[0].next_attempt_at,
+            timezone.now() + timedelta(seconds=PUSH_OUTBOX_SENDING_LEASE_SECONDS - 5),
+        )
+        self.assertFalse(PushOutboxService.get_due_outboxes().exists())
+
+        # Then: 발송 후에는 결과가 저장되어야 함
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.status, PushOutboxStatus.SENT.value)
+
+    def test_deliver_pending_should_reclaim_sending_outbox_after_lease(self):
+        # Given: 발송 중 워커가 죽어서 sending 으로 남은 행
+        transport = FakePushTransport()
+        sending_outbox = PushOutbox.objects.create(
+            guest_ids=[self.guests[0].id],
+            title='title',
+            body='body',
+            status=PushOutboxStatus.SENDING.value,
+            next_attempt_at=timezone.now() + timedelta(seconds=PUSH_OUTBOX_SENDING_LEASE_SECONDS),
+        )
+
+        # When: 가져간 지 PUSH_OUTBOX_SENDING_LEASE_SECONDS 가 지나기 전에 발송
+        # Then: 가져가지 않아야 함
+        self.assertEqual(PushOutboxService(PushService(transport)).deliver_pending(), (0, False))
+
+        # When: PUSH_OUTBOX_SENDING_LEASE_SECONDS 가 지난 뒤 발송
+        PushOutbox.objects.filter(id=sending_outbox.id).update(next_attempt_at=timezone.now())
+        processed_count, _ = PushOutboxService(PushService(transport)).deliver_pending()
+
+        # Then: 다시 가져가서 발송해야 함
+        self.assertEqual(processed_count, 1)
+        sending_outbox.refresh_from_db()
+        self.assertEqual(sending_outbox.status, PushOutboxStatus.SENT.value)
+
+
+class PushReminderScheduleServiceTest(TestCase):
+    def setUp(self):
+        self.redis_client = get_redis_connection('default')
+        self.redis_client.delete(PUSH_REMINDER_SCHEDULE_KEY, PUSH_REMINDER_SCHEDULE_BUILT_KEY)
+        self.time_zone = ZoneInfo('Asia/Seoul')
+        member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.guest = Guest.objects.create(
+            member=member,
+            temp_nickname='guest',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=member,
+        )
+        map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=map_play,
+            member=member,
+        )
+
+    def tearDown(self):
+        self.redis_client.delete(PUSH_REMINDER_SCHEDULE_KEY, PUSH_REMINDER_SCHEDULE_BUILT_KEY)
+
+    def _create_push_map_play_member(self, push_time, push_date=None, is_active=True):
+        return PushMapPlayMember.objects.create(
+            map_play_member=self.map_play_member,
+            guest=self.guest,
+            push_type=PushMapPlayMemberPushType.REMINDER.value,
+            push_date=push_date,
+            push_time=push_time,
+            is_active=is_active,
+        )
+
+    def _get_schedule(self):
+        return {
+            int(push_map_play_member_id): datetime.fromtimestamp(score, tz=self.time_zone)
+            for push_map_play_member_id, score in self.redis_client.zrange(
+                PUSH_REMINDER_SCHEDULE_KEY, 0, -1, withscores=True,
+            )
+        }
+
+    def test_get_next_fire_at(self):
+        # Given: 2024-01-01 09:00 (한국 시간)
+        now = datetime(2024, 1, 1, 9, 0, tzinfo=self.time_zone)
+        get_next_fire_at = PushReminderScheduleService.get_next_fire_at
+
+        # Then: 매일 반복하는 리마인드는 지났으면 다음 날, 아니면 오늘 발송해야 함
+        self.assertEqual(get_next_fire_at(None, time(9, 0), now), datetime(2024, 1, 2, 9, 0, tzinfo=self.time_zone))
+        self.assertEqual(get_next_fire_at(None, time(10, 0), now), datetime(2024, 1, 1, 10, 0, tzinfo=self.time_zone))
+        # Then: 날짜가 있는 리마인드는 지났으면 발송하지 않아야 함
+        self.assertEqual(
+            get_next_fire_at(date(2024, 1, 3), time(8, 0), now),
+            datetime(2024, 1, 3, 8, 0, tzinfo=self.time_zone),
+        )
+        self.assertIsNone(get_next_fire_at(date(2024, 1, 1), time(8, 0), now))
+        self.assertIsNone(get_next_fire_at(None, None, now))
+
+    def test_schedule_should_follow_active_status_changes(self):
+        # Given: 활성화된 리마인드, 비활성화된 리마인드
+        now = datetime(2024, 1, 1, 8, 0, tzinfo=self.time_zone)
+        active_reminder = self._create_push_map_play_member(time(9, 0))
+        inactive_reminder = self._create_push_map_play_member(time(9, 0), is_active=False)
+
+        # When: 스케줄 등록
+        PushReminderScheduleService(self.redis_client).schedule([active_reminder.id, inactive_reminder.id], now)
+
+        # Then: 활성화된 리마인드만 다음 발송 시각으로 등록되어야 함
+        self.assertEqual(self._get_schedule(), {active_reminder.id: datetime(2024, 1, 1, 9, 0, tzinfo=self.time_zone)})
+
+        # When: 활성화 상태 변경
+        with self.captureOnCommitCallbacks() as callbacks:
+            PushService(FakePushTransport()).update_push_map_play_member_active_status(
+                [active_reminder.id, inactive_reminder.id],
+                is_active=False,
+            )
+            # Then: 커밋 전에는 스케줄을 바꾸지 않아야 함
+            self.assertEqual(list(self._get_schedule()), [active_reminder.id])
+        for callback in callbacks:
+            callback()
+
+        # Then: 모두 스케줄에서 빠져야 함
+        self.assertEqual(self._get_schedule(), {})
+
+    @patch('push.tasks.deliver_push_outbox.delay')
+    def test_send_due_should_enqueue_due_reminders_and_reschedule_daily(self, mock_deliver_delay):
+        # Given: 매일 9시, 2024-01-01 9시 한 번, 매일 8시(스케줄러가 멈춰서 한참 지난) 리마인드
+        daily_reminder = self._create_push_map_play_member(time(9, 0))
+        once_reminder = self._create_push_map_play_member(time(9, 0), push_date=date(2024, 1, 1))
+        late_reminder = self._create_push_map_play_member(time(8, 0))
+        later_reminder = self._create_push_map_play_member(time(10, 0))
+        service = PushReminderScheduleService(self.redis_client)
+        self.assertEqual(service.rebuild(datetime(2024, 1, 1, 7, 0, tzinfo=self.time_zone)), 4)
+
+        # When: 9시에 발송
+        now = datetime(2024, 1, 1, 9, 0, 3, tzinfo=self.time_zone)
+        with self.captureOnCommitCallbacks(execute=True):
+            sent_count = service.send_due(now)
+
+        # Then: 발송 시각이 된 리마인드만 PushOutbox 에 저장되고, 발송 작업은 한 번만 등록되어야 함
+        self.assertEqual(sent_count, 2)
+        self.assertEqual(
+            list(PushOutbox.objects.order_by('id').values_list('guest_ids', 'body')),
+            [([self.guest.id], 'Test Map 의 Test Play 리마인드 알림 입니다. ')] * 2,
+        )
+        mock_deliver_delay.assert_called_once_with()
+        # Then: 매일 반복하는 리마인드는 다음 날로 다시 등록되고, 한 번만 보내는 리마인드는 빠져야 함
+        self.assertEqual(
+            self._get_schedule(),
+            {
+                daily_reminder.id: datetime(2024, 1, 2, 9, 0, tzinfo=self.time_zone),
+                late_reminder.id: datetime(2024, 1, 2, 8, 0, tzinfo=self.time_zone),
+                later_reminder.id: datetime(2024, 1, 1, 10, 0, tzinfo=self.time_zone),
+            },
+        )
+        self.assertNotIn(once_reminder.id, self._get_schedule())
+
+        # When: 같은 시각에 다시 발송
+        # Then: 이미 꺼낸 리마인드는 다시 보내지 않아야 함
+        self.assertEqual(service.send_due(now), 0)
+
+    def test_rebuild_if_missing_should_rebuild_only_once(self):
+        # Given: 스케줄러가 한 번도 sorted set 을 만들지 않은 상태의 리마인드
+        reminder = self._create_push_map_play_member(time(9, 0))
+        service = PushReminderScheduleService(self.redis_client)
+        now = datetime(2024, 1, 1, 8, 0, tzinfo=self.time_zone)
+
+        # When: 처음 확인
+        # Then: DB 기준으로 sorted set 을 만들어야 함
+        self.assertEqual(service.rebuild_if_missing(now), 1)
+        self.assertEqual(self._get_schedule(), {reminder.id: datetime(2024, 1, 1, 9, 0, tzinfo=self.time_zone)})
+
+        # When: 다시 확인
+        # Then: 이미 만들었으므로 다시 만들지 않아야 함
+        self.assertIsNone(service.rebuild_if_missing(now))
+
+        # When: Redis 데이터가 사라진 뒤 확인
+        self.redis_client.delete(PUSH_REMINDER_SCHEDULE_KEY, PUSH_REMINDER_SCHEDULE_BUILT_KEY)
+
+        # Then: 다시 만들어야 함
+        self.assertEqual(service.rebuild_if_missing(now), 1)
+
+
+class PushDigestServiceTest(TestCase):
+    def setUp(self):
+        self.redis_client = get_redis_connection('default')
+        self.service = PushDigestService('test_digest', 60, self.redis_client)
+        self.now = timezone.now()
+
+    def tearDown(self):
+        self.redis_client.delete(self.service.due_key)
+        for group_id in (1, 2):
+            self.redis_client.delete(self.service._get_events_key(group_id))
+
+    def test_add_should_start_window_only_once_per_group(self):
+        # When: 같은 묶음에 알림 2개, 다른 묶음에 알림 1개 추가
+        # Then: 묶음마다 첫 알림에서만 새 묶음이 시작되어야 함
+        self.assertTrue(self.service.add(1, {'id': 1}, self.now))
+        self.assertFalse(self.service.add(1, {'id': 2}, self.now))
+        self.assertTrue(self.service.add(2, {'id': 3}, self.now))
+
+        # When: window 가 지나기 전에 꺼내기
+        # Then: 꺼내지 않아야 함
+        self.assertEqual(self.service.pop_due(self.now), [])
+
+        # When: window 가 지난 뒤 꺼내기
+        due_group_ids = self.service.pop_due(self.now + timedelta(seconds=60))
+
+        # Then: 두 묶음 모두 한 번만 가져가고, 모인 알림을 순서대로 꺼내야 함
+        self.assertEqual(sorted(due_group_ids), [1, 2])
+        self.assertFalse(self.service.claim(1))
+        self.assertEqual(self.service.pop_events(1), [{'id': 1}, {'id': 2}])
+        self.assertEqual(self.service.pop_events(1), [])
+
+        # When: 꺼낸 뒤 다시 추가
+        # Then: 새 묶음이 시작되어야 함
+        self.assertTrue(self.service.add(1, {'id': 4}, self.now))
+
+
+class PushHistoryPartitionServiceTest(TestCase):
+    def setUp(self):
+        member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        guest = Guest.objects.create(
+            member=member,
+            temp_nickname='guest',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+        device_token = DeviceToken.objects.create(
+            guest=guest,
+            token='token',
+            device_type='android',
+        )
+        # Given: 이번 달 발송 이력
+        PushHistory.objects.create(
+            guest=guest,
+            device_token=device_token,
+            title='title',
+            body='body',
+            is_success=True,
+        )
+        self.this_month = timezone.now().date().replace(day=1)
+
+    def test_maintain_should_create_next_partitions_and_drop_expired_partitions(self):
+        # Given: 보관 기간이 지나는 시점 (지연된 FK 검사가 남아 있으면 파티션을 삭제할 수 없으므로 먼저 검사)
+        with connection.cursor() as cursor:
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        service = PushHistoryPartitionService()
+        now = datetime(self.this_month.year + 2, 1, 15, tzinfo=ZoneInfo('UTC'))
+
+        # When: 파티션 관리
+        created_partition_names, dropped_partition_names = service.maintain(now, months_ahead=2, retention_months=6)
+
+        # Then: 이번 달부터 2개월 뒤까지 파티션이 만들어져야 함
+        self.assertEqual(
+            created_partition_names,
+            [f'push_pushhistory_p{self.this_month.year + 2}{month:02d}' for month in (1, 2, 3)],
+        )
+        # Then: 보관 기간이 지난 파티션은 DELETE 없이 통째로 삭제되어야 함
+        self.assertIn(service.get_partition_name(self.this_month), dropped_partition_names)
+        self.assertEqual(PushHistory.objects.count(), 0)
+        self.assertEqual(service.get_partition_months()[0], date(self.this_month.year + 2, 1, 1))
+
+        # When: 다시 실행
+        # Then: 이미 있는 파티션은 다시 만들지 않아야 함
+        self.assertEqual(service.maintain(now, months_ahead=2, retention_months=6), ([], []))
+
+
+class MyPushNotificationListViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        # Given: 로그인한 게스트, 다른 게스트
+        self.guests = []
+        for i in range(2):
+            member = Member.objects.create(
+                username=f'test_user_{i}',
+                nickname=f'테스트 유저 {i}',
+                member_status_id=1,
+            )
+            self.guests.append(
+                Guest.objects.create(
+                    member=member,
+                    temp_nickname=f'guest_{i}',
+                    ip='127.0.0.1',
+                    email=f'test{i}@test.com',
+                )
+            )
+        device_token = DeviceToken.objects.create(
+            guest=self.guests[0],
+            token='token',
+            device_type='android',
+        )
+        # Given: 같은 시각에 발송된 알림 3개, 실패한 알림 1개, 다른 게스트 알림 1개
+        histories = [
+            PushHistory.objects.create(
+                guest=guest,
+                device_token=device_token,
+                title=f'title {i}',
+                body='body',
+                is_success=is_success,
+            )
+            for i, (guest, is_success) in enumerate([
+                (self.guests[0], True),
+                (self.guests[0], True),
+                (self.guests[0], True),
+                (self.guests[0], False),
+                (self.guests[1], True),
+            ])
+        ]
+        PushHistory.objects.filter(
+            id__in=[history.id for history in histories[1:]],
+        ).update(
+            sent_at=histories[0].sent_at + timedelta(microseconds=1),
+        )
+        self.success_histories = histories[:3]
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_notifications_with_keyset_pagination(self, mock_jwt_decode, mock_auth_cred):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guests[0]
+        mock_jwt_decode.return_value = {'guest_id': self.guests[0].id}
+
+        # When: 2개씩 조회
+        response = self.client.get(
+            reverse('push:my_push_notification_list'),
+            {'size': 2},
+            HTTP_AUTHORIZATION='jwt some-token',
+        )
+
+        # Then: 최신순, 같은 발송일시는 id 역순으로 조회되어야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data['data']
+        self.assertEqual(
+            [notification['id'] for notification in data['notifications']],
+            [self.success_histories[2].id, self.success_histories[1].id],
+        )
+        self.assertTrue(data['has_more'])
+
+        # When: 다음 페이지 조회
+        response = self.client.get(
+            reverse('push:my_push_notification_list'),
+            {'size': 2, 'next_cursor': data['next_cursor']},
+            HTTP_AUTHORIZATION='jwt some-token',
+        )
+
+        # Then: 실패한 알림, 다른 게스트 알림 없이 남은 알림만 조회되어야 함
+        data = response.data['data']
+        self.assertEqual([notification['id'] for notification in data['notifications']], [self.success_histories[0].id])
+        self.assertFalse(data['has_more'])
+        self.assertIsNone(data['next_cursor'])
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_one_notification_per_push_outbox(self, mock_jwt_decode, mock_auth_cred):
+        # Given: 인증 모킹, 디바이스 토큰이 2개인 게스트에게 PushOutbox 로 발송
+        cache.clear()
+        mock_auth_cred.return_value = self.guests[0]
+        mock_jwt_decode.return_value = {'guest_id': self.guests[0].id}
+        DeviceToken.objects.create(
+            guest=self.guests[0],
+            token='token-2',
+            device_type='ios',
+        )
+        PushOutbox.objects.create(
+            guest_ids=[self.guests[0].id],
+            title='outbox title',
+            body='body',
+        )
+        PushOutboxService(PushService(FakePushTransport())).deliver_pending()
+        outbox_histories = list(PushHistory.objects.filter(title='outbox title').order_by('id'))
+        self.assertEqual(len(outbox_histories), 2)
+
+        # When: 알림 조회
+        response = self.client.get(
+            reverse('push:my_push_notification_list'),
+            HTTP_AUTHORIZATION='jwt some-token',
+        )
 
-# Create your tests here.
+        # Then: 토큰 수와 관계없이 발송한 푸시마다 알림 하나만 조회되어야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [notification['id'] for notification in response.data['data']['notifications']],
+            [
+                outbox_histories[0].id,
+                self.success_histories[2].id,
+                self.success_histories[1].id,
+                self.success_histories[0].id,
+            ],
+        )
@@ -0,0 +1,109 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+import firebase_admin
+from firebase_admin import messaging
+from firebase_admin.exceptions import (
+    FirebaseError,
+    InvalidArgumentError,
+)
+
+from push.consts import PushChannelType
+from push.dtos.push_send_result import PushSendResultDto
+
+
+# 토큰이 유효하지 않다는 FCM 오류 메시지
+INVALID_TOKEN_ERROR_MESSAGES = (
+    'not a valid fcm registration token',
+    'requested entity was not found',
+    'invalid argument',
+    'registration token not valid',
+)
+
+
+def is_invalid_token_error(error: Exception) -> bool:
+    if isinstance(error, (messaging.UnregisteredError, messaging.SenderIdMismatchError, InvalidArgumentError)):
+        return True
+    error_message = str(error).lower()
+    return any(message in error_message for message in INVALID_TOKEN_ERROR_MESSAGES)
+
+
+class PushTransport(ABC):
+    """
+    여러 디바이스 토큰에 같은 푸시를 보내는 발송 수단입니다.
+    테스트에서는 가짜 발송 수단으로 바꿔서 사용합니다.
+    """
+    # 발송량 제한(PUSH_OUTBOX_MAX_MESSAGES_PER_SECOND)을 나눠 쓰는 단위
+    project_id = 'default'
+
+    @abstractmethod
+    def send_multicast(
+        self,
+        tokens: List[str],
+        title: str,
+        body: str,
+        push_channel_type: PushChannelType,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List[PushSendResultDto]:
+        """
+        tokens 는 FCM_MULTICAST_MAX_TOKENS 개 이하이며, tokens 순서대로 결과를 반환합니다.
+        """
+        pass
+
+
+class FcmPushTransport(PushTransport):
+    @property
+    def project_id(self) -> str:
+        try:
+            return firebase_admin.get_app().project_id or PushTransport.project_id
+        except ValueError:
+            return PushTransport.project_id
+
+    def send_multicast(
+        self,
+        tokens: List[str],
+        title: str,
+        body: str,
+        push_channel_type: PushChannelType,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> List[PushSendResultDto]:
+        message = messaging.MulticastMessage(
+            data=data or {},
+            android=messaging.AndroidConfig(
+                priority='high',
+                notification=messaging.AndroidNotification(
+                    title=title,
+                    body=body,
+                    channel_id=push_channel_type.value,
+                    priority='max',
+                    default_sound=True,
+                    default_vibrate_timings=True,
+                    click_action='.MainActivity',
+                ),
+                data=data or {},
+            ),
+            tokens=tokens,
+        )
+        try:
+            batch_response = messaging.send_each_for_multicast(message)
+        except FirebaseError as e:
+            return [PushSendResultDto(is_success=False, error_message=str(e)) for _ in tokens]
+
+        return [
+            PushSendResultDto(is_success=True)
+            if response.success else
+            PushSendResultDto(
+                is_success=False,
+                error_message=str(response.exception),
+                is_invalid_token=is_invalid_token_error(response.exception),
+            )
+            for response in batch_response.responses
+        ]
@@ -7,6 +7,7 @@ from push.views import (
     MemberPushMapPlayMemberListView,
     PushMapPlayMemberActiveUpdateView,
     PushMapPlayDetailView,
+    MyPushNotificationListView,
 )
 
 app_name = 'push'
@@ -19,4 +20,5 @@ urlpatterns = [
     path('/map-play-member/<int:map_play_member_id>/push-settings', PushMapPlayMemberListView.as_view(), name='push_map_play_member_list'),
     path('/member/push-settings', MemberPushMapPlayMemberListView.as_view(), name='member_push_map_play_member_list'),
     path('/push-settings/active', PushMapPlayMemberActiveUpdateView.as_view(), name='push_map_play_member_active_update'),
+    path('/notifications', MyPushNotificationListView.as_view(), name='my_push_notification_list'),
 ]
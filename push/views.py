@@ -5,16 +5,25 @@ from rest_framework import status
 
 from common.common_consts.common_error_messages import InvalidInputResponseErrorStatus
 from common.common_consts.common_status_codes import SuccessStatusCode
+from common.common_decorators.request_decorators import cursor_pagination
 from common.common_exceptions import PydanticAPIException
 from common.dtos.response_dtos import BaseFormatResponse
 from member.permissions import IsGuestExists, IsMemberLogin
 from play.exceptions import PlayMemberNoPermissionException
 from play.services import MapPlayService
+from push.cursor_criteria.cursor_criteria import PushNotificationListCursorCriteria
 from push.dtos.request_dtos import PutPushMapPlayMemberActiveRequest
 from push.exceptions import PushMapPlayMemberNotFoundException
-from push.services import PushService
+from push.services import (
+    PushNotificationService,
+    PushReminderScheduleService,
+    PushService,
+)
 from push.models import PushMapPlayMember
-from push.consts import PushMapPlayMemberPushType
+from push.consts import (
+    PUSH_NOTIFICATION_LIST_DEFAULT_SIZE,
+    PushMapPlayMemberPushType,
+)
 from play.models import MapPlayMember
 from django.shortcuts import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
@@ -134,7 +143,7 @@ class PushMapPlayMemberView(APIView):
         push_time = request.data.get('push_time')
         remind_info = request.data.get('remind_info')
         
-        PushMapPlayMember.objects.create(
+        push_map_play_member = PushMapPlayMember.objects.create(
             map_play_member_id=map_play_member_id,
             guest_id=request.guest.id,
             push_type=PushMapPlayMemberPushType.REMINDER.value,
@@ -142,6 +151,7 @@ class PushMapPlayMemberView(APIView):
             push_time=push_time,
             remind_info=remind_info,
         )
+        PushReminderScheduleService.schedule_on_commit([push_map_play_member.id])
 
         return Response(
             BaseFormatResponse(
@@ -196,6 +206,7 @@ class PushMapPlayDetailView(APIView):
             update_fields.append('is_active')
         
         push_map_play_member.save(update_fields=update_fields)
+        PushReminderScheduleService.schedule_on_commit([push_map_play_member.id])
         
         return Response(
             BaseFormatResponse(
@@ -230,6 +241,7 @@ class PushMapPlayDetailView(APIView):
 
         push_map_play_member.is_deleted = True
         push_map_play_member.save(update_fields=['is_deleted', 'updated_at'])
+        PushReminderScheduleService.schedule_on_commit([push_map_play_member.id])
         
         return Response(
             BaseFormatResponse(
@@ -378,3 +390,33 @@ class PushMapPlayMemberActiveUpdateView(APIView):
             ).model_dump(),
             status=status.HTTP_200_OK,
         )
+
+
+class MyPushNotificationListView(APIView):
+    permission_classes = [IsGuestExists]
+
+    @cursor_pagination(
+        default_size=PUSH_NOTIFICATION_LIST_DEFAULT_SIZE,
+        cursor_criteria=[PushNotificationListCursorCriteria],
+    )
+    def get(self, request, decoded_next_cursor: dict, size: int):
+        """
+        내 알림 목록 조회 (최신순)
+        - 응답의 next_cursor 를 next_cursor 로 전달하면 다음 페이지를 조회합니다.
+        """
+        notifications, has_more, next_cursor = PushNotificationService().get_guest_notifications(
+            guest_id=request.guest.id,
+            decoded_next_cursor=decoded_next_cursor,
+            size=size,
+        )
+        return Response(
+            BaseFormatResponse(
+                status_code=SuccessStatusCode.SUCCESS.value,
+                data={
+                    'notifications': [notification.model_dump() for notification in notifications],
+                    'next_cursor': next_cursor,
+                    'has_more': has_more,
+                },
+            ).model_dump(),
+            status=status.HTTP_200_OK,
+        )
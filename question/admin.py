@@ -10,10 +10,6 @@ from django.utils.html import format_html
 from django.template.response import TemplateResponse
 from django.utils import timezone
 
-from map.models import Arrow
-from member.models import Guest
-from play.models import MapPlayMember
-from push.consts import PushChannelType
 from question.consts import QuestionType
 from question.forms.admin_forms import QuestionFileAdminForm
 from question.forms.client_forms import FeedbackForm
@@ -25,9 +21,10 @@ from question.models import (
     UserQuestionAnswerFile,
 )
 from django.http import HttpResponseRedirect
+from question.services.answer_validation_service import invalidate_compiled_answers
 from question.services.node_completion_service import NodeCompletionService
 from django.db import transaction
-from push.services import PushService
+from question.tasks import send_question_feedback_push
 
 
 class QuestionAdminForm(ModelForm):
@@ -155,6 +152,23 @@ class QuestionAnswerAdmin(admin.ModelAdmin):
             
         return form
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        question_ids = {obj.question_id}
+        # 다른 문제로 옮겨진 경우 이전 문제도 갱신
+        if change and 'question' in form.changed_data and form.initial.get('question'):
+            question_ids.add(form.initial['question'])
+        invalidate_compiled_answers(question_ids)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_compiled_answers({obj.question_id})
+
+    def delete_queryset(self, request, queryset):
+        question_ids = set(queryset.values_list('question_id', flat=True))
+        super().delete_queryset(request, queryset)
+        invalidate_compiled_answers(question_ids)
+
 
 @admin.register(UserQuestionAnswer)
 class UserQuestionAnswerAdmin(admin.ModelAdmin):
@@ -231,54 +245,9 @@ class UserQuestionAnswerAdmin(admin.ModelAdmin):
                             node_completion_service.process_nodes_completion(
                                 nodes=[user_answer.question.arrow.start_node]
                             )
-                    map_play_members = MapPlayMember.objects.filter(
-                        map_play_id=user_answer.map_play_member.map_play.id,
-                        deactivated=False,
-                    )
-                    try:
-                        push_service = PushService()
-
-                        answer_owner = Guest.objects.get(
-                            member_id=user_answer.member_id,
-                            member__is_active=True,
-                        )
-                        push_service.send_push(
-                            guest_id=answer_owner.id,
-                            title=f"\'{user_answer.question.title}\' 문제 결과",
-                            body=feedback_obj.feedback,
-                            push_channel_type=PushChannelType.QUESTION_FEEDBACK,
-                            data={
-                                "type": "question_feedback",
-                                "question_id": str(user_answer.question.id),
-                                "map_id": str(user_answer.question.arrow.map_id),
-                                "map_play_member_id": str(user_answer.map_play_member_id),
-                                "is_correct": str(feedback_obj.is_correct).lower(),
-                            },
-                        )
-
-                        if feedback_obj.is_correct:
-                            guests = Guest.objects.filter(
-                                member_id__in=[map_play_member.member_id for map_play_member in map_play_members],
-                                member__is_active=True,
-                            ).exclude(
-                                member_id=user_answer.member_id,
-                            )
-                            for guest in guests:
-                                push_service.send_push(
-                                    guest_id=guest.id,
-                                    title=f"\'{user_answer.question.title}\' 문제 해결",
-                                    body=f"{user_answer.member.nickname}님이 문제를 해결했습니다.",
-                                    push_channel_type=PushChannelType.QUESTION_SOLVED_ALERT,
-                                    data={
-                                        "type": "question_solved_alert",
-                                        "question_id": str(user_answer.question.id),
-                                        "map_id": str(user_answer.question.arrow.map_id),
-                                        "map_play_id": str(user_answer.map_play_member.map_play_id),
-                                        "is_correct": True,
-                                    },
-                                )
-                    except (Guest.DoesNotExist, Arrow.DoesNotExist):
-                        pass
+
+                    # 답변 작성자 피드백 / 같은 MapPlay 멤버 문제 해결 알림은 커밋 후 발송
+                    transaction.on_commit(lambda: send_question_feedback_push.delay(user_answer.id))
 
                 messages.success(request, '피드백이 성공적으로 저장되었습니다.')
                 return HttpResponseRedirect(
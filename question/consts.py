@@ -25,6 +25,7 @@ class QuestionInvalidInputResponseErrorStatus(StrValueLabel):
     """
     INVALID_INPUT_ANSWER_PARAM_ERROR_400 = ('40040002', '입력값을 확인해주세요.')
     INVALID_INPUT_FEEDBACK_ERROR_400 = ('40040003', '피드백 입력값을 확인해주세요.')
+    INVALID_INPUT_BULK_FEEDBACK_ERROR_400 = ('40040004', '피드백 목록 입력값을 확인해주세요.')
 
 
 class AnswerStatus(StrValueLabel):
@@ -34,3 +35,21 @@ class AnswerStatus(StrValueLabel):
     SUCCESS = ('success', '정답')
     FAILED = ('failed', '오답')
     PENDING = ('pending', '검토중')
+
+
+class FeedbackResultStatus(StrValueLabel):
+    """
+    여러 답변 피드백 제출 결과
+    """
+    REVIEWED = ('reviewed', '피드백 완료')
+    NOT_FOUND = ('not_found', '답변 없음')
+    PERMISSION_DENIED = ('permission_denied', '권한 없음')
+
+
+# 한 번에 피드백을 제출할 수 있는 최대 답변 수
+QUESTION_BULK_FEEDBACK_MAX_ITEMS = 100
+
+# 워커 프로세스 단위로 캐싱하는 Question 별 컴파일된 정답 수
+ANSWER_MATCHER_LOCAL_CACHE_SIZE = 1024
+# 정규식 정답 하나를 검사하는 최대 시간 (초), 넘으면 관리자 수동 평가로 넘깁니다.
+ANSWER_REGEX_TIME_BUDGET_SECONDS = 0.1
@@ -1,4 +1,12 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import (
+    List,
+    Optional,
+)
+
+from pydantic import BaseModel, Field, field_validator
+
+from question.consts import QUESTION_BULK_FEEDBACK_MAX_ITEMS
 
 
 class FeedbackRequestDTO(BaseModel):
@@ -11,3 +19,39 @@ class FeedbackRequestDTO(BaseModel):
             is_correct=request.data.get('is_correct'),
             feedback=request.data.get('feedback'),
         )
+
+
+class BulkFeedbackItemDTO(BaseModel):
+    user_question_answer_id: int = Field(..., description="답변 ID")
+    is_correct: bool = Field(..., description="정답 여부")
+    feedback: str = Field(..., description="피드백 내용")
+
+
+class BulkFeedbackRequestDTO(BaseModel):
+    items: List[BulkFeedbackItemDTO] = Field(
+        ...,
+        min_length=1,
+        max_length=QUESTION_BULK_FEEDBACK_MAX_ITEMS,
+        description="답변별 피드백 목록",
+    )
+
+    @field_validator('items')
+    def validate_unique_answer_ids(cls, value: List[BulkFeedbackItemDTO]) -> List[BulkFeedbackItemDTO]:
+        answer_ids = [item.user_question_answer_id for item in value]
+        if len(answer_ids) != len(set(answer_ids)):
+            raise ValueError('같은 답변에 피드백을 여러 번 제출할 수 없습니다')
+        return value
+
+    @classmethod
+    def of(cls, request) -> 'BulkFeedbackRequestDTO':
+        return cls(
+            items=request.data.get('items'),
+        )
+
+
+class FeedbackResultDto(BaseModel):
+    id: int = Field(..., description="답변 ID")
+    status: str = Field(..., description="피드백 처리 결과 (FeedbackResultStatus)")
+    is_correct: Optional[bool] = Field(None, description="정답 여부")
+    feedback: Optional[str] = Field(None, description="피드백 내용")
+    reviewed_at: Optional[datetime] = Field(None, description="리뷰 일시")
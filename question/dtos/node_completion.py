@@ -1,4 +1,8 @@
-from typing import List
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
 
 from pydantic import BaseModel, Field
 
@@ -12,3 +16,14 @@ class NodeCompletionResultDto(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+
+
+class MapPlayProgressDiffDto(BaseModel):
+    map_play_id: int = Field(description="MapPlay id")
+    resolved_arrow_ids: List[int] = Field(default_factory=list, description="새로 해결되는 Arrow id 목록")
+    completed_node_rules: List[Tuple[int, int]] = Field(default_factory=list, description="새로 완료되는 (node_id, rule_id) 목록")
+    node_statistic_changes: Dict[int, Tuple[Tuple[int, int], Tuple[int, int]]] = Field(
+        default_factory=dict,
+        description="값이 바뀌는 Node 별 (변경 전, 변경 후) (진행 중 수, 완료 수)",
+    )
+    is_applied: bool = Field(default=False, description="이력 저장 여부 (dry-run 이거나 활성 멤버가 없으면 False)")
@@ -0,0 +1,138 @@
+import time
+from collections import deque
+from typing import (
+    List,
+    Set,
+    Tuple,
+)
+
+from django.core.management.base import BaseCommand
+
+from map_graph.dtos.map_graph_snapshot import (
+    MapGraphSnapshot,
+    SnapshotArrow,
+    SnapshotNode,
+    SnapshotRule,
+)
+from map_graph.services.map_graph_snapshot_service import compile_map_graph_snapshot
+from question.services.node_completion_service import resolve_unlock_cascade
+
+
+def build_chain_snapshot(node_count: int) -> MapGraphSnapshot:
+    """
+    node_0 -> node_1 -> ... -> node_{n-1} 형태의 체인 Map 을 메모리에 구성합니다.
+    node_0 은 self arrow(문제) 하나로 완료되는 시작 Node 입니다.
+    """
+    nodes = [
+        SnapshotNode(
+            id=node_id,
+            name=f'node_{node_id}',
+            title=f'node_{node_id}',
+            position_x=node_id * 100,
+            position_y=0,
+            width=100,
+            height=100,
+            is_active=True,
+        )
+        for node_id in range(node_count)
+    ]
+    rules = [
+        SnapshotRule(id=node_id, name=f'rule_{node_id}', node_id=node_id)
+        for node_id in range(node_count)
+    ]
+    arrows = [
+        SnapshotArrow(id=0, start_node_id=0, end_node_id=0, node_complete_rule_id=0),
+    ] + [
+        SnapshotArrow(id=node_id, start_node_id=node_id - 1, end_node_id=node_id, node_complete_rule_id=node_id)
+        for node_id in range(1, node_count)
+    ]
+    return compile_map_graph_snapshot(0, 0, nodes, arrows, rules)
+
+
+def legacy_unlock_cascade(
+        snapshot: MapGraphSnapshot,
+        start_node_ids: List[int],
+        completed_arrow_ids: Set[int],
+        completed_rule_ids: Set[int],
+) -> Tuple[List[int], List[Tuple[int, int]]]:
+    """
+    Node 를 처리할 때마다 Map 의 모든 Rule 을 다시 확인하던 기존 방식입니다. (비교용)
+    """
+    completed_arrow_ids = set(completed_arrow_ids)
+    completed_rule_ids = set(completed_rule_ids)
+    resolved_arrow_ids = []
+    completed_node_rules = []
+    nodes_to_process = deque(start_node_ids)
+    processed_node_ids = set()
+    while nodes_to_process:
+        current_node_id = nodes_to_process.popleft()
+        if current_node_id in processed_node_ids:
+            continue
+        processed_node_ids.add(current_node_id)
+
+        for arrow in snapshot.get_arrows_by_start_node_id(current_node_id):
+            if arrow.id not in completed_arrow_ids:
+                resolved_arrow_ids.append(arrow.id)
+                completed_arrow_ids.add(arrow.id)
+
+        going_to_completed = []
+        for node_id, rule_ids in snapshot.rule_ids_by_node_id.items():
+            for rule_id in rule_ids:
+                if rule_id in completed_rule_ids:
+                    continue
+                rule_arrows = snapshot.get_arrows_by_rule_id(rule_id)
+                if all(arrow.id in completed_arrow_ids for arrow in rule_arrows):
+                    going_to_completed.append((node_id, rule_id))
+
+        for node_id, rule_id in going_to_completed:
+            completed_node_rules.append((node_id, rule_id))
+            completed_rule_ids.add(rule_id)
+            nodes_to_process.append(node_id)
+    return resolved_arrow_ids, completed_node_rules
+
+
+class Command(BaseCommand):
+    """
+    python manage.py benchmark_unlock_cascade
+    python manage.py benchmark_unlock_cascade --nodes 2000 --repeat 3
+    """
+    help = '체인 형태의 가상 Map 으로 Node 해금 연쇄 계산 성능을 기존 방식과 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--nodes', type=int, default=2000, help='체인 Node 수')
+        parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+        parser.add_argument('--skip-legacy', action='store_true', help='기존 방식 측정 생략')
+
+    def _measure(self, cascade, snapshot: MapGraphSnapshot, repeat: int):
+        best = None
+        result = None
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            # 시작 Node 의 self arrow(문제)는 이미 해결된 상태에서 시작
+            result = cascade(snapshot, [0], {0}, set())
+            elapsed = time.perf_counter() - started_at
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def handle(self, *args, **options):
+        node_count = options['nodes']
+        repeat = options['repeat']
+        snapshot = build_chain_snapshot(node_count)
+
+        counter_seconds, counter_result = self._measure(resolve_unlock_cascade, snapshot, repeat)
+        self.stdout.write(
+            f'counter: {counter_seconds * 1000:.2f}ms '
+            f'(arrows={len(counter_result[0])}, completed={len(counter_result[1])})'
+        )
+        if options['skip_legacy']:
+            return
+
+        legacy_seconds, legacy_result = self._measure(legacy_unlock_cascade, snapshot, repeat)
+        self.stdout.write(
+            f'legacy: {legacy_seconds * 1000:.2f}ms '
+            f'(arrows={len(legacy_result[0])}, completed={len(legacy_result[1])})'
+        )
+        if set(counter_result[0]) != set(legacy_result[0]) or set(counter_result[1]) != set(legacy_result[1]):
+            self.stdout.write(self.style.ERROR('두 방식의 결과가 다릅니다.'))
+            return
+        self.stdout.write(self.style.SUCCESS(f'결과 동일, {legacy_seconds / counter_seconds:.1f}배 빠름'))
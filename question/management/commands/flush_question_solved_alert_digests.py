@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from question.tasks import flush_due_question_solved_alert_digests
+
+
+class Command(BaseCommand):
+    """
+    python manage.py flush_question_solved_alert_digests
+
+    예약된 flush_question_solved_alert_digest 작업이 유실되어 발송 시각이 지난 문제 해결 알림 묶음을 바로 보냅니다.
+    평소에는 run_push_reminder_scheduler 명령어가 같은 처리를 계속 실행합니다.
+    """
+    help = '발송 시각이 지난 문제 해결 알림 묶음을 보냅니다.'
+
+    def handle(self, *args, **options):
+        flushed_count = flush_due_question_solved_alert_digests()
+        self.stdout.write(self.style.SUCCESS(f'문제 해결 알림 묶음 {flushed_count}개를 처리했습니다.'))
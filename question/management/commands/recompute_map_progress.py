@@ -0,0 +1,68 @@
+from celery import group
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+from question.services.map_progress_recompute_service import MapProgressRecomputeService
+from question.tasks import recompute_map_play_progress
+
+
+class Command(BaseCommand):
+    """
+    python manage.py recompute_map_progress 1 --dry-run
+    python manage.py recompute_map_progress 1
+    python manage.py recompute_map_progress 1 --celery --chunk-size 200
+    """
+    help = 'Map 에 Arrow / Rule 을 추가한 뒤 기존 MapPlay 들의 ArrowProgress / NodeCompletedHistory / Node 통계를 새 구조에 맞게 채웁니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('map_id', type=int, help='Map id')
+        parser.add_argument('--dry-run', action='store_true', help='저장하지 않고 MapPlay 별 변경 내용만 출력')
+        parser.add_argument('--chunk-size', type=int, default=500, help='한 번에 처리할 MapPlay 수')
+        parser.add_argument('--celery', action='store_true', help='MapPlay 묶음을 Celery group 으로 나눠서 실행')
+
+    def handle(self, *args, **options):
+        map_id = options['map_id']
+        dry_run = options['dry_run']
+        if dry_run and options['celery']:
+            # Celery 작업에서는 MapPlay 별 변경 내용을 출력할 수 없음
+            raise CommandError('--dry-run 은 --celery 와 함께 사용할 수 없습니다.')
+        service = MapProgressRecomputeService(map_id)
+        chunks = service.get_map_play_id_chunks(options['chunk_size'])
+        map_play_count = sum(len(chunk) for chunk in chunks)
+
+        if options['celery']:
+            group(
+                recompute_map_play_progress.s(map_id, chunk)
+                for chunk in chunks
+            ).apply_async()
+            self.stdout.write(
+                self.style.SUCCESS(f'{map_play_count}개 MapPlay 를 {len(chunks)}개 작업으로 나눠서 등록했습니다.')
+            )
+            return
+
+        processed_count = 0
+        changed_count = 0
+        skipped_count = 0
+        for chunk in chunks:
+            diffs = service.recompute(chunk, dry_run=dry_run)
+            processed_count += len(chunk)
+            changed_count += len(diffs)
+            for diff in diffs:
+                if not dry_run and not diff.is_applied:
+                    skipped_count += 1
+                if dry_run or self.verbosity > 1:
+                    self.stdout.write(
+                        f'MapPlay {diff.map_play_id} - 해결 Arrow: {diff.resolved_arrow_ids}, '
+                        f'완료 (Node, Rule): {diff.completed_node_rules}, '
+                        f'Node 통계 (진행 중, 완료) 변경 전 -> 후: {diff.node_statistic_changes}'
+                    )
+            self.stdout.write(f'[{processed_count}/{map_play_count}] 변경 MapPlay: {changed_count}')
+
+        if skipped_count:
+            self.stdout.write(self.style.WARNING(f'활성 멤버가 없어 {skipped_count}개 MapPlay 는 저장하지 않았습니다.'))
+        if dry_run:
+            self.stdout.write(self.style.SUCCESS(f'[dry-run] {map_play_count}개 MapPlay 중 {changed_count}개가 변경됩니다.'))
+            return
+        self.stdout.write(self.style.SUCCESS(f'{map_play_count}개 MapPlay 중 {changed_count - skipped_count}개를 갱신했습니다.'))
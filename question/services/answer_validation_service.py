@@ -1,37 +1,129 @@
 import re
+import signal
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Iterable, List, Optional, Pattern, Tuple
 
+from django.utils import timezone
+
+from question.consts import (
+    ANSWER_MATCHER_LOCAL_CACHE_SIZE,
+    ANSWER_REGEX_TIME_BUDGET_SECONDS,
+)
 from question.models import Question, QuestionAnswer
 from question.models import QuestionType
 
 
+class AnswerRegexTimeout(Exception):
+    pass
+
+
+@contextmanager
+def regex_time_budget(seconds: float):
+    """
+    정규식 검사가 seconds 를 넘기면 AnswerRegexTimeout 을 발생시킵니다.
+    re 는 실행 중에도 주기적으로 signal 을 확인하므로 SIGALRM 으로 중단할 수 있습니다.
+    signal 은 메인 스레드에서만 설정할 수 있으므로, 다른 스레드이거나 이미 타이머가 설정된 경우 시간 제한 없이 실행합니다.
+    """
+    if (
+        not hasattr(signal, 'setitimer')
+        or threading.current_thread() is not threading.main_thread()
+        or signal.getitimer(signal.ITIMER_REAL)[0]
+    ):
+        yield
+        return
+
+    def _raise_timeout(signum, frame):
+        raise AnswerRegexTimeout()
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
 class AnswerValidationStrategy(ABC):
+    def compile(self, answers: List[str]) -> Any:
+        """
+        정답 목록을 검사에 쓸 형태로 한 번만 변환합니다. 결과는 Question 별로 캐싱됩니다.
+        """
+        return answers
+
     @abstractmethod
-    def validate(self, user_answer: str, correct_answers: List[QuestionAnswer]) -> Optional[bool]:
+    def validate(self, user_answer: str, compiled_answers: Any) -> Optional[bool]:
         pass
 
 
 class TextExactValidationStrategy(AnswerValidationStrategy):
-    def validate(self, user_answer: str, correct_answers: List[QuestionAnswer]) -> Optional[bool]:
-        return any(user_answer == qa.answer for qa in correct_answers)
+    def compile(self, answers: List[str]) -> frozenset:
+        return frozenset(answers)
+
+    def validate(self, user_answer: str, compiled_answers: frozenset) -> Optional[bool]:
+        return user_answer in compiled_answers
 
 
 class TextContainsValidationStrategy(AnswerValidationStrategy):
-    def validate(self, user_answer: str, correct_answers: List[QuestionAnswer]) -> Optional[bool]:
-        return any(qa.answer in user_answer for qa in correct_answers)
+    def compile(self, answers: List[str]) -> Pattern:
+        # 모든 정답을 하나의 alternation 으로 묶어서 답변을 한 번만 훑습니다.
+        return re.compile('|'.join(re.escape(answer) for answer in sorted(set(answers), key=len, reverse=True)))
+
+    def validate(self, user_answer: str, compiled_answers: Pattern) -> Optional[bool]:
+        return compiled_answers.search(user_answer) is not None
 
 
 class RegexValidationStrategy(AnswerValidationStrategy):
-    def validate(self, user_answer: str, correct_answers: List[QuestionAnswer]) -> Optional[bool]:
-        return any(bool(re.match(qa.answer, user_answer)) for qa in correct_answers)
+    def compile(self, answers: List[str]) -> Tuple[Pattern, ...]:
+        patterns = []
+        for answer in answers:
+            try:
+                patterns.append(re.compile(answer))
+            except re.error:
+                # 잘못된 정규식 정답은 무시
+                continue
+        return tuple(patterns)
+
+    def validate(self, user_answer: str, compiled_answers: Tuple[Pattern, ...]) -> Optional[bool]:
+        """
+        시간 제한을 넘긴 정규식이 있고 다른 정답과도 일치하지 않으면 관리자 수동 평가(None)로 넘깁니다.
+        """
+        is_timeout = False
+        for pattern in compiled_answers:
+            try:
+                with regex_time_budget(ANSWER_REGEX_TIME_BUDGET_SECONDS):
+                    if pattern.match(user_answer):
+                        return True
+            except AnswerRegexTimeout:
+                is_timeout = True
+        return None if is_timeout else False
 
 
 class ManualValidationStrategy(AnswerValidationStrategy):
-    def validate(self, user_answer: str, correct_answers: List[QuestionAnswer]) -> Optional[bool]:
+    def validate(self, user_answer: str, compiled_answers: Any) -> Optional[bool]:
         return None
 
 
+# 워커 프로세스 단위 캐시 (question_id -> ((updated_at, answer_validation_type), 컴파일된 정답))
+_compiled_answers: 'OrderedDict[int, Tuple[Tuple[Any, str], Any]]' = OrderedDict()
+_compiled_answers_lock = threading.Lock()
+
+
+def clear_local_compiled_answers() -> None:
+    with _compiled_answers_lock:
+        _compiled_answers.clear()
+
+
+def invalidate_compiled_answers(question_ids: Iterable[int]) -> None:
+    """
+    QuestionAnswer 가 바뀌면 Question 의 updated_at 을 갱신해서 모든 워커의 컴파일된 정답이 다시 만들어지도록 합니다.
+    """
+    Question.objects.filter(id__in=set(question_ids)).update(updated_at=timezone.now())
+
+
 class AnswerValidationService:
     _strategies = {
         'text_exact': TextExactValidationStrategy(),
@@ -56,19 +148,46 @@ class AnswerValidationService:
         if not user_answer:
             return False
 
-        # QuestionAnswer 객체로 정답 목록 조회
-        correct_answers = QuestionAnswer.objects.filter(
-            question=question,
-            is_deleted=False
-        )
-
-        if not correct_answers.exists():
-            return None
-
         validation_type = question.answer_validation_type
         strategy = cls._strategies.get(validation_type)
 
-        if not strategy:
+        if not strategy or isinstance(strategy, ManualValidationStrategy):
             return None
 
-        return strategy.validate(user_answer, correct_answers)
+        compiled_answers = cls._get_compiled_answers(question, strategy)
+        if compiled_answers is None:
+            return None
+
+        return strategy.validate(user_answer, compiled_answers)
+
+    @classmethod
+    def _get_compiled_answers(cls, question: Question, strategy: AnswerValidationStrategy) -> Any:
+        """
+        Question 의 updated_at, 검증 방식이 같으면 캐싱된 결과를 쿼리 없이 사용합니다.
+        정답이 없으면 None 입니다.
+        """
+        cache_key = (question.updated_at, question.answer_validation_type)
+        with _compiled_answers_lock:
+            cached = _compiled_answers.get(question.id)
+            if cached is not None and cached[0] == cache_key:
+                _compiled_answers.move_to_end(question.id)
+                return cached[1]
+
+        # QuestionAnswer 객체로 정답 목록 조회
+        answers = list(
+            QuestionAnswer.objects.filter(
+                question=question,
+                is_deleted=False
+            ).values_list(
+                'answer',
+                flat=True,
+            )
+        )
+        compiled_answers = strategy.compile(answers) if answers else None
+
+        with _compiled_answers_lock:
+            _compiled_answers[question.id] = (cache_key, compiled_answers)
+            _compiled_answers.move_to_end(question.id)
+            while len(_compiled_answers) > ANSWER_MATCHER_LOCAL_CACHE_SIZE:
+                _compiled_answers.popitem(last=False)
+        return compiled_answers
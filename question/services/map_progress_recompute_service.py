@@ -0,0 +1,141 @@
+from typing import (
+    Dict,
+    List,
+)
+
+from django.db import transaction
+
+from map_graph.services.map_graph_snapshot_service import get_map_graph_snapshot
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+    MapPlayProgress,
+)
+from play.services import (
+    MapPlayNodeStatisticService,
+    MapPlayProgressService,
+)
+from question.dtos.node_completion import MapPlayProgressDiffDto
+from question.services.node_completion_service import (
+    NodeCompletionService,
+    resolve_unlock_cascade,
+)
+
+
+class MapProgressRecomputeService:
+    """
+    Map 구조(Arrow, NodeCompleteRule)가 바뀐 뒤 기존 MapPlay 들의 진행 이력을 새 구조에 맞게 채웁니다.
+    MapPlay 마다 완료된 Node 들부터 NodeCompletionService 의 연쇄 처리를 다시 실행하고,
+    이미 완료된 Node 에서 새로 나가는 Arrow 도 반영되도록 Node 통계(MapPlayNodeStatistic)를 새 구조 기준으로 다시 계산합니다.
+    """
+    def __init__(self, map_id: int):
+        self.map_id = map_id
+
+    def get_map_play_id_chunks(self, chunk_size: int) -> List[List[int]]:
+        map_play_ids = list(
+            MapPlay.objects.filter(
+                map_id=self.map_id,
+            ).order_by(
+                'id',
+            ).values_list(
+                'id',
+                flat=True,
+            )
+        )
+        return [
+            map_play_ids[index:index + chunk_size]
+            for index in range(0, len(map_play_ids), chunk_size)
+        ]
+
+    def recompute(self, map_play_ids: List[int], dry_run: bool = False) -> List[MapPlayProgressDiffDto]:
+        """
+        변경이 있는 MapPlay 의 diff 만 반환합니다.
+        잠금 없이 먼저 계산해서 변경이 없는 MapPlay 는 건너뛰고,
+        변경이 있는 MapPlay 만 진행 상태 row lock 을 잡고 다시 계산해서 저장합니다.
+        Node 통계는 이력이 없어 새 이력을 저장하지 못하는 MapPlay 도 저장된 이력 기준으로 다시 계산합니다.
+        """
+        snapshot = get_map_graph_snapshot(self.map_id)
+        statistic_service = MapPlayNodeStatisticService()
+        completed_node_ids_by_map_play_id = statistic_service.get_completed_node_ids_by_map_play_id(map_play_ids)
+        statistics_by_map_play_id = statistic_service.get_statistics_by_map_play_id(map_play_ids)
+        progress_by_map_play_id = {
+            progress.map_play_id: progress
+            for progress in MapPlayProgress.objects.filter(
+                map_play_id__in=map_play_ids,
+            )
+        }
+        map_play_member_by_map_play_id = self._get_map_play_member_by_map_play_id(map_play_ids)
+
+        diffs = []
+        for map_play_id in map_play_ids:
+            progress = progress_by_map_play_id.get(map_play_id)
+            if progress is None:
+                progress = MapPlayProgressService().get_progress(map_play_id)
+            resolved_arrow_ids, completed_node_rules = resolve_unlock_cascade(
+                snapshot=snapshot,
+                start_node_ids=progress.completed_node_ids,
+                completed_arrow_ids=set(progress.resolved_arrow_ids),
+                completed_rule_ids=set(progress.completed_rule_ids),
+            )
+            has_new_histories = bool(resolved_arrow_ids or completed_node_rules)
+            node_statistic_changes = statistic_service.get_statistic_changes(
+                statistics_by_map_play_id.get(map_play_id, {}),
+                statistic_service.calculate_statistics(
+                    snapshot,
+                    completed_node_ids_by_map_play_id.get(map_play_id, [])
+                    + [node_id for node_id, _ in completed_node_rules],
+                ),
+            )
+            if not (has_new_histories or node_statistic_changes):
+                continue
+
+            map_play_member = map_play_member_by_map_play_id.get(map_play_id)
+            is_applied = not dry_run and (map_play_member is not None or not has_new_histories)
+            if not dry_run:
+                with transaction.atomic():
+                    if has_new_histories and map_play_member is not None:
+                        result = NodeCompletionService(
+                            member_id=map_play_member.member_id,
+                            map_play_member_id=map_play_member.id,
+                            map_play_id=map_play_id,
+                        ).recompute_progress(self.map_id, snapshot)
+                        resolved_arrow_ids = [
+                            arrow_progress.arrow_id
+                            for arrow_progress in result.new_arrow_progresses
+                        ]
+                        completed_node_rules = [
+                            (history.node_id, history.node_complete_rule_id)
+                            for history in result.new_completed_node_histories
+                        ]
+                    node_statistic_changes = statistic_service.rebuild_statistics(map_play_id, snapshot)
+            diffs.append(
+                MapPlayProgressDiffDto(
+                    map_play_id=map_play_id,
+                    resolved_arrow_ids=resolved_arrow_ids,
+                    completed_node_rules=completed_node_rules,
+                    node_statistic_changes=node_statistic_changes,
+                    is_applied=is_applied,
+                )
+            )
+        return diffs
+
+    @staticmethod
+    def _get_map_play_member_by_map_play_id(map_play_ids: List[int]) -> Dict[int, MapPlayMember]:
+        """
+        새로 만드는 이력은 MapPlay 의 가장 먼저 참여한 admin (없으면 가장 먼저 참여한 멤버) 이름으로 남깁니다.
+        활성 멤버가 없는 MapPlay 는 이력을 남길 수 없으므로 제외됩니다.
+        """
+        map_play_member_by_map_play_id = {}
+        for map_play_member in MapPlayMember.objects.filter(
+            map_play_id__in=map_play_ids,
+            deactivated=False,
+        ).order_by(
+            'id',
+        ):
+            selected = map_play_member_by_map_play_id.get(map_play_member.map_play_id)
+            if selected is None or (
+                selected.role != MapPlayMemberRole.ADMIN and map_play_member.role == MapPlayMemberRole.ADMIN
+            ):
+                map_play_member_by_map_play_id[map_play_member.map_play_id] = map_play_member
+        return map_play_member_by_map_play_id
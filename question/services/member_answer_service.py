@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import List, Optional
 
 from django.db.models import F
@@ -5,19 +6,25 @@ from django.utils import timezone
 from django.db import transaction
 
 from map.models import ArrowProgress, Node
-from member.models import Guest
-from play.models import MapPlayMember
-from push.consts import PushChannelType
-from push.services import PushService
+from play.services import MapPlayProgressService
+from question.consts import FeedbackResultStatus
+from question.dtos.feedback import (
+    BulkFeedbackItemDTO,
+    FeedbackResultDto,
+)
 from question.dtos.member_answer_file import MemberAnswerFileDto
 from question.dtos.node_completion import NodeCompletionResultDto
 from question.exceptions import AnswerPermissionDeniedException, AnswerNotFoundException
 from question.models import Question, UserQuestionAnswer, UserQuestionAnswerFile
 from question.services.answer_validation_service import AnswerValidationService
 from question.services.node_completion_service import NodeCompletionService
-from question.tasks import send_question_submitted_email
+from question.tasks import (
+    send_question_feedback_push,
+    send_question_feedback_pushes,
+    send_question_solved_alert,
+    send_question_submitted_email,
+)
 from map.models.arrow import Arrow
-from map.models.node_history import NodeCompletedHistory
 
 
 class MemberAnswerService:
@@ -71,12 +78,10 @@ class MemberAnswerService:
             for from_before_node_complete_rule_arrow in from_before_node_complete_rule_arrows
         ]
         before_node_ids = [before_node.id for before_node in before_nodes]
-        # 그 Node 중에서 해결된 것들을 확인하는 쿼리
-        from_before_arrows_node_completed_ids = NodeCompletedHistory.objects.filter(
-            map_id=self.question.map_id,
-            node_id__in=before_node_ids,
-            map_play_member__map_play_id=self.map_play_id,
-        ).values_list('node_id', flat=True)
+        # 그 Node 중에서 해결된 것들을 MapPlay 진행 상태에서 확인
+        from_before_arrows_node_completed_ids = set(
+            MapPlayProgressService().get_progress(self.map_play_id).completed_node_ids
+        ) & set(before_node_ids)
 
         # 모든 것과 완결된 거를 차집합 하는 경우, 만약 풀리지 않은 게 있으면 그 id
         not_completed_node_ids = set(before_node_ids) - set(from_before_arrows_node_completed_ids)
@@ -142,39 +147,49 @@ class MemberAnswerService:
                 ]
                 UserQuestionAnswerFile.objects.bulk_create(answer_files)
 
-            # 관리자 수동 검증이 필요한 경우 email 전송
+            # 관리자 수동 검증이 필요한 경우 커밋 후 email 전송
             if is_correct is None:
-                send_question_submitted_email.apply_async(
-                    (
-                        [self.question.map.created_by.email],
-                        user_answer.member.nickname,
-                        self.question.map.name,
-                        self.question.title,
-                        answer,
-                        [
-                            {'name': file.name, 'url': file.url}
-                            for file in files
-                        ],
-                        user_answer.id,
-                     )
+                email_args = (
+                    [self.question.map.created_by.email],
+                    user_answer.member.nickname,
+                    self.question.map.name,
+                    self.question.title,
+                    answer,
+                    [
+                        {'name': file.name, 'url': file.url}
+                        for file in files
+                    ],
+                    user_answer.id,
                 )
+                transaction.on_commit(lambda: send_question_submitted_email.apply_async(email_args))
 
             # 정답인 경우 Arrow 진행 상태 처리
             if is_correct:
-                # Question과 연결된 Arrow 찾기
-                now = timezone.now()
-                # 현재 Arrow의 ArrowProgress 생성
+                # 같은 MapPlay 의 연쇄 처리는 MapPlay 단위 lock 으로 순서대로 처리됩니다.
+                progress_service = MapPlayProgressService()
+                progress = progress_service.get_progress(self.map_play_id, for_update=True)
+
+                # 현재 Arrow의 ArrowProgress 생성, 같은 MapPlay 에서 이미 해결된 Arrow 라면 연쇄 처리하지 않음
                 _, created = ArrowProgress.objects.get_or_create(
-                    map=self.question.map,
+                    map_play_id=self.map_play_id,
                     arrow=self.question.arrow,
-                    member_id=self.member_id,
-                    map_play_member_id=self.map_play_member_id,
-                    is_resolved=True,
-                    resolved_at=now
+                    defaults={
+                        'map': self.question.map,
+                        'member_id': self.member_id,
+                        'map_play_member_id': self.map_play_member_id,
+                        'is_resolved': True,
+                        'resolved_at': timezone.now(),
+                    },
                 )
                 if not created:
                     return user_answer
 
+                # MapPlay 진행 상태에 해결된 Arrow 반영
+                progress = progress_service.add_progress(
+                    progress,
+                    resolved_arrow_ids=[self.question.arrow_id],
+                )
+
                 # 같은 규칙에 묶인 Arrow들의 진행 상태 확인
                 rule_connected_arrow_ids = Arrow.objects.filter(
                     node_complete_rule=self.question.arrow.node_complete_rule,
@@ -183,16 +198,7 @@ class MemberAnswerService:
                     'id',
                     flat=True,
                 )
-                completed_arrow_ids = set(
-                    ArrowProgress.objects.filter(
-                        arrow__in=rule_connected_arrow_ids,
-                        map_play_member__map_play_id=self.map_play_id,
-                        is_resolved=True
-                    ).values_list(
-                        'arrow_id',
-                        flat=True,
-                    )
-                )
+                completed_arrow_ids = set(rule_connected_arrow_ids) & set(progress.resolved_arrow_ids)
 
                 # 모든 Arrow가 completed 상태인 경우 NodeCompletionService 호출
                 if len(rule_connected_arrow_ids) <= len(completed_arrow_ids):
@@ -209,32 +215,8 @@ class MemberAnswerService:
                     self.new_arrow_progresses.extend(completion_result.new_arrow_progresses)
                     self.new_completed_node_histories.extend(completion_result.new_completed_node_histories)
 
-                push_service = PushService()
-                map_play_members = MapPlayMember.objects.filter(
-                    map_play_id=self.map_play_id,
-                    deactivated=False,
-                ).exclude(
-                    member_id=self.member_id,
-                )
-                if map_play_members:
-                    guests = Guest.objects.filter(
-                        member_id__in=[map_play_member.member_id for map_play_member in map_play_members],
-                        member__is_active=True,
-                    )
-                    for guest in guests:
-                        push_service.send_push(
-                            guest_id=guest.id,
-                            title=f"\'{user_answer.question.title}\' 문제 해결",
-                            body=f"{user_answer.member.nickname}님이 문제를 해결했습니다.",
-                            push_channel_type=PushChannelType.QUESTION_SOLVED_ALERT,
-                            data={
-                                "type": "question_solved_alert",
-                                "question_id": str(user_answer.question.id),
-                                "map_id": str(self.question.arrow.map_id),
-                                "map_play_id": str(user_answer.map_play_member.map_play_id),
-                                "is_correct": True,
-                            },
-                        )
+                # 같은 MapPlay 멤버들에게 커밋 후 문제 해결 알림
+                transaction.on_commit(lambda: send_question_solved_alert.delay(user_answer.id))
 
             return user_answer
 
@@ -286,6 +268,7 @@ class MemberAnswerService:
             raise AnswerNotFoundException()
 
     @staticmethod
+    @transaction.atomic
     def submit_feedback(
         user_question_answer_id: int,
         member_id: int,
@@ -329,29 +312,6 @@ class MemberAnswerService:
             answer.reviewed_at = timezone.now()
             answer.save(update_fields=['is_correct', 'feedback', 'reviewed_by', 'reviewed_at'])
 
-            push_service = PushService()
-
-            try:
-                answer_owner = Guest.objects.get(
-                    member_id=answer.member_id,
-                    member__is_active=True,
-                )
-                push_service.send_push(
-                    guest_id=answer_owner.id,
-                    title=f"\'{answer.question.title}\' 문제 결과",
-                    body=feedback,
-                    push_channel_type=PushChannelType.QUESTION_FEEDBACK,
-                    data={
-                        "type": "question_feedback",
-                        "question_id": str(answer.question.id),
-                        "map_id": str(answer.map_id),
-                        "map_play_member_id": str(answer.map_play_member_id),
-                        "is_correct": str(answer.is_correct).lower(),
-                    },
-                )
-            except Guest.DoesNotExist:
-                pass
-            
             # 정답인 경우 노드 완료 처리
             if is_correct:
                 node_completion_service = NodeCompletionService(
@@ -360,35 +320,106 @@ class MemberAnswerService:
                     map_play_id=answer.map_play_member.map_play_id,
                 )
                 node_completion_service.process_nodes_completion(nodes=[answer.question.arrow.start_node])
-                
-                # 푸시 알림 전송
-                map_play_members = MapPlayMember.objects.filter(
-                    map_play_id=answer.map_play_member.map_play_id,
-                    deactivated=False,
-                ).exclude(
-                    member_id=answer.map_play_member.member_id,
-                )
-                if map_play_members:
-                    guests = Guest.objects.filter(
-                        member_id__in=[map_play_member.member_id for map_play_member in map_play_members],
-                        member__is_active=True,
-                    )
-                    for guest in guests:
-                        push_service.send_push(
-                            guest_id=guest.id,
-                            title=f"\'{answer.question.title}\' 문제 해결",
-                            body=f"{answer.member.nickname}님이 문제를 해결했습니다.",
-                            push_channel_type=PushChannelType.QUESTION_SOLVED_ALERT,
-                            data={
-                                "type": "question_solved_alert",
-                                "question_id": str(answer.question.id),
-                                "map_id": str(answer.map_id),
-                                "map_play_id": str(answer.map_play_member.map_play_id),
-                                "is_correct": True,
-                            },
-                        )
+
+            # 답변 작성자 피드백 / 같은 MapPlay 멤버 문제 해결 알림은 커밋 후 발송
+            transaction.on_commit(lambda: send_question_feedback_push.delay(answer.id))
             
             return answer
             
         except UserQuestionAnswer.DoesNotExist:
             raise AnswerNotFoundException()
+
+    @staticmethod
+    @transaction.atomic
+    def submit_feedbacks(member_id: int, items: List[BulkFeedbackItemDTO]) -> List[FeedbackResultDto]:
+        """
+        여러 답변에 대한 피드백을 한 번에 제출합니다.
+        - Map 생성자가 아닌 답변, 없는 답변은 건너뛰고 답변별 결과로 알려줍니다.
+        - 정답 처리된 답변은 MapPlay 별로 묶어 연쇄 처리를 한 번만 실행합니다.
+        - 알림은 커밋 후 한 번의 작업으로 모아서 발송합니다.
+
+        Args:
+            member_id: 피드백 제출자 ID
+            items: 답변별 피드백 목록
+
+        Returns:
+            List[FeedbackResultDto]: items 순서대로의 답변별 결과
+        """
+        answer_by_id = UserQuestionAnswer.objects.select_related(
+            'map',
+            'map_play_member',
+            'question__arrow__start_node',
+        ).in_bulk(
+            [item.user_question_answer_id for item in items],
+        )
+
+        now = timezone.now()
+        results = []
+        reviewed_answers = []
+        for item in items:
+            answer = answer_by_id.get(item.user_question_answer_id)
+            if not answer:
+                results.append(
+                    FeedbackResultDto(
+                        id=item.user_question_answer_id,
+                        status=FeedbackResultStatus.NOT_FOUND.value,
+                    )
+                )
+                continue
+            # Map 생성자만 피드백 제출 가능
+            if member_id != answer.map.created_by_id:
+                results.append(
+                    FeedbackResultDto(
+                        id=item.user_question_answer_id,
+                        status=FeedbackResultStatus.PERMISSION_DENIED.value,
+                    )
+                )
+                continue
+
+            answer.is_correct = item.is_correct
+            answer.feedback = item.feedback
+            answer.reviewed_by_id = member_id
+            answer.reviewed_at = now
+            reviewed_answers.append(answer)
+            results.append(
+                FeedbackResultDto(
+                    id=answer.id,
+                    status=FeedbackResultStatus.REVIEWED.value,
+                    is_correct=answer.is_correct,
+                    feedback=answer.feedback,
+                    reviewed_at=answer.reviewed_at,
+                )
+            )
+
+        if not reviewed_answers:
+            return results
+
+        UserQuestionAnswer.objects.bulk_update(
+            reviewed_answers,
+            ['is_correct', 'feedback', 'reviewed_by', 'reviewed_at'],
+        )
+
+        # 정답인 답변의 시작 Node 를 MapPlay 별로 모아서 연쇄 처리 (lock 순서를 맞추기 위해 MapPlay id 순서대로)
+        correct_answers_by_map_play_id = defaultdict(list)
+        for answer in reviewed_answers:
+            if answer.is_correct and answer.question.arrow:
+                correct_answers_by_map_play_id[answer.map_play_member.map_play_id].append(answer)
+        for map_play_id in sorted(correct_answers_by_map_play_id):
+            correct_answers = correct_answers_by_map_play_id[map_play_id]
+            # 새로 생기는 이력은 첫 번째 답변 작성자가 완료한 것으로 기록합니다.
+            node_completion_service = NodeCompletionService(
+                member_id=correct_answers[0].map_play_member.member_id,
+                map_play_member_id=correct_answers[0].map_play_member_id,
+                map_play_id=map_play_id,
+            )
+            start_node_by_id = {
+                answer.question.arrow.start_node_id: answer.question.arrow.start_node
+                for answer in correct_answers
+            }
+            node_completion_service.process_nodes_completion(nodes=list(start_node_by_id.values()))
+
+        # 답변 작성자 피드백 / 같은 MapPlay 멤버 문제 해결 알림은 커밋 후 발송
+        reviewed_answer_ids = [answer.id for answer in reviewed_answers]
+        transaction.on_commit(lambda: send_question_feedback_pushes.delay(reviewed_answer_ids))
+
+        return results
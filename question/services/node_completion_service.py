@@ -1,20 +1,25 @@
 from typing import (
     Dict,
+    Iterable,
     List,
+    Set,
+    Tuple,
 )
-from collections import (
-    defaultdict,
-    deque,
-)
+from collections import deque
 
 from django.db import transaction
 from django.utils import timezone
 
-from map.models.arrow import Arrow
 from map.models.arrow_progress import ArrowProgress
 from map.models.node import Node
 from map.models.node_history import NodeCompletedHistory
-from map.models.node_rule import NodeCompleteRule
+from map_graph.dtos.map_graph_snapshot import MapGraphSnapshot
+from map_graph.services.map_graph_snapshot_service import get_map_graph_snapshot
+from play.models import MapPlayProgress
+from play.services import (
+    MapPlayNodeStatisticService,
+    MapPlayProgressService,
+)
 from question.dtos.node_completion import NodeCompletionResultDto
 
 
@@ -41,148 +46,157 @@ class NodeCompletionService:
             )
 
         map_id = nodes[0].map_id  # 모든 노드는 같은 map에 속한다고 가정
-        map_data = self._fetch_map_data(map_id)
-
-        new_arrow_progresses = []
-        new_completed_node_histories = []
-        now = timezone.now()
-
-        nodes_to_process = deque(node.id for node in nodes)
-        processed_nodes = set()
+        snapshot = get_map_graph_snapshot(map_id)
+        # 같은 MapPlay 의 연쇄 처리는 진행 상태 row lock 으로 순서대로 처리됩니다.
+        progress = MapPlayProgressService().get_progress(self.map_play_id, for_update=True)
+        return self._complete_nodes(
+            map_id=map_id,
+            snapshot=snapshot,
+            progress=progress,
+            start_node_ids=[node.id for node in nodes],
+        )
 
-        while nodes_to_process:
-            current_node_id = nodes_to_process.popleft()
+    @transaction.atomic
+    def recompute_progress(self, map_id: int, snapshot: MapGraphSnapshot) -> NodeCompletionResultDto:
+        """
+        Map 구조가 바뀐 뒤, 이미 완료된 Node 들부터 연쇄 처리를 다시 실행해서 빠진 이력을 채웁니다.
+        진행 상태 row lock 안에서 진행 상태와 비교하므로 여러 번 실행해도 중복 생성되지 않습니다.
+        """
+        progress = MapPlayProgressService().get_progress(self.map_play_id, for_update=True)
+        return self._complete_nodes(
+            map_id=map_id,
+            snapshot=snapshot,
+            progress=progress,
+            start_node_ids=progress.completed_node_ids,
+        )
 
-            if current_node_id in processed_nodes:
-                continue
+    def _complete_nodes(
+            self,
+            map_id: int,
+            snapshot: MapGraphSnapshot,
+            progress: MapPlayProgress,
+            start_node_ids: List[int],
+    ) -> NodeCompletionResultDto:
+        """
+        진행 상태 row lock 을 잡은 트랜잭션 안에서 호출해야 합니다.
+        """
+        resolved_arrow_ids, completed_node_rules = resolve_unlock_cascade(
+            snapshot=snapshot,
+            start_node_ids=start_node_ids,
+            completed_arrow_ids=set(progress.resolved_arrow_ids),
+            completed_rule_ids=set(progress.completed_rule_ids),
+        )
 
-            processed_nodes.add(current_node_id)
-
-            # 현재 노드에서 출발하는 Arrow들에 대한 ArrowProgress 생성
-            outgoing_arrows = map_data['arrows_by_start_node_id'].get(current_node_id, [])
-            for arrow in outgoing_arrows:
-                if arrow.id not in map_data['completed_arrows']:
-                    new_arrow_progresses.append(
-                        ArrowProgress(
-                            map_id=map_data['map_id'],
-                            arrow=arrow,
-                            member_id=self.member_id,
-                            map_play_member_id=self.map_play_member_id,
-                            is_resolved=True,
-                            resolved_at=now
-                        )
-                    )
-                    map_data['completed_arrows'].add(arrow.id)
-
-            # 새로 완료된 Arrow로 인해 해금 가능한 Node 찾기
-            going_to_completed_nodes = self._find_going_to_completed_nodes(map_data)
-
-            # 해금된 Node들 처리
-            for going_to_completed_node_id, rule in going_to_completed_nodes:
-                new_completed_node_histories.append(
-                    NodeCompletedHistory(
-                        map_id=map_data['map_id'],
-                        node_id=going_to_completed_node_id,
-                        member_id=self.member_id,
-                        map_play_member_id=self.map_play_member_id,
-                        node_complete_rule=rule
-                    )
-                )
-                map_data['completed_node_ids'].add(going_to_completed_node_id)
-                map_data['completed_node_rule_ids'].add(rule.id)
-                nodes_to_process.append(going_to_completed_node_id)
+        now = timezone.now()
+        new_arrow_progresses = [
+            ArrowProgress(
+                map_id=map_id,
+                arrow_id=arrow_id,
+                member_id=self.member_id,
+                map_play_id=self.map_play_id,
+                map_play_member_id=self.map_play_member_id,
+                is_resolved=True,
+                resolved_at=now
+            )
+            for arrow_id in resolved_arrow_ids
+        ]
+        new_completed_node_histories = [
+            NodeCompletedHistory(
+                map_id=map_id,
+                node_id=node_id,
+                member_id=self.member_id,
+                map_play_id=self.map_play_id,
+                map_play_member_id=self.map_play_member_id,
+                node_complete_rule_id=rule_id
+            )
+            for node_id, rule_id in completed_node_rules
+        ]
 
         # 모아둔 데이터 한 번에 생성
+        # 진행 상태와 이력이 어긋나 이미 있는 (MapPlay, Arrow), (MapPlay, Node, Rule) 이력은 unique 제약으로 건너뜁니다.
         if new_arrow_progresses:
-            ArrowProgress.objects.bulk_create(new_arrow_progresses)
+            ArrowProgress.objects.bulk_create(new_arrow_progresses, ignore_conflicts=True)
         if new_completed_node_histories:
-            NodeCompletedHistory.objects.bulk_create(new_completed_node_histories)
+            NodeCompletedHistory.objects.bulk_create(new_completed_node_histories, ignore_conflicts=True)
+            MapPlayNodeStatisticService().increase_statistics(
+                self.map_play_id,
+                snapshot,
+                [node_id for node_id, _ in completed_node_rules],
+            )
+        MapPlayProgressService().add_progress(
+            progress,
+            resolved_arrow_ids=resolved_arrow_ids,
+            completed_node_rules=completed_node_rules,
+        )
 
         return NodeCompletionResultDto(
             new_arrow_progresses=new_arrow_progresses,
             new_completed_node_histories=new_completed_node_histories
         )
 
-    def _fetch_map_data(self, map_id: int) -> Dict:
-        """
-        필요한 모든 데이터를 미리 가져옵니다.
-        """
-        # Arrow와 연결된 Node들 가져오기
-        arrows = Arrow.objects.filter(
-            map_id=map_id,
-            is_deleted=False
-        ).select_related(
-            'start_node',
-            'node_complete_rule__node',
-        )
 
-        # NodeCompleteRule 가져오기
-        rules = NodeCompleteRule.objects.filter(
-            map_id=map_id,
-            is_deleted=False
+def resolve_unlock_cascade(
+        snapshot: MapGraphSnapshot,
+        start_node_ids: Iterable[int],
+        completed_arrow_ids: Set[int],
+        completed_rule_ids: Set[int],
+) -> Tuple[List[int], List[Tuple[int, int]]]:
+    """
+    주어진 노드들부터 연쇄적으로 해결되는 Arrow 와 완료되는 (node_id, rule_id) 를 계산합니다.
+    Rule 마다 "남은 미해결 Arrow 수" 를 세어두고, 새로 해결된 Arrow 가 속한 Rule 만 다시 확인하므로
+    전체 비용은 O(Node + Arrow + Rule) 입니다.
+    Arrow 가 없는 Rule 은 처음부터 충족된 것으로 보고, 이미 완료된 Rule 은 다시 완료하지 않습니다.
+    """
+    completed_arrow_ids = set(completed_arrow_ids)
+
+    # Rule 별 남은 미해결 Arrow 수
+    remaining_arrow_count_by_rule_id: Dict[int, int] = {}
+    satisfied_rule_ids = []
+    for rule_id in snapshot.rules:
+        if rule_id in completed_rule_ids:
+            continue
+        remaining_arrow_count = sum(
+            1
+            for arrow_id in snapshot.arrow_ids_by_rule_id.get(rule_id, ())
+            if arrow_id not in completed_arrow_ids
         )
+        remaining_arrow_count_by_rule_id[rule_id] = remaining_arrow_count
+        if remaining_arrow_count == 0:
+            satisfied_rule_ids.append(rule_id)
 
-        # 기존 ArrowProgress 가져오기
-        existing_progresses = ArrowProgress.objects.filter(
-            map_id=map_id,
-            map_play_member__map_play_id=self.map_play_id,
-            is_resolved=True
-        )
+    resolved_arrow_ids = []
+    completed_node_rules = []
+    nodes_to_process = deque(start_node_ids)
+    processed_node_ids = set()
 
-        # 기존 NodeCompletedHistory 가져오기 (node_complete_rule_id도 함께 가져옴)
-        completed_histories = NodeCompletedHistory.objects.filter(
-            map_id=map_id,
-            map_play_member__map_play_id=self.map_play_id,
-        ).values_list('node_id', 'node_complete_rule_id')
-
-        # rule별 arrow 매핑 구성
-        arrows_by_rule_id = {}
-        for arrow in arrows:
-            rule_id = arrow.node_complete_rule_id
-            if rule_id not in arrows_by_rule_id:
-                arrows_by_rule_id[rule_id] = set()
-            arrows_by_rule_id[rule_id].add(arrow)
-
-        # rules_by_node_id 구성
-        rules_by_node_id = defaultdict(list)
-        for rule in rules:
-            rules_by_node_id[rule.node_id].append(rule)
-
-        # arrows_by_start_node_id 구성
-        arrows_by_start_node_id = {}
-        for arrow in arrows:
-            if arrow.start_node_id not in arrows_by_start_node_id:
-                arrows_by_start_node_id[arrow.start_node_id] = []
-            arrows_by_start_node_id[arrow.start_node_id].append(arrow)
-
-        # 데이터 구조화
-        return {
-            'map_id': map_id,
-            'arrows_by_start_node_id': arrows_by_start_node_id,
-            'rules_by_node_id': rules_by_node_id,
-            'arrows_by_rule_id': arrows_by_rule_id,
-            'completed_arrows': {p.arrow_id for p in existing_progresses},
-            'completed_node_ids': {node_id for node_id, _ in completed_histories},
-            'completed_node_rule_ids': {rule_id for _, rule_id in completed_histories},
-        }
-
-    @staticmethod
-    def _find_going_to_completed_nodes(map_data: Dict) -> List[tuple[int, NodeCompleteRule]]:
-        """
-        Completed 가 될 수 있는 조건이 충족된 Node들을 찾습니다.
-        하나의 Node 가 해결 되면 여러 규칙으로 해금될 수 있으며,
-        이미 해금된 규칙은 다시 생성하지 않습니다.
-        """
-        going_to_completed = []
-        for node_id, node_rules in map_data['rules_by_node_id'].items():
-            # 노드의 모든 규칙을 체크
-            for rule in node_rules:
-                # 이미 해당 규칙으로 해금된 이력이 있다면 스킵
-                if rule.id in map_data['completed_node_rule_ids']:
-                    continue
-
-                rule_arrows = map_data['arrows_by_rule_id'].get(rule.id, [])
-                if all(arrow.id in map_data['completed_arrows'] for arrow in rule_arrows):
-                    going_to_completed.append((node_id, rule))
-
-        return going_to_completed
+    while nodes_to_process:
+        current_node_id = nodes_to_process.popleft()
+
+        if current_node_id in processed_node_ids:
+            continue
+
+        processed_node_ids.add(current_node_id)
+
+        # 현재 노드에서 출발하는 Arrow 해결
+        for arrow_id in snapshot.arrow_ids_by_start_node_id.get(current_node_id, ()):
+            if arrow_id in completed_arrow_ids:
+                continue
+            completed_arrow_ids.add(arrow_id)
+            resolved_arrow_ids.append(arrow_id)
+
+            rule_id = snapshot.arrows[arrow_id].node_complete_rule_id
+            if rule_id not in remaining_arrow_count_by_rule_id:
+                continue
+            remaining_arrow_count_by_rule_id[rule_id] -= 1
+            if remaining_arrow_count_by_rule_id[rule_id] == 0:
+                satisfied_rule_ids.append(rule_id)
+
+        # 모든 Arrow 가 해결된 Rule 의 Node 완료 처리
+        for rule_id in satisfied_rule_ids:
+            del remaining_arrow_count_by_rule_id[rule_id]
+            node_id = snapshot.rules[rule_id].node_id
+            completed_node_rules.append((node_id, rule_id))
+            nodes_to_process.append(node_id)
+        satisfied_rule_ids = []
+
+    return resolved_arrow_ids, completed_node_rules
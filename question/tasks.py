@@ -1,10 +1,26 @@
+from collections import defaultdict
 from typing import (
     Dict,
     List,
 )
 
+from django.db import transaction
+
 from common.common_utils import send_email
 from config.celery import app
+from member.models import Guest
+from play.models import MapPlayMember
+from push.consts import (
+    QUESTION_SOLVED_ALERT_DIGEST_TYPE,
+    QUESTION_SOLVED_ALERT_DIGEST_WINDOW_SECONDS,
+    PushChannelType,
+)
+from push.services import (
+    PushDigestService,
+    PushService,
+)
+from question.models import UserQuestionAnswer
+from question.services.map_progress_recompute_service import MapProgressRecomputeService
 
 
 # send_question_submitted_email.apply_async(...)
@@ -33,3 +49,258 @@ def send_question_submitted_email(
         },
         emails
     )
+
+
+# recompute_map_progress 명령어에서 MapPlay id 묶음마다 group 으로 실행
+@app.task
+def recompute_map_play_progress(
+        map_id: int,
+        map_play_ids: List[int],
+) -> Dict[str, int]:
+    diffs = MapProgressRecomputeService(map_id).recompute(map_play_ids)
+    return {
+        'map_play_count': len(map_play_ids),
+        'changed_map_play_count': len(diffs),
+        'applied_map_play_count': sum(1 for diff in diffs if diff.is_applied),
+        'resolved_arrow_count': sum(len(diff.resolved_arrow_ids) for diff in diffs),
+        'completed_node_count': sum(len(diff.completed_node_rules) for diff in diffs),
+        'changed_node_statistic_count': sum(len(diff.node_statistic_changes) for diff in diffs),
+    }
+
+
+def _get_question_solved_alert_digest_service() -> PushDigestService:
+    return PushDigestService(
+        digest_type=QUESTION_SOLVED_ALERT_DIGEST_TYPE,
+        window_seconds=QUESTION_SOLVED_ALERT_DIGEST_WINDOW_SECONDS,
+    )
+
+
+def _add_question_solved_alerts(answers: List[UserQuestionAnswer]) -> None:
+    """
+    정답 처리된 답변을 MapPlay 별 문제 해결 알림 묶음에 추가하고, 새로 시작된 묶음은 window 뒤에 발송하도록 예약합니다.
+    """
+    digest_service = _get_question_solved_alert_digest_service()
+    for answer in answers:
+        map_play_id = answer.map_play_member.map_play_id
+        is_new_digest = digest_service.add(
+            map_play_id,
+            {
+                'member_id': answer.member_id,
+                'nickname': answer.member.nickname,
+                'question_id': answer.question_id,
+                'question_title': answer.question.title,
+                'map_id': answer.map_id,
+            },
+        )
+        if is_new_digest:
+            flush_question_solved_alert_digest.apply_async(
+                (map_play_id,),
+                countdown=QUESTION_SOLVED_ALERT_DIGEST_WINDOW_SECONDS,
+            )
+
+
+def _send_question_solved_alert_digest(map_play_id: int, events: List[Dict]) -> None:
+    """
+    모인 문제 해결 알림을 수신자별로 하나씩 보냅니다.
+    본인이 해결한 문제는 빼고 보내며, 받을 내용이 같은 수신자끼리는 한 번에 등록합니다.
+    """
+    if not events:
+        return
+    guest_ids_by_member_id = defaultdict(list)
+    for member_id, guest_id in Guest.objects.filter(
+        member_id__in=MapPlayMember.objects.filter(
+            map_play_id=map_play_id,
+            deactivated=False,
+        ).values(
+            'member_id',
+        ),
+        member__is_active=True,
+    ).values_list(
+        'member_id',
+        'id',
+    ):
+        guest_ids_by_member_id[member_id].append(guest_id)
+
+    guest_ids_by_event_indexes = defaultdict(list)
+    for member_id, guest_ids in guest_ids_by_member_id.items():
+        event_indexes = tuple(
+            index
+            for index, event in enumerate(events)
+            if event['member_id'] != member_id
+        )
+        if event_indexes:
+            guest_ids_by_event_indexes[event_indexes].extend(guest_ids)
+
+    push_service = PushService()
+    with transaction.atomic():
+        for event_indexes, guest_ids in guest_ids_by_event_indexes.items():
+            recipient_events = [events[index] for index in event_indexes]
+            data = {
+                "type": "question_solved_alert",
+                "map_id": str(recipient_events[0]['map_id']),
+                "map_play_id": str(map_play_id),
+                "is_correct": "true",
+            }
+            if len(recipient_events) == 1:
+                event = recipient_events[0]
+                push_service.enqueue_push_to_multiple(
+                    guest_ids=sorted(guest_ids),
+                    title=f"\'{event['question_title']}\' 문제 해결",
+                    body=f"{event['nickname']}님이 문제를 해결했습니다.",
+                    push_channel_type=PushChannelType.QUESTION_SOLVED_ALERT,
+                    data={**data, "question_id": str(event['question_id'])},
+                )
+                continue
+            nicknames = list(dict.fromkeys(event['nickname'] for event in recipient_events))
+            push_service.enqueue_push_to_multiple(
+                guest_ids=sorted(guest_ids),
+                title=f"문제 {len(recipient_events)}개 해결",
+                body=f"{', '.join(nicknames)}님이 문제 {len(recipient_events)}개를 해결했습니다.",
+                push_channel_type=PushChannelType.QUESTION_SOLVED_ALERT,
+                data={
+                    **data,
+                    "question_ids": ",".join(str(event['question_id']) for event in recipient_events),
+                },
+            )
+
+
+# 정답 처리 트랜잭션이 커밋된 뒤 transaction.on_commit 으로 실행
+@app.task
+def send_question_solved_alert(user_question_answer_id: int) -> None:
+    """
+    같은 MapPlay 의 다른 멤버들에게 보낼 문제 해결 알림을 MapPlay 별 묶음에 추가합니다.
+    QUESTION_SOLVED_ALERT_DIGEST_WINDOW_SECONDS 동안 모인 알림은 flush_question_solved_alert_digest 에서 한 번에 보냅니다.
+    """
+    answer = UserQuestionAnswer.objects.select_related(
+        'question',
+        'member',
+        'map_play_member',
+    ).get(
+        id=user_question_answer_id,
+    )
+    _add_question_solved_alerts([answer])
+
+
+# _add_question_solved_alerts 에서 묶음이 시작될 때 window 뒤로 예약
+@app.task
+def flush_question_solved_alert_digest(map_play_id: int) -> None:
+    digest_service = _get_question_solved_alert_digest_service()
+    if not digest_service.claim(map_play_id):
+        return
+    _send_question_solved_alert_digest(map_play_id, digest_service.pop_events(map_play_id))
+
+
+# run_push_reminder_scheduler 명령어에서 PUSH_REMINDER_TICK_SECONDS 마다 실행
+@app.task
+def flush_due_question_solved_alert_digests() -> int:
+    """
+    예약된 작업이 유실되어 발송 시각이 지난 문제 해결 알림 묶음을 보냅니다.
+    """
+    digest_service = _get_question_solved_alert_digest_service()
+    map_play_ids = digest_service.pop_due()
+    for map_play_id in map_play_ids:
+        _send_question_solved_alert_digest(map_play_id, digest_service.pop_events(map_play_id))
+    return len(map_play_ids)
+
+
+def _enqueue_question_feedback_push(answer: UserQuestionAnswer, guest_ids: List[int], push_service: PushService) -> None:
+    push_service.enqueue_push_to_multiple(
+        guest_ids=guest_ids,
+        title=f"\'{answer.question.title}\' 문제 결과",
+        body=answer.feedback,
+        push_channel_type=PushChannelType.QUESTION_FEEDBACK,
+        data={
+            "type": "question_feedback",
+            "question_id": str(answer.question_id),
+            "map_id": str(answer.map_id),
+            "map_play_member_id": str(answer.map_play_member_id),
+            "is_correct": str(answer.is_correct).lower(),
+        },
+    )
+
+
+# 피드백 저장 트랜잭션이 커밋된 뒤 transaction.on_commit 으로 실행
+@app.task
+def send_question_feedback_push(user_question_answer_id: int) -> None:
+    """
+    답변 작성자에게 피드백 결과를 보내고, 정답이면 같은 MapPlay 의 다른 멤버들에게 보낼 문제 해결 알림 묶음에도 추가합니다.
+    """
+    answer = UserQuestionAnswer.objects.select_related(
+        'question',
+    ).get(
+        id=user_question_answer_id,
+    )
+    _enqueue_question_feedback_push(
+        answer,
+        list(
+            Guest.objects.filter(
+                member_id=answer.member_id,
+                member__is_active=True,
+            ).values_list(
+                'id',
+                flat=True,
+            )
+        ),
+        PushService(),
+    )
+    if answer.is_correct:
+        send_question_solved_alert(user_question_answer_id)
+
+
+# 여러 답변 피드백 저장 트랜잭션이 커밋된 뒤 transaction.on_commit 으로 실행
+@app.task
+def send_question_feedback_pushes(user_question_answer_ids: List[int]) -> None:
+    """
+    여러 답변의 피드백 알림을 모아서 보냅니다.
+    - 답변 작성자별로 피드백 결과 알림을 하나씩 보냅니다. (답변이 여러 개면 한 번에 묶어서 알림)
+    - 정답 처리된 답변은 MapPlay 별 문제 해결 알림 묶음에 추가해서 다른 정답 알림과 함께 보냅니다.
+    """
+    answers = list(
+        UserQuestionAnswer.objects.select_related(
+            'question',
+            'member',
+            'map_play_member',
+        ).filter(
+            id__in=user_question_answer_ids,
+        ).order_by(
+            'id',
+        )
+    )
+    if not answers:
+        return
+
+    push_service = PushService()
+    guest_ids_by_member_id = defaultdict(list)
+    for member_id, guest_id in Guest.objects.filter(
+        member_id__in={answer.member_id for answer in answers},
+        member__is_active=True,
+    ).values_list(
+        'member_id',
+        'id',
+    ):
+        guest_ids_by_member_id[member_id].append(guest_id)
+
+    answers_by_member_id = defaultdict(list)
+    for answer in answers:
+        answers_by_member_id[answer.member_id].append(answer)
+    for member_id, member_answers in answers_by_member_id.items():
+        if not guest_ids_by_member_id[member_id]:
+            continue
+        if len(member_answers) == 1:
+            _enqueue_question_feedback_push(member_answers[0], guest_ids_by_member_id[member_id], push_service)
+            continue
+        push_service.enqueue_push_to_multiple(
+            guest_ids=guest_ids_by_member_id[member_id],
+            title=f"문제 {len(member_answers)}개 결과",
+            body=f"\'{member_answers[0].question.title}\' 외 {len(member_answers) - 1}개 문제에 피드백이 등록되었습니다.",
+            push_channel_type=PushChannelType.QUESTION_FEEDBACK,
+            data={
+                "type": "question_feedback",
+                "question_ids": ",".join(str(answer.question_id) for answer in member_answers),
+                "map_id": str(member_answers[0].map_id),
+                "map_play_member_id": str(member_answers[0].map_play_member_id),
+            },
+        )
+
+    # 정답 처리된 답변은 문제 해결 알림 묶음으로 모아서 보냄 (작성자 본인이 해결한 문제는 작성자에게 보내지 않음)
+    _add_question_solved_alerts([answer for answer in answers if answer.is_correct])
@@ -0,0 +1,112 @@
+import time
+
+from django.test import TestCase
+
+from map.consts import MapSeedShape
+from map.services.map_document_service import MapDocumentService
+from map.services.map_seed_service import build_seed_map_document
+from member.models import Member
+from question.consts import (
+    QuestionType,
+    ValidationType,
+)
+from question.models import (
+    Question,
+    QuestionAnswer,
+)
+from question.services.answer_validation_service import (
+    AnswerValidationService,
+    clear_local_compiled_answers,
+    invalidate_compiled_answers,
+)
+
+
+class AnswerValidationServiceTest(TestCase):
+    def setUp(self):
+        clear_local_compiled_answers()
+        member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.map = MapDocumentService().import_map(
+            build_seed_map_document(MapSeedShape.CHAIN.value, 1),
+            member.id,
+        )
+        # Given: 텍스트 문제
+        self.question = Question.objects.get(map=self.map)
+        self.question.is_by_pass = False
+        self.question.question_types = [QuestionType.TEXT.value]
+        self.question.save()
+
+    def tearDown(self):
+        clear_local_compiled_answers()
+
+    def _set_answers(self, validation_type: str, answers):
+        QuestionAnswer.objects.filter(question=self.question).delete()
+        QuestionAnswer.objects.bulk_create([
+            QuestionAnswer(
+                map=self.map,
+                question=self.question,
+                answer=answer,
+                description='',
+            )
+            for answer in answers
+        ])
+        self.question.answer_validation_type = validation_type
+        self.question.save()
+
+    def test_validate_answer_should_match_by_validation_type(self):
+        # Given: 정확일치 정답
+        self._set_answers(ValidationType.TEXT_EXACT.value, ['사과', '배'])
+        # Then: 정답 중 하나와 같아야 정답
+        self.assertTrue(AnswerValidationService.validate_answer(self.question, '배'))
+        self.assertFalse(AnswerValidationService.validate_answer(self.question, '사과나무'))
+
+        # Given: 포함 정답 (정규식 특수문자 포함)
+        self._set_answers(ValidationType.TEXT_CONTAINS.value, ['a+b', '사과'])
+        # Then: 정답 중 하나를 포함해야 정답
+        self.assertTrue(AnswerValidationService.validate_answer(self.question, '답은 a+b 입니다'))
+        self.assertTrue(AnswerValidationService.validate_answer(self.question, '빨간 사과'))
+        self.assertFalse(AnswerValidationService.validate_answer(self.question, 'aab'))
+
+        # Given: 정규식 정답 (잘못된 정규식 포함)
+        self._set_answers(ValidationType.REGEX.value, ['[', r'^\d{3}$'])
+        # Then: 올바른 정규식과 일치해야 정답
+        self.assertTrue(AnswerValidationService.validate_answer(self.question, '123'))
+        self.assertFalse(AnswerValidationService.validate_answer(self.question, '1234'))
+
+        # Given: 수동 평가
+        self._set_answers(ValidationType.MANUAL.value, ['사과'])
+        # Then: 관리자 평가 대기
+        self.assertIsNone(AnswerValidationService.validate_answer(self.question, '사과'))
+
+    def test_validate_answer_should_use_cached_answers_until_question_updated(self):
+        # Given: 한 번 검증한 문제
+        self._set_answers(ValidationType.TEXT_EXACT.value, ['사과'])
+        self.assertTrue(AnswerValidationService.validate_answer(self.question, '사과'))
+
+        # When: 다시 검증
+        # Then: 쿼리 없이 검증해야 함
+        with self.assertNumQueries(0):
+            self.assertTrue(AnswerValidationService.validate_answer(self.question, '사과'))
+
+        # When: 정답 변경 후 캐시 무효화
+        QuestionAnswer.objects.filter(question=self.question).update(answer='배')
+        invalidate_compiled_answers([self.question.id])
+        question = Question.objects.get(id=self.question.id)
+
+        # Then: 바뀐 정답으로 검증해야 함
+        self.assertFalse(AnswerValidationService.validate_answer(question, '사과'))
+        self.assertTrue(AnswerValidationService.validate_answer(question, '배'))
+
+    def test_validate_answer_should_return_none_when_regex_time_budget_exceeded(self):
+        # Given: 지수 시간이 걸리는 정규식 정답
+        self._set_answers(ValidationType.REGEX.value, [r'^(a+)+$'])
+
+        # When: 일치하지 않는 긴 답변
+        started_at = time.monotonic()
+        result = AnswerValidationService.validate_answer(self.question, 'a' * 40 + 'b')
+
+        # Then: 시간 제한 후 관리자 평가 대기로 넘겨야 함
+        self.assertIsNone(result)
+        self.assertLess(time.monotonic() - started_at, 5)
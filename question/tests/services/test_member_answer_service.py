@@ -0,0 +1,386 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import (
+    IntegrityError,
+    transaction,
+)
+from django.test import TestCase
+
+from map.consts import MapSeedShape
+from map.models import (
+    ArrowProgress,
+    NodeCompletedHistory,
+)
+from map.services.map_document_service import MapDocumentService
+from map.services.map_seed_service import build_seed_map_document
+from map_graph.services.map_graph_snapshot_service import clear_local_map_graph_snapshots
+from member.models import (
+    Guest,
+    Member,
+)
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+)
+from play.services import MapPlayProgressService
+from push.consts import (
+    QUESTION_SOLVED_ALERT_DIGEST_WINDOW_SECONDS,
+    PushChannelType,
+)
+from push.models import PushOutbox
+from question.consts import FeedbackResultStatus
+from question.dtos.feedback import BulkFeedbackItemDTO
+from question.models import (
+    Question,
+    UserQuestionAnswer,
+)
+from question.services.member_answer_service import MemberAnswerService
+from question.tasks import (
+    flush_question_solved_alert_digest,
+    send_question_feedback_pushes,
+    send_question_solved_alert,
+)
+
+
+class MemberAnswerServiceSideEffectTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 바로 통과하는 문제가 있는 2개 Node 체인 Map
+        self.members = [
+            Member.objects.create(
+                username=f'test_user_{i}',
+                nickname=f'테스트 유저 {i}',
+            )
+            for i in range(4)
+        ]
+        self.map = MapDocumentService().import_map(
+            build_seed_map_document(MapSeedShape.CHAIN.value, 2),
+            self.members[0].id,
+        )
+        self.question = Question.objects.select_related(
+            'map',
+            'arrow',
+            'arrow__start_node',
+        ).get(
+            map=self.map,
+            title='Question 0-0',
+        )
+        # Given: 4명이 참여한 MapPlay, 모두 게스트가 있음
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.members[0],
+        )
+        self.map_play_members = [
+            MapPlayMember.objects.create(
+                map_play=self.map_play,
+                member=member,
+                role=MapPlayMemberRole.ADMIN if i == 0 else MapPlayMemberRole.PARTICIPANT,
+            )
+            for i, member in enumerate(self.members)
+        ]
+        self.guests = [
+            Guest.objects.create(
+                member=member,
+                temp_nickname=f'guest_{i}',
+                ip='127.0.0.1',
+                email=f'test{i}@test.com',
+            )
+            for i, member in enumerate(self.members)
+        ]
+        MapPlayProgressService().rebuild_progress(self.map_play.id)
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    @patch('question.services.member_answer_service.send_question_solved_alert.delay')
+    @patch('push.services.PushService.send_push')
+    def test_create_answer_should_send_solved_alert_after_commit(self, mock_send_push, mock_solved_alert_delay):
+        # Given: 정답 제출 서비스
+        service = MemberAnswerService(
+            question=self.question,
+            member_id=self.members[0].id,
+            map_play_member_id=self.map_play_members[0].id,
+            map_play_id=self.map_play.id,
+        )
+
+        # When: 정답 제출
+        with self.captureOnCommitCallbacks() as callbacks:
+            user_answer = service.create_answer('', [])
+
+            # Then: 커밋 전에는 푸시를 보내지 않아야 함
+            mock_send_push.assert_not_called()
+            mock_solved_alert_delay.assert_not_called()
+        self.assertTrue(NodeCompletedHistory.objects.filter(map_play_member=self.map_play_members[0]).exists())
+
+        # When: 커밋
+        for callback in callbacks:
+            callback()
+
+        # Then: 답변 id 로 문제 해결 알림 작업이 등록되어야 함
+        mock_solved_alert_delay.assert_called_once_with(user_answer.id)
+        mock_send_push.assert_not_called()
+
+    @patch('push.services.PUSH_TASK_GUEST_BATCH_SIZE', 2)
+    @patch('question.tasks.flush_question_solved_alert_digest.apply_async')
+    def test_send_question_solved_alert_should_enqueue_teammates_in_batches(self, mock_flush_apply_async):
+        # Given: 정답 처리된 답변
+        user_answer = UserQuestionAnswer.objects.create(
+            map=self.map,
+            question=self.question,
+            member=self.members[0],
+            map_play_member=self.map_play_members[0],
+            answer='',
+            is_correct=True,
+        )
+
+        # When: 문제 해결 알림 작업 실행
+        send_question_solved_alert(user_answer.id)
+
+        # Then: 바로 보내지 않고 MapPlay 묶음 발송이 예약되어야 함
+        self.assertEqual(PushOutbox.objects.count(), 0)
+        mock_flush_apply_async.assert_called_once_with(
+            (self.map_play.id,),
+            countdown=QUESTION_SOLVED_ALERT_DIGEST_WINDOW_SECONDS,
+        )
+
+        # When: 묶음 발송
+        flush_question_solved_alert_digest(self.map_play.id)
+
+        # Then: 본인을 제외한 3명이 2명씩 나눠서 등록되어야 함
+        outboxes = list(PushOutbox.objects.order_by('id'))
+        guest_id_batches = [outbox.guest_ids for outbox in outboxes]
+        self.assertEqual([len(guest_ids) for guest_ids in guest_id_batches], [2, 1])
+        self.assertEqual(
+            sorted(guest_id for guest_ids in guest_id_batches for guest_id in guest_ids),
+            sorted(guest.id for guest in self.guests[1:]),
+        )
+        self.assertTrue(
+            all(outbox.push_channel_type == PushChannelType.QUESTION_SOLVED_ALERT.value for outbox in outboxes)
+        )
+
+    @patch('question.tasks.flush_question_solved_alert_digest.apply_async')
+    def test_send_question_solved_alert_should_send_one_digest_per_recipient(self, mock_flush_apply_async):
+        # Given: 첫 번째 멤버가 2개, 두 번째 멤버가 1개 문제를 해결
+        questions = list(Question.objects.filter(map=self.map).order_by('id'))
+        user_answers = [
+            UserQuestionAnswer.objects.create(
+                map=self.map,
+                question=question,
+                member=self.members[member_index],
+                map_play_member=self.map_play_members[member_index],
+                answer='',
+                is_correct=True,
+            )
+            for member_index, question in [(0, questions[0]), (1, questions[0]), (0, questions[1])]
+        ]
+
+        # When: 알림 창 안에서 문제 해결 알림 3번
+        for user_answer in user_answers:
+            send_question_solved_alert(user_answer.id)
+
+        # Then: 묶음 발송은 한 번만 예약되어야 함
+        mock_flush_apply_async.assert_called_once()
+
+        # When: 묶음 발송, 다시 발송
+        flush_question_solved_alert_digest(self.map_play.id)
+        flush_question_solved_alert_digest(self.map_play.id)
+
+        # Then: 수신자별로 본인이 해결한 문제를 뺀 알림 하나씩, 받을 내용이 같은 수신자끼리는 한 번에 등록되어야 함
+        pushes = {
+            tuple(outbox.guest_ids): (outbox.title, outbox.body)
+            for outbox in PushOutbox.objects.all()
+        }
+        self.assertEqual(
+            pushes,
+            {
+                (self.guests[0].id,): (f"\'{questions[0].title}\' 문제 해결", '테스트 유저 1님이 문제를 해결했습니다.'),
+                (self.guests[1].id,): ('문제 2개 해결', '테스트 유저 0님이 문제 2개를 해결했습니다.'),
+                (self.guests[2].id, self.guests[3].id): ('문제 3개 해결', '테스트 유저 0, 테스트 유저 1님이 문제 3개를 해결했습니다.'),
+            },
+        )
+
+    @patch('question.services.member_answer_service.send_question_solved_alert.delay')
+    def test_create_answer_should_not_duplicate_progress_when_teammates_solve_same_question(self, mock_solved_alert_delay):
+        # Given: 같은 문제를 푸는 두 명의 팀원
+        services = [
+            MemberAnswerService(
+                question=self.question,
+                member_id=self.members[i].id,
+                map_play_member_id=self.map_play_members[i].id,
+                map_play_id=self.map_play.id,
+            )
+            for i in range(2)
+        ]
+
+        # When: 두 명 모두 정답 제출
+        for service in services:
+            service.create_answer('', [])
+
+        # Then: MapPlay 에는 Arrow 진행 상태와 Node 완료 이력이 하나씩만 있어야 함
+        self.assertEqual(ArrowProgress.objects.filter(map_play=self.map_play, arrow=self.question.arrow).count(), 1)
+        self.assertEqual(
+            NodeCompletedHistory.objects.filter(map_play=self.map_play, node=self.question.arrow.start_node).count(),
+            1,
+        )
+        # Then: 두 번째 팀원은 연쇄 처리를 하지 않아야 함
+        self.assertEqual(services[1].new_arrow_progresses, [])
+        self.assertEqual(services[1].new_completed_node_histories, [])
+
+        # When: 같은 MapPlay, Arrow 로 직접 생성
+        # Then: unique 제약으로 막혀야 함
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ArrowProgress.objects.create(
+                map=self.map,
+                map_play=self.map_play,
+                arrow=self.question.arrow,
+                member=self.members[2],
+                map_play_member=self.map_play_members[2],
+                is_resolved=True,
+            )
+
+
+class MemberAnswerServiceBulkFeedbackTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 3개 Node 체인 Map 과 생성자
+        self.members = [
+            Member.objects.create(
+                username=f'test_user_{i}',
+                nickname=f'테스트 유저 {i}',
+            )
+            for i in range(3)
+        ]
+        self.map = MapDocumentService().import_map(
+            build_seed_map_document(MapSeedShape.CHAIN.value, 3),
+            self.members[0].id,
+        )
+        self.questions = list(
+            Question.objects.select_related(
+                'arrow',
+            ).filter(
+                map=self.map,
+            ).order_by(
+                'id',
+            )
+        )
+        # Given: 생성자를 제외한 2명이 참여한 MapPlay, 모두 게스트가 있음
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.members[1],
+        )
+        self.map_play_members = [
+            MapPlayMember.objects.create(
+                map_play=self.map_play,
+                member=member,
+                role=MapPlayMemberRole.ADMIN if i == 0 else MapPlayMemberRole.PARTICIPANT,
+            )
+            for i, member in enumerate(self.members[1:])
+        ]
+        self.guests = [
+            Guest.objects.create(
+                member=member,
+                temp_nickname=f'guest_{i}',
+                ip='127.0.0.1',
+                email=f'test{i}@test.com',
+            )
+            for i, member in enumerate(self.members)
+        ]
+        MapPlayProgressService().rebuild_progress(self.map_play.id)
+        # Given: 첫 번째 참여자가 앞의 2개 문제에 제출한 검토 대기 답변
+        self.answers = [
+            UserQuestionAnswer.objects.create(
+                map=self.map,
+                question=question,
+                member=self.members[1],
+                map_play_member=self.map_play_members[0],
+                answer='답변',
+                is_correct=None,
+            )
+            for question in self.questions[:2]
+        ]
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    @patch('question.services.member_answer_service.send_question_feedback_pushes.delay')
+    def test_submit_feedbacks_should_review_answers_and_complete_nodes_once(self, mock_feedback_pushes_delay):
+        # When: Map 생성자가 정답 처리 2개, 없는 답변 1개를 한 번에 제출
+        with self.captureOnCommitCallbacks(execute=True):
+            results = MemberAnswerService.submit_feedbacks(
+                member_id=self.members[0].id,
+                items=[
+                    BulkFeedbackItemDTO(user_question_answer_id=answer.id, is_correct=True, feedback='정답')
+                    for answer in self.answers
+                ] + [
+                    BulkFeedbackItemDTO(user_question_answer_id=0, is_correct=False, feedback='오답'),
+                ],
+            )
+
+        # Then: 요청 순서대로 답변별 결과가 있어야 함
+        self.assertEqual(
+            [(result.id, result.status) for result in results],
+            [
+                (self.answers[0].id, FeedbackResultStatus.REVIEWED.value),
+                (self.answers[1].id, FeedbackResultStatus.REVIEWED.value),
+                (0, FeedbackResultStatus.NOT_FOUND.value),
+            ],
+        )
+        for answer in self.answers:
+            answer.refresh_from_db()
+            self.assertTrue(answer.is_correct)
+            self.assertEqual(answer.reviewed_by_id, self.members[0].id)
+        # Then: 두 문제의 시작 Node 부터 연쇄 처리되어 Node 별 완료 이력이 하나씩만 있어야 함
+        progress = MapPlayProgressService().get_progress(self.map_play.id)
+        for question in self.questions[:2]:
+            self.assertIn(question.arrow.start_node_id, progress.completed_node_ids)
+            self.assertEqual(
+                NodeCompletedHistory.objects.filter(map_play=self.map_play, node_id=question.arrow.start_node_id).count(),
+                1,
+            )
+        # Then: 알림은 커밋 후 한 번만 등록되어야 함
+        mock_feedback_pushes_delay.assert_called_once_with([answer.id for answer in self.answers])
+
+    @patch('question.services.member_answer_service.send_question_feedback_pushes.delay')
+    def test_submit_feedbacks_should_skip_answers_of_other_creators_map(self, mock_feedback_pushes_delay):
+        # When: Map 생성자가 아닌 사용자가 피드백 제출
+        with self.captureOnCommitCallbacks(execute=True):
+            results = MemberAnswerService.submit_feedbacks(
+                member_id=self.members[1].id,
+                items=[
+                    BulkFeedbackItemDTO(user_question_answer_id=self.answers[0].id, is_correct=True, feedback='정답'),
+                ],
+            )
+
+        # Then: 권한 없음 결과, 답변은 그대로여야 함
+        self.assertEqual(results[0].status, FeedbackResultStatus.PERMISSION_DENIED.value)
+        self.answers[0].refresh_from_db()
+        self.assertIsNone(self.answers[0].is_correct)
+        mock_feedback_pushes_delay.assert_not_called()
+
+    @patch('question.tasks.flush_question_solved_alert_digest.apply_async')
+    def test_send_question_feedback_pushes_should_group_by_author_and_map_play(self, mock_flush_apply_async):
+        # Given: 같은 작성자의 정답 처리된 답변 2개
+        UserQuestionAnswer.objects.filter(
+            id__in=[answer.id for answer in self.answers],
+        ).update(
+            is_correct=True,
+            feedback='정답',
+        )
+
+        # When: 여러 답변 피드백 알림 작업 실행 후 문제 해결 알림 묶음 발송
+        send_question_feedback_pushes([answer.id for answer in self.answers])
+        flush_question_solved_alert_digest(self.map_play.id)
+
+        # Then: 작성자에게 피드백 알림 1번, 다른 참여자에게 문제 해결 알림 1번만 등록되어야 함
+        pushes = {outbox.push_channel_type: outbox.guest_ids for outbox in PushOutbox.objects.all()}
+        self.assertEqual(PushOutbox.objects.count(), 2)
+        self.assertEqual(pushes[PushChannelType.QUESTION_FEEDBACK.value], [self.guests[1].id])
+        self.assertEqual(pushes[PushChannelType.QUESTION_SOLVED_ALERT.value], [self.guests[2].id])
@@ -0,0 +1,517 @@
+import random
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from map.models import (
+    Arrow,
+    ArrowProgress,
+    Map,
+    Node,
+    NodeCompleteRule,
+    NodeCompletedHistory,
+)
+from map_graph.dtos.map_graph_snapshot import (
+    SnapshotArrow,
+    SnapshotNode,
+    SnapshotRule,
+)
+from map_graph.services.map_graph_snapshot_service import (
+    clear_local_map_graph_snapshots,
+    compile_map_graph_snapshot,
+    get_map_graph_snapshot,
+    increase_map_graph_version,
+)
+from member.models import Member
+from play.consts import MapPlayMemberRole
+from play.models import (
+    MapPlay,
+    MapPlayMember,
+    MapPlayNodeStatistic,
+    MapPlayProgress,
+)
+from play.services import (
+    MapPlayNodeStatisticService,
+    MapPlayProgressService,
+)
+from play.tasks import rebuild_map_node_statistics
+from question.management.commands.benchmark_unlock_cascade import (
+    build_chain_snapshot,
+    legacy_unlock_cascade,
+)
+from question.services.map_progress_recompute_service import MapProgressRecomputeService
+from question.services.node_completion_service import (
+    NodeCompletionService,
+    resolve_unlock_cascade,
+)
+
+
+class ResolveUnlockCascadeTest(TestCase):
+    def test_resolve_unlock_cascade_should_complete_whole_chain(self):
+        # Given: 2,000 개 Node 로 이루어진 체인
+        snapshot = build_chain_snapshot(2000)
+
+        # When: 시작 Node 의 문제를 해결한 상태에서 연쇄 계산
+        resolved_arrow_ids, completed_node_rules = resolve_unlock_cascade(snapshot, [0], {0}, set())
+
+        # Then: 모든 Node 가 완료되고 기존 방식과 결과가 같아야 함
+        self.assertEqual(len(completed_node_rules), 2000)
+        self.assertEqual(len(resolved_arrow_ids), 1999)
+        legacy_arrow_ids, legacy_node_rules = legacy_unlock_cascade(snapshot, [0], {0}, set())
+        self.assertEqual(resolved_arrow_ids, legacy_arrow_ids)
+        self.assertEqual(completed_node_rules, legacy_node_rules)
+
+    def test_resolve_unlock_cascade_should_equal_legacy_on_random_graph(self):
+        # Given: 여러 Rule 과 병렬 경로가 섞인 무작위 DAG
+        randomizer = random.Random(7)
+        node_count = 80
+        nodes = [
+            SnapshotNode(
+                id=node_id, name='', title='', position_x=0, position_y=0, width=0, height=0, is_active=True,
+            )
+            for node_id in range(node_count)
+        ]
+        rules = []
+        arrows = []
+        for node_id in range(node_count):
+            for _ in range(randomizer.randint(1, 2)):
+                rule_id = len(rules)
+                rules.append(SnapshotRule(id=rule_id, name='', node_id=node_id))
+                start_node_ids = randomizer.sample(range(node_id), min(node_id, randomizer.randint(0, 3)))
+                # 시작 Node 또는 문제가 있는 Node 는 self arrow 를 가짐
+                if not start_node_ids or randomizer.random() < 0.3:
+                    start_node_ids.append(node_id)
+                for start_node_id in start_node_ids:
+                    arrows.append(
+                        SnapshotArrow(
+                            id=len(arrows),
+                            start_node_id=start_node_id,
+                            end_node_id=node_id,
+                            node_complete_rule_id=rule_id,
+                        )
+                    )
+        snapshot = compile_map_graph_snapshot(0, 0, nodes, arrows, rules)
+        self_arrow_ids = set(snapshot.self_arrow_ids)
+
+        for _ in range(20):
+            # Given: 일부 문제가 해결된 상태
+            completed_arrow_ids = set(randomizer.sample(sorted(self_arrow_ids), len(self_arrow_ids) // 2))
+            start_node_ids = [snapshot.arrows[arrow_id].start_node_id for arrow_id in completed_arrow_ids][:3]
+
+            # When: 연쇄 계산
+            result = resolve_unlock_cascade(snapshot, start_node_ids, completed_arrow_ids, set())
+            legacy_result = legacy_unlock_cascade(snapshot, start_node_ids, completed_arrow_ids, set())
+
+            # Then: 기존 방식과 결과가 같아야 함
+            self.assertEqual(set(result[0]), set(legacy_result[0]))
+            self.assertEqual(set(result[1]), set(legacy_result[1]))
+
+    def test_resolve_unlock_cascade_should_skip_completed_rules(self):
+        # Given: 체인의 시작 Rule 이 이미 완료된 상태
+        snapshot = build_chain_snapshot(3)
+
+        # When: 연쇄 계산
+        resolved_arrow_ids, completed_node_rules = resolve_unlock_cascade(snapshot, [0], {0}, {0})
+
+        # Then: 완료된 Rule 은 다시 완료하지 않아야 함
+        self.assertEqual(resolved_arrow_ids, [1, 2])
+        self.assertEqual(completed_node_rules, [(1, 1), (2, 2)])
+
+
+class NodeCompletionServiceTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: 테스트 사용자, Map, MapPlay 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+        )
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=self.map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+        # Given: node1 -> node2 -> node3 체인, node1 은 문제(self arrow)로 완료
+        self.nodes = [
+            Node.objects.create(
+                map=self.map,
+                name=f'Node {i}',
+                title=f'Title {i}',
+                description=f'Description {i}',
+                position_x=i * 100,
+                position_y=0,
+            )
+            for i in range(3)
+        ]
+        self.rules = [
+            NodeCompleteRule.objects.create(
+                map=self.map,
+                node=node,
+                name=f'Rule {i}',
+            )
+            for i, node in enumerate(self.nodes)
+        ]
+        self.question_arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[0],
+            node_complete_rule=self.rules[0],
+        )
+        self.arrows = [
+            Arrow.objects.create(
+                map=self.map,
+                start_node=self.nodes[i],
+                node_complete_rule=self.rules[i + 1],
+            )
+            for i in range(2)
+        ]
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def test_process_nodes_completion(self):
+        # Given: 문제 Arrow 해결
+        ArrowProgress.objects.create(
+            map=self.map,
+            arrow=self.question_arrow,
+            member=self.member,
+            map_play_member=self.map_play_member,
+            is_resolved=True,
+        )
+        service = NodeCompletionService(
+            member_id=self.member.id,
+            map_play_member_id=self.map_play_member.id,
+            map_play_id=self.map_play.id,
+        )
+
+        # When: 연쇄 처리
+        result = service.process_nodes_completion(nodes=[self.nodes[0]])
+
+        # Then: 모든 Node 가 완료되어야 함
+        self.assertEqual(
+            {arrow_progress.arrow_id for arrow_progress in result.new_arrow_progresses},
+            {arrow.id for arrow in self.arrows},
+        )
+        self.assertEqual(
+            set(
+                NodeCompletedHistory.objects.filter(
+                    map_play_member=self.map_play_member,
+                ).values_list(
+                    'node_id',
+                    'node_complete_rule_id',
+                )
+            ),
+            {(node.id, rule.id) for node, rule in zip(self.nodes, self.rules)},
+        )
+        # Then: MapPlay 진행 상태도 같은 트랜잭션에서 갱신되어야 함
+        progress = MapPlayProgress.objects.get(map_play=self.map_play)
+        self.assertEqual(progress.completed_node_ids, [node.id for node in self.nodes])
+        self.assertEqual(progress.completed_rule_ids, [rule.id for rule in self.rules])
+        self.assertEqual(
+            progress.resolved_arrow_ids,
+            sorted([self.question_arrow.id] + [arrow.id for arrow in self.arrows]),
+        )
+        version = progress.version
+
+        # When: 다시 처리
+        result = service.process_nodes_completion(nodes=[self.nodes[0]])
+
+        # Then: 중복 생성되지 않아야 함
+        self.assertEqual(result.new_arrow_progresses, [])
+        self.assertEqual(result.new_completed_node_histories, [])
+        self.assertEqual(MapPlayProgress.objects.get(map_play=self.map_play).version, version)
+
+    def test_process_nodes_completion_should_maintain_node_statistics(self):
+        # Given: 문제 Arrow 해결
+        ArrowProgress.objects.create(
+            map=self.map,
+            arrow=self.question_arrow,
+            member=self.member,
+            map_play_member=self.map_play_member,
+            is_resolved=True,
+        )
+        service = NodeCompletionService(
+            member_id=self.member.id,
+            map_play_member_id=self.map_play_member.id,
+            map_play_id=self.map_play.id,
+        )
+
+        # When: 연쇄 처리
+        service.process_nodes_completion(nodes=[self.nodes[0]])
+
+        # Then: 모든 Node 완료 수 1, 진행 중 수 0 이어야 함
+        statistic_service = MapPlayNodeStatisticService()
+        self.assertEqual(
+            [statistic_service.get_statistic(self.map_play.id, node.id) for node in self.nodes],
+            [(0, 1), (0, 1), (0, 1)],
+        )
+        # Then: 이력으로 다시 계산한 결과와 같아야 함
+        statistics = set(
+            MapPlayNodeStatistic.objects.filter(
+                map_play=self.map_play,
+            ).values_list(
+                'node_id',
+                'activated_count',
+                'completed_count',
+            )
+        )
+        statistic_service.rebuild_statistics(self.map_play.id, get_map_graph_snapshot(self.map.id))
+        self.assertEqual(
+            set(
+                MapPlayNodeStatistic.objects.filter(
+                    map_play=self.map_play,
+                ).values_list(
+                    'node_id',
+                    'activated_count',
+                    'completed_count',
+                )
+            ),
+            statistics,
+        )
+
+    def test_rebuild_statistics_should_count_activated_nodes(self):
+        # Given: node1 만 완료된 이력
+        NodeCompletedHistory.objects.create(
+            map=self.map,
+            node=self.nodes[0],
+            member=self.member,
+            map_play_member=self.map_play_member,
+            node_complete_rule=self.rules[0],
+        )
+
+        # When: 이력으로 통계 계산
+        statistic_service = MapPlayNodeStatisticService()
+        statistic_service.rebuild_statistics(self.map_play.id, get_map_graph_snapshot(self.map.id))
+
+        # Then: node1 완료, node2 진행 중, node3 잠김
+        self.assertEqual(
+            [statistic_service.get_statistic(self.map_play.id, node.id) for node in self.nodes],
+            [(0, 1), (1, 0), (0, 0)],
+        )
+
+    def test_get_progress_should_rebuild_from_histories(self):
+        # Given: 진행 상태 없이 이력만 있는 MapPlay
+        ArrowProgress.objects.create(
+            map=self.map,
+            arrow=self.question_arrow,
+            member=self.member,
+            map_play_member=self.map_play_member,
+            is_resolved=True,
+        )
+        NodeCompletedHistory.objects.create(
+            map=self.map,
+            node=self.nodes[0],
+            member=self.member,
+            map_play_member=self.map_play_member,
+            node_complete_rule=self.rules[0],
+        )
+
+        # When: 진행 상태 조회
+        progress = MapPlayProgressService().get_progress(self.map_play.id)
+
+        # Then: 이력으로 진행 상태가 만들어져야 함
+        self.assertEqual(progress.completed_node_ids, [self.nodes[0].id])
+        self.assertEqual(progress.completed_rule_ids, [self.rules[0].id])
+        self.assertEqual(progress.resolved_arrow_ids, [self.question_arrow.id])
+
+        # Then: 이후 조회는 primary key 조회 한 번이어야 함
+        with self.assertNumQueries(1):
+            MapPlayProgressService().get_progress(self.map_play.id)
+
+
+class MapProgressRecomputeServiceTest(TestCase):
+    def setUp(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+        # Given: node1 -> node2 체인을 모두 완료한 MapPlay
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+        )
+        self.map = Map.objects.create(
+            name='Test Map',
+            description='Test Description',
+            created_by=self.member,
+        )
+        self.map_play = MapPlay.objects.create(
+            map=self.map,
+            title='Test Play',
+            created_by=self.member,
+        )
+        self.map_play_member = MapPlayMember.objects.create(
+            map_play=self.map_play,
+            member=self.member,
+            role=MapPlayMemberRole.ADMIN,
+        )
+        self.nodes = [
+            Node.objects.create(
+                map=self.map,
+                name=f'Node {i}',
+                title=f'Title {i}',
+                description=f'Description {i}',
+                position_x=i * 100,
+                position_y=0,
+            )
+            for i in range(3)
+        ]
+        self.rules = [
+            NodeCompleteRule.objects.create(
+                map=self.map,
+                node=node,
+                name=f'Rule {i}',
+            )
+            for i, node in enumerate(self.nodes)
+        ]
+        question_arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[0],
+            node_complete_rule=self.rules[0],
+        )
+        Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[0],
+            node_complete_rule=self.rules[1],
+        )
+        # Given: node3 는 아직 들어오는 Arrow 가 없음 (문제로 완료)
+        Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[2],
+            node_complete_rule=self.rules[2],
+        )
+        ArrowProgress.objects.create(
+            map=self.map,
+            arrow=question_arrow,
+            member=self.member,
+            map_play_member=self.map_play_member,
+            is_resolved=True,
+        )
+        NodeCompletionService(
+            member_id=self.member.id,
+            map_play_member_id=self.map_play_member.id,
+            map_play_id=self.map_play.id,
+        ).process_nodes_completion(nodes=[self.nodes[0]])
+
+    def tearDown(self):
+        clear_local_map_graph_snapshots()
+        cache.clear()
+
+    def _add_arrow_node2_to_node3(self) -> Arrow:
+        # Admin 에서 node2 -> node3 Arrow 를 추가하고 node3 의 문제 Arrow 를 삭제
+        Arrow.objects.filter(start_node=self.nodes[2]).update(is_deleted=True)
+        arrow = Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[1],
+            node_complete_rule=self.rules[2],
+        )
+        increase_map_graph_version(self.map.id)
+        return arrow
+
+    def test_recompute_should_return_diff_without_saving_on_dry_run(self):
+        # Given: 진행 중인 MapPlay 가 있는 Map 에 Arrow 추가
+        arrow = self._add_arrow_node2_to_node3()
+        service = MapProgressRecomputeService(self.map.id)
+
+        # When: dry-run
+        diffs = service.recompute([self.map_play.id], dry_run=True)
+
+        # Then: node3 가 새로 완료되어야 하지만 저장되지 않아야 함
+        self.assertEqual(len(diffs), 1)
+        self.assertEqual(diffs[0].resolved_arrow_ids, [arrow.id])
+        self.assertEqual(diffs[0].completed_node_rules, [(self.nodes[2].id, self.rules[2].id)])
+        self.assertFalse(diffs[0].is_applied)
+        self.assertFalse(NodeCompletedHistory.objects.filter(node=self.nodes[2]).exists())
+        # Then: 바뀔 Node 통계도 diff 에 포함되어야 함
+        self.assertEqual(diffs[0].node_statistic_changes, {self.nodes[2].id: ((0, 0), (0, 1))})
+        self.assertEqual(MapPlayNodeStatisticService().get_statistic(self.map_play.id, self.nodes[2].id), (0, 0))
+
+    def test_recompute_should_save_missing_histories_idempotently(self):
+        # Given: 진행 중인 MapPlay 가 있는 Map 에 Arrow 추가
+        self._add_arrow_node2_to_node3()
+        service = MapProgressRecomputeService(self.map.id)
+        chunks = service.get_map_play_id_chunks(100)
+
+        # When: 다시 계산
+        diffs = service.recompute(chunks[0])
+
+        # Then: node3 완료 이력과 진행 상태가 저장되어야 함
+        self.assertEqual(chunks, [[self.map_play.id]])
+        self.assertTrue(diffs[0].is_applied)
+        self.assertEqual(
+            list(NodeCompletedHistory.objects.filter(node=self.nodes[2]).values_list('map_play_member_id', flat=True)),
+            [self.map_play_member.id],
+        )
+        self.assertEqual(
+            MapPlayProgress.objects.get(map_play=self.map_play).completed_node_ids,
+            [node.id for node in self.nodes],
+        )
+
+        # When: 한 번 더 실행
+        # Then: 변경이 없어야 함
+        self.assertEqual(service.recompute(chunks[0]), [])
+        self.assertEqual(NodeCompletedHistory.objects.filter(node=self.nodes[2]).count(), 1)
+
+    def test_recompute_should_rebuild_statistics_for_arrow_from_completed_node(self):
+        # Given: 이미 완료된 node2 에서 node3 로 가는 Arrow 추가 (node3 는 문제 Arrow 도 풀어야 완료)
+        Arrow.objects.create(
+            map=self.map,
+            start_node=self.nodes[1],
+            node_complete_rule=self.rules[2],
+        )
+        increase_map_graph_version(self.map.id)
+        service = MapProgressRecomputeService(self.map.id)
+        statistic_service = MapPlayNodeStatisticService()
+
+        # When: 다시 계산
+        diffs = service.recompute([self.map_play.id])
+
+        # Then: 새로 완료되는 Node 는 없지만 node3 가 진행 중으로 세어져야 함
+        self.assertEqual(diffs[0].completed_node_rules, [])
+        self.assertEqual(diffs[0].node_statistic_changes, {self.nodes[2].id: ((0, 0), (1, 0))})
+        self.assertEqual(statistic_service.get_statistic(self.map_play.id, self.nodes[2].id), (1, 0))
+
+        # When: 한 번 더 실행
+        # Then: 변경이 없어야 함
+        self.assertEqual(service.recompute([self.map_play.id]), [])
+
+    @patch('play.tasks.rebuild_map_node_statistics.delay')
+    def test_rebuild_map_statistics_on_commit_should_rebuild_statistics_after_graph_edit(self, mock_rebuild_delay):
+        # Given: Map 구조 수정 트랜잭션에서 이미 완료된 node2 에서 node3 로 가는 Arrow 추가
+        with self.captureOnCommitCallbacks() as callbacks:
+            Arrow.objects.create(
+                map=self.map,
+                start_node=self.nodes[1],
+                node_complete_rule=self.rules[2],
+            )
+            increase_map_graph_version(self.map.id)
+            MapPlayNodeStatisticService.rebuild_map_statistics_on_commit([self.map.id, self.map.id])
+
+            # Then: 커밋 전에는 등록하지 않아야 함
+            mock_rebuild_delay.assert_not_called()
+        for callback in callbacks:
+            callback()
+
+        # Then: 커밋 후 Map 별로 한 번만 등록되어야 함
+        mock_rebuild_delay.assert_called_once_with(self.map.id)
+
+        # When: 등록된 작업 실행
+        changed_map_play_count = rebuild_map_node_statistics(self.map.id)
+
+        # Then: node3 가 진행 중으로 세어져야 함
+        self.assertEqual(changed_map_play_count, 1)
+        self.assertEqual(MapPlayNodeStatisticService().get_statistic(self.map_play.id, self.nodes[2].id), (1, 0))
+
+        # When: 한 번 더 실행
+        # Then: 바뀌는 MapPlay 가 없어야 함
+        self.assertEqual(rebuild_map_node_statistics(self.map.id), 0)
@@ -0,0 +1,80 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from member.models import (
+    Guest,
+    Member,
+)
+from question.consts import (
+    FeedbackResultStatus,
+    QuestionInvalidInputResponseErrorStatus,
+)
+from rest_framework import status
+from rest_framework.test import APIClient
+
+
+class UserQuestionAnswerBulkFeedbackViewTest(TestCase):
+    def setUp(self):
+        # Given: 테스트 클라이언트 설정
+        self.client = APIClient()
+
+        # Given: 로그인한 테스트 사용자 생성
+        self.member = Member.objects.create(
+            username='test_user',
+            nickname='테스트 유저',
+            member_status_id=1,
+        )
+        self.guest = Guest.objects.create(
+            member=self.member,
+            temp_nickname='testsdfsdf',
+            ip='127.0.0.1',
+            email='test@test.com',
+        )
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_result_per_item(self, mock_jwt_decode, mock_auth_cred):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 없는 답변에 피드백 제출
+        response = self.client.post(
+            reverse('question:bulk-user-question-answer-feedback'),
+            data={'items': [{'user_question_answer_id': 100, 'is_correct': True, 'feedback': '정답'}]},
+            format='json',
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 답변별 결과로 알려줘야 함
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['results'][0]['id'], 100)
+        self.assertEqual(response.data['data']['results'][0]['status'], FeedbackResultStatus.NOT_FOUND.value)
+
+    @patch('config.middlewares.authentications.DefaultAuthentication.authenticate_credentials')
+    @patch('config.middlewares.authentications.jwt_decode_handler')
+    def test_should_return_400_when_answer_duplicated(self, mock_jwt_decode, mock_auth_cred):
+        # Given: 인증 모킹
+        mock_auth_cred.return_value = self.guest
+        mock_jwt_decode.return_value = {'guest_id': self.guest.id}
+
+        # When: 같은 답변을 두 번 포함해서 제출
+        response = self.client.post(
+            reverse('question:bulk-user-question-answer-feedback'),
+            data={
+                'items': [
+                    {'user_question_answer_id': 1, 'is_correct': True, 'feedback': '정답'},
+                    {'user_question_answer_id': 1, 'is_correct': False, 'feedback': '오답'},
+                ],
+            },
+            format='json',
+            HTTP_AUTHORIZATION='jwt some-token'
+        )
+
+        # Then: 400
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data['status_code'],
+            QuestionInvalidInputResponseErrorStatus.INVALID_INPUT_BULK_FEEDBACK_ERROR_400.value,
+        )
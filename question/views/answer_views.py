@@ -213,3 +213,41 @@ class UserQuestionAnswerDetailView(APIView):
             ).model_dump(),
             status=status.HTTP_200_OK,
         )
+
+
+class UserQuestionAnswerBulkFeedbackView(APIView):
+    """
+    여러 사용자 문제 답변 피드백 제출 API
+    """
+    permission_classes = [IsMemberLogin]
+
+    def post(self, request):
+        """
+        여러 답변에 대한 피드백을 한 번에 제출합니다.
+        - Map 생성자인 답변만 반영되고, 답변별 결과를 반환합니다.
+        """
+        try:
+            from question.dtos.feedback import BulkFeedbackRequestDTO
+            bulk_feedback_dto = BulkFeedbackRequestDTO.of(request)
+        except ValidationError as e:
+            raise PydanticAPIException(
+                status_code=400,
+                error_summary=QuestionInvalidInputResponseErrorStatus.INVALID_INPUT_BULK_FEEDBACK_ERROR_400.label,
+                error_code=QuestionInvalidInputResponseErrorStatus.INVALID_INPUT_BULK_FEEDBACK_ERROR_400.value,
+                errors=e.errors(),
+            )
+
+        results = MemberAnswerService.submit_feedbacks(
+            member_id=request.guest.member_id,
+            items=bulk_feedback_dto.items,
+        )
+
+        return Response(
+            BaseFormatResponse(
+                status_code='success',
+                data={
+                    'results': [result.model_dump() for result in results],
+                }
+            ).model_dump(),
+            status=status.HTTP_200_OK,
+        )